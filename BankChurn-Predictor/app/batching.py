@@ -0,0 +1,145 @@
+"""
+Adaptive micro-batching for single-row prediction requests.
+
+Concurrent ``/predict`` calls are queued and coalesced for up to
+``max_wait_ms`` (or until ``max_batch_size`` rows are collected), scored with
+one vectorized model call and fanned back out to the awaiting requests.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+BatchFn = Callable[[List[Any]], Union[Sequence[Any], Awaitable[Sequence[Any]]]]
+BatchObserver = Callable[[int, float], None]
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the batching queue has reached its maximum depth."""
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-item requests into batched calls.
+
+    Args:
+        batch_fn: Callable receiving a list of items and returning one result
+            per item (in order). May be sync or async.
+        max_batch_size: Maximum number of items scored in one call.
+        max_wait_ms: Maximum time the first queued item waits for companions.
+        max_queue_size: Maximum number of pending items before rejecting.
+        observer: Optional callback ``(batch_size, oldest_wait_seconds)``
+            invoked for every dispatched batch (used for metrics).
+    """
+
+    def __init__(
+        self,
+        batch_fn: BatchFn,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+        max_queue_size: int = 1024,
+        observer: Optional[BatchObserver] = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.max_queue_size = max_queue_size
+        self.observer = observer
+        self._queue: Optional["asyncio.Queue[Tuple[Any, asyncio.Future, float]]"] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of items waiting to be batched."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        """Start the background batching task on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the batching task and fail any pending requests."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        while self._queue is not None and not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Batcher stopped"))
+
+    async def submit(self, item: Any) -> Any:
+        """Queue ``item`` and wait for its individual result.
+
+        Raises:
+            QueueFullError: If ``max_queue_size`` items are already pending.
+        """
+        if not self.running:
+            self.start()
+        assert self._queue is not None
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((item, future, time.perf_counter()))
+        except asyncio.QueueFull:
+            raise QueueFullError(f"Batch queue full ({self.max_queue_size} pending)") from None
+        return await future
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future, float]]:
+        assert self._queue is not None
+        batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000.0
+        while len(batch) < self.max_batch_size:
+            # Drain whatever is already queued without yielding
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            items = [item for item, _, _ in batch]
+            futures = [future for _, future, _ in batch]
+            if self.observer is not None:
+                self.observer(len(batch), time.perf_counter() - batch[0][2])
+            try:
+                outcome = self.batch_fn(items)
+                results: Sequence[Any]
+                if isinstance(outcome, Awaitable):
+                    results = await outcome
+                else:
+                    results = outcome
+                if len(results) != len(items):
+                    raise RuntimeError(f"batch_fn returned {len(results)} results for {len(items)} items")
+            except Exception as e:
+                logger.error(f"Micro-batch of {len(items)} failed: {e}")
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for future, result in zip(futures, results):
+                if not future.done():
+                    future.set_result(result)
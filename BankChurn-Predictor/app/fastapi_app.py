@@ -2,28 +2,53 @@
 FastAPI application for BankChurn Predictor
 
 Features:
-- Real-time churn prediction with probability and risk level
-- Batch prediction support (up to 1000 customers)
+- Real-time churn prediction with probability, risk level and exact per-feature contributions
+- Batch prediction support (up to 1000 customers), vectorized with optional columnar output
+- Streaming bulk scoring of NDJSON / Arrow IPC bodies of any length (/predict_stream)
+- Optional compiled NumPy inference path (BANKCHURN_INFERENCE_MODE=compiled)
+- Optional adaptive micro-batching of concurrent /predict calls (BANKCHURN_MICROBATCH=1)
+- Inference on a bounded worker pool so scoring never blocks the event loop
+- Hot model reload (file watcher or POST /admin/reload) with warm-up and atomic swap
+- Memory-mapped model loading and optional preload for copy-on-write sharing across workers
+- Synthetic warm-up prediction before the service reports ready
+- Optional prediction cache for repeated /predict inputs (BANKCHURN_PREDICTION_CACHE=1)
 - Prometheus-compatible metrics endpoint
 - Health checks for Kubernetes readiness/liveness
 """
 
+import asyncio
 import contextlib
+import hmac
+import json
 import logging
+import os
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
-from fastapi import BackgroundTasks, FastAPI, HTTPException
+from common_utils.artifacts import ArtifactSettings, file_checksum, freeze_for_fork
+from common_utils.cache import CacheSettings, PredictionCache, canonical_key
+from common_utils.serving import (
+    ExecutorSaturatedError,
+    ExecutorSettings,
+    InferenceExecutor,
+    InferenceMetrics,
+    run_inference,
+)
+from common_utils.tabular_io import read_table
+from fastapi import BackgroundTasks, FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
 from pydantic import BaseModel, Field, validator
 
 # Prometheus metrics
+INFERENCE_METRICS: Optional[InferenceMetrics] = None
 try:
-    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
 
     PROMETHEUS_AVAILABLE = True
     REQUEST_COUNT = Counter(
@@ -42,69 +67,579 @@ try:
         "Total predictions made",
         ["risk_level"],
     )
+    MICROBATCH_SIZE = Histogram(
+        "bankchurn_microbatch_size",
+        "Rows scored per coalesced /predict batch",
+        buckets=[1, 2, 4, 8, 16, 32, 64, 128, 256],
+    )
+    MICROBATCH_WAIT = Histogram(
+        "bankchurn_microbatch_wait_seconds",
+        "Time the oldest request in a batch waited before dispatch",
+        buckets=[0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1],
+    )
+    MICROBATCH_QUEUE_DEPTH = Gauge(
+        "bankchurn_microbatch_queue_depth",
+        "Requests waiting in the micro-batching queue",
+    )
+    MICROBATCH_SETTINGS = Gauge(
+        "bankchurn_microbatch_setting",
+        "Configured micro-batching settings",
+        ["setting"],
+    )
+    STREAM_ROWS = Counter(
+        "bankchurn_stream_rows_total",
+        "Rows received by /predict_stream",
+        ["status"],
+    )
+    INFERENCE_METRICS = InferenceMetrics("bankchurn")
+    MODEL_INFO = Gauge(
+        "bankchurn_model_info",
+        "Model currently served (always 1; identity in labels)",
+        ["version", "checksum"],
+    )
+    MODEL_LOADED_AT = Gauge(
+        "bankchurn_model_loaded_timestamp_seconds",
+        "Unix time the served model was swapped in",
+    )
+    MODEL_RELOADS = Counter(
+        "bankchurn_model_reloads_total",
+        "Model reload attempts",
+        ["status"],
+    )
+    MODEL_RELOAD_DURATION = Histogram(
+        "bankchurn_model_reload_duration_seconds",
+        "Time to load, warm up and swap in a new model",
+        buckets=[0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+    )
+    MODEL_LOAD_SECONDS = Gauge(
+        "bankchurn_model_load_seconds",
+        "Time the last model load spent in each phase",
+        ["phase"],
+    )
+    PREDICTION_CACHE_EVENTS = Counter(
+        "bankchurn_prediction_cache_events_total",
+        "Prediction cache lookups (hit, miss, expired) and evictions",
+        ["event"],
+    )
+    PREDICTION_CACHE_BYTES = Gauge(
+        "bankchurn_prediction_cache_bytes",
+        "Approximate size of the prediction cache",
+    )
 except ImportError:
     PROMETHEUS_AVAILABLE = False
 
+# Fast JSON serialization for batch responses (optional dependency)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add project root to path to allow imports from src
 # app/ is one level deep, so parent is root
 BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 
+from app.batching import MicroBatcher, QueueFullError  # noqa: E402
+from app.reloading import ModelFileWatcher, ModelReloadError  # noqa: E402
+from app.streaming import (  # noqa: E402
+    ARROW_AVAILABLE,
+    ARROW_STREAM_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    DuplexStreamingResponse,
+    rules_from_model,
+    score_stream,
+)
+from src.bankchurn.compiled import CompilationError  # noqa: E402
+from src.bankchurn.explainability import ModelExplainer  # noqa: E402
+from src.bankchurn.postprocessing import ChurnScores  # noqa: E402
 from src.bankchurn.prediction import ChurnPredictor  # noqa: E402
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Inference backend: "sklearn" (default) or "compiled" (NumPy fast path)
+INFERENCE_MODE = os.getenv("BANKCHURN_INFERENCE_MODE", "sklearn").lower()
+
+# feature_contributions: "exact" (from the model structure, default) or "heuristic" (legacy fixed values)
+CONTRIBUTIONS_MODE = os.getenv("BANKCHURN_CONTRIBUTIONS", "exact").lower()
+
+# SHAP explanations for /explain_batch: background sample file (CSV/Parquet/Feather) and explainer
+EXPLAIN_BACKGROUND_PATH = os.getenv("BANKCHURN_EXPLAIN_BACKGROUND")
+EXPLAIN_BACKGROUND_SAMPLES = int(os.getenv("BANKCHURN_EXPLAIN_BACKGROUND_SAMPLES", "100"))
+EXPLAIN_METHOD = os.getenv("BANKCHURN_EXPLAIN_METHOD", "auto").lower()
+# KernelExplainer costs kernel_nsamples x background rows model evaluations per explained row
+EXPLAIN_MAX_BATCH_SIZE = int(os.getenv("BANKCHURN_EXPLAIN_MAX_BATCH", "100"))
+EXPLAIN_KERNEL_NSAMPLES = int(os.getenv("BANKCHURN_EXPLAIN_KERNEL_NSAMPLES", "256"))
+
+# Micro-batching of concurrent single-customer requests (opt-in)
+MICROBATCH_ENABLED = os.getenv("BANKCHURN_MICROBATCH", "0").lower() in ("1", "true", "yes")
+MICROBATCH_WINDOW_MS = float(os.getenv("BANKCHURN_MICROBATCH_WINDOW_MS", "2.0"))
+MICROBATCH_MAX_SIZE = int(os.getenv("BANKCHURN_MICROBATCH_MAX_SIZE", "64"))
+MICROBATCH_MAX_QUEUE = int(os.getenv("BANKCHURN_MICROBATCH_QUEUE_DEPTH", "1024"))
+
+# Rows parsed, validated and scored together by /predict_stream
+STREAM_CHUNK_SIZE = int(os.getenv("BANKCHURN_STREAM_CHUNK_SIZE", "5000"))
+
+# Bounded inference executor (BANKCHURN_INFERENCE_WORKERS / _MAX_QUEUE / _EXECUTOR)
+EXECUTOR_SETTINGS = ExecutorSettings.from_env("BANKCHURN_")
+
+# Model loading (BANKCHURN_MODEL_MMAP / BANKCHURN_PRELOAD_MODEL)
+ARTIFACT_SETTINGS = ArtifactSettings.from_env("BANKCHURN_")
+
+# Prediction cache (BANKCHURN_PREDICTION_CACHE / _MAX_BYTES / _TTL_SECONDS / _PATH)
+CACHE_SETTINGS = CacheSettings.from_env("BANKCHURN_")
+
+# Model artifacts and hot reload (watcher is off unless an interval is set)
+MODEL_PATH = BASE_DIR / "models" / "best_model.pkl"
+PREPROCESSOR_PATH = BASE_DIR / "models" / "preprocessor.pkl"
+METADATA_PATH = BASE_DIR / "models" / "best_model_metadata.json"
+MODEL_WATCH_INTERVAL = float(os.getenv("BANKCHURN_MODEL_WATCH_INTERVAL", "0"))
+ADMIN_TOKEN = os.getenv("BANKCHURN_ADMIN_TOKEN")
+
 # Global state
 predictor: Optional[ChurnPredictor] = None
 model_metadata: Dict[str, Any] = {}
+model_checksum: Optional[str] = None
 request_count: int = 0
 total_prediction_time: float = 0.0
 start_time = time.time()
+batcher: Optional[MicroBatcher] = None
+executor: Optional[InferenceExecutor] = None
+watcher: Optional[ModelFileWatcher] = None
+reload_lock: Optional[asyncio.Lock] = None
+prediction_cache: Optional["PredictionCache"] = None
+# SHAP explainer and the predictor it was built for
+model_explainer: Optional[Tuple[ChurnPredictor, ModelExplainer]] = None
+# Executor threads read (predictor, model_checksum) together; install_model swaps them under this lock
+model_state_lock = threading.Lock()
+# Serializes explainer rebuilds so concurrent /explain_batch calls build it once
+model_explainer_lock = threading.Lock()
+
+# Synthetic customers scored by every new model before it is swapped in
+WARMUP_RECORDS: List[Dict[str, Any]] = [
+    {
+        "CreditScore": 650,
+        "Geography": "France",
+        "Gender": "Female",
+        "Age": 40,
+        "Tenure": 5,
+        "Balance": 60000.0,
+        "NumOfProducts": 2,
+        "HasCrCard": 1,
+        "IsActiveMember": 1,
+        "EstimatedSalary": 100000.0,
+    },
+    {
+        "CreditScore": 420,
+        "Geography": "Germany",
+        "Gender": "Male",
+        "Age": 62,
+        "Tenure": 1,
+        "Balance": 180000.0,
+        "NumOfProducts": 3,
+        "HasCrCard": 0,
+        "IsActiveMember": 0,
+        "EstimatedSalary": 35000.0,
+    },
+    {
+        "CreditScore": 800,
+        "Geography": "Spain",
+        "Gender": "Male",
+        "Age": 25,
+        "Tenure": 9,
+        "Balance": 0.0,
+        "NumOfProducts": 1,
+        "HasCrCard": 1,
+        "IsActiveMember": 1,
+        "EstimatedSalary": 150000.0,
+    },
+]
+
+
+def build_predictor() -> Tuple[ChurnPredictor, Dict[str, Any], str]:
+    """Load the model, metadata and checksum from disk without touching the served model.
+
+    Raises:
+        FileNotFoundError: If the model file is missing.
+    """
+    if not MODEL_PATH.exists():
+        raise FileNotFoundError(f"Model not found: {MODEL_PATH}")
+    checksum = file_checksum(MODEL_PATH)
+
+    # Pass preprocessor path only if it exists, otherwise None
+    # The ChurnPredictor handles Pipeline models without separate preprocessor
+    prep_arg = PREPROCESSOR_PATH if PREPROCESSOR_PATH.exists() else None
+    start = time.perf_counter()
+    new_predictor = ChurnPredictor.from_files(
+        MODEL_PATH, prep_arg, compiled=INFERENCE_MODE == "compiled", mmap_mode=ARTIFACT_SETTINGS.mmap_mode
+    )
+    if PROMETHEUS_AVAILABLE:
+        MODEL_LOAD_SECONDS.labels(phase="load").set(time.perf_counter() - start)
+
+    metadata: Dict[str, Any] = {}
+    if METADATA_PATH.exists():
+        with open(METADATA_PATH, "r") as f:
+            metadata = json.load(f)
+    return new_predictor, metadata, checksum
+
+
+def warm_up(candidate: ChurnPredictor) -> None:
+    """Score ``WARMUP_RECORDS`` once; rejects models that fail or return invalid probabilities."""
+    start = time.perf_counter()
+    probabilities = candidate.predict(WARMUP_RECORDS, as_arrays=True).probability
+    if len(probabilities) != len(WARMUP_RECORDS) or not np.all((probabilities >= 0) & (probabilities <= 1)):
+        raise ModelReloadError("warm-up returned invalid probabilities")
+    if CONTRIBUTIONS_MODE == "exact":
+        try:
+            candidate.explain(WARMUP_RECORDS)
+        except CompilationError as e:
+            logger.warning(f"Exact feature contributions unavailable, using heuristic values: {e}")
+    if PROMETHEUS_AVAILABLE:
+        MODEL_LOAD_SECONDS.labels(phase="warmup").set(time.perf_counter() - start)
+
+
+def install_model(new_predictor: ChurnPredictor, metadata: Dict[str, Any], checksum: str) -> None:
+    """Swap the served model. Requests already running keep the predictor they started with."""
+    global predictor, model_metadata, model_checksum
+    with model_state_lock:
+        predictor, model_metadata, model_checksum = new_predictor, metadata, checksum
+    if PROMETHEUS_AVAILABLE:
+        MODEL_INFO.clear()
+        MODEL_INFO.labels(version=str(metadata.get("version", "1.0.0")), checksum=checksum[:12]).set(1)
+        MODEL_LOADED_AT.set_to_current_time()
 
 
 def load_model_logic() -> bool:
     """Internal logic to load model."""
-    global predictor, model_metadata
     try:
-        model_path = BASE_DIR / "models" / "best_model.pkl"
-        preprocessor_path = BASE_DIR / "models" / "preprocessor.pkl"
+        new_predictor, metadata, checksum = build_predictor()
+        install_model(new_predictor, metadata, checksum)
+        logger.info(f"Model loaded successfully (inference mode: {new_predictor.inference_mode})")
+        return True
+    except FileNotFoundError as e:
+        logger.error(str(e))
+        return False
+    except Exception as e:
+        logger.error(f"Failed to load model: {e}")
+        return False
+
+
+def warm_up_served_model() -> bool:
+    """Warm up the loaded model before readiness is reported; unloads it if warm-up fails."""
+    global predictor
+    if predictor is None:
+        return False
+    try:
+        warm_up(predictor)
+    except Exception as e:
+        logger.error(f"Model warm-up failed, serving without a model: {e}")
+        predictor = None
+        return False
+    return True
 
-        if not model_path.exists():
-            logger.error(f"Model not found: {model_path}")
-            return False
 
-        # Pass preprocessor path only if it exists, otherwise None
-        # The ChurnPredictor handles Pipeline models without separate preprocessor
-        prep_arg = preprocessor_path if preprocessor_path.exists() else None
+def _prepare_model() -> Tuple[ChurnPredictor, Dict[str, Any], str]:
+    try:
+        new_predictor, metadata, checksum = build_predictor()
+        warm_up(new_predictor)
+    except ModelReloadError:
+        raise
+    except Exception as e:
+        raise ModelReloadError(str(e)) from e
+    return new_predictor, metadata, checksum
 
-        predictor = ChurnPredictor.from_files(model_path, prep_arg)
 
-        # Try to load metadata
-        metadata_path = BASE_DIR / "models" / "best_model_metadata.json"
-        if metadata_path.exists():
-            import json
+async def reload_model(force: bool = False) -> Dict[str, Any]:
+    """Load, warm up and swap in the model currently on disk.
 
-            with open(metadata_path, "r") as f:
-                model_metadata = json.load(f)
+    Loading runs in a separate thread so serving continues on the old model
+    until the swap. A model whose checksum matches the served one is skipped
+    unless ``force`` is set. With a process executor, a fresh pool is started
+    for the new model and the old pool drains its in-flight calls.
 
-        logger.info("Model loaded successfully")
-        return True
-    except Exception as e:
-        logger.error(f"Failed to load model: {e}")
-        return False
+    Raises:
+        ModelReloadError: If the new model fails to load or warm up; the
+            previous model keeps serving.
+    """
+    global executor, reload_lock
+    if reload_lock is None:
+        reload_lock = asyncio.Lock()
+    async with reload_lock:
+        start = time.perf_counter()
+        previous = model_checksum
+        if not force and previous is not None and MODEL_PATH.exists():
+            if await asyncio.to_thread(file_checksum, MODEL_PATH) == previous:
+                if PROMETHEUS_AVAILABLE:
+                    MODEL_RELOADS.labels(status="unchanged").inc()
+                return {"status": "unchanged", "checksum": previous}
+
+        try:
+            new_predictor, metadata, checksum = await asyncio.to_thread(_prepare_model)
+        except ModelReloadError as e:
+            if PROMETHEUS_AVAILABLE:
+                MODEL_RELOADS.labels(status="failed").inc()
+            logger.error(f"Model reload failed, keeping previous model: {e}")
+            raise
+
+        if executor is not None and executor.kind == "process":
+            old_executor, executor = executor, create_executor()
+            old_executor.shutdown(wait=False)
+        install_model(new_predictor, metadata, checksum)
+        if prediction_cache is not None:
+            # Keys include the checksum, so old entries are already unreachable
+            prediction_cache.clear()
+
+        elapsed = time.perf_counter() - start
+        if PROMETHEUS_AVAILABLE:
+            MODEL_RELOADS.labels(status="reloaded").inc()
+            MODEL_RELOAD_DURATION.observe(elapsed)
+        logger.info(f"Model reloaded in {elapsed:.2f}s (checksum {checksum[:12]}, previous {str(previous)[:12]})")
+        return {
+            "status": "reloaded",
+            "model_version": metadata.get("version", "1.0.0"),
+            "checksum": checksum,
+            "previous_checksum": previous,
+            "reload_seconds": elapsed,
+        }
+
+
+# (probability, prediction, risk_level, confidence, feature_contributions) for one customer
+RecordScore = Tuple[float, int, str, float, Dict[str, float]]
+
+
+def served_predictor() -> ChurnPredictor:
+    """Snapshot of the served model, read under ``model_state_lock``."""
+    with model_state_lock:
+        current = predictor
+    if current is None:
+        raise RuntimeError("Model not loaded")
+    return current
+
+
+def predict_records(records: Any, current: Optional[ChurnPredictor] = None) -> ChurnScores:
+    """Run the loaded predictor on customer records or a feature DataFrame.
+
+    Module-level so process-pool workers can call it against their own model copy.
+    ``current`` pins the predictor to use; by default the served model is read.
+    """
+    if current is None:
+        current = served_predictor()
+    return current.predict(records, as_arrays=True)
+
+
+def contribution_columns(
+    records: List[Dict[str, Any]], current: Optional[ChurnPredictor] = None
+) -> Dict[str, np.ndarray]:
+    """Per-feature contribution arrays for customer records.
+
+    Exact contributions from the served model (``BANKCHURN_CONTRIBUTIONS=exact``),
+    or the legacy heuristic when disabled or the model structure is not supported.
+    """
+    if CONTRIBUTIONS_MODE == "exact":
+        if current is None:
+            current = served_predictor()
+        try:
+            return current.explain(records).columns()
+        except CompilationError:
+            pass
+    return calculate_feature_contributions_batch(records)
+
+
+def score_batch(records: List[Dict[str, Any]]) -> Tuple[ChurnScores, Dict[str, np.ndarray]]:
+    """Scores and feature contributions for customer records, computed together on the executor.
+
+    Both come from one predictor snapshot, so a reload in between cannot pair
+    the scores of one model with the contributions of another.
+    """
+    current = served_predictor()
+    return predict_records(records, current), contribution_columns(records, current)
+
+
+def score_records(records: List[Dict[str, Any]]) -> List[RecordScore]:
+    """Score customer records in one vectorized call; returns one :data:`RecordScore` per record."""
+    scores, contributions = score_batch(records)
+    names = list(contributions)
+    contribution_rows = zip(*(values.tolist() for values in contributions.values()))
+    return [
+        (prob, pred, risk, conf, dict(zip(names, row)))
+        for prob, pred, risk, conf, row in zip(
+            scores.probability.tolist(),
+            scores.prediction.tolist(),
+            scores.risk_level.tolist(),
+            scores.confidence.tolist(),
+            contribution_rows,
+        )
+    ]
+
+
+def get_model_explainer() -> ModelExplainer:
+    """SHAP explainer of the served model, rebuilt after the model is swapped.
+
+    Background transforms and global importances are cached by model checksum
+    in the explainability module, so rebuilding for an unchanged model is cheap.
+    Runs on executor threads: the served model and its checksum are read as
+    one snapshot, so a concurrent reload cannot pair them up wrongly.
+    """
+    global model_explainer
+    with model_state_lock:
+        current, checksum = predictor, model_checksum
+    assert current is not None, "endpoints check for a loaded model before explaining"
+    with model_explainer_lock:
+        cached = model_explainer
+        if cached is None or cached[0] is not current:
+            background = read_table(EXPLAIN_BACKGROUND_PATH, columns=current.required_features)
+            explainer = current.shap_explainer(
+                background,
+                max_background_samples=EXPLAIN_BACKGROUND_SAMPLES,
+                method=EXPLAIN_METHOD,
+                model_key=checksum,
+                kernel_nsamples=EXPLAIN_KERNEL_NSAMPLES,
+            )
+            cached = model_explainer = (current, explainer)
+        return cached[1]
+
+
+def explain_records(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """SHAP explanations of customer records in one batched call, as JSON-ready values."""
+    result = get_model_explainer().explain_batch(records)
+    contributions = result["contributions"]
+    names = list(contributions.columns)
+    explanations = [
+        {"churn_probability": prob, "churn_prediction": pred, "feature_contributions": dict(zip(names, row))}
+        for prob, pred, row in zip(
+            result["probabilities"].tolist(), result["predictions"].tolist(), contributions.values.tolist()
+        )
+    ]
+    return {
+        "explanations": explanations,
+        "base_value": result["base_value"],
+        "explanation_type": result["explanation_type"],
+        "method": result["method"],
+    }
+
+
+def create_executor() -> InferenceExecutor:
+    """Build the inference executor; process workers load their own model copy."""
+    return InferenceExecutor.from_settings(
+        EXECUTOR_SETTINGS,
+        metrics=INFERENCE_METRICS,
+        initializer=load_model_logic if EXECUTOR_SETTINGS.kind == "process" else None,
+    )
+
+
+async def score_records_async(records: List[Dict[str, Any]]) -> List[RecordScore]:
+    """Score records on the executor, answering repeated inputs from the prediction cache."""
+    cache, checksum = prediction_cache, model_checksum
+    if cache is None or checksum is None:
+        return await run_inference(executor, score_records, records)
+
+    # Hashing and the store round trips run off the event loop, one batch each way
+    keys, results = await asyncio.to_thread(_cache_lookup, cache, records, checksum)
+    misses = [i for i, result in enumerate(results) if result is None]
+    if misses:
+        scored = await run_inference(executor, score_records, [records[i] for i in misses])
+        for i, result in zip(misses, scored):
+            results[i] = result
+        await asyncio.to_thread(cache.put_many, [(keys[i], results[i]) for i in misses])
+    return results  # type: ignore[return-value]
+
+
+def _cache_lookup(
+    cache: PredictionCache, records: List[Dict[str, Any]], checksum: str
+) -> Tuple[List[str], List[Optional[RecordScore]]]:
+    keys = [canonical_key(record, checksum) for record in records]
+    return keys, cache.get_many(keys)
+
+
+def _observe_cache(event: str) -> None:
+    if PROMETHEUS_AVAILABLE:
+        PREDICTION_CACHE_EVENTS.labels(event=event).inc()
+
+
+def create_prediction_cache() -> Optional[PredictionCache]:
+    """Build the prediction cache if enabled (per process, or shared through a SQLite file)."""
+    if not CACHE_SETTINGS.enabled:
+        return None
+    cache = PredictionCache.from_settings(CACHE_SETTINGS, observer=_observe_cache)
+    if PROMETHEUS_AVAILABLE:
+        PREDICTION_CACHE_BYTES.set_function(lambda: cache.bytes_used)
+    return cache
+
+
+def _observe_microbatch(size: int, wait_seconds: float) -> None:
+    if PROMETHEUS_AVAILABLE:
+        MICROBATCH_SIZE.observe(size)
+        MICROBATCH_WAIT.observe(wait_seconds)
+
+
+def create_batcher() -> MicroBatcher:
+    """Build the /predict micro-batcher from the configured settings."""
+    new_batcher = MicroBatcher(
+        score_records_async,
+        max_batch_size=MICROBATCH_MAX_SIZE,
+        max_wait_ms=MICROBATCH_WINDOW_MS,
+        max_queue_size=MICROBATCH_MAX_QUEUE,
+        observer=_observe_microbatch,
+    )
+    if PROMETHEUS_AVAILABLE:
+        MICROBATCH_SETTINGS.labels(setting="window_ms").set(MICROBATCH_WINDOW_MS)
+        MICROBATCH_SETTINGS.labels(setting="max_batch_size").set(MICROBATCH_MAX_SIZE)
+        MICROBATCH_SETTINGS.labels(setting="max_queue_depth").set(MICROBATCH_MAX_QUEUE)
+        MICROBATCH_QUEUE_DEPTH.set_function(lambda: new_batcher.queue_depth)
+    return new_batcher
 
 
 @contextlib.asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
-    success = load_model_logic()
+    global batcher, executor, watcher, reload_lock, prediction_cache
+    reload_lock = asyncio.Lock()
+    # A model preloaded at import time (BANKCHURN_PRELOAD_MODEL) is already installed
+    success = (predictor is not None or load_model_logic()) and warm_up_served_model()
     if not success:
         logger.warning("Application started without model loaded.")
+    executor = create_executor()
+    logger.info(f"Inference executor: {executor.kind} x{executor.max_workers} (max queue={executor.max_queue})")
+    prediction_cache = create_prediction_cache()
+    if prediction_cache is not None:
+        store = CACHE_SETTINGS.path or "process memory"
+        logger.info(
+            f"Prediction cache enabled ({CACHE_SETTINGS.max_bytes} bytes, ttl={CACHE_SETTINGS.ttl_seconds}s, {store})"
+        )
+    if MICROBATCH_ENABLED:
+        batcher = create_batcher()
+        batcher.start()
+        logger.info(
+            f"Micro-batching enabled (window={MICROBATCH_WINDOW_MS}ms, "
+            f"max_batch={MICROBATCH_MAX_SIZE}, queue={MICROBATCH_MAX_QUEUE})"
+        )
+    if MODEL_WATCH_INTERVAL > 0:
+        watcher = ModelFileWatcher(MODEL_PATH, reload_model, interval_seconds=MODEL_WATCH_INTERVAL)
+        watcher.start()
+        logger.info(f"Watching {MODEL_PATH} for new models every {MODEL_WATCH_INTERVAL}s")
     yield
-
+    if watcher is not None:
+        await watcher.stop()
+        watcher = None
+    if batcher is not None:
+        await batcher.stop()
+        batcher = None
+    if executor is not None:
+        executor.shutdown(wait=False)
+        executor = None
+    if prediction_cache is not None:
+        prediction_cache.close()
+        prediction_cache = None
+
+
+# Load in the importing process so workers forked by ``gunicorn --preload``
+# share the model copy-on-write instead of each unpickling its own copy.
+if ARTIFACT_SETTINGS.preload and load_model_logic() and warm_up_served_model():
+    freeze_for_fork()
 
 app = FastAPI(
     title="BankChurn Predictor API",
@@ -125,6 +660,10 @@ app.add_middleware(
 # --- Pydantic Models ---
 
 
+VALID_GEOGRAPHIES = ["France", "Spain", "Germany"]
+VALID_GENDERS = ["Male", "Female"]
+
+
 class CustomerData(BaseModel):
     """Schema for individual customer data."""
 
@@ -141,19 +680,22 @@ class CustomerData(BaseModel):
 
     @validator("Geography")
     def validate_geography(cls, v):
-        valid = ["France", "Spain", "Germany"]
-        if v not in valid:
-            raise ValueError(f"Geography must be one of: {valid}")
+        if v not in VALID_GEOGRAPHIES:
+            raise ValueError(f"Geography must be one of: {VALID_GEOGRAPHIES}")
         return v
 
     @validator("Gender")
     def validate_gender(cls, v):
-        valid = ["Male", "Female"]
-        if v not in valid:
-            raise ValueError(f"Gender must be one of: {valid}")
+        if v not in VALID_GENDERS:
+            raise ValueError(f"Gender must be one of: {VALID_GENDERS}")
         return v
 
 
+# CustomerData rules applied column-wise to /predict_stream chunks
+CUSTOMER_RULES = rules_from_model(CustomerData, choices={"Geography": VALID_GEOGRAPHIES, "Gender": VALID_GENDERS})
+STREAM_RESULT_DTYPES = {"churn_probability": "Float64", "churn_prediction": "Int64", "risk_level": "string"}
+
+
 class BatchCustomerData(BaseModel):
     """Schema for batch prediction."""
 
@@ -187,6 +729,21 @@ class BatchPredictionResponse(BaseModel):
     processing_time_seconds: float
 
 
+class ColumnarBatchPredictionResponse(BaseModel):
+    """``/predict_batch?format=columnar``: one list per field, in customer order."""
+
+    batch_id: str
+    total_customers: int
+    processing_time_seconds: float
+    model_version: str
+    prediction_timestamp: str
+    churn_probability: List[float]
+    churn_prediction: List[int]
+    risk_level: List[str]
+    confidence: List[float]
+    feature_contributions: Dict[str, List[float]]
+
+
 class HealthResponse(BaseModel):
     status: str
     model_loaded: bool
@@ -200,6 +757,8 @@ class ModelMetrics(BaseModel):
     model_accuracy: Optional[float] = None
     model_f1_score: Optional[float] = None
     model_auc_roc: Optional[float] = None
+    model_version: Optional[str] = None
+    model_checksum: Optional[str] = None
 
 
 # --- Helpers ---
@@ -207,8 +766,9 @@ class ModelMetrics(BaseModel):
 
 def calculate_feature_contributions(customer_data: Dict[str, Any]) -> Dict[str, float]:
     """
-    Calcula contribuciones aproximadas de features usando valores promedio.
-    En producción, se usaría SHAP o LIME para explicaciones precisas.
+    Contribuciones heurísticas (legacy) de features con valores fijos.
+    Solo se usan con BANKCHURN_CONTRIBUTIONS=heuristic o si la estructura del
+    modelo no admite contribuciones exactas (ver ``ChurnPredictor.explain``).
     """
     # Contribuciones simuladas basadas en importancia conocida
     base = {
@@ -244,17 +804,92 @@ def calculate_feature_contributions(customer_data: Dict[str, Any]) -> Dict[str,
     return base
 
 
-def determine_risk_level(probability: float) -> str:
-    if probability < 0.3:
-        return "LOW"
-    elif probability < 0.7:
-        return "MEDIUM"
-    else:
-        return "HIGH"
+# Features reported in feature_contributions, in CustomerData field order
+CONTRIBUTION_FEATURES = [
+    "CreditScore",
+    "Geography",
+    "Age",
+    "Balance",
+    "NumOfProducts",
+    "IsActiveMember",
+    "EstimatedSalary",
+]
+
+
+def calculate_feature_contributions_batch(customers: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Vectorized :func:`calculate_feature_contributions`; returns one array per feature."""
+    n = len(customers)
+    age = np.fromiter((c["Age"] for c in customers), dtype=float, count=n)
+    products = np.fromiter((c["NumOfProducts"] for c in customers), dtype=float, count=n)
+    active = np.fromiter((c["IsActiveMember"] for c in customers), dtype=float, count=n)
+    germany = np.fromiter((c["Geography"] == "Germany" for c in customers), dtype=bool, count=n)
+
+    contributions = {name: np.zeros(n) for name in CONTRIBUTION_FEATURES}
+    contributions["Age"] = np.where(age > 50, 0.15, np.where(age < 30, -0.05, 0.0))
+    contributions["NumOfProducts"] = np.where(products == 1, 0.12, 0.0)
+    contributions["IsActiveMember"] = np.where(active == 0, 0.18, 0.0)
+    contributions["Geography"] = np.where(germany, 0.14, 0.0)
+    return contributions
+
+
+def build_batch_columns(scores: ChurnScores, contributions: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """Assemble all per-customer response fields as plain Python lists."""
+    return {
+        "churn_probability": scores.probability.tolist(),
+        "churn_prediction": scores.prediction.tolist(),
+        "risk_level": scores.risk_level.tolist(),
+        "confidence": scores.confidence.tolist(),
+        "feature_contributions": {name: values.tolist() for name, values in contributions.items()},
+    }
+
+
+def batch_columns_to_rows(columns: Dict[str, Any], model_version: str, timestamp: str) -> List[Dict[str, Any]]:
+    """Transpose columnar batch output into PredictionResponse-shaped dicts."""
+    names = list(columns["feature_contributions"])
+    contribution_rows = zip(*columns["feature_contributions"].values())
+    return [
+        {
+            "churn_probability": prob,
+            "churn_prediction": pred,
+            "risk_level": risk,
+            "confidence": conf,
+            "feature_contributions": dict(zip(names, contrib)),
+            "model_version": model_version,
+            "prediction_timestamp": timestamp,
+        }
+        for prob, pred, risk, conf, contrib in zip(
+            columns["churn_probability"],
+            columns["churn_prediction"],
+            columns["risk_level"],
+            columns["confidence"],
+            contribution_rows,
+        )
+    ]
+
+
+async def score_stream_chunk(features: pd.DataFrame) -> pd.DataFrame:
+    """Score one validated /predict_stream chunk."""
+    scores = await run_inference(executor, predict_records, features)
+    return pd.DataFrame(
+        {
+            "churn_probability": scores.probability,
+            "churn_prediction": scores.prediction,
+            "risk_level": scores.risk_level,
+        },
+        index=features.index,
+    )
+
+
+def _observe_stream_chunk(valid: int, invalid: int) -> None:
+    if PROMETHEUS_AVAILABLE:
+        STREAM_ROWS.labels(status="valid").inc(valid)
+        STREAM_ROWS.labels(status="invalid").inc(invalid)
 
 
-def calculate_confidence(probability: float) -> float:
-    return abs(probability - 0.5) * 2
+def json_response(content: Dict[str, Any]) -> Response:
+    """Serialize an already JSON-compatible payload without response-model validation."""
+    body = orjson.dumps(content) if ORJSON_AVAILABLE else json.dumps(content).encode("utf-8")
+    return Response(content=body, media_type="application/json")
 
 
 # --- Endpoints ---
@@ -294,9 +929,27 @@ async def get_metrics():
         model_accuracy=model_metadata.get("test_accuracy"),
         model_f1_score=model_metadata.get("test_f1_score"),
         model_auc_roc=model_metadata.get("test_auc_roc"),
+        model_version=model_metadata.get("version"),
+        model_checksum=model_checksum,
     )
 
 
+@app.post("/admin/reload")
+async def admin_reload(force: bool = False, x_admin_token: Optional[str] = Header(default=None)):
+    """Load the model file on disk, warm it up and swap it in without a restart.
+
+    Requires the ``X-Admin-Token`` header when ``BANKCHURN_ADMIN_TOKEN`` is set.
+    Returns ``status="unchanged"`` if the file matches the served model
+    (``force=true`` reloads anyway).
+    """
+    if ADMIN_TOKEN and not hmac.compare_digest(x_admin_token or "", ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+    try:
+        return await reload_model(force=force)
+    except ModelReloadError as e:
+        raise HTTPException(status_code=500, detail=f"Reload failed, previous model still served: {e}")
+
+
 @app.post("/predict", response_model=PredictionResponse)
 async def predict_churn(customer: CustomerData):
     global request_count, total_prediction_time
@@ -309,14 +962,12 @@ async def predict_churn(customer: CustomerData):
     start_pred = time.time()
     try:
         customer_dict = customer.dict()
-        df = pd.DataFrame([customer_dict])
 
-        # Use robust prediction from src
-        results = predictor.predict(df, include_proba=True)
-
-        prob = float(results.iloc[0]["probability"])
-        pred = int(results.iloc[0]["prediction"])
-        risk_level = determine_risk_level(prob)
+        # Coalesce with concurrent requests when micro-batching is enabled
+        if batcher is not None:
+            prob, pred, risk_level, confidence, contributions = await batcher.submit(customer_dict)
+        else:
+            prob, pred, risk_level, confidence, contributions = (await score_records_async([customer_dict]))[0]
 
         pred_time = time.time() - start_pred
         request_count += 1
@@ -332,11 +983,15 @@ async def predict_churn(customer: CustomerData):
             churn_probability=prob,
             churn_prediction=pred,
             risk_level=risk_level,
-            confidence=calculate_confidence(prob),
-            feature_contributions=calculate_feature_contributions(customer_dict),
+            confidence=confidence,
+            feature_contributions=contributions,
             model_version=model_metadata.get("version", "1.0.0"),
             prediction_timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
         )
+    except (QueueFullError, ExecutorSaturatedError) as e:
+        if PROMETHEUS_AVAILABLE:
+            REQUEST_COUNT.labels(method="POST", endpoint="/predict", status="429").inc()
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         logger.error(f"Prediction error: {e}")
         if PROMETHEUS_AVAILABLE:
@@ -344,8 +999,28 @@ async def predict_churn(customer: CustomerData):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/predict_batch", response_model=BatchPredictionResponse)
-async def predict_batch(batch_data: BatchCustomerData, background_tasks: BackgroundTasks):
+# Serialized with orjson, so the response body is documented here rather than validated
+@app.post(
+    "/predict_batch",
+    response_model=None,
+    responses={
+        200: {
+            "model": Union[BatchPredictionResponse, ColumnarBatchPredictionResponse],
+            "description": "One entry per customer (format=rows) or one list per field (format=columnar)",
+        }
+    },
+)
+async def predict_batch(
+    batch_data: BatchCustomerData,
+    background_tasks: BackgroundTasks,
+    format: Literal["rows", "columnar"] = "rows",
+):
+    """Score a batch of customers.
+
+    ``format=rows`` (default) returns one ``PredictionResponse`` per customer;
+    ``format=columnar`` returns one list per field, plus a single
+    ``model_version`` and ``prediction_timestamp`` for the whole batch.
+    """
     if predictor is None:
         raise HTTPException(status_code=503, detail="Model not available")
 
@@ -354,43 +1029,115 @@ async def predict_batch(batch_data: BatchCustomerData, background_tasks: Backgro
 
     try:
         customers_list = [c.dict() for c in batch_data.customers]
-        df = pd.DataFrame(customers_list)
-
-        results = predictor.predict(df, include_proba=True)
-
-        predictions = []
-        for i, row in results.iterrows():
-            prob = float(row["probability"])
-            pred = int(row["prediction"])
-            predictions.append(
-                PredictionResponse(
-                    churn_probability=prob,
-                    churn_prediction=pred,
-                    risk_level=determine_risk_level(prob),
-                    confidence=calculate_confidence(prob),
-                    feature_contributions=calculate_feature_contributions(customers_list[i]),
-                    model_version=model_metadata.get("version", "1.0.0"),
-                    prediction_timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                )
-            )
+
+        scores, contributions = await run_inference(executor, score_batch, customers_list)
+        columns = build_batch_columns(scores, contributions)
+        model_version = model_metadata.get("version", "1.0.0")
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ")
 
         processing_time = time.time() - start_batch
 
         global request_count, total_prediction_time
-        request_count += len(batch_data.customers)
+        request_count += len(customers_list)
         total_prediction_time += processing_time
 
-        return BatchPredictionResponse(
-            predictions=predictions,
-            batch_id=batch_id,
-            total_customers=len(batch_data.customers),
-            processing_time_seconds=processing_time,
-        )
+        meta = {
+            "batch_id": batch_id,
+            "total_customers": len(customers_list),
+            "processing_time_seconds": processing_time,
+        }
+        if format == "columnar":
+            return json_response({**meta, "model_version": model_version, "prediction_timestamp": timestamp, **columns})
+        return json_response({"predictions": batch_columns_to_rows(columns, model_version, timestamp), **meta})
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         logger.error(f"Batch prediction error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/explain_batch")
+async def explain_batch(batch_data: BatchCustomerData):
+    """SHAP feature contributions for a batch of customers.
+
+    Requires ``BANKCHURN_EXPLAIN_BACKGROUND``. Contributions are per
+    transformed feature with TreeExplainer and per input feature with
+    KernelExplainer (``method``); ``base_value`` plus a row's contributions
+    is its churn probability.
+    """
+    if predictor is None:
+        raise HTTPException(status_code=503, detail="Model not available")
+    if not EXPLAIN_BACKGROUND_PATH:
+        raise HTTPException(status_code=503, detail="Explainer not configured (set BANKCHURN_EXPLAIN_BACKGROUND)")
+    if len(batch_data.customers) > EXPLAIN_MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Max {EXPLAIN_MAX_BATCH_SIZE} customers per explanation batch (BANKCHURN_EXPLAIN_MAX_BATCH)",
+        )
+
+    start = time.time()
+    try:
+        customers_list = [c.dict() for c in batch_data.customers]
+        result = await run_inference(executor, explain_records, customers_list)
+        processing_time = time.time() - start
+        if PROMETHEUS_AVAILABLE:
+            REQUEST_LATENCY.labels(endpoint="/explain_batch").observe(processing_time)
+        return json_response(
+            {
+                **result,
+                "total_customers": len(customers_list),
+                "processing_time_seconds": processing_time,
+                "rows_per_second": len(customers_list) / processing_time if processing_time > 0 else None,
+            }
+        )
+    except ExecutorSaturatedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        logger.error(f"Explanation error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/predict_stream")
+async def predict_stream(
+    request: Request,
+    chunk_size: int = Query(STREAM_CHUNK_SIZE, ge=1, le=1_000_000),
+    id_column: str = "CustomerId",
+):
+    """Score an NDJSON or Arrow IPC stream of customers of any length.
+
+    Send ``Content-Type: application/x-ndjson`` (one customer object per line)
+    or ``application/vnd.apache.arrow.stream``. Rows are validated with the
+    ``CustomerData`` rules and scored in chunks of ``chunk_size``; results are
+    streamed back in the request format, one row per input row with its
+    position (``row``), ``id_column`` if present, the prediction fields and an
+    ``error`` message for rows that failed validation.
+    """
+    if predictor is None:
+        raise HTTPException(status_code=503, detail="Model not available")
+
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if media_type not in (NDJSON_MEDIA_TYPE, ARROW_STREAM_MEDIA_TYPE):
+        raise HTTPException(
+            status_code=415, detail=f"Content-Type must be {NDJSON_MEDIA_TYPE} or {ARROW_STREAM_MEDIA_TYPE}"
+        )
+    if media_type == ARROW_STREAM_MEDIA_TYPE and not ARROW_AVAILABLE:
+        raise HTTPException(status_code=415, detail="pyarrow is not installed; use NDJSON")
+
+    return DuplexStreamingResponse(
+        score_stream(
+            request.stream(),
+            media_type,
+            chunk_size,
+            CUSTOMER_RULES,
+            score_stream_chunk,
+            STREAM_RESULT_DTYPES,
+            id_column=id_column,
+            observer=_observe_stream_chunk,
+        ),
+        media_type=media_type,
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
 
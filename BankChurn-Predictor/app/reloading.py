@@ -0,0 +1,97 @@
+"""
+Hot model reload support.
+
+``ModelFileWatcher`` polls the model file's (mtime, size) signature and calls
+an async reload callback once a new file has stopped changing for one poll
+interval, so a model copied in place is not loaded half-written. Deploying by
+atomic rename (write to a temp file, then ``mv``) avoids the wait entirely.
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+Signature = Tuple[int, int]
+
+
+class ModelReloadError(RuntimeError):
+    """Raised when a candidate model cannot be loaded or fails warm-up."""
+
+
+def file_signature(path: Union[str, Path]) -> Optional[Signature]:
+    """Cheap change detector: ``(mtime_ns, size)``, or None if the file is missing."""
+    try:
+        stat = Path(path).stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ModelFileWatcher:
+    """Trigger a reload when the model file changes.
+
+    Args:
+        path: Model file to watch.
+        reload: Async callable invoked (with no arguments) for each new,
+            settled version of the file. Exceptions are logged, not raised.
+        interval_seconds: Polling interval.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        reload: Callable[[], Awaitable[Any]],
+        interval_seconds: float = 10.0,
+    ):
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be > 0")
+        self.path = Path(path)
+        self.reload = reload
+        self.interval_seconds = interval_seconds
+        self._current = file_signature(self.path)
+        self._candidate: Optional[Signature] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start polling on the running event loop."""
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def poll(self) -> bool:
+        """Check the file once; returns True if a reload was triggered."""
+        signature = file_signature(self.path)
+        if signature is None or signature == self._current:
+            self._candidate = None
+            return False
+        if signature != self._candidate:
+            # Changed since the last poll: wait until it stops changing
+            self._candidate = signature
+            return False
+        self._current, self._candidate = signature, None
+        try:
+            await self.reload()
+        except Exception as e:
+            logger.error(f"Model reload after file change failed: {e}")
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.poll()
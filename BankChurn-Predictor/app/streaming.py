@@ -0,0 +1,454 @@
+"""
+Streaming bulk scoring for ``/predict_stream``.
+
+The request body (NDJSON or an Arrow IPC stream) is consumed incrementally,
+parsed into fixed-size chunks on a worker thread, validated column-wise per
+chunk and scored. Results are streamed back in the same format as soon as
+each chunk is done, so memory is bounded by the chunk size rather than the
+body size.
+"""
+
+import asyncio
+import collections
+import io
+import json
+import logging
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+import pandas as pd
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401
+
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# A parsed chunk plus optional per-row parse errors (NDJSON lines that are not JSON objects)
+Chunk = Tuple[pd.DataFrame, Optional[List[Optional[str]]]]
+ScoreFn = Callable[[pd.DataFrame], Awaitable[pd.DataFrame]]
+
+
+# --- Vectorized validation ---
+
+
+@dataclass
+class FieldRule:
+    """Validation rule for one input column."""
+
+    name: str
+    kind: str  # "int", "float" or "choice"
+    ge: Optional[float] = None
+    le: Optional[float] = None
+    choices: Optional[Sequence[str]] = None
+
+    def message(self) -> str:
+        if self.kind == "choice":
+            return f"{self.name} must be one of: {list(self.choices or [])}"
+        bounds = []
+        if self.ge is not None:
+            bounds.append(f">= {self.ge}")
+        if self.le is not None:
+            bounds.append(f"<= {self.le}")
+        kind = "an integer" if self.kind == "int" else "a number"
+        return f"{self.name} must be {kind}" + (f" {' and '.join(bounds)}" if bounds else "")
+
+
+def rules_from_model(model: Any, choices: Optional[Dict[str, Sequence[str]]] = None) -> List[FieldRule]:
+    """Derive column rules from a pydantic model's field types and ``ge``/``le`` constraints.
+
+    Args:
+        model: Pydantic (v2) model class, e.g. ``CustomerData``.
+        choices: Allowed values for string fields validated by custom validators.
+    """
+    choices = choices or {}
+    rules = []
+    for name, field in model.model_fields.items():
+        if name in choices:
+            rules.append(FieldRule(name, "choice", choices=list(choices[name])))
+            continue
+        ge = next((m.ge for m in field.metadata if getattr(m, "ge", None) is not None), None)
+        le = next((m.le for m in field.metadata if getattr(m, "le", None) is not None), None)
+        kind = "int" if field.annotation is int else "float"
+        rules.append(FieldRule(name, kind, ge=ge, le=le))
+    return rules
+
+
+def validate_chunk(frame: pd.DataFrame, rules: Sequence[FieldRule]) -> Tuple[pd.DataFrame, np.ndarray]:
+    """Validate and coerce a chunk column-wise.
+
+    Returns:
+        The coerced feature frame (rule columns only) and an object array with
+        the first validation error per row (``None`` for valid rows).
+    """
+    n = len(frame)
+    errors = np.full(n, None, dtype=object)
+    columns = {}
+    for rule in rules:
+        if rule.name not in frame.columns:
+            errors[pd.isna(errors)] = f"{rule.name}: field required"
+            columns[rule.name] = np.full(n, np.nan)
+            continue
+        values = frame[rule.name]
+        if rule.kind == "choice":
+            invalid = ~values.isin(rule.choices).to_numpy()
+            columns[rule.name] = values.to_numpy(dtype=object)
+        else:
+            numeric = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+            invalid = np.isnan(numeric)
+            if rule.ge is not None:
+                invalid |= numeric < rule.ge
+            if rule.le is not None:
+                invalid |= numeric > rule.le
+            if rule.kind == "int":
+                invalid |= np.mod(numeric, 1) != 0
+            columns[rule.name] = numeric
+        errors[invalid & pd.isna(errors)] = rule.message()
+
+    features = pd.DataFrame(columns, index=frame.index)
+    valid = pd.isna(errors)
+    for rule in rules:
+        if rule.kind == "int" and valid.any():
+            features[rule.name] = features[rule.name].where(valid, 0).astype(np.int64)
+    return features, errors
+
+
+# --- Request body bridge ---
+
+
+class BodyReader(io.RawIOBase):
+    """Blocking file-like FIFO over request body chunks pushed from the event loop.
+
+    Up to ``max_memory_chunks`` chunks are buffered in memory; anything beyond
+    that spills to a temporary file. ``feed`` therefore never blocks, so
+    half-duplex clients (which upload the whole body before reading the
+    response) cannot deadlock against response backpressure, while memory
+    stays bounded.
+    """
+
+    def __init__(self, max_memory_chunks: int = 16):
+        super().__init__()
+        self.max_memory_chunks = max_memory_chunks
+        self._memory: Deque[bytes] = collections.deque()
+        self._spool: Optional[IO[bytes]] = None
+        self._spool_read = 0
+        self._spool_write = 0
+        self._current = memoryview(b"")
+        self._eof = False
+        self._aborted = False
+        self._cond = threading.Condition()
+
+    def readable(self) -> bool:
+        return True
+
+    @property
+    def spooled_bytes(self) -> int:
+        """Body bytes currently waiting on disk."""
+        return self._spool_write - self._spool_read
+
+    def feed(self, chunk: Optional[bytes]) -> None:
+        """Append a chunk; ``None`` marks the end of the body."""
+        with self._cond:
+            if chunk is None:
+                self._eof = True
+            elif self.spooled_bytes or len(self._memory) >= self.max_memory_chunks:
+                if self._spool is None:
+                    self._spool = tempfile.TemporaryFile()
+                self._spool.seek(self._spool_write)
+                self._spool.write(chunk)
+                self._spool_write += len(chunk)
+            else:
+                self._memory.append(chunk)
+            self._cond.notify()
+
+    def abort(self) -> None:
+        with self._cond:
+            self._aborted = True
+            self._cond.notify_all()
+
+    def _next_chunk(self, size: int) -> Optional[bytes]:
+        # Called with the lock held; memory chunks always precede spooled bytes
+        if self._memory:
+            return self._memory.popleft()
+        if self.spooled_bytes:
+            spool = self._spool
+            assert spool is not None  # spooled bytes imply feed() created the file
+            spool.seek(self._spool_read)
+            data = spool.read(min(max(size, 65536), self.spooled_bytes))
+            self._spool_read += len(data)
+            if not self.spooled_bytes:
+                self._spool_read = self._spool_write = 0
+                spool.truncate(0)
+            return data
+        return None
+
+    def readinto(self, buffer) -> int:
+        if not self._current:
+            with self._cond:
+                while True:
+                    if self._aborted:
+                        raise IOError("Request body stream aborted")
+                    chunk = self._next_chunk(len(buffer))
+                    if chunk is not None or self._eof:
+                        break
+                    self._cond.wait()
+            if chunk is None:
+                return 0
+            self._current = memoryview(chunk)
+        n = min(len(buffer), len(self._current))
+        buffer[:n] = self._current[:n]
+        self._current = self._current[n:]
+        return n
+
+    def close(self) -> None:
+        with self._cond:
+            if self._spool is not None:
+                self._spool.close()
+                self._spool = None
+        super().close()
+
+
+async def pump_body(body: AsyncIterator[bytes], reader: BodyReader) -> None:
+    """Copy the ASGI request body into ``reader`` as fast as the client sends it."""
+    try:
+        async for chunk in body:
+            if chunk:
+                reader.feed(bytes(chunk))
+    finally:
+        reader.feed(None)
+
+
+# --- Parsers (run on a worker thread) ---
+
+
+def iter_ndjson_chunks(fileobj: io.RawIOBase, chunk_size: int) -> Iterator[Chunk]:
+    """Yield DataFrames of up to ``chunk_size`` NDJSON records; blank lines are skipped."""
+    records: List[Dict[str, Any]] = []
+    parse_errors: List[Optional[str]] = []
+    for line in io.BufferedReader(fileobj):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError
+            records.append(record)
+            parse_errors.append(None)
+        except ValueError:
+            records.append({})
+            parse_errors.append("invalid JSON object")
+        if len(records) >= chunk_size:
+            yield pd.DataFrame(records), parse_errors
+            records, parse_errors = [], []
+    if records:
+        yield pd.DataFrame(records), parse_errors
+
+
+def iter_arrow_chunks(fileobj: io.RawIOBase, chunk_size: int) -> Iterator[Chunk]:
+    """Re-chunk an Arrow IPC stream into DataFrames of ``chunk_size`` rows."""
+    reader = pa.ipc.open_stream(fileobj)
+    pending: List[Any] = []
+    pending_rows = 0
+    for batch in reader:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        while pending_rows >= chunk_size:
+            table = pa.Table.from_batches(pending, schema=reader.schema)
+            yield table.slice(0, chunk_size).to_pandas(), None
+            rest = table.slice(chunk_size)
+            pending, pending_rows = rest.to_batches(), rest.num_rows
+    if pending_rows:
+        yield pa.Table.from_batches(pending, schema=reader.schema).to_pandas(), None
+
+
+# --- Encoders ---
+
+
+class ResultEncoder(Protocol):
+    """Serializes scored chunks, a trailing error and the end of a response stream."""
+
+    media_type: str
+
+    def encode(self, frame: pd.DataFrame) -> bytes:
+        ...
+
+    def error(self, message: str) -> bytes:
+        ...
+
+    def finish(self) -> bytes:
+        ...
+
+
+class NDJSONEncoder:
+    media_type = NDJSON_MEDIA_TYPE
+
+    def encode(self, frame: pd.DataFrame) -> bytes:
+        columns = list(frame.columns)
+        # object dtype turns NaN into None so invalid rows serialize as null
+        values = frame.astype(object).where(frame.notna(), None).to_numpy().tolist()
+        if ORJSON_AVAILABLE:
+            return b"".join(orjson.dumps(dict(zip(columns, row))) + b"\n" for row in values)
+        return "".join(json.dumps(dict(zip(columns, row))) + "\n" for row in values).encode("utf-8")
+
+    def error(self, message: str) -> bytes:
+        return (json.dumps({"error": message}) + "\n").encode("utf-8")
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class ArrowEncoder:
+    media_type = ARROW_STREAM_MEDIA_TYPE
+
+    def __init__(self):
+        self._sink = io.BytesIO()
+        self._writer = None
+        self._schema = None
+
+    def _drain(self) -> bytes:
+        data = self._sink.getvalue()
+        self._sink.seek(0)
+        self._sink.truncate()
+        return data
+
+    def encode(self, frame: pd.DataFrame) -> bytes:
+        if self._writer is None:
+            self._schema = pa.Schema.from_pandas(frame, preserve_index=False)
+            self._writer = pa.ipc.new_stream(self._sink, self._schema)
+        self._writer.write_batch(pa.RecordBatch.from_pandas(frame, schema=self._schema, preserve_index=False))
+        return self._drain()
+
+    def error(self, message: str) -> bytes:
+        # Arrow streams have no in-band error record; ending the stream early signals failure
+        return b""
+
+    def finish(self) -> bytes:
+        if self._writer is None:
+            return b""
+        self._writer.close()
+        return self._drain()
+
+
+# --- Driver ---
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """StreamingResponse that can keep reading the request body while responding.
+
+    Starlette's ``StreamingResponse`` detects client disconnects by consuming
+    ``receive()``, which would steal body messages from the request stream.
+    Here a disconnect ends the request stream or fails the next ``send``.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def score_stream(
+    body: AsyncIterator[bytes],
+    media_type: str,
+    chunk_size: int,
+    rules: Sequence[FieldRule],
+    score: ScoreFn,
+    result_dtypes: Dict[str, str],
+    id_column: Optional[str] = None,
+    observer: Optional[Callable[[int, int], None]] = None,
+) -> AsyncIterator[bytes]:
+    """Parse, validate, score and encode a streamed body chunk by chunk.
+
+    Args:
+        body: Async iterator over raw request body bytes.
+        media_type: ``NDJSON_MEDIA_TYPE`` or ``ARROW_STREAM_MEDIA_TYPE``.
+        chunk_size: Rows parsed, validated and scored together.
+        rules: Column validation rules (see :func:`rules_from_model`).
+        score: Async callable mapping a validated feature frame to a frame of
+            output columns with the same index.
+        result_dtypes: Output columns produced by ``score`` and their
+            (nullable) pandas dtypes, so every chunk shares one schema even
+            when all of its rows are invalid.
+        id_column: Optional input column echoed back with every result.
+        observer: Optional ``(valid_rows, invalid_rows)`` callback per chunk.
+
+    Yields:
+        Encoded output bytes. Each row carries its 0-based position in the
+        input (``row``), the scored columns and an ``error`` (null if valid).
+    """
+    reader = BodyReader()
+    parse = iter_arrow_chunks if media_type == ARROW_STREAM_MEDIA_TYPE else iter_ndjson_chunks
+    encoder: ResultEncoder
+    if media_type == ARROW_STREAM_MEDIA_TYPE:
+        encoder = ArrowEncoder()
+    else:
+        encoder = NDJSONEncoder()
+    chunks = parse(reader, chunk_size)
+    pump = asyncio.ensure_future(pump_body(body, reader))
+    loop = asyncio.get_running_loop()
+    offset = 0
+    try:
+        while True:
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                break
+            frame, parse_errors = chunk
+            features, errors = validate_chunk(frame, rules)
+            if parse_errors is not None:
+                parsed = np.array([e is None for e in parse_errors])
+                errors[~parsed] = np.array(parse_errors, dtype=object)[~parsed]
+            valid = pd.isna(errors)
+
+            output = pd.DataFrame({"row": np.arange(offset, offset + len(frame), dtype=np.int64)}, index=frame.index)
+            if id_column is not None and id_column in frame.columns:
+                output[id_column] = frame[id_column]
+            scored = await score(features[valid]) if valid.any() else pd.DataFrame(index=frame.index[:0])
+            for column, dtype in result_dtypes.items():
+                values = scored[column] if column in scored else pd.Series(dtype=dtype)
+                output[column] = values.astype(dtype).reindex(output.index)
+            output["error"] = pd.Series(errors, index=output.index, dtype="string")
+            if observer is not None:
+                observer(int(valid.sum()), int((~valid).sum()))
+
+            offset += len(frame)
+            yield encoder.encode(output)
+        yield encoder.finish()
+    except Exception as e:
+        logger.error(f"Streaming scoring failed after {offset} rows: {e}")
+        yield encoder.error(str(e))
+    finally:
+        reader.abort()
+        pump.cancel()
+        reader.close()
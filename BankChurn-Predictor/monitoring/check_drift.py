@@ -7,6 +7,7 @@ from typing import Dict, List
 
 import numpy as np
 import pandas as pd
+from common_utils.feature_cache import read_csv
 
 try:
     from evidently import ColumnMapping  # type: ignore
@@ -94,8 +95,8 @@ def main() -> None:
     ap.add_argument("--report-html", default=None, help="Optional Evidently HTML path")
     args = ap.parse_args()
 
-    ref = pd.read_csv(args.ref)
-    cur = pd.read_csv(args.cur)
+    ref = read_csv(args.ref, prefix="BANKCHURN_")
+    cur = read_csv(args.cur, prefix="BANKCHURN_")
     cols = [c for c in args.cols if c in ref.columns and c in cur.columns]
     drift = compute_drift(ref, cur, cols)
 
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Dict, Tuple
 
 import pandas as pd
+from common_utils.feature_cache import read_csv
 from evidently import Report
 from evidently.presets import DataDriftPreset
 
@@ -23,10 +24,10 @@ logger = logging.getLogger(__name__)
 def load_data(reference_path: str, current_path: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Load reference and current datasets."""
     logger.info(f"Loading reference data from: {reference_path}")
-    reference_data = pd.read_csv(reference_path)
+    reference_data = read_csv(reference_path, prefix="BANKCHURN_")
 
     logger.info(f"Loading current data from: {current_path}")
-    current_data = pd.read_csv(current_path)
+    current_data = read_csv(current_path, prefix="BANKCHURN_")
 
     return reference_data, current_data
 
@@ -0,0 +1,122 @@
+"""Throughput benchmark for /predict_batch response assembly.
+
+Compares the previous per-row construction (``iterrows`` + one pydantic
+``PredictionResponse`` and one ``strftime`` per customer) with the vectorized
+row and columnar formats. Model scoring is excluded: probabilities are
+synthetic so only response building and JSON serialization are measured.
+
+Usage:
+    python scripts/benchmark_batch_response.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from app.fastapi_app import (  # noqa: E402
+    BatchPredictionResponse,
+    PredictionResponse,
+    batch_columns_to_rows,
+    build_batch_columns,
+    calculate_feature_contributions,
+    calculate_feature_contributions_batch,
+    json_response,
+)
+from src.bankchurn.postprocessing import (  # noqa: E402
+    ChurnScores,
+    calculate_confidence,
+    determine_risk_level,
+    postprocess,
+)
+
+
+def _customers(n: int, rng: np.random.Generator) -> list[dict]:
+    return [
+        {
+            "CreditScore": int(rng.integers(300, 851)),
+            "Geography": str(rng.choice(["France", "Spain", "Germany"])),
+            "Gender": str(rng.choice(["Male", "Female"])),
+            "Age": int(rng.integers(18, 91)),
+            "Tenure": int(rng.integers(0, 11)),
+            "Balance": float(rng.uniform(0, 250000)),
+            "NumOfProducts": int(rng.integers(1, 5)),
+            "HasCrCard": int(rng.integers(0, 2)),
+            "IsActiveMember": int(rng.integers(0, 2)),
+            "EstimatedSalary": float(rng.uniform(10000, 200000)),
+        }
+        for _ in range(n)
+    ]
+
+
+def legacy(customers: list[dict], results: pd.DataFrame) -> bytes:
+    predictions = []
+    for i, row in results.iterrows():
+        prob = float(row["probability"])
+        predictions.append(
+            PredictionResponse(
+                churn_probability=prob,
+                churn_prediction=int(row["prediction"]),
+                risk_level=determine_risk_level(prob),
+                confidence=calculate_confidence(prob),
+                feature_contributions=calculate_feature_contributions(customers[i]),
+                model_version="1.0.0",
+                prediction_timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            )
+        )
+    response = BatchPredictionResponse(
+        predictions=predictions, batch_id="batch", total_customers=len(customers), processing_time_seconds=0.0
+    )
+    return response.model_dump_json().encode("utf-8")
+
+
+def vectorized(customers: list[dict], scores: ChurnScores, columnar: bool) -> bytes:
+    columns = build_batch_columns(scores, calculate_feature_contributions_batch(customers))
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ")
+    meta = {"batch_id": "batch", "total_customers": len(customers), "processing_time_seconds": 0.0}
+    if columnar:
+        payload = {**meta, "model_version": "1.0.0", "prediction_timestamp": timestamp, **columns}
+    else:
+        payload = {"predictions": batch_columns_to_rows(columns, "1.0.0", timestamp), **meta}
+    return json_response(payload).body
+
+
+def _rows_per_second(fn, rows: int, repeats: int) -> float:
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return rows * repeats / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print(f"{'rows':>6}{'legacy rows/s':>16}{'rows rows/s':>16}{'columnar rows/s':>18}{'speedup':>10}")
+    for rows in (10, 100, 1000):
+        customers = _customers(rows, rng)
+        proba = rng.uniform(size=rows)
+        results = pd.DataFrame({"prediction": (proba >= 0.5).astype(int), "probability": proba})
+        scores = postprocess(proba)
+        repeats = max(5, args.repeats * 10 // rows)
+
+        before = _rows_per_second(lambda: legacy(customers, results), rows, repeats)
+        after_rows = _rows_per_second(lambda: vectorized(customers, scores, columnar=False), rows, repeats)
+        after_cols = _rows_per_second(lambda: vectorized(customers, scores, columnar=True), rows, repeats)
+        print(f"{rows:>6}{before:>16,.0f}{after_rows:>16,.0f}{after_cols:>18,.0f}{after_cols / before:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
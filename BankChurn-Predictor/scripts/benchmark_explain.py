@@ -0,0 +1,104 @@
+"""Explanation throughput benchmark: rows/sec of the SHAP and exact paths.
+
+Compares, one row at a time and as one batch:
+
+- ``kernel``: KernelExplainer on the full model (model agnostic, sampling based)
+- ``tree``: TreeExplainer on the first tree-ensemble member of the model
+  (the RandomForest of the default voting ensemble) behind the same preprocessor
+- ``exact``: structural contributions (``ChurnPredictor.explain``)
+
+Usage:
+    python scripts/benchmark_explain.py --model models/best_model.pkl --data data/raw/Churn.csv --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import joblib
+import pandas as pd
+from sklearn.pipeline import Pipeline
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from src.bankchurn.explainability import ModelExplainer, _is_tree_model  # noqa: E402
+from src.bankchurn.prediction import ChurnPredictor  # noqa: E402
+
+FEATURES = [
+    "CreditScore",
+    "Geography",
+    "Gender",
+    "Age",
+    "Tenure",
+    "Balance",
+    "NumOfProducts",
+    "HasCrCard",
+    "IsActiveMember",
+    "EstimatedSalary",
+]
+
+
+def _tree_member(estimator: Any) -> Optional[Any]:
+    """First estimator supported by TreeExplainer, searching resampling wrappers and voting members."""
+    if _is_tree_model(estimator):
+        return estimator
+    for inner in (getattr(estimator, "estimator_", None), *getattr(estimator, "estimators_", [])):
+        found = _tree_member(inner) if inner is not None else None
+        if found is not None:
+            return found
+    return None
+
+
+def _rows_per_second(fn, rows: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return rows / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default="models/best_model.pkl")
+    parser.add_argument("--data", default="data/raw/Churn.csv")
+    parser.add_argument("--rows", type=int, default=200, help="Rows explained per path (kernel uses a tenth)")
+    parser.add_argument("--nsamples", type=int, default=200, help="KernelExplainer model evaluations per row")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    model = joblib.load(args.model)
+    data = pd.read_csv(args.data)[FEATURES]
+    background = data.sample(100, random_state=0)
+
+    paths = {"kernel": ModelExplainer(model, background, method="kernel", kernel_nsamples=args.nsamples)}
+    tree = _tree_member(model.named_steps["classifier"])
+    if tree is not None:
+        tree_model = Pipeline([("preprocessor", model.named_steps["preprocessor"]), ("classifier", tree)])
+        paths["tree"] = ModelExplainer(tree_model, background, method="tree")
+    predictor = ChurnPredictor(model, compiled=True)
+
+    print(f"{'path':<8}{'rows':>6}{'single rows/s':>16}{'batch rows/s':>15}{'workers rows/s':>17}")
+    for name, explainer in paths.items():
+        rows = max(1, args.rows // 10) if name == "kernel" else args.rows
+        batch = data.head(rows)
+        single = _rows_per_second(lambda: [explainer.explain_batch(batch.iloc[[i]]) for i in range(rows)], rows)
+        batched = _rows_per_second(lambda: explainer.explain_batch(batch), rows)
+        pooled = (
+            f"{_rows_per_second(lambda: explainer.explain_batch(batch, n_jobs=args.workers), rows):>17.1f}"
+            if args.workers > 1
+            else f"{'-':>17}"
+        )
+        print(f"{name:<8}{rows:>6}{single:>16.1f}{batched:>15.1f}{pooled}")
+
+    batch = data.head(args.rows)
+    single = _rows_per_second(lambda: [predictor.explain(batch.iloc[[i]]) for i in range(args.rows)], args.rows)
+    batched = _rows_per_second(lambda: predictor.explain(batch), args.rows)
+    print(f"{'exact':<8}{args.rows:>6}{single:>16.1f}{batched:>15.1f}{'-':>17}")
+
+
+if __name__ == "__main__":
+    main()
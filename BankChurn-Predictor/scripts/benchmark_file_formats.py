@@ -0,0 +1,125 @@
+"""End-to-end batch scoring time and peak RSS: CSV vs Parquet vs Feather.
+
+Generates a synthetic churn file (``--rows``, default 10M) in each format,
+then scores it in a fresh subprocess per configuration so peak RSS is
+measured in isolation. Parquet/Feather inputs are written with one row group
+(record batch) per ``--chunksize`` rows; outputs use the input's format.
+
+Usage:
+    python scripts/benchmark_file_formats.py --model models/best_model.pkl --rows 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from common_utils.tabular_io import TableWriter
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from src.bankchurn.prediction import ChurnPredictor  # noqa: E402
+
+SUFFIXES = {"csv": ".csv", "parquet": ".parquet", "feather": ".feather"}
+
+
+def _synthetic_block(start: int, n: int, rng: np.random.Generator) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "RowNumber": np.arange(start + 1, start + n + 1),
+            "CustomerId": 15_000_000 + np.arange(start, start + n),
+            "Surname": rng.choice(["Smith", "Garcia", "Muller", "Rossi", "Dubois"], n),
+            "CreditScore": rng.integers(350, 851, n),
+            "Geography": rng.choice(["France", "Spain", "Germany"], n),
+            "Gender": rng.choice(["Male", "Female"], n),
+            "Age": rng.integers(18, 93, n),
+            "Tenure": rng.integers(0, 11, n),
+            "Balance": np.round(rng.uniform(0, 250_000, n) * (rng.random(n) > 0.35), 2),
+            "NumOfProducts": rng.integers(1, 5, n),
+            "HasCrCard": rng.integers(0, 2, n),
+            "IsActiveMember": rng.integers(0, 2, n),
+            "EstimatedSalary": np.round(rng.uniform(10, 200_000, n), 2),
+        }
+    )
+
+
+def build_inputs(rows: int, chunksize: int, directory: Path, formats: list[str]) -> dict[str, Path]:
+    """Write the same synthetic rows in each of ``formats``."""
+    paths = {fmt: directory / f"churn{SUFFIXES[fmt]}" for fmt in formats}
+    writers = [TableWriter(path) for path in paths.values()]
+    rng = np.random.default_rng(42)
+    for start in range(0, rows, chunksize):
+        block = _synthetic_block(start, min(chunksize, rows - start), rng)
+        for writer in writers:
+            writer.write(block)
+    for writer in writers:
+        writer.close()
+    return paths
+
+
+def score(args: argparse.Namespace) -> None:
+    """Child process: score one file and print timing and peak RSS as JSON."""
+    start = time.perf_counter()
+    predictor = ChurnPredictor.from_files(args.model)
+    if args.chunked:
+        n_rows = predictor.predict_batch_chunked(
+            args.score, args.output, chunksize=args.chunksize, prune_columns=args.prune, id_columns=["CustomerId"]
+        )
+    else:
+        scored = predictor.predict_batch(args.score, args.output, prune_columns=args.prune, id_columns=["CustomerId"])
+        n_rows = len(scored)
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"rows": n_rows, "seconds": time.perf_counter() - start, "peak_rss_mb": peak_kb / 1024}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="models/best_model.pkl")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--formats", default="csv,parquet,feather", help="Comma-separated formats to compare")
+    parser.add_argument("--in-memory", action="store_true", help="Also benchmark whole-file predict_batch")
+    parser.add_argument("--score", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    parser.add_argument("--chunked", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--prune", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.score:
+        score(args)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        inputs = build_inputs(args.rows, args.chunksize, Path(tmp), args.formats.split(","))
+        print(f"generated {args.rows:,} rows in {time.perf_counter() - start:.0f}s")
+        for fmt, path in inputs.items():
+            print(f"  {fmt:<8}{path.stat().st_size / 1e6:>10,.0f} MB")
+
+        modes = [("chunked", True, False), ("chunked+prune", True, True)]
+        if args.in_memory:
+            modes.insert(0, ("in-memory", False, False))
+        print(f"{'format':<10}{'mode':<16}{'seconds':>10}{'rows/sec':>12}{'peak RSS MB':>14}")
+        for fmt, path in inputs.items():
+            for label, chunked, prune in modes:
+                cmd = [sys.executable, __file__, "--model", args.model, "--score", str(path)]
+                cmd += ["--output", str(Path(tmp) / f"scored{SUFFIXES[fmt]}"), "--chunksize", str(args.chunksize)]
+                cmd += ["--chunked"] * chunked + ["--prune"] * prune
+                child = subprocess.run(cmd, check=True, capture_output=True, text=True)
+                result = json.loads(child.stdout.splitlines()[-1])
+                seconds, peak = result["seconds"], result["peak_rss_mb"]
+                print(f"{fmt:<10}{label:<16}{seconds:>10.1f}{result['rows'] / seconds:>12,.0f}{peak:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Single-row and batch latency benchmark: scikit-learn vs compiled inference.
+
+The ``explain`` rows time exact feature contributions (``ChurnPredictor.explain``).
+
+Usage:
+    python scripts/benchmark_inference.py --model models/best_model.pkl --data data/raw/Churn.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from src.bankchurn.prediction import ChurnPredictor  # noqa: E402
+
+FEATURES = [
+    "CreditScore",
+    "Geography",
+    "Gender",
+    "Age",
+    "Tenure",
+    "Balance",
+    "NumOfProducts",
+    "HasCrCard",
+    "IsActiveMember",
+    "EstimatedSalary",
+]
+
+
+def _latencies(fn, repeats: int) -> np.ndarray:
+    timings = np.empty(repeats)
+    for i in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings[i] = time.perf_counter() - start
+    return timings * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default="models/best_model.pkl")
+    parser.add_argument("--data", default="data/raw/Churn.csv")
+    parser.add_argument("--repeats", type=int, default=500)
+    args = parser.parse_args()
+
+    model = joblib.load(args.model)
+    data = pd.read_csv(args.data)[FEATURES]
+    records = data.head(1).to_dict(orient="records")
+
+    sklearn_predictor = ChurnPredictor(model)
+    compiled_predictor = ChurnPredictor(model, compiled=True)
+    if compiled_predictor.compiled_ is None:
+        raise SystemExit("Model could not be compiled")
+
+    max_diff = np.max(
+        np.abs(compiled_predictor.compiled_.predict_proba(data) - sklearn_predictor.model.predict_proba(data))
+    )
+    print(f"max |p_compiled - p_sklearn| over {len(data)} rows: {max_diff:.3e}")
+
+    print(f"{'path':<10}{'rows':>8}{'p50 ms':>10}{'p99 ms':>10}")
+    for rows in (1, 100, 1000):
+        batch = data.head(rows)
+        batch_records = batch.to_dict(orient="records") if rows > 1 else records
+        repeats = args.repeats if rows == 1 else max(20, args.repeats // 10)
+        paths = (
+            ("sklearn", lambda: sklearn_predictor.predict(batch_records)),
+            ("compiled", lambda: compiled_predictor.predict(batch_records)),
+            ("explain", lambda: compiled_predictor.explain(batch_records)),
+        )
+        for name, fn in paths:
+            timings = _latencies(fn, repeats)
+            p50, p99 = np.percentile(timings, [50, 99])
+            print(f"{name:<10}{rows:>8}{p50:>10.3f}{p99:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
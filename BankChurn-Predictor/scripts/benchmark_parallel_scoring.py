@@ -0,0 +1,80 @@
+"""Batch scoring throughput (rows/sec) vs worker-process count.
+
+Replicates the training CSV up to ``--rows`` rows, then scores it with
+``predict_csv_parallel`` for each worker count. Use it to size batch nodes.
+
+Usage:
+    python scripts/benchmark_parallel_scoring.py --model models/best_model.pkl --rows 2000000 --workers 1,2,4,8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from src.bankchurn.parallel import predict_csv_parallel  # noqa: E402
+
+
+def _build_input(data_path: str, rows: int, path: Path) -> None:
+    data = pd.read_csv(data_path)
+    written = 0
+    with open(path, "w", newline="") as f:
+        while written < rows:
+            block = data.head(rows - written)
+            block.to_csv(f, index=False, header=written == 0)
+            written += len(block)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="models/best_model.pkl")
+    parser.add_argument("--data", default="data/raw/Churn.csv")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument(
+        "--workers", default=None, help="Comma-separated worker counts (default: 1,2,4,... up to cores)"
+    )
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--compiled", action="store_true", help="Use the compiled NumPy inference path")
+    args = parser.parse_args()
+
+    if args.workers:
+        worker_counts = [int(w) for w in args.workers.split(",")]
+    else:
+        cores = os.cpu_count() or 1
+        worker_counts = sorted({1, *(2**i for i in range(1, cores.bit_length()) if 2**i <= cores), cores})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "input.csv"
+        _build_input(args.data, args.rows, input_path)
+        print(f"input: {args.rows:,} rows, {input_path.stat().st_size / 1e6:.0f} MB, {os.cpu_count()} cores")
+        print(f"{'workers':>8}{'seconds':>10}{'rows/sec':>14}{'speedup':>10}")
+
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            n_rows = predict_csv_parallel(
+                args.model,
+                input_path,
+                Path(tmp) / "output.csv",
+                workers=workers,
+                chunksize=args.chunksize,
+                compiled=args.compiled,
+            )
+            elapsed = time.perf_counter() - start
+            throughput = n_rows / elapsed
+            baseline = baseline or throughput
+            print(f"{workers:>8}{elapsed:>10.1f}{throughput:>14,.0f}{throughput / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
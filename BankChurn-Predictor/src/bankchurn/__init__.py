@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+from .compiled import CompiledChurnModel
+from .contributions import FeatureContributions
 from .evaluation import ModelEvaluator
 from .explainability import ModelExplainer
-from .models import ResampleClassifier
+from .models import FoldEnsembleClassifier, ResampleClassifier
+from .postprocessing import ChurnScores
 from .prediction import ChurnPredictor
 from .training import ChurnTrainer
 
 __all__ = [
     "ResampleClassifier",
+    "FoldEnsembleClassifier",
     "ChurnPredictor",
+    "ChurnScores",
+    "CompiledChurnModel",
+    "FeatureContributions",
     "ChurnTrainer",
     "ModelEvaluator",
     "ModelExplainer",
@@ -4,7 +4,8 @@ This module provides the main CLI entry point with subcommands for:
 - train: Train a new model
 - evaluate: Evaluate a trained model
 - predict: Make predictions on new data
-- hyperopt: Hyperparameter optimization
+- explain: SHAP feature contributions for new data
+- tune: Hyperparameter optimization with Optuna
 """
 
 from __future__ import annotations
@@ -12,13 +13,16 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import Sequence
 
-import pandas as pd
+from common_utils.feature_cache import read_csv
+from common_utils.tabular_io import read_table, write_table
 
 from .config import BankChurnConfig
 from .evaluation import ModelEvaluator
+from .parallel import predict_csv_parallel
 from .prediction import ChurnPredictor
 from .training import ChurnTrainer
 
@@ -43,6 +47,8 @@ def setup_logging(log_file: str = "bankchurn.log", level: int = logging.INFO) ->
             logging.StreamHandler(sys.stdout),
         ],
     )
+    # KernelExplainer logs every explained row at INFO
+    logging.getLogger("shap").setLevel(max(level, logging.WARNING))
 
 
 def train_command(args: argparse.Namespace) -> int:
@@ -86,7 +92,7 @@ def train_command(args: argparse.Namespace) -> int:
             metrics_path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(metrics_path, "w") as f:
-                json.dump(metrics, f, indent=2)
+                json.dump({**metrics, "cv_folds": trainer.cv_results_}, f, indent=2)
 
             logger.info(f"Metrics saved to {metrics_path}")
 
@@ -116,7 +122,7 @@ def evaluate_command(args: argparse.Namespace) -> int:
         evaluator = ModelEvaluator.from_files(args.model, args.preprocessor)
 
         # Load data
-        data = pd.read_csv(args.input)
+        data = read_csv(args.input, prefix="BANKCHURN_")
         logger.info(f"Loaded {len(data)} samples for evaluation")
 
         # Prepare data (assuming config for column names)
@@ -164,18 +170,53 @@ def predict_command(args: argparse.Namespace) -> int:
         0 for success, non-zero for failure.
     """
     try:
+        inputs = [args.input] if isinstance(args.input, str) else list(args.input)
+        id_columns = args.id_columns.split(",") if args.id_columns else None
+
+        # Multi-process: shard files (or byte ranges of one file) across workers
+        if args.workers > 1 or len(inputs) > 1:
+            n_rows = predict_csv_parallel(
+                model_path=args.model,
+                input_paths=inputs,
+                output_path=args.output,
+                workers=args.workers,
+                preprocessor_path=args.preprocessor,
+                chunksize=args.chunksize or 100_000,
+                include_proba=not args.no_proba,
+                threshold=args.threshold,
+                prune_columns=args.prune_columns,
+                id_columns=id_columns,
+            )
+            logger.info(f"Predictions saved: {n_rows} rows")
+            logger.info("Prediction completed successfully")
+            return 0
+
         # Load model
         predictor = ChurnPredictor.from_files(args.model, args.preprocessor)
 
-        # Make predictions
-        predictions = predictor.predict_batch(
-            input_path=args.input,
-            output_path=args.output,
-            include_proba=not args.no_proba,
-            threshold=args.threshold,
-        )
-
-        logger.info(f"Predictions saved: {len(predictions)} rows")
+        # Make predictions (chunked mode keeps memory flat for large files)
+        if args.chunksize:
+            n_rows = predictor.predict_batch_chunked(
+                input_path=inputs[0],
+                output_path=args.output,
+                chunksize=args.chunksize,
+                include_proba=not args.no_proba,
+                threshold=args.threshold,
+                prune_columns=args.prune_columns,
+                id_columns=id_columns,
+            )
+        else:
+            predictions = predictor.predict_batch(
+                input_path=inputs[0],
+                output_path=args.output,
+                include_proba=not args.no_proba,
+                threshold=args.threshold,
+                prune_columns=args.prune_columns,
+                id_columns=id_columns,
+            )
+            n_rows = len(predictions)
+
+        logger.info(f"Predictions saved: {n_rows} rows")
         logger.info("Prediction completed successfully")
         return 0
 
@@ -184,6 +225,99 @@ def predict_command(args: argparse.Namespace) -> int:
         return 1
 
 
+def explain_command(args: argparse.Namespace) -> int:
+    """Execute explain command.
+
+    Parameters
+    ----------
+    args : Namespace
+        Parsed command-line arguments.
+
+    Returns
+    -------
+    exit_code : int
+        0 for success, non-zero for failure.
+    """
+    try:
+        predictor = ChurnPredictor.from_files(args.model, args.preprocessor)
+        features = predictor.required_features
+
+        data = read_table(args.input, columns=features)
+        background = read_table(args.background, columns=features) if args.background else data
+        if args.rows:
+            data = data.head(args.rows)
+        nsamples = int(args.nsamples) if args.nsamples.isdigit() else args.nsamples
+
+        explainer = predictor.shap_explainer(
+            background,
+            max_background_samples=args.background_samples,
+            method=args.method,
+            kernel_nsamples=nsamples,
+        )
+        start = time.perf_counter()
+        result = explainer.explain_batch(data, n_jobs=args.workers)
+        elapsed = time.perf_counter() - start
+
+        output = result["contributions"].add_prefix("shap_")
+        output.insert(0, "base_value", result["base_value"])
+        output.insert(0, "probability", result["probabilities"])
+        output.insert(0, "prediction", result["predictions"])
+        write_table(output.reset_index(drop=True), args.output)
+
+        logger.info(
+            f"Explained {len(data)} rows with {result['method'] or result['explanation_type']} "
+            f"in {elapsed:.2f}s ({len(data) / elapsed:.1f} rows/s)"
+        )
+        logger.info(f"Explanations saved to {args.output}")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Explanation failed: {e}", exc_info=True)
+        return 1
+
+
+def tune_command(args: argparse.Namespace) -> int:
+    """Execute tune command.
+
+    Parameters
+    ----------
+    args : Namespace
+        Parsed command-line arguments.
+
+    Returns
+    -------
+    exit_code : int
+        0 for success, non-zero for failure.
+    """
+    try:
+        from .optimization import HyperparameterTuner, write_tuned_config
+
+        config = BankChurnConfig.from_yaml(args.config)
+        tuner = HyperparameterTuner(config, random_state=args.seed)
+
+        trainer = ChurnTrainer(config, random_state=args.seed)
+        X, y = trainer.prepare_features(trainer.load_data(args.input))
+
+        study = tuner.tune(
+            X,
+            y,
+            n_trials=args.n_trials,
+            timeout=args.timeout,
+            n_jobs=args.workers,
+            storage=args.storage,
+            study_name=args.study_name,
+        )
+        tuner.best_config()  # raises if no trial completed
+        write_tuned_config(args.config, study.best_params, args.output, score=study.best_value)
+
+        logger.info(f"Best CV F1 {study.best_value:.4f}; train with: train --config {args.output}")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Tuning failed: {e}", exc_info=True)
+        return 1
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser for CLI.
 
@@ -225,12 +359,78 @@ def create_parser() -> argparse.ArgumentParser:
 
     # Predict command
     predict_parser = subparsers.add_parser("predict", help="Make predictions on new data")
-    predict_parser.add_argument("--input", required=True, help="Path to input CSV")
-    predict_parser.add_argument("--output", required=True, help="Path to save predictions")
+    predict_parser.add_argument(
+        "--input",
+        required=True,
+        nargs="+",
+        help="Input CSV, Parquet or Feather file(s), format from the extension (several files are scored as shards)",
+    )
+    predict_parser.add_argument(
+        "--output", required=True, help="Path to save predictions (.csv, .parquet or .feather by extension)"
+    )
     predict_parser.add_argument("--model", required=True, help="Path to trained model")
     predict_parser.add_argument("--preprocessor", default=None, help="Path to preprocessor (optional)")
     predict_parser.add_argument("--threshold", type=float, default=0.5, help="Classification threshold")
     predict_parser.add_argument("--no-proba", action="store_true", help="Exclude probability scores")
+    predict_parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Score the input in chunks of this many rows (constant memory for large files)",
+    )
+    predict_parser.add_argument(
+        "--prune-columns",
+        action="store_true",
+        help="Read only the model's input features (plus --id-columns) from the input",
+    )
+    predict_parser.add_argument("--id-columns", help="Comma-separated ID columns to pass through when pruning")
+    predict_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes; >1 shards the input across a process pool and merges outputs in order",
+    )
+
+    # Explain command
+    explain_parser = subparsers.add_parser("explain", help="SHAP feature contributions for new data")
+    explain_parser.add_argument("--input", required=True, help="Input CSV, Parquet or Feather file")
+    explain_parser.add_argument(
+        "--output", required=True, help="Path to save contributions (.csv, .parquet or .feather by extension)"
+    )
+    explain_parser.add_argument("--model", required=True, help="Path to trained model")
+    explain_parser.add_argument("--preprocessor", default=None, help="Path to preprocessor (optional)")
+    explain_parser.add_argument("--background", help="Background sample file (default: the input)")
+    explain_parser.add_argument("--background-samples", type=int, default=100, help="Max background rows")
+    explain_parser.add_argument("--rows", type=int, default=None, help="Explain only the first N rows")
+    explain_parser.add_argument(
+        "--method",
+        default="auto",
+        choices=["auto", "tree", "kernel"],
+        help="SHAP explainer (auto: TreeExplainer for tree models, KernelExplainer otherwise)",
+    )
+    explain_parser.add_argument("--nsamples", default="auto", help="KernelExplainer model evaluations per row")
+    explain_parser.add_argument("--workers", type=int, default=1, help="Worker processes (-1 for all cores)")
+
+    # Tune command
+    tune_parser = subparsers.add_parser("tune", help="Hyperparameter optimization with Optuna")
+    tune_parser.add_argument("--config", required=True, help="Path to config YAML (search space and base settings)")
+    tune_parser.add_argument("--input", required=True, help="Path to input CSV")
+    tune_parser.add_argument(
+        "--output", default="configs/config.tuned.yaml", help="Config YAML to write with the best parameters"
+    )
+    tune_parser.add_argument("--n-trials", type=int, default=None, help="New trials to run (default: from config)")
+    tune_parser.add_argument(
+        "--timeout", type=float, default=None, help="Time budget in seconds (default: from config)"
+    )
+    tune_parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes running trials in parallel (-1 for all cores)"
+    )
+    tune_parser.add_argument(
+        "--storage",
+        default="sqlite:///optuna_bankchurn.db",
+        help="Optuna storage URL; rerunning with the same storage and study name resumes the study",
+    )
+    tune_parser.add_argument("--study-name", default="bankchurn", help="Optuna study name")
 
     return parser
 
@@ -272,6 +472,10 @@ def cli_main(argv: Sequence[str] | None = None) -> int:
         return evaluate_command(args)
     elif args.command == "predict":
         return predict_command(args)
+    elif args.command == "explain":
+        return explain_command(args)
+    elif args.command == "tune":
+        return tune_command(args)
     else:
         logger.error(f"Unknown command: {args.command}")
         return 1
@@ -0,0 +1,472 @@
+"""Compiled fast-path inference for fitted churn pipelines.
+
+This module flattens a fitted ``Pipeline(preprocessor, classifier)`` produced
+by :class:`~src.bankchurn.training.ChurnTrainer` into plain NumPy arrays:
+
+- imputer statistics, scaler means/scales and one-hot category lookups
+- LogisticRegression coefficients and intercept
+- RandomForest trees concatenated into a single node table
+
+Evaluation is fully vectorized and skips the per-call validation done by
+scikit-learn, which dominates latency for single-row requests. Probabilities
+match the scikit-learn path to within floating point summation order (1e-9).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy.special import expit
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestClassifier, VotingClassifier
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from .models import FoldEnsembleClassifier, ResampleClassifier
+
+logger = logging.getLogger(__name__)
+
+
+class CompilationError(ValueError):
+    """Raised when a fitted model cannot be compiled to the fast path."""
+
+
+def _column(X: Any, name: str) -> np.ndarray:
+    """Extract a single input column from a DataFrame, mapping or list of records."""
+    if isinstance(X, pd.DataFrame):
+        return X[name].to_numpy()
+    if isinstance(X, Mapping):
+        return np.asarray(X[name])
+    return np.asarray([record.get(name) for record in X], dtype=object)
+
+
+def _n_rows(X: Any) -> int:
+    if isinstance(X, pd.DataFrame):
+        return len(X)
+    if isinstance(X, Mapping):
+        return len(next(iter(X.values()))) if X else 0
+    return len(X)
+
+
+def _is_missing(values: np.ndarray) -> np.ndarray:
+    """Vectorized ``None``/``NaN`` mask for object or numeric arrays."""
+    if values.dtype.kind == "f":
+        return np.isnan(values)
+    if values.dtype.kind == "O":
+        return pd.isna(values)
+    return np.zeros(values.shape, dtype=bool)
+
+
+class _NumericBlock:
+    """Median/constant imputation followed by optional standard scaling."""
+
+    def __init__(self, columns: list[str], fill: np.ndarray, mean: np.ndarray, scale: np.ndarray) -> None:
+        self.columns = columns
+        self.fill = fill
+        self.mean = mean
+        self.scale = scale
+
+    @property
+    def width(self) -> int:
+        return len(self.columns)
+
+    def transform(self, X: Any, out: np.ndarray) -> None:
+        for j, name in enumerate(self.columns):
+            values = np.asarray(_column(X, name), dtype=np.float64)
+            missing = np.isnan(values)
+            if missing.any():
+                values = np.where(missing, self.fill[j], values)
+            out[:, j] = values
+        out -= self.mean
+        out /= self.scale
+
+
+class _OneHotBlock:
+    """Constant/most-frequent imputation followed by one-hot encoding."""
+
+    def __init__(
+        self,
+        columns: list[str],
+        fill: list[Any],
+        lookups: list[dict[Any, int]],
+        widths: list[int],
+        n_categories: list[int] | None = None,
+    ) -> None:
+        self.columns = columns
+        self.fill = fill
+        self.lookups = lookups
+        self.widths = widths
+        # Fitted categories per column, including a dropped one
+        self.n_categories = n_categories if n_categories is not None else list(widths)
+        self.offsets = np.concatenate([[0], np.cumsum(widths)[:-1]]).astype(int)
+
+    @property
+    def width(self) -> int:
+        return int(sum(self.widths))
+
+    def transform(self, X: Any, out: np.ndarray) -> None:
+        out[:] = 0.0
+        rows = np.arange(out.shape[0])
+        for j, name in enumerate(self.columns):
+            values = np.asarray(_column(X, name), dtype=object)
+            missing = _is_missing(values)
+            if missing.any():
+                values = np.where(missing, self.fill[j], values)
+            lookup = self.lookups[j]
+            # -1 marks unknown or dropped categories, which encode to all zeros
+            codes = np.fromiter((lookup.get(v, -1) for v in values), dtype=np.intp, count=len(values))
+            hit = codes >= 0
+            out[rows[hit], self.offsets[j] + codes[hit]] = 1.0
+
+
+class CompiledChurnModel:
+    """Flat NumPy evaluator for a fitted preprocessing + soft-voting ensemble.
+
+    Parameters
+    ----------
+    blocks : list
+        Ordered preprocessing blocks mirroring the ColumnTransformer output.
+    members : list of tuple
+        ``(kind, params)`` for each ensemble member, where ``kind`` is
+        ``"linear"`` or ``"forest"``.
+    weights : ndarray or None
+        Soft-voting weights aligned with ``members``.
+    classes : ndarray
+        Class labels in predict_proba column order.
+
+    Examples
+    --------
+    >>> compiled = CompiledChurnModel.from_pipeline(pipeline)
+    >>> proba = compiled.predict_proba([{"CreditScore": 600, "Geography": "France", ...}])
+    """
+
+    def __init__(
+        self,
+        blocks: list[_NumericBlock | _OneHotBlock],
+        members: list[tuple[str, dict[str, np.ndarray]]],
+        weights: np.ndarray | None,
+        classes: np.ndarray,
+    ) -> None:
+        self.blocks = blocks
+        self.members = members
+        self.weights = weights
+        self.classes_ = classes
+        self.n_features_out_ = int(sum(block.width for block in blocks))
+        self.feature_names_in_ = [name for block in blocks for name in block.columns]
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_pipeline(cls, model: Any, preprocessor: Any = None) -> CompiledChurnModel:
+        """Compile a fitted model (and optional separate preprocessor).
+
+        Parameters
+        ----------
+        model : Pipeline or estimator
+            Either a ``Pipeline([("preprocessor", ...), ("classifier", ...)])``
+            or a bare classifier when ``preprocessor`` is given.
+        preprocessor : ColumnTransformer, optional
+            Fitted preprocessor for non-Pipeline (legacy) models.
+
+        Returns
+        -------
+        compiled : CompiledChurnModel
+
+        Raises
+        ------
+        CompilationError
+            If any component is not supported by the fast path.
+        """
+        if isinstance(model, Pipeline):
+            if len(model.steps) != 2:
+                raise CompilationError("Expected a two-step Pipeline (preprocessor, classifier)")
+            preprocessor = model.steps[0][1]
+            classifier = model.steps[1][1]
+        else:
+            classifier = model
+        if preprocessor is None:
+            raise CompilationError("A fitted preprocessor is required to compile the model")
+
+        blocks = cls._compile_preprocessor(preprocessor)
+        members, weights, classes = cls._compile_classifier(classifier)
+
+        compiled = cls(blocks, members, weights, classes)
+        logger.info(
+            f"Compiled model: {len(compiled.feature_names_in_)} inputs -> "
+            f"{compiled.n_features_out_} features, {len(members)} ensemble members"
+        )
+        return compiled
+
+    @staticmethod
+    def _compile_preprocessor(preprocessor: Any) -> list[_NumericBlock | _OneHotBlock]:
+        if not isinstance(preprocessor, ColumnTransformer):
+            raise CompilationError(f"Unsupported preprocessor: {type(preprocessor).__name__}")
+        if preprocessor.remainder != "drop":
+            raise CompilationError("Only remainder='drop' ColumnTransformers are supported")
+
+        blocks: list[_NumericBlock | _OneHotBlock] = []
+        for _, transformer, columns in preprocessor.transformers_:
+            if transformer == "drop" or len(columns) == 0:
+                continue
+            columns = list(columns)
+            steps = transformer.steps if isinstance(transformer, Pipeline) else [(None, transformer)]
+            imputer = next((s for _, s in steps if isinstance(s, SimpleImputer)), None)
+            scaler = next((s for _, s in steps if isinstance(s, StandardScaler)), None)
+            encoder = next((s for _, s in steps if isinstance(s, OneHotEncoder)), None)
+            known = sum(s is not None for s in (imputer, scaler, encoder))
+            if known != len(steps):
+                raise CompilationError(f"Unsupported transformer steps for columns {columns}")
+
+            if encoder is not None:
+                blocks.append(CompiledChurnModel._compile_onehot(columns, imputer, encoder))
+            else:
+                blocks.append(CompiledChurnModel._compile_numeric(columns, imputer, scaler))
+        return blocks
+
+    @staticmethod
+    def _compile_numeric(
+        columns: list[str], imputer: SimpleImputer | None, scaler: StandardScaler | None
+    ) -> _NumericBlock:
+        n = len(columns)
+        fill = np.full(n, np.nan)
+        if imputer is not None:
+            if imputer.add_indicator:
+                raise CompilationError("SimpleImputer(add_indicator=True) is not supported")
+            fill = np.asarray(imputer.statistics_, dtype=np.float64)
+        mean = np.zeros(n)
+        scale = np.ones(n)
+        if scaler is not None:
+            if scaler.mean_ is not None:
+                mean = np.asarray(scaler.mean_, dtype=np.float64)
+            if scaler.scale_ is not None:
+                scale = np.asarray(scaler.scale_, dtype=np.float64)
+        return _NumericBlock(columns, fill, mean, scale)
+
+    @staticmethod
+    def _compile_onehot(columns: list[str], imputer: SimpleImputer | None, encoder: OneHotEncoder) -> _OneHotBlock:
+        if getattr(encoder, "_infrequent_enabled", False):
+            raise CompilationError("OneHotEncoder with infrequent categories is not supported")
+        if encoder.handle_unknown not in ("ignore", "infrequent_if_exist"):
+            raise CompilationError("OneHotEncoder must use handle_unknown='ignore'")
+
+        fill = [None] * len(columns)
+        if imputer is not None:
+            fill = list(imputer.statistics_)
+
+        drop_idx = encoder.drop_idx_
+        lookups: list[dict[Any, int]] = []
+        widths: list[int] = []
+        for j, categories in enumerate(encoder.categories_):
+            dropped = None if drop_idx is None or drop_idx[j] is None else int(drop_idx[j])
+            lookup: dict[Any, int] = {}
+            position = 0
+            for index, category in enumerate(categories):
+                if index == dropped:
+                    continue
+                lookup[category] = position
+                position += 1
+            lookups.append(lookup)
+            widths.append(position)
+        return _OneHotBlock(columns, fill, lookups, widths, [len(c) for c in encoder.categories_])
+
+    @classmethod
+    def _compile_classifier(
+        cls, classifier: Any
+    ) -> tuple[list[tuple[str, dict[str, np.ndarray]]], np.ndarray | None, np.ndarray]:
+        if isinstance(classifier, ResampleClassifier):
+            classifier = classifier.estimator_
+
+        if isinstance(classifier, FoldEnsembleClassifier):
+            # Equal-weight average of the folds: each fold's members keep their relative weights
+            members, weights = [], []
+            for fold_estimator in classifier.estimators_:
+                fold_members, fold_weights, _ = cls._compile_classifier(fold_estimator)
+                fold_weights = np.ones(len(fold_members)) if fold_weights is None else fold_weights
+                members.extend(fold_members)
+                weights.append(fold_weights / fold_weights.sum())
+            return members, np.concatenate(weights), np.asarray(classifier.classes_)
+
+        if isinstance(classifier, VotingClassifier):
+            if classifier.voting != "soft":
+                raise CompilationError("Only soft-voting ensembles can be compiled")
+            members = [cls._compile_member(est) for est in classifier.estimators_]
+            weights = None
+            if classifier.weights is not None:
+                kept = [w for (_, est), w in zip(classifier.estimators, classifier.weights) if est != "drop"]
+                weights = np.asarray(kept, dtype=np.float64)
+            return members, weights, np.asarray(classifier.classes_)
+
+        return [cls._compile_member(classifier)], None, np.asarray(classifier.classes_)
+
+    @staticmethod
+    def _compile_member(estimator: Any) -> tuple[str, dict[str, np.ndarray]]:
+        if len(estimator.classes_) != 2:
+            raise CompilationError("Only binary classifiers can be compiled")
+
+        if isinstance(estimator, LogisticRegression):
+            return "linear", {
+                "coef": np.asarray(estimator.coef_, dtype=np.float64).ravel(),
+                "intercept": np.asarray(estimator.intercept_, dtype=np.float64).ravel(),
+            }
+
+        if isinstance(estimator, RandomForestClassifier):
+            return "forest", _flatten_forest(estimator)
+
+        raise CompilationError(f"Unsupported estimator: {type(estimator).__name__}")
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def transform(self, X: Any) -> np.ndarray:
+        """Apply the compiled preprocessing.
+
+        Parameters
+        ----------
+        X : DataFrame, mapping of columns or list of record dicts
+            Raw input features.
+
+        Returns
+        -------
+        X_transformed : ndarray of shape (n_samples, n_features_out_)
+        """
+        out = np.empty((_n_rows(X), self.n_features_out_), dtype=np.float64)
+        start = 0
+        for block in self.blocks:
+            block.transform(X, out[:, start : start + block.width])
+            start += block.width
+        return out
+
+    def predict_proba_transformed(self, X_transformed: np.ndarray) -> np.ndarray:
+        """Class probabilities for an already transformed feature matrix."""
+        probas = [_MEMBER_PROBA[kind](params, X_transformed) for kind, params in self.members]
+        if len(probas) == 1:
+            return probas[0]
+        return np.average(np.asarray(probas), axis=0, weights=self.weights)
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        """Predict class probabilities.
+
+        Parameters
+        ----------
+        X : DataFrame, mapping of columns or list of record dicts
+            Raw input features.
+
+        Returns
+        -------
+        proba : ndarray of shape (n_samples, 2)
+        """
+        return self.predict_proba_transformed(self.transform(X))
+
+    def predict(self, X: Any) -> np.ndarray:
+        """Predict class labels (argmax of the soft-voting probabilities)."""
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+
+def _flatten_forest(forest: RandomForestClassifier) -> dict[str, np.ndarray]:
+    """Concatenate all trees of a fitted forest into one node table.
+
+    Leaves point to themselves so a fixed number of vectorized descent steps
+    (the maximum tree depth) lands every sample on its leaf.
+    """
+    lefts, rights, features, thresholds, values, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        n_nodes = tree.node_count
+        index = np.arange(n_nodes) + offset
+        is_leaf = tree.children_left == -1
+
+        lefts.append(np.where(is_leaf, index, tree.children_left + offset))
+        rights.append(np.where(is_leaf, index, tree.children_right + offset))
+        features.append(np.where(is_leaf, 0, tree.feature))
+        thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+
+        value = np.asarray(tree.value[:, 0, :], dtype=np.float64)
+        totals = value.sum(axis=1, keepdims=True)
+        # Older scikit-learn stores raw weighted counts rather than fractions
+        if not np.allclose(totals, 1.0):
+            value = value / np.where(totals == 0.0, 1.0, totals)
+        values.append(value)
+
+        roots.append(offset)
+        offset += n_nodes
+        max_depth = max(max_depth, tree.max_depth)
+
+    return {
+        "left": np.concatenate(lefts).astype(np.intp),
+        "right": np.concatenate(rights).astype(np.intp),
+        "feature": np.concatenate(features).astype(np.intp),
+        "threshold": np.concatenate(thresholds).astype(np.float64),
+        "value": np.concatenate(values),
+        "roots": np.asarray(roots, dtype=np.intp),
+        "max_depth": np.asarray(max_depth, dtype=np.intp),
+    }
+
+
+def _forest_leaves(params: dict[str, np.ndarray], X: np.ndarray) -> np.ndarray:
+    """Leaf node index for every (sample, tree) pair."""
+    # Trees compare float32 inputs against float64 thresholds
+    X32 = X.astype(np.float32)
+    rows = np.arange(X.shape[0])[:, None]
+    nodes = np.broadcast_to(params["roots"], (X.shape[0], len(params["roots"]))).copy()
+    for _ in range(int(params["max_depth"])):
+        go_left = X32[rows, params["feature"][nodes]] <= params["threshold"][nodes]
+        nodes = np.where(go_left, params["left"][nodes], params["right"][nodes])
+    return nodes
+
+
+def _forest_proba(params: dict[str, np.ndarray], X: np.ndarray) -> np.ndarray:
+    leaves = _forest_leaves(params, X)
+    return params["value"][leaves].sum(axis=1) / leaves.shape[1]
+
+
+def _linear_proba(params: dict[str, np.ndarray], X: np.ndarray) -> np.ndarray:
+    positive = expit(X @ params["coef"] + params["intercept"])
+    return np.stack([1 - positive, positive], axis=1)
+
+
+_MEMBER_PROBA = {"linear": _linear_proba, "forest": _forest_proba}
+
+
+def compile_model(model: Any, preprocessor: Any = None, check_data: Sequence[Any] | None = None) -> CompiledChurnModel:
+    """Compile ``model`` and optionally verify it against scikit-learn.
+
+    Parameters
+    ----------
+    model : Pipeline or estimator
+        Fitted model.
+    preprocessor : ColumnTransformer, optional
+        Fitted preprocessor for non-Pipeline models.
+    check_data : DataFrame, optional
+        Rows used to assert the compiled probabilities match scikit-learn.
+
+    Returns
+    -------
+    compiled : CompiledChurnModel
+
+    Raises
+    ------
+    CompilationError
+        If compilation fails or the verification exceeds ``1e-9``.
+    """
+    compiled = CompiledChurnModel.from_pipeline(model, preprocessor)
+    if check_data is not None:
+        X = check_data if isinstance(check_data, pd.DataFrame) else pd.DataFrame(list(check_data))
+        if isinstance(model, Pipeline):
+            expected = model.predict_proba(X)
+        else:
+            expected = model.predict_proba(preprocessor.transform(X))
+        max_diff = float(np.max(np.abs(compiled.predict_proba(X) - expected)))
+        if max_diff > 1e-9:
+            raise CompilationError(f"Compiled model deviates from scikit-learn by {max_diff:.3e}")
+    return compiled
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any, List
+from typing import Any, List, Optional
 
 import yaml
 from pydantic import BaseModel, Field
@@ -49,6 +49,10 @@ class ModelConfig(BaseModel):
     test_size: float = Field(0.2, ge=0.0, le=1.0)
     random_state: int = 42
     cv_folds: int = Field(5, ge=2)
+    # Cross-validation folds fitted in parallel (-1 for all cores)
+    n_jobs: int = 1
+    # Serve the CV fold models as a bagged ensemble instead of refitting on the full train set
+    cv_ensemble: bool = False
     resampling_strategy: str = "none"
 
     # Model specific configs
@@ -79,12 +83,33 @@ class MLflowConfig(BaseModel):
     enabled: bool = True
 
 
+class SearchSpaceConfig(BaseModel):
+    """Hyperparameter search ranges as ``[low, high]`` (inclusive)."""
+
+    lr_C: List[float] = [0.01, 10.0]  # log scale
+    rf_n_estimators: List[int] = [50, 200]
+    rf_max_depth: List[int] = [5, 20]
+    rf_min_samples_split: List[int] = [5, 20]
+    rf_min_samples_leaf: List[int] = [1, 10]
+    ensemble_lr_weight: List[float] = [0.1, 0.9]
+
+
+class HyperparameterOptimizationConfig(BaseModel):
+    """Optuna search settings (see :mod:`src.bankchurn.optimization`)."""
+
+    method: str = "optuna"
+    n_trials: int = Field(100, ge=1)
+    timeout: Optional[float] = 3600
+    search_space: SearchSpaceConfig = SearchSpaceConfig()
+
+
 class BankChurnConfig(BaseModel):
     """Complete BankChurn configuration."""
 
     model: ModelConfig
     data: DataConfig
     mlflow: MLflowConfig
+    hyperparameter_optimization: HyperparameterOptimizationConfig = HyperparameterOptimizationConfig()
 
     @classmethod
     def from_yaml(cls, config_path: str | Path) -> BankChurnConfig:
@@ -4,22 +4,34 @@ Model Explainability Module using SHAP.
 Provides interpretation tools for churn predictions including:
 - Feature importance (global explanation)
 - Individual prediction explanations (local explanation)
+- Batch explanations of many rows in one vectorized SHAP call, optionally
+  split across a process pool
 - Force plots for single predictions
 - Summary plots for model overview
 
+Transformed background data and global importances are cached per model key
+(a checksum of the model), so explainers rebuilt for the same model (e.g. in
+every API worker or after a no-op reload) skip that work.
+
 Usage:
     from src.bankchurn.explainability import ModelExplainer
 
     explainer = ModelExplainer(model_pipeline, X_train)
     importance = explainer.get_feature_importance()
     explanation = explainer.explain_prediction(X_single)
+    batch = explainer.explain_batch(X_many, n_jobs=4)
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Dict, List, Optional, Union
 
+import joblib
 import numpy as np
 import pandas as pd
 
@@ -34,6 +46,81 @@ except ImportError:  # pragma: no cover
     SHAP_AVAILABLE = False
     logger.warning("SHAP not installed. Explainability features will be limited.")
 
+# Per-model cache of transformed backgrounds and global importances
+_CACHE_MAX_MODELS = 8
+_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Per-process explainer, set by _init_worker
+_WORKER_EXPLAINER: Optional["ModelExplainer"] = None
+
+# Default KernelExplainer coalitions per explained row: bounded so a batch of
+# explanations costs a predictable number of model evaluations
+KERNEL_NSAMPLES = 256
+
+
+def _cache_entry(model_key: str) -> Dict[str, Any]:
+    """Cache entry for ``model_key``, evicting the least recently used models."""
+    with _cache_lock:
+        entry = _cache.pop(model_key, None)
+        if entry is None:
+            entry = {}
+        _cache[model_key] = entry
+        while len(_cache) > _CACHE_MAX_MODELS:
+            _cache.popitem(last=False)
+        return entry
+
+
+def clear_explanation_cache() -> None:
+    """Drop all cached background transforms and importances."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _is_tree_model(estimator: Any) -> bool:
+    """Whether SHAP's TreeExplainer supports ``estimator`` (single trees and tree ensembles)."""
+    if hasattr(estimator, "tree_") or hasattr(estimator, "get_booster"):
+        return True
+    members = getattr(estimator, "estimators_", None)
+    if members is None:
+        return False
+    return all(hasattr(member, "tree_") for member in np.ravel(np.asarray(members, dtype=object)))
+
+
+def _positive_class(shap_values: Any) -> np.ndarray:
+    """SHAP values of the positive class as an (n_samples, n_features) array."""
+    if isinstance(shap_values, list):
+        return np.asarray(shap_values[-1])
+    shap_values = np.asarray(shap_values)
+    if shap_values.ndim == 3:  # (n_samples, n_features, n_classes)
+        return shap_values[:, :, -1]
+    return shap_values
+
+
+def _positive_expected_value(expected_value: Any) -> float:
+    values = np.ravel(np.asarray(expected_value, dtype=float))
+    return float(values[-1]) if values.size else 0.5
+
+
+class _PositiveProba:
+    """Picklable ``predict_proba(X)[:, 1]`` on raw arrays, restoring column names."""
+
+    def __init__(self, model: Any, columns: List[str]):
+        self.model = model
+        self.columns = columns
+
+    def __call__(self, X: np.ndarray) -> np.ndarray:
+        return self.model.predict_proba(pd.DataFrame(X, columns=self.columns))[:, 1]
+
+
+def _init_worker(explainer: "ModelExplainer") -> None:
+    global _WORKER_EXPLAINER
+    _WORKER_EXPLAINER = explainer
+
+
+def _explain_chunk(X: pd.DataFrame) -> np.ndarray:
+    return _WORKER_EXPLAINER._shap_values(X)
+
 
 class ModelExplainer:
     """
@@ -44,6 +131,7 @@ class ModelExplainer:
         explainer: SHAP explainer instance
         feature_names: List of feature names
         expected_value: Model's expected value (base prediction)
+        explanation_method: "tree" or "kernel" once a SHAP explainer is built
     """
 
     def __init__(
@@ -52,6 +140,9 @@ class ModelExplainer:
         X_background: Optional[pd.DataFrame] = None,
         feature_names: Optional[List[str]] = None,
         max_background_samples: int = 100,
+        method: str = "auto",
+        model_key: Optional[str] = None,
+        kernel_nsamples: Union[int, str] = KERNEL_NSAMPLES,
     ):
         """
         Initialize the explainer.
@@ -61,12 +152,25 @@ class ModelExplainer:
             X_background: Background dataset for SHAP (sampled if too large)
             feature_names: Feature names (inferred from X_background if not provided)
             max_background_samples: Max samples for background data
+            method: "tree" (TreeExplainer), "kernel" (KernelExplainer) or "auto"
+                (tree for tree models, kernel otherwise)
+            model_key: Identifies the model in the explanation cache (e.g. the
+                model file checksum); hashed from the model when not given
+            kernel_nsamples: Coalitions sampled per explained row by KernelExplainer
+                (each costs one model evaluation per background row). SHAP's
+                ``"auto"`` uses ``2 * n_features + 2048``.
         """
+        if method not in ("auto", "tree", "kernel"):
+            raise ValueError(f"method must be 'auto', 'tree' or 'kernel', got {method!r}")
         self.model = model
         self.feature_names = feature_names
+        self.method = method
+        self.kernel_nsamples = kernel_nsamples
         self.explainer = None
         self.expected_value = None
-        self._shap_values_cache = None
+        self.explanation_method: Optional[str] = None
+        self._model_key = model_key
+        self._X_background: Optional[pd.DataFrame] = None
 
         if not SHAP_AVAILABLE:  # pragma: no cover
             logger.warning("SHAP not available. Using fallback explanations.")
@@ -80,42 +184,103 @@ class ModelExplainer:
             if self.feature_names is None:
                 self.feature_names = list(X_background.columns)
 
+            self._X_background = X_background
             # Create appropriate explainer based on model type
             self._initialize_explainer(X_background)
 
-    def _initialize_explainer(self, X_background: pd.DataFrame) -> None:  # pragma: no cover
+    def __getstate__(self) -> Dict[str, Any]:
+        # SHAP explainers hold unpicklable buffers; they are rebuilt on unpickling
+        state = self.__dict__.copy()
+        state["explainer"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if SHAP_AVAILABLE and self.explanation_method is not None and self._X_background is not None:
+            self._initialize_explainer(self._X_background)
+
+    @property
+    def model_key(self) -> str:
+        """Cache key of the model (hash of the fitted model unless given)."""
+        if self._model_key is None:
+            self._model_key = joblib.hash(self.model)
+        return self._model_key
+
+    def _split_model(self) -> tuple:
+        """Return ``(preprocessor, classifier)``; the preprocessor is None for bare estimators."""
+        if hasattr(self.model, "named_steps"):
+            classifier = self.model.named_steps.get("classifier", self.model.named_steps.get("clf"))
+            if classifier is None:
+                classifier = self.model.steps[-1][1]
+            return self.model.named_steps.get("preprocessor"), classifier
+        return None, self.model
+
+    def _transform(self, X: pd.DataFrame) -> np.ndarray:
+        """Input of the TreeExplainer: preprocessed features, or raw values for bare models."""
+        preprocessor, _ = self._split_model()
+        return preprocessor.transform(X) if preprocessor is not None else X.values
+
+    def _background_transformed(self, X_background: pd.DataFrame) -> np.ndarray:
+        key = f"background:{joblib.hash(X_background)}"
+        entry = _cache_entry(self.model_key)
+        if key not in entry:
+            entry[key] = self._transform(X_background)
+        return entry[key]
+
+    def _initialize_explainer(self, X_background: pd.DataFrame) -> None:
         """Initialize the appropriate SHAP explainer."""
         try:
-            # Try TreeExplainer first (faster for tree-based models)
-            if hasattr(self.model, "named_steps"):
-                # Pipeline - extract the classifier
-                classifier = self.model.named_steps.get("classifier", self.model.named_steps.get("clf"))
-                if classifier is not None and hasattr(classifier, "estimators_"):
-                    # Transform background data through preprocessor
-                    preprocessor = self.model.named_steps.get("preprocessor")
-                    if preprocessor is not None:
-                        X_transformed = preprocessor.transform(X_background)
-                        self.explainer = shap.TreeExplainer(classifier)
-                        self._X_background_transformed = X_transformed
-                        self.expected_value = self.explainer.expected_value
-                        logger.info("Initialized TreeExplainer for pipeline")
-                        return
-
-            # Fallback to KernelExplainer (slower but universal)
-            def predict_proba_wrapper(X):
-                return self.model.predict_proba(X)[:, 1]
-
-            self.explainer = shap.KernelExplainer(predict_proba_wrapper, X_background.values[:50])
+            _, classifier = self._split_model()
+            if self.method == "tree" or (self.method == "auto" and _is_tree_model(classifier)):
+                # Path-dependent TreeExplainer on the preprocessed features
+                self._X_background_transformed = self._background_transformed(X_background)
+                self.explainer = shap.TreeExplainer(classifier)
+                self.explanation_method = "tree"
+                self.expected_value = self.explainer.expected_value
+                logger.info("Initialized TreeExplainer")
+                return
+
+            # KernelExplainer (slower but universal) on the raw features
+            self.explainer = shap.KernelExplainer(
+                _PositiveProba(self.model, list(X_background.columns)), X_background.values[:50]
+            )
+            self.explanation_method = "kernel"
             self.expected_value = self.explainer.expected_value
             logger.info("Initialized KernelExplainer")
 
         except Exception as e:
             logger.warning(f"Failed to initialize SHAP explainer: {e}")
             self.explainer = None
+            self.explanation_method = None
+
+    def _shap_values(self, X: pd.DataFrame) -> np.ndarray:
+        """Positive-class SHAP values for all rows of ``X`` in one call."""
+        if self.explanation_method == "kernel":
+            shap_values = self.explainer.shap_values(X.values, nsamples=self.kernel_nsamples, silent=True)
+        else:
+            shap_values = self.explainer.shap_values(self._transform(X))
+        return _positive_class(shap_values)
+
+    def _output_names(self, n_features: int) -> List[str]:
+        """Names of the explained features (transformed features for the tree path)."""
+        preprocessor, _ = self._split_model()
+        if self.explanation_method == "tree" and preprocessor is not None:
+            try:
+                names = [str(name) for name in preprocessor.get_feature_names_out()]
+                if len(names) == n_features:
+                    return names
+            except Exception:
+                pass
+        if self.feature_names and len(self.feature_names) == n_features:
+            return list(self.feature_names)
+        return [f"feature_{i}" for i in range(n_features)]
 
     def get_feature_importance(self, X: Optional[pd.DataFrame] = None, top_n: int = 10) -> Dict[str, float]:
         """Get global feature importance scores.
 
+        Importance over the background set is computed once per model and
+        background and then served from the cache.
+
         Args:
             X: Data to compute importance on (uses background if not provided)
             top_n: Number of top features to return
@@ -134,34 +299,20 @@ class ModelExplainer:
                 sorted_items = sorted_items[:top_n]
             return dict(sorted_items)
 
-        try:  # pragma: no cover
+        try:
             if X is None and hasattr(self, "_X_background_transformed"):
-                shap_values = self.explainer.shap_values(self._X_background_transformed)
+                key = f"importance:{joblib.hash(self._X_background)}"
+                entry = _cache_entry(self.model_key)
+                if key not in entry:
+                    shap_values = _positive_class(self.explainer.shap_values(self._X_background_transformed))
+                    entry[key] = np.abs(shap_values).mean(axis=0)
+                importance = entry[key]
             elif X is not None:
-                if hasattr(self.model, "named_steps"):
-                    preprocessor = self.model.named_steps.get("preprocessor")
-                    if preprocessor:
-                        X_transformed = preprocessor.transform(X)
-                        shap_values = self.explainer.shap_values(X_transformed)
-                    else:
-                        shap_values = self.explainer.shap_values(X.values)
-                else:
-                    shap_values = self.explainer.shap_values(X.values)
+                importance = np.abs(self._shap_values(X)).mean(axis=0)
             else:
                 return self._fallback_feature_importance()
 
-            # Handle multi-class output
-            if isinstance(shap_values, list):
-                shap_values = shap_values[1]  # Use positive class
-
-            # Compute mean absolute SHAP values
-            importance = np.abs(shap_values).mean(axis=0)
-
-            # Create feature importance dict
-            if self.feature_names and len(self.feature_names) == len(importance):
-                importance_dict = dict(zip(self.feature_names, importance))
-            else:
-                importance_dict = {f"feature_{i}": imp for i, imp in enumerate(importance)}
+            importance_dict = dict(zip(self._output_names(len(importance)), importance))
 
             # Sort and return top N
             sorted_importance = dict(sorted(importance_dict.items(), key=lambda x: x[1], reverse=True)[:top_n])
@@ -171,6 +322,60 @@ class ModelExplainer:
             logger.warning(f"Error computing SHAP importance: {e}")
             return self._fallback_feature_importance()
 
+    def explain_batch(
+        self, X: Union[pd.DataFrame, List[Dict[str, Any]]], n_jobs: int = 1, threshold: float = 0.5
+    ) -> Dict[str, Any]:
+        """
+        Explain many predictions at once.
+
+        SHAP values of all rows are computed in one vectorized call, or with
+        ``n_jobs > 1`` in contiguous chunks on a process pool (each worker
+        rebuilds the SHAP explainer once).
+
+        Args:
+            X: Observations to explain (DataFrame or list of dicts)
+            n_jobs: Worker processes (-1 for all cores)
+            threshold: Classification threshold for ``predictions``
+
+        Returns:
+            Dictionary with:
+                - base_value: Expected value (baseline)
+                - predictions: Predicted class per row
+                - probabilities: Churn probability per row
+                - contributions: DataFrame of per-feature SHAP values (fallback values without SHAP)
+                - explanation_type: "shap" or "fallback"
+                - method: "tree", "kernel" or None
+        """
+        if not isinstance(X, pd.DataFrame):
+            X = pd.DataFrame(list(X))
+        probabilities = self.model.predict_proba(X)[:, 1]
+
+        if not SHAP_AVAILABLE or self.explainer is None:
+            contributions = pd.DataFrame(
+                [self._fallback_contributions(X.iloc[[i]]) for i in range(len(X))], index=X.index
+            )
+            base_value, explanation_type = 0.5, "fallback"
+        else:
+            if n_jobs == -1:
+                n_jobs = os.cpu_count() or 1
+            values = self._shap_values_parallel(X, n_jobs) if n_jobs > 1 and len(X) > 1 else self._shap_values(X)
+            contributions = pd.DataFrame(values, columns=self._output_names(values.shape[1]), index=X.index)
+            base_value, explanation_type = _positive_expected_value(self.expected_value), "shap"
+
+        return {
+            "base_value": base_value,
+            "predictions": (probabilities >= threshold).astype(int),
+            "probabilities": probabilities,
+            "contributions": contributions,
+            "explanation_type": explanation_type,
+            "method": self.explanation_method,
+        }
+
+    def _shap_values_parallel(self, X: pd.DataFrame, n_jobs: int) -> np.ndarray:
+        chunks = [X.iloc[idx] for idx in np.array_split(np.arange(len(X)), min(n_jobs, len(X)))]
+        with ProcessPoolExecutor(max_workers=len(chunks), initializer=_init_worker, initargs=(self,)) as pool:
+            return np.vstack(list(pool.map(_explain_chunk, chunks)))
+
     def explain_prediction(self, X_single: Union[pd.DataFrame, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Explain a single prediction.
@@ -206,29 +411,9 @@ class ModelExplainer:
                 "explanation_type": "fallback",
             }
 
-        try:  # pragma: no cover
-            # Transform if pipeline
-            if hasattr(self.model, "named_steps"):
-                preprocessor = self.model.named_steps.get("preprocessor")
-                if preprocessor:
-                    X_transformed = preprocessor.transform(X_single)
-                else:
-                    X_transformed = X_single.values
-            else:
-                X_transformed = X_single.values
-
-            # Compute SHAP values
-            shap_values = self.explainer.shap_values(X_transformed)
-            if isinstance(shap_values, list):
-                shap_values = shap_values[1]
-
-            shap_values = shap_values.flatten()
-
-            # Map to feature names
-            if self.feature_names and len(self.feature_names) == len(shap_values):
-                contributions = dict(zip(self.feature_names, shap_values))
-            else:
-                contributions = {f"feature_{i}": float(v) for i, v in enumerate(shap_values)}
+        try:
+            shap_values = self._shap_values(X_single).flatten()
+            contributions = dict(zip(self._output_names(len(shap_values)), shap_values.tolist()))
 
             # Sort contributions
             sorted_contribs = sorted(contributions.items(), key=lambda x: x[1], reverse=True)
@@ -238,11 +423,7 @@ class ModelExplainer:
             return {
                 "prediction": prediction,
                 "probability": probability,
-                "base_value": float(
-                    self.expected_value[1]
-                    if isinstance(self.expected_value, (list, np.ndarray))
-                    else self.expected_value
-                ),
+                "base_value": _positive_expected_value(self.expected_value),
                 "feature_contributions": {k: round(v, 4) for k, v in contributions.items()},
                 "top_positive": top_positive,
                 "top_negative": top_negative,
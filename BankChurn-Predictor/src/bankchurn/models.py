@@ -192,3 +192,89 @@ class ResampleClassifier(BaseEstimator, ClassifierMixin):
 
         else:
             raise ValueError(f"Unknown strategy: {self.strategy}")
+
+
+class FoldEnsembleClassifier(BaseEstimator, ClassifierMixin):
+    """Bagged ensemble of already fitted cross-validation fold models.
+
+    Probabilities are the unweighted mean of the members' ``predict_proba``,
+    so the fold models trained during cross-validation can be served
+    directly instead of refitting one more model on the full training set.
+
+    Parameters
+    ----------
+    estimators : list of estimator objects
+        Fitted classifiers sharing the same classes (one per fold).
+
+    Attributes
+    ----------
+    classes_ : ndarray of shape (n_classes,)
+        Class labels of the members.
+    estimators_ : list of estimator objects
+        Ensemble members.
+
+    Examples
+    --------
+    >>> ensemble = FoldEnsembleClassifier(fold_models).fit()
+    >>> proba = ensemble.predict_proba(X_test)
+    """
+
+    def __init__(self, estimators: list[BaseEstimator] | None = None) -> None:
+        self.estimators = estimators
+
+    def fit(
+        self, X: pd.DataFrame | np.ndarray | None = None, y: pd.Series | np.ndarray | None = None
+    ) -> FoldEnsembleClassifier:
+        """Adopt the prefit members; ``X`` and ``y`` are ignored.
+
+        Returns
+        -------
+        self : FoldEnsembleClassifier
+            Fitted estimator.
+
+        Raises
+        ------
+        ValueError
+            If there are no members or their classes differ.
+        """
+        if not self.estimators:
+            raise ValueError("FoldEnsembleClassifier needs at least one fitted estimator")
+        for estimator in self.estimators:
+            check_is_fitted(estimator)
+        classes = np.asarray(self.estimators[0].classes_)
+        if any(not np.array_equal(estimator.classes_, classes) for estimator in self.estimators[1:]):
+            raise ValueError("All fold estimators must have the same classes")
+        self.estimators_ = list(self.estimators)
+        self.classes_ = classes
+        return self
+
+    def predict(self, X: pd.DataFrame | np.ndarray) -> np.ndarray:
+        """Predict class labels (argmax of the averaged probabilities).
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Samples to predict.
+
+        Returns
+        -------
+        y_pred : ndarray of shape (n_samples,)
+            Predicted class labels.
+        """
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+    def predict_proba(self, X: pd.DataFrame | np.ndarray) -> np.ndarray:
+        """Predict class probabilities averaged over the fold models.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Samples to predict.
+
+        Returns
+        -------
+        proba : ndarray of shape (n_samples, n_classes)
+            Class probabilities.
+        """
+        check_is_fitted(self, "estimators_")
+        return np.mean([estimator.predict_proba(X) for estimator in self.estimators_], axis=0)
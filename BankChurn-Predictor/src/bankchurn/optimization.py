@@ -0,0 +1,331 @@
+"""Hyperparameter search for the churn ensemble with Optuna.
+
+Searches the LogisticRegression ``C``, the RandomForest size, depth and leaf
+sizes and the soft-voting weights within
+``config.hyperparameter_optimization.search_space``:
+
+- Each trial is scored by stratified K-fold F1 on the training split (the
+  test split is held out exactly as in :meth:`ChurnTrainer.train`). The
+  running mean is reported after every fold, so a
+  :class:`~optuna.pruners.MedianPruner` stops unpromising trials early.
+- Trials run in parallel worker processes that share one study through its
+  storage. The preprocessed training matrix is memory-mapped once for all
+  workers.
+- With a SQLite storage (``sqlite:///path.db``) the study survives
+  interruptions; running the same study again resumes it.
+- ``timeout`` bounds the wall time of the whole search.
+
+The best parameters are written into a copy of the YAML config that the
+``train`` command consumes.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import yaml
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.metrics import f1_score
+from sklearn.model_selection import StratifiedKFold
+
+from .config import BankChurnConfig
+from .training import ChurnTrainer
+
+logger = logging.getLogger(__name__)
+
+# Optional Optuna import
+try:
+    import optuna
+
+    OPTUNA_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    OPTUNA_AVAILABLE = False
+
+
+def suggest_params(trial: Any, config: BankChurnConfig) -> dict[str, Any]:
+    """Sample one point of the configured search space.
+
+    Parameters
+    ----------
+    trial : optuna.Trial
+        Trial to sample from.
+    config : BankChurnConfig
+        Configuration holding the search space.
+
+    Returns
+    -------
+    params : dict
+        Search-space keys (``lr_C``, ``rf_max_depth``, ...) to values.
+    """
+    space = config.hyperparameter_optimization.search_space
+    return {
+        "lr_C": trial.suggest_float("lr_C", *space.lr_C, log=True),
+        "rf_n_estimators": trial.suggest_int("rf_n_estimators", *space.rf_n_estimators),
+        "rf_max_depth": trial.suggest_int("rf_max_depth", *space.rf_max_depth),
+        "rf_min_samples_split": trial.suggest_int("rf_min_samples_split", *space.rf_min_samples_split),
+        "rf_min_samples_leaf": trial.suggest_int("rf_min_samples_leaf", *space.rf_min_samples_leaf),
+        "ensemble_lr_weight": trial.suggest_float("ensemble_lr_weight", *space.ensemble_lr_weight),
+    }
+
+
+def model_overrides(params: dict[str, Any]) -> dict[str, Any]:
+    """Nested ``model`` config section for search-space parameters."""
+    lr_weight = float(params["ensemble_lr_weight"])
+    return {
+        "logistic_regression": {"C": float(params["lr_C"])},
+        "random_forest": {
+            "n_estimators": int(params["rf_n_estimators"]),
+            "max_depth": int(params["rf_max_depth"]),
+            "min_samples_split": int(params["rf_min_samples_split"]),
+            "min_samples_leaf": int(params["rf_min_samples_leaf"]),
+        },
+        "ensemble": {"weights": [lr_weight, 1.0 - lr_weight]},
+    }
+
+
+def _merge(base: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any]:
+    merged = dict(base)
+    for key, value in overrides.items():
+        merged[key] = _merge(merged.get(key) or {}, value) if isinstance(value, dict) else value
+    return merged
+
+
+def apply_params(config: BankChurnConfig, params: dict[str, Any]) -> BankChurnConfig:
+    """Copy of ``config`` with the model section updated from search-space parameters."""
+    data = config.dict()
+    data["model"] = _merge(data["model"], model_overrides(params))
+    return BankChurnConfig(**data)
+
+
+def write_tuned_config(
+    config_path: str | Path, params: dict[str, Any], output_path: str | Path, score: float | None = None
+) -> Path:
+    """Write ``config_path`` with the tuned model parameters to ``output_path``.
+
+    Sections the tuner does not touch are copied as they are.
+
+    Returns
+    -------
+    output_path : Path
+    """
+    with open(config_path, "r") as f:
+        data = yaml.safe_load(f) or {}
+    data["model"] = _merge(data.get("model") or {}, model_overrides(params))
+    if score is not None:
+        data.setdefault("hyperparameter_optimization", {})["best_cv_f1"] = float(score)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w") as f:
+        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+    logger.info(f"Tuned config saved to {output_path}")
+    return output_path
+
+
+def _cv_objective(
+    trial: Any,
+    config: BankChurnConfig,
+    X: np.ndarray,
+    y: np.ndarray,
+    splits: list[tuple[np.ndarray, np.ndarray]],
+    random_state: int,
+    single_threaded: bool,
+) -> float:
+    trainer = ChurnTrainer(apply_params(config, suggest_params(trial, config)), random_state=random_state)
+    scores = []
+    for step, (train_idx, val_idx) in enumerate(splits):
+        model = trainer.build_model()
+        if single_threaded:
+            model.set_params(estimator__rf__n_jobs=1)
+        model.fit(X[train_idx], y[train_idx])
+        scores.append(f1_score(y[val_idx], model.predict(X[val_idx]), average="weighted"))
+        trial.report(float(np.mean(scores)), step)
+        if trial.should_prune():
+            raise optuna.TrialPruned()
+    return float(np.mean(scores))
+
+
+def _optimize_worker(
+    study_name: str,
+    storage: str | None,
+    config: BankChurnConfig,
+    X: np.ndarray,
+    y: np.ndarray,
+    splits: list[tuple[np.ndarray, np.ndarray]],
+    random_state: int,
+    seed: int,
+    max_trials: int,
+    deadline: float | None,
+    single_threaded: bool,
+) -> None:
+    """Run trials of a stored study until the study has ``max_trials`` or the deadline passes."""
+    study = optuna.load_study(
+        study_name=study_name,
+        storage=storage,
+        sampler=optuna.samplers.TPESampler(seed=seed),
+        pruner=HyperparameterTuner.pruner(),
+    )
+    timeout = None if deadline is None else max(deadline - time.time(), 0.0)
+    if timeout == 0.0:
+        return
+    study.optimize(
+        lambda trial: _cv_objective(trial, config, X, y, splits, random_state, single_threaded),
+        timeout=timeout,
+        callbacks=[optuna.study.MaxTrialsCallback(max_trials, states=None)],
+    )
+
+
+class HyperparameterTuner:
+    """Optuna search over the churn ensemble's hyperparameters.
+
+    Parameters
+    ----------
+    config : BankChurnConfig
+        Base configuration (data columns, CV folds, search space).
+    random_state : int, optional
+        Seed for the data split, the models and the samplers.
+
+    Attributes
+    ----------
+    study_ : optuna.Study
+        Study of the last :meth:`tune` call.
+
+    Examples
+    --------
+    >>> tuner = HyperparameterTuner(config, random_state=42)
+    >>> study = tuner.tune(X, y, n_trials=50, timeout=600, n_jobs=4, storage="sqlite:///optuna.db")
+    >>> tuner.best_config().model.random_forest.max_depth
+    """
+
+    def __init__(self, config: BankChurnConfig, random_state: int | None = None) -> None:
+        if not OPTUNA_AVAILABLE:  # pragma: no cover
+            raise ImportError("Hyperparameter tuning requires optuna (pip install optuna)")
+        self.config = config
+        # Trials never log to MLflow
+        data = config.dict()
+        data["mlflow"]["enabled"] = False
+        self._trial_config = BankChurnConfig(**data)
+        self.random_state = random_state or config.model.random_state
+        self.study_: Any = None
+
+    @staticmethod
+    def pruner() -> Any:
+        """Median pruning on the running fold mean, after a few complete trials."""
+        return optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=1)
+
+    def tune(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        n_trials: int | None = None,
+        timeout: float | None = None,
+        n_jobs: int = 1,
+        storage: str | None = None,
+        study_name: str = "bankchurn",
+    ) -> Any:
+        """Run the search.
+
+        Parameters
+        ----------
+        X : DataFrame
+            Raw feature matrix (the test split is held out internally).
+        y : Series
+            Target vector.
+        n_trials : int, optional
+            New trials to run in this call (default: ``hyperparameter_optimization.n_trials``).
+            Trials already in a resumed study do not count.
+        timeout : float, optional
+            Wall-time budget in seconds (default: ``hyperparameter_optimization.timeout``).
+        n_jobs : int, default=1
+            Worker processes running trials in parallel (-1 for all cores).
+            More than one worker requires a persistent ``storage``.
+        storage : str, optional
+            Optuna storage URL such as ``sqlite:///optuna.db``; None keeps
+            the study in memory.
+        study_name : str, default="bankchurn"
+            Study to create or resume.
+
+        Returns
+        -------
+        study : optuna.Study
+        """
+        hpo = self.config.hyperparameter_optimization
+        n_trials = n_trials or hpo.n_trials
+        timeout = hpo.timeout if timeout is None else timeout
+        n_workers = effective_n_jobs(n_jobs)
+        if n_workers > 1 and storage is None:
+            raise ValueError("Parallel trials need a shared storage (e.g. sqlite:///optuna.db)")
+
+        trainer = ChurnTrainer(self._trial_config, random_state=self.random_state)
+        X_train, _, y_train, _ = trainer.split_and_preprocess(X, y)
+        y_train = np.asarray(y_train)
+        cv = StratifiedKFold(n_splits=self.config.model.cv_folds, shuffle=True, random_state=self.random_state)
+        splits = list(cv.split(X_train, y_train))
+
+        study = optuna.create_study(
+            study_name=study_name,
+            storage=storage,
+            direction="maximize",
+            sampler=optuna.samplers.TPESampler(seed=self.random_state),
+            pruner=self.pruner(),
+            load_if_exists=True,
+        )
+        max_trials = len(study.trials) + n_trials
+        if study.trials:
+            logger.info(f"Resuming study '{study_name}' with {len(study.trials)} trials")
+        deadline = time.time() + timeout if timeout else None
+
+        start = time.perf_counter()
+        if n_workers == 1:
+            study.optimize(
+                lambda trial: _cv_objective(
+                    trial, self._trial_config, X_train, y_train, splits, self.random_state, False
+                ),
+                timeout=timeout or None,
+                callbacks=[optuna.study.MaxTrialsCallback(max_trials, states=None)],
+            )
+        else:
+            # Each worker loads the study from storage; its sampler gets its own seed
+            Parallel(n_jobs=n_workers, max_nbytes=0, mmap_mode="r")(
+                delayed(_optimize_worker)(
+                    study_name,
+                    storage,
+                    self._trial_config,
+                    X_train,
+                    y_train,
+                    splits,
+                    self.random_state,
+                    self.random_state + worker,
+                    max_trials,
+                    deadline,
+                    True,
+                )
+                for worker in range(1, n_workers + 1)
+            )
+            study = optuna.load_study(study_name=study_name, storage=storage)
+
+        states = pd.Series([trial.state.name for trial in study.trials]).value_counts().to_dict()
+        logger.info(f"Tuning finished in {time.perf_counter() - start:.1f}s: {states}")
+        self.study_ = study
+        if any(trial.state == optuna.trial.TrialState.COMPLETE for trial in study.trials):
+            logger.info(f"Best CV F1 {study.best_value:.4f} with {study.best_params}")
+        return study
+
+    def best_config(self) -> BankChurnConfig:
+        """Base configuration updated with the best trial's parameters.
+
+        Raises
+        ------
+        ValueError
+            If no trial has completed yet.
+        """
+        if self.study_ is None or not any(
+            trial.state == optuna.trial.TrialState.COMPLETE for trial in self.study_.trials
+        ):
+            raise ValueError("No completed trials; run tune() first")
+        return apply_params(self.config, self.study_.best_params)
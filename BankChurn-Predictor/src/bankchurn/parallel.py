@@ -0,0 +1,286 @@
+"""Multi-process batch scoring for large CSV, Parquet and Feather inputs.
+
+Input is split into shards (one per input file, or for a single file either
+newline-aligned CSV byte ranges or contiguous Parquet row groups / Arrow
+record batches), each shard is scored by a pool worker that loads the model
+once, and the per-shard outputs are concatenated in input order.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple, Sequence
+
+from common_utils.tabular_io import CSV, detect_format
+
+from .prediction import ChurnPredictor
+from .tabular_io import concat_files, count_row_groups
+
+logger = logging.getLogger(__name__)
+
+# Per-process predictor, set by _init_worker
+_PREDICTOR: ChurnPredictor | None = None
+
+
+class _ByteRangeReader(io.RawIOBase):
+    """Read a CSV header followed by the byte range ``[start, end)`` of a file."""
+
+    def __init__(self, path: Path, header: bytes, start: int, end: int) -> None:
+        super().__init__()
+        self._file = open(path, "rb")
+        self._file.seek(start)
+        self._remaining = end - start
+        self._header = memoryview(header)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if self._header:
+            n = min(len(buffer), len(self._header))
+            buffer[:n] = self._header[:n]
+            self._header = self._header[n:]
+            return n
+        if self._remaining <= 0:
+            return 0
+        data = self._file.read(min(len(buffer), self._remaining))
+        self._remaining -= len(data)
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+def csv_byte_ranges(path: str | Path, n_shards: int) -> tuple[bytes, list[tuple[int, int]]]:
+    """Split a CSV into newline-aligned byte ranges.
+
+    Parameters
+    ----------
+    path : str or Path
+        CSV file with a single header line.
+    n_shards : int
+        Desired number of ranges (fewer are returned for small files).
+
+    Returns
+    -------
+    header : bytes
+        Header line, including its newline.
+    ranges : list of (int, int)
+        ``[start, end)`` byte offsets covering every data row exactly once.
+
+    Notes
+    -----
+    Splitting assumes no quoted field contains a newline.
+    """
+    path = Path(path)
+    size = path.stat().st_size
+    with open(path, "rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+        boundaries = [data_start]
+        step = max(1, (size - data_start) // max(1, n_shards))
+        for i in range(1, n_shards):
+            target = max(data_start + i * step, boundaries[-1])
+            if target >= size:
+                break
+            f.seek(target)
+            f.readline()  # advance to the start of the next full row
+            position = f.tell()
+            if position >= size:
+                break
+            if position > boundaries[-1]:
+                boundaries.append(position)
+    boundaries.append(size)
+    ranges = [(start, end) for start, end in zip(boundaries[:-1], boundaries[1:]) if end > start]
+    return header, ranges
+
+
+def row_group_ranges(n_groups: int, n_shards: int) -> list[tuple[int, int]]:
+    """Split ``n_groups`` Parquet row groups (or Arrow record batches) into contiguous ranges."""
+    n_shards = max(1, min(n_shards, n_groups))
+    bounds = [i * n_groups // n_shards for i in range(n_shards + 1)]
+    return [(start, end) for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+
+
+class _Shard(NamedTuple):
+    """A unit of work: a whole file, a CSV byte range or a row-group range."""
+
+    path: str
+    header: bytes | None = None  # set for CSV byte ranges
+    start: int = 0
+    end: int | None = None  # None scores the whole file
+
+
+def _split_single_file(path: Path, n_shards: int) -> list[_Shard]:
+    if detect_format(path) == CSV:
+        header, ranges = csv_byte_ranges(path, n_shards)
+        return [_Shard(str(path), header, start, end) for start, end in ranges]
+    ranges = row_group_ranges(count_row_groups(path), n_shards)
+    return [_Shard(str(path), None, start, end) for start, end in ranges] or [_Shard(str(path))]
+
+
+def _limit_threads(model: Any) -> None:
+    """Pin nested estimators to one thread so workers don't oversubscribe cores."""
+    try:
+        params = model.get_params(deep=True)
+    except AttributeError:
+        return
+    n_jobs_params = {name: 1 for name in params if name == "n_jobs" or name.endswith("__n_jobs")}
+    if n_jobs_params:
+        model.set_params(**n_jobs_params)
+
+
+def _init_worker(model_path: str, preprocessor_path: str | None, compiled: bool) -> None:
+    global _PREDICTOR
+    try:
+        from threadpoolctl import threadpool_limits
+
+        threadpool_limits(1)
+    except ImportError:  # pragma: no cover
+        pass
+    _PREDICTOR = ChurnPredictor.from_files(model_path, preprocessor_path, compiled=compiled)
+    _limit_threads(_PREDICTOR.model)
+
+
+def _score_shard(
+    shard: _Shard,
+    part_path: str,
+    chunksize: int,
+    include_proba: bool,
+    threshold: float,
+    prune_columns: bool,
+    id_columns: Sequence[str] | None,
+) -> int:
+    if _PREDICTOR is None:
+        raise RuntimeError("Scoring worker not initialised (run it through predict_csv_parallel)")
+    usecols = _PREDICTOR.input_columns(prune_columns, id_columns)
+    source: Any = shard.path
+    row_groups = None
+    if shard.header is not None:
+        source = io.BufferedReader(_ByteRangeReader(Path(shard.path), shard.header, shard.start, shard.end or 0))
+    elif shard.end is not None:
+        row_groups = range(shard.start, shard.end)
+    try:
+        return _PREDICTOR.write_scored_chunks(
+            source,
+            part_path,
+            chunksize=chunksize,
+            include_proba=include_proba,
+            threshold=threshold,
+            usecols=usecols,
+            row_groups=row_groups,
+        )
+    finally:
+        if shard.header is not None:
+            source.close()
+
+
+def predict_csv_parallel(
+    model_path: str | Path,
+    input_paths: str | Path | Sequence[str | Path],
+    output_path: str | Path,
+    workers: int | None = None,
+    preprocessor_path: str | Path | None = None,
+    chunksize: int = 100_000,
+    include_proba: bool = True,
+    threshold: float = 0.5,
+    prune_columns: bool = False,
+    id_columns: Sequence[str] | None = None,
+    compiled: bool = False,
+) -> int:
+    """Score one or more files on a process pool and write one merged output.
+
+    Several input files are scored one file per task; a single CSV is split
+    into ``workers`` newline-aligned byte ranges and a single Parquet or
+    Feather file into ``workers`` contiguous row-group ranges. Each worker
+    loads the model once and scores its shard chunk by chunk, so memory per
+    worker stays flat. Output rows keep input order. Input and output
+    formats are chosen from the file extensions.
+
+    Parameters
+    ----------
+    model_path : str or Path
+        Path to saved model.
+    input_paths : str, Path or sequence of them
+        CSV, Parquet or Feather file(s) to score. All files must share the
+        same columns.
+    output_path : str or Path
+        Path to save the merged predictions (format from its extension).
+    workers : int, optional
+        Number of worker processes (default: ``os.cpu_count()``).
+    preprocessor_path : str or Path, optional
+        Path to saved preprocessor (legacy models).
+    chunksize : int, default=100_000
+        Rows scored per chunk inside each worker.
+    include_proba : bool, default=True
+        Whether to include probability scores.
+    threshold : float, default=0.5
+        Classification threshold.
+    prune_columns : bool, default=False
+        Read only the model's input features plus ``id_columns``.
+    id_columns : sequence of str, optional
+        Identifier columns passed through to the output when pruning.
+    compiled : bool, default=False
+        Use the compiled NumPy inference path in each worker.
+
+    Returns
+    -------
+    n_rows : int
+        Number of rows scored and written.
+    """
+    if isinstance(input_paths, (str, Path)):
+        input_paths = [input_paths]
+    input_paths = [Path(p) for p in input_paths]
+    for path in input_paths:
+        if not path.exists():
+            raise FileNotFoundError(f"Input file not found: {path}")
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    if len(input_paths) == 1:
+        shards = _split_single_file(input_paths[0], workers)
+    else:
+        shards = [_Shard(str(path)) for path in input_paths]
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    parts_dir = Path(tempfile.mkdtemp(prefix=f".{output_path.name}.", dir=output_path.parent))
+    output_format = detect_format(output_path)
+    part_paths = [parts_dir / f"part-{i:05d}.{output_format}" for i in range(len(shards))]
+
+    logger.info(f"Scoring {len(shards)} shard(s) with {workers} worker process(es)")
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)) or 1,
+            initializer=_init_worker,
+            initargs=(str(model_path), str(preprocessor_path) if preprocessor_path else None, compiled),
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _score_shard,
+                    shard,
+                    str(part),
+                    chunksize,
+                    include_proba,
+                    threshold,
+                    prune_columns,
+                    list(id_columns) if id_columns else None,
+                )
+                for shard, part in zip(shards, part_paths)
+            ]
+            n_rows = sum(future.result() for future in futures)
+        concat_files(part_paths, output_path, fmt=output_format)
+    finally:
+        shutil.rmtree(parts_dir, ignore_errors=True)
+
+    logger.info(f"Predictions for {n_rows} rows saved to {output_path}")
+    return n_rows
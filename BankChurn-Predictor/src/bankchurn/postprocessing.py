@@ -0,0 +1,103 @@
+"""Vectorized post-processing of churn probabilities.
+
+A single pass over the positive-class probabilities produces every per-row
+output reported by :class:`~src.bankchurn.prediction.ChurnPredictor` and the
+API, so both use the same labels and boundaries:
+
+- ``prediction``: ``probability >= threshold``
+- ``risk_level``: ``LOW`` below 0.3, ``MEDIUM`` from 0.3 to below 0.7,
+  ``HIGH`` from 0.7
+- ``confidence``: distance from 0.5 rescaled to [0, 1]
+"""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+RISK_LEVELS = ("LOW", "MEDIUM", "HIGH")
+RISK_BOUNDARIES = np.array([0.3, 0.7])
+
+_RISK_LABELS = np.array(RISK_LEVELS)
+
+
+class ChurnScores(NamedTuple):
+    """Per-row churn model outputs as NumPy arrays.
+
+    Attributes
+    ----------
+    prediction : ndarray of int64
+        Thresholded class.
+    probability : ndarray of float64
+        Probability of churn.
+    risk_code : ndarray of int8
+        Index into :data:`RISK_LEVELS`.
+    confidence : ndarray of float64
+        ``|probability - 0.5| * 2``.
+    """
+
+    prediction: np.ndarray
+    probability: np.ndarray
+    risk_code: np.ndarray
+    confidence: np.ndarray
+
+    @property
+    def risk_level(self) -> np.ndarray:
+        """Risk labels (``LOW``/``MEDIUM``/``HIGH``) as a string array."""
+        return _RISK_LABELS[self.risk_code]
+
+    def risk_distribution(self) -> dict[str, int]:
+        """Number of rows per risk level."""
+        return dict(zip(RISK_LEVELS, np.bincount(self.risk_code, minlength=len(RISK_LEVELS)).tolist()))
+
+    def to_frame(self, index: Any = None) -> pd.DataFrame:
+        """DataFrame with ``prediction``, ``probability``, ``risk_level`` (categorical) and ``confidence``."""
+        return pd.DataFrame(
+            {
+                "prediction": self.prediction,
+                "probability": self.probability,
+                "risk_level": pd.Categorical.from_codes(self.risk_code, categories=RISK_LEVELS),
+                "confidence": self.confidence,
+            },
+            index=index,
+        )
+
+
+def postprocess(probabilities: Any, threshold: float = 0.5) -> ChurnScores:
+    """Compute prediction, risk level and confidence from churn probabilities.
+
+    Parameters
+    ----------
+    probabilities : array-like of shape (n_samples,)
+        Probability of the positive (churn) class.
+    threshold : float, default=0.5
+        Classification threshold.
+
+    Returns
+    -------
+    scores : ChurnScores
+        Per-row outputs.
+    """
+    probability = np.asarray(probabilities, dtype=np.float64)
+    return ChurnScores(
+        prediction=(probability >= threshold).astype(np.int64),
+        probability=probability,
+        risk_code=np.searchsorted(RISK_BOUNDARIES, probability, side="right").astype(np.int8),
+        confidence=np.abs(probability - 0.5) * 2,
+    )
+
+
+def determine_risk_level(probability: float) -> str:
+    """Risk label for one probability."""
+    if probability < RISK_BOUNDARIES[0]:
+        return RISK_LEVELS[0]
+    if probability < RISK_BOUNDARIES[1]:
+        return RISK_LEVELS[1]
+    return RISK_LEVELS[2]
+
+
+def calculate_confidence(probability: float) -> float:
+    """Confidence for one probability."""
+    return abs(probability - 0.5) * 2
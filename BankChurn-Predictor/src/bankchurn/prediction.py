@@ -7,12 +7,19 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 import joblib
+import numpy as np
 import pandas as pd
+from common_utils.tabular_io import TableWriter, iter_batches, read_table, write_table
 from sklearn.pipeline import Pipeline
 
+from .compiled import CompilationError, CompiledChurnModel
+from .contributions import Contributions, FeatureContributions
+from .explainability import ModelExplainer
+from .postprocessing import ChurnScores, postprocess
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +32,10 @@ class ChurnPredictor:
         Trained model (Pipeline or estimator) with predict and predict_proba methods.
     preprocessor : object, optional
         Fitted preprocessor for feature transformation (required if model is not a Pipeline).
+    compiled : bool, default=False
+        Whether to compile the model into the NumPy fast path (see
+        :mod:`src.bankchurn.compiled`). Falls back to scikit-learn with a
+        warning if the model structure is not supported.
 
     Attributes
     ----------
@@ -32,11 +43,18 @@ class ChurnPredictor:
         Loaded model.
     preprocessor : object
         Loaded preprocessor.
+    compiled_ : CompiledChurnModel or None
+        Compiled evaluator used instead of scikit-learn when available.
+    contributions_ : FeatureContributions or None
+        Contribution explainer, built on the first call to :meth:`explain`.
     """
 
-    def __init__(self, model: Any, preprocessor: Any = None) -> None:
+    def __init__(self, model: Any, preprocessor: Any = None, compiled: bool = False) -> None:
         self.model = model
         self.preprocessor = preprocessor
+        self.compiled_: CompiledChurnModel | None = None
+        self.contributions_: FeatureContributions | None = None
+        self._explain_error: CompilationError | None = None
 
         # If model is a Pipeline and preprocessor is None, try to extract it
         if self.preprocessor is None and isinstance(self.model, Pipeline):
@@ -45,8 +63,112 @@ class ChurnPredictor:
             except (KeyError, AttributeError):
                 logger.warning("Could not extract preprocessor from Pipeline.")
 
+        if compiled:
+            self.compile()
+
+    @property
+    def inference_mode(self) -> str:
+        """Active inference backend: ``"compiled"`` or ``"sklearn"``."""
+        return "compiled" if self.compiled_ is not None else "sklearn"
+
+    def compile(self, strict: bool = False) -> CompiledChurnModel | None:
+        """Compile the model into the NumPy fast path.
+
+        Parameters
+        ----------
+        strict : bool, default=False
+            Raise instead of falling back to scikit-learn when the model
+            cannot be compiled.
+
+        Returns
+        -------
+        compiled : CompiledChurnModel or None
+            The compiled evaluator, or None if compilation was not possible.
+        """
+        preprocessor = None if isinstance(self.model, Pipeline) else self.preprocessor
+        try:
+            self.compiled_ = CompiledChurnModel.from_pipeline(self.model, preprocessor)
+        except (CompilationError, AttributeError) as e:
+            if strict:
+                raise
+            logger.warning(f"Could not compile model, using scikit-learn inference: {e}")
+            self.compiled_ = None
+        return self.compiled_
+
+    def explain(self, X: pd.DataFrame | list[dict[str, Any]]) -> Contributions:
+        """Exact per-feature contributions to the churn probability.
+
+        Computed from the model structure (see :mod:`src.bankchurn.contributions`);
+        ``base_value + values.sum(axis=1)`` equals the churn probability.
+
+        Parameters
+        ----------
+        X : DataFrame or list of dict
+            Input features.
+
+        Returns
+        -------
+        contributions : Contributions
+
+        Raises
+        ------
+        CompilationError
+            If the model structure is not supported. The structure is only
+            inspected once; later calls raise the same error.
+        """
+        if self._explain_error is not None:
+            raise self._explain_error
+        if self.contributions_ is None:
+            try:
+                if self.compiled_ is not None:
+                    self.contributions_ = FeatureContributions(self.compiled_)
+                else:
+                    preprocessor = None if isinstance(self.model, Pipeline) else self.preprocessor
+                    self.contributions_ = FeatureContributions.from_pipeline(self.model, preprocessor)
+            except (CompilationError, AttributeError) as e:
+                self._explain_error = e if isinstance(e, CompilationError) else CompilationError(str(e))
+                raise self._explain_error from e
+        return self.contributions_.explain(X)
+
+    def shap_explainer(self, background: pd.DataFrame, **kwargs: Any) -> ModelExplainer:
+        """SHAP explainer of the model on raw input features.
+
+        Parameters
+        ----------
+        background : DataFrame
+            Background sample (raw features).
+        **kwargs
+            Passed to :class:`~src.bankchurn.explainability.ModelExplainer`
+            (``method``, ``model_key``, ``max_background_samples``, ...).
+
+        Returns
+        -------
+        explainer : ModelExplainer
+        """
+        model = self.model
+        if not isinstance(model, Pipeline):
+            model = Pipeline([("preprocessor", self.preprocessor), ("classifier", model)])
+        return ModelExplainer(model, background, **kwargs)
+
+    @property
+    def required_features(self) -> list[str] | None:
+        """Input columns the model consumes, or None if they cannot be determined."""
+        if self.compiled_ is not None:
+            return list(self.compiled_.feature_names_in_)
+        for estimator in (self.model, self.preprocessor):
+            names = getattr(estimator, "feature_names_in_", None)
+            if names is not None:
+                return [str(name) for name in names]
+        return None
+
     @classmethod
-    def from_files(cls, model_path: str | Path, preprocessor_path: str | Path | None = None) -> ChurnPredictor:
+    def from_files(
+        cls,
+        model_path: str | Path,
+        preprocessor_path: str | Path | None = None,
+        compiled: bool = False,
+        mmap_mode: str | None = None,
+    ) -> ChurnPredictor:
         """Load model and preprocessor from disk.
 
         Parameters
@@ -55,13 +177,20 @@ class ChurnPredictor:
             Path to saved model.
         preprocessor_path : str or Path, optional
             Path to saved preprocessor (required for legacy models).
+        compiled : bool, default=False
+            Whether to compile the loaded model into the NumPy fast path.
+        mmap_mode : {'r', 'c'}, optional
+            Memory-map the NumPy arrays of an uncompressed artifact instead of
+            copying them (see :func:`joblib.load`), so processes loading the
+            same file share them through the page cache. Tree node arrays are
+            always copied by scikit-learn.
 
         Returns
         -------
         predictor : ChurnPredictor
             Initialized predictor with loaded artifacts.
         """
-        model = joblib.load(model_path)
+        model = joblib.load(model_path, mmap_mode=mmap_mode)
         preprocessor = None
 
         if preprocessor_path:
@@ -73,13 +202,21 @@ class ChurnPredictor:
                 logger.warning(f"Could not load preprocessor from {preprocessor_path}: {e}")
 
         logger.info(f"Loaded model from {model_path}")
-        return cls(model, preprocessor)
+        return cls(model, preprocessor, compiled=compiled)
 
-    def _get_predictions_and_proba(self, X: pd.DataFrame, include_proba: bool) -> tuple[Any, Any]:
+    def _get_predictions_and_proba(self, X: Any, include_proba: bool) -> tuple[Any, Any]:
         """Get predictions and probabilities from model.
 
         Returns tuple of (y_pred, y_proba) where y_proba may be None.
         """
+        if self.compiled_ is not None:
+            proba = self.compiled_.predict_proba(X)
+            y_pred = self.compiled_.classes_[np.argmax(proba, axis=1)]
+            return y_pred, proba if include_proba else None
+
+        if not isinstance(X, pd.DataFrame):
+            X = pd.DataFrame(X)
+
         if isinstance(self.model, Pipeline):
             y_pred = self.model.predict(X)
             y_proba = self._safe_predict_proba(self.model, X) if include_proba else None
@@ -106,6 +243,10 @@ class ChurnPredictor:
         threshold: float,
     ) -> pd.DataFrame:
         """Build results DataFrame with predictions and optional probabilities."""
+        if include_proba and y_proba is not None and y_proba.shape[1] == 2:
+            # Binary classification: prediction, probability, risk level and confidence in one pass
+            return postprocess(y_proba[:, 1], threshold).to_frame()
+
         results = pd.DataFrame({"prediction": y_pred})
 
         if not include_proba or y_proba is None:
@@ -113,75 +254,112 @@ class ChurnPredictor:
                 logger.warning("Model does not support predict_proba, skipping probabilities")
             return results
 
-        if y_proba.shape[1] == 2:
-            # Binary classification
-            results["probability"] = y_proba[:, 1]
-            results["prediction"] = (results["probability"] >= threshold).astype(int)
-            results["risk_level"] = pd.cut(
-                results["probability"],
-                bins=[0, 0.3, 0.7, 1.0],
-                labels=["low", "medium", "high"],
-            )
-        else:
-            # Multi-class: include all class probabilities
-            for i in range(y_proba.shape[1]):
-                results[f"probability_class_{i}"] = y_proba[:, i]
+        # Multi-class: include all class probabilities
+        for i in range(y_proba.shape[1]):
+            results[f"probability_class_{i}"] = y_proba[:, i]
 
         return results
 
     def predict(
         self,
-        X: pd.DataFrame,
+        X: pd.DataFrame | list[dict[str, Any]],
         include_proba: bool = True,
         threshold: float = 0.5,
-    ) -> pd.DataFrame:
+        as_arrays: bool = False,
+    ) -> pd.DataFrame | ChurnScores:
         """Make predictions on new data.
 
         Parameters
         ----------
-        X : DataFrame
-            Feature matrix for prediction.
+        X : DataFrame or list of dict
+            Feature matrix for prediction. Lists of records are scored without
+            building a DataFrame when the compiled fast path is active.
         include_proba : bool, default=True
             Whether to include probability scores.
         threshold : float, default=0.5
             Classification threshold for binary predictions.
+        as_arrays : bool, default=False
+            Return the per-row outputs as NumPy arrays (:class:`ChurnScores`)
+            instead of building a DataFrame. Requires a binary classifier
+            with ``predict_proba``.
 
         Returns
         -------
-        predictions : DataFrame
-            Predictions with columns:
+        predictions : DataFrame or ChurnScores
+            Predictions with columns (or arrays):
             - prediction: Binary class (0 or 1)
             - probability: Probability of positive class (if include_proba=True)
-            - risk_level: Risk category (low/medium/high)
+            - risk_level: Risk category (LOW/MEDIUM/HIGH, see :mod:`src.bankchurn.postprocessing`)
+            - confidence: ``|probability - 0.5| * 2``
         """
-        y_pred, y_proba = self._get_predictions_and_proba(X, include_proba)
+        y_pred, y_proba = self._get_predictions_and_proba(X, include_proba or as_arrays)
+        if as_arrays:
+            if y_proba is None or y_proba.shape[1] != 2:
+                raise ValueError("as_arrays requires a binary classifier with predict_proba")
+            scores = postprocess(y_proba[:, 1], threshold)
+            logger.info(f"Generated predictions for {len(scores.prediction)} samples")
+            logger.info(f"Risk distribution: {scores.risk_distribution()}")
+            return scores
+
         results = self._build_results_dataframe(y_pred, y_proba, include_proba, threshold)
 
         logger.info(f"Generated predictions for {len(results)} samples")
         if "risk_level" in results.columns:
-            logger.info(f"Risk distribution: {dict(results['risk_level'].value_counts())}")
+            logger.info(f"Risk distribution: {dict(results['risk_level'].value_counts(sort=False))}")
 
         return results
 
+    def input_columns(self, prune_columns: bool, id_columns: Sequence[str] | None = None) -> list[str] | None:
+        """Columns to read from an input file: ``id_columns`` then the model features.
+
+        Returns None (read everything) unless ``prune_columns`` is set and the
+        model exposes its input features.
+        """
+        if not prune_columns:
+            return None
+        features = self.required_features
+        if features is None:
+            logger.warning("Model does not expose its input features; reading all columns")
+            return None
+        id_columns = [c for c in (id_columns or []) if c not in features]
+        return list(id_columns) + features
+
+    def _model_input(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Select the model's input features, leaving ID/passthrough columns out of scoring."""
+        features = self.required_features
+        if features is None or not set(features).issubset(data.columns):
+            return data
+        return data[features]
+
     def predict_batch(
         self,
         input_path: str | Path,
         output_path: str | Path,
         include_proba: bool = True,
         threshold: float = 0.5,
+        prune_columns: bool = False,
+        id_columns: Sequence[str] | None = None,
     ) -> pd.DataFrame:
-        """Make predictions on data from CSV file and save results.
+        """Make predictions on data from a file and save results.
+
+        Input and output formats (CSV, Parquet or Arrow IPC/Feather) are
+        chosen from the file extensions; see :mod:`common_utils.tabular_io`.
 
         Parameters
         ----------
         input_path : str or Path
-            Path to input CSV file.
+            Path to input CSV, Parquet or Feather file.
         output_path : str or Path
-            Path to save predictions CSV.
+            Path to save predictions (format from its extension).
         include_proba : bool, default=True
             Whether to include probability scores.
         threshold : float, default=0.5
             Classification threshold.
+        prune_columns : bool, default=False
+            Read only the model's input features plus ``id_columns`` instead
+            of every column in the file.
+        id_columns : sequence of str, optional
+            Identifier columns passed through to the output when pruning.
 
         Returns
         -------
@@ -200,22 +378,132 @@ class ChurnPredictor:
             raise FileNotFoundError(f"Input file not found: {input_path}")
 
         # Load data
-        data = pd.read_csv(input_path)
+        usecols = self.input_columns(prune_columns, id_columns)
+        data = read_table(input_path, columns=usecols)  # IDs first, then features
         logger.info(f"Loaded {len(data)} rows from {input_path}")
 
         # Make predictions
-        predictions = self.predict(data, include_proba=include_proba, threshold=threshold)
+        predictions = self.predict(self._model_input(data), include_proba=include_proba, threshold=threshold)
 
         # Combine with original data (optional)
         results_df = pd.concat([data.reset_index(drop=True), predictions.reset_index(drop=True)], axis=1)
 
         # Save
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        results_df.to_csv(output_path, index=False)
+        write_table(results_df, output_path)
         logger.info(f"Predictions saved to {output_path}")
 
         return results_df
 
+    def predict_batch_chunked(
+        self,
+        input_path: str | Path,
+        output_path: str | Path,
+        chunksize: int = 100_000,
+        include_proba: bool = True,
+        threshold: float = 0.5,
+        prune_columns: bool = False,
+        id_columns: Sequence[str] | None = None,
+    ) -> int:
+        """Score a file chunk by chunk, appending results to the output.
+
+        Unlike :meth:`predict_batch`, only one chunk of input and output is
+        held in memory at a time, so memory stays flat regardless of file size.
+        Parquet inputs are streamed row group by row group and Parquet/Feather
+        outputs get one row group (record batch) per chunk.
+
+        Parameters
+        ----------
+        input_path : str or Path
+            Path to input CSV, Parquet or Feather file.
+        output_path : str or Path
+            Path to save predictions (format from its extension).
+        chunksize : int, default=100_000
+            Rows read, scored and written per chunk.
+        include_proba : bool, default=True
+            Whether to include probability scores.
+        threshold : float, default=0.5
+            Classification threshold.
+        prune_columns : bool, default=False
+            Read only the model's input features plus ``id_columns``.
+        id_columns : sequence of str, optional
+            Identifier columns passed through to the output when pruning.
+
+        Returns
+        -------
+        n_rows : int
+            Number of rows scored and written.
+
+        Raises
+        ------
+        FileNotFoundError
+            If input file doesn't exist.
+        """
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1")
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        n_rows = self.write_scored_chunks(
+            input_path,
+            output_path,
+            chunksize=chunksize,
+            include_proba=include_proba,
+            threshold=threshold,
+            usecols=self.input_columns(prune_columns, id_columns),
+        )
+
+        logger.info(f"Predictions for {n_rows} rows saved to {output_path} ({chunksize} rows per chunk)")
+        return n_rows
+
+    def write_scored_chunks(
+        self,
+        source: Any,
+        output_path: str | Path,
+        chunksize: int,
+        include_proba: bool = True,
+        threshold: float = 0.5,
+        usecols: list[str] | None = None,
+        row_groups: Sequence[int] | None = None,
+    ) -> int:
+        """Stream ``source`` through the model into ``output_path``, one chunk at a time.
+
+        Parameters
+        ----------
+        source : str, Path or file object
+            Input file, or an open CSV byte stream (used for CSV byte-range shards).
+        output_path : str or Path
+            Output file (format from its extension); its directory must exist.
+        chunksize : int
+            Rows read, scored and written per chunk.
+        include_proba : bool, default=True
+            Whether to include probability scores.
+        threshold : float, default=0.5
+            Classification threshold.
+        usecols : list of str, optional
+            Columns to read (see :meth:`input_columns`).
+        row_groups : sequence of int, optional
+            Parquet row groups / Arrow record batches to read (default: all).
+
+        Returns
+        -------
+        n_rows : int
+            Number of rows scored and written.
+        """
+        chunks = iter_batches(source, chunksize, columns=usecols, row_groups=row_groups)  # IDs first, then features
+        with TableWriter(output_path) as writer:
+            for i, chunk in enumerate(chunks):
+                y_pred, y_proba = self._get_predictions_and_proba(self._model_input(chunk), include_proba)
+                predictions = self._build_results_dataframe(y_pred, y_proba, include_proba, threshold)
+                predictions.index = chunk.index
+                writer.write(pd.concat([chunk, predictions], axis=1))
+                logger.debug(f"Scored chunk {i} ({writer.rows_written} rows so far)")
+        return writer.rows_written
+
     def explain_prediction(self, X: pd.DataFrame, sample_idx: int = 0) -> dict[str, Any]:
         """Explain a single prediction (basic feature importance).
 
@@ -0,0 +1,63 @@
+"""Sharding helpers for multi-process scoring of CSV, Parquet and Arrow IPC files.
+
+Reading and writing live in ``common_utils.tabular_io`` (shared with the
+other projects); :func:`count_row_groups` and :func:`concat_files` are the
+BankChurn-specific pieces used to split a file across worker processes and
+join their outputs.
+"""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Sequence
+
+from common_utils.tabular_io import CSV, FEATHER, PARQUET, TableWriter, detect_format, open_ipc, pyarrow_modules
+
+
+def count_row_groups(path: str | Path, fmt: str | None = None) -> int:
+    """Number of Parquet row groups (or Arrow IPC record batches) in a file."""
+    fmt = fmt or detect_format(path)
+    if fmt == PARQUET:
+        _, pq, _ = pyarrow_modules()
+        return pq.ParquetFile(path).num_row_groups
+    if fmt == FEATHER:
+        return open_ipc(path).num_record_batches
+    raise ValueError(f"CSV files have no row groups: {path}")
+
+
+def concat_files(part_paths: Sequence[Path], output_path: Path, fmt: str | None = None) -> None:
+    """Concatenate same-format files in order into ``output_path``.
+
+    CSV parts are copied byte for byte, keeping only the first header.
+    Parquet row groups and Arrow record batches are copied without a round
+    trip through pandas. Missing parts (shards with no rows) are skipped.
+    """
+    fmt = fmt or detect_format(output_path)
+    if fmt == CSV:
+        with open(output_path, "wb") as out:
+            wrote_header = False
+            for part in part_paths:
+                if not part.exists():
+                    continue
+                with open(part, "rb") as f:
+                    header = f.readline()
+                    if not wrote_header:
+                        out.write(header)
+                        wrote_header = True
+                    shutil.copyfileobj(f, out, length=1 << 20)
+        return
+
+    pa, pq, _ = pyarrow_modules()
+    with TableWriter(output_path, fmt=fmt) as writer:
+        for part in part_paths:
+            if not part.exists():
+                continue
+            if fmt == PARQUET:
+                with pq.ParquetFile(part, pre_buffer=False) as parquet_file:
+                    for i in range(parquet_file.num_row_groups):
+                        writer.write_arrow(parquet_file.read_row_group(i))
+            else:
+                reader = open_ipc(part, memory_map=False)
+                for i in range(reader.num_record_batches):
+                    writer.write_arrow(pa.Table.from_batches([reader.get_batch(i)]))
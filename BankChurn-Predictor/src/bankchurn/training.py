@@ -4,19 +4,23 @@ This module implements the complete training workflow including:
 - Data loading and validation
 - Feature preprocessing
 - Model training with cross-validation
-- Hyperparameter optimization with Optuna
+- Hyperparameter optimization with Optuna (see :mod:`.optimization`)
 - Model persistence and logging
 """
 
 from __future__ import annotations
 
 import logging
+import time
 from pathlib import Path
+from typing import Any
 
 import joblib
 import mlflow
 import numpy as np
 import pandas as pd
+from common_utils.feature_cache import read_csv
+from joblib import Parallel, delayed, effective_n_jobs
 from sklearn.compose import ColumnTransformer
 from sklearn.ensemble import RandomForestClassifier, VotingClassifier
 from sklearn.impute import SimpleImputer
@@ -27,11 +31,31 @@ from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import OneHotEncoder, StandardScaler
 
 from .config import BankChurnConfig
-from .models import ResampleClassifier
+from .models import FoldEnsembleClassifier, ResampleClassifier
 
 logger = logging.getLogger(__name__)
 
 
+def _fit_fold(
+    model: Any, X: np.ndarray, y: np.ndarray, train_idx: np.ndarray, val_idx: np.ndarray, keep_model: bool
+) -> tuple[float, float, np.ndarray, Any]:
+    """Fit ``model`` on one CV fold.
+
+    Module-level so joblib workers can run it; ``X`` arrives as a read-only
+    memory map shared by all folds.
+
+    Returns ``(weighted F1, fit seconds, validation probabilities, model)``;
+    the model is None unless ``keep_model`` (saves sending it back).
+    """
+    start = time.perf_counter()
+    model.fit(X[train_idx], y[train_idx])
+    fit_seconds = time.perf_counter() - start
+    proba = model.predict_proba(X[val_idx])
+    y_pred = model.classes_[np.argmax(proba, axis=1)]
+    f1 = float(f1_score(y[val_idx], y_pred, average="weighted"))
+    return f1, fit_seconds, proba, model if keep_model else None
+
+
 class ChurnTrainer:
     """Training pipeline for churn prediction models.
 
@@ -52,6 +76,13 @@ class ChurnTrainer:
         Training set performance.
     test_score_ : float
         Test set performance.
+    cv_results_ : list of dict
+        Per-fold ``f1`` and ``fit_seconds`` of the last cross-validation.
+    cv_models_ : list
+        Fitted fold models, kept when cross-validating with ``keep_models``.
+    oof_proba_ : Series or None
+        Out-of-fold churn probability of every training row (indexed like
+        ``y``), e.g. as a calibration set.
     """
 
     def __init__(self, config: BankChurnConfig, random_state: int | None = None) -> None:
@@ -61,6 +92,9 @@ class ChurnTrainer:
         self.preprocessor_: ColumnTransformer | None = None
         self.train_score_: float | None = None
         self.test_score_: float | None = None
+        self.cv_results_: list[dict[str, float]] = []
+        self.cv_models_: list[ResampleClassifier] = []
+        self.oof_proba_: pd.Series | None = None
 
         if self.config.mlflow.enabled:
             try:
@@ -95,7 +129,7 @@ class ChurnTrainer:
         if not input_path.exists():
             raise FileNotFoundError(f"Input file not found: {input_path}")
 
-        data = pd.read_csv(input_path)
+        data = read_csv(input_path, prefix="BANKCHURN_")
         logger.info(f"Loaded data: {data.shape[0]} rows, {data.shape[1]} columns")
 
         # Validate required columns
@@ -250,13 +284,10 @@ class ChurnTrainer:
 
         return model
 
-    def train(
-        self,
-        X: pd.DataFrame,
-        y: pd.Series,
-        use_cv: bool = True,
-    ) -> tuple[Pipeline, dict[str, float]]:
-        """Train the model with optional cross-validation.
+    def split_and_preprocess(
+        self, X: pd.DataFrame, y: pd.Series
+    ) -> tuple[np.ndarray, np.ndarray, pd.Series, pd.Series]:
+        """Hold out the test split and fit ``preprocessor_`` on the training split.
 
         Parameters
         ----------
@@ -264,17 +295,14 @@ class ChurnTrainer:
             Feature matrix.
         y : Series
             Target vector.
-        use_cv : bool, default=True
-            Whether to use cross-validation.
 
         Returns
         -------
-        model : Pipeline
-            Fitted model.
-        metrics : dict
-            Training metrics.
+        X_train, X_test : ndarray
+            Preprocessed feature matrices.
+        y_train, y_test : Series
+            Matching targets.
         """
-        # Split data
         # CRITICAL: Split BEFORE fitting preprocessor to avoid data leakage
         # We split the raw data first
         X_train, X_test, y_train, y_test = train_test_split(
@@ -293,39 +321,53 @@ class ChurnTrainer:
         X_test = self.preprocessor_.transform(X_test)
 
         logger.info(f"Train: {X_train.shape[0]} samples, Test: {X_test.shape[0]} samples")
+        return X_train, X_test, y_train, y_test
 
-        # Build and train model
-        self.model_ = self.build_model()
-
-        if use_cv:
-            # Cross-validation
-            cv = StratifiedKFold(
-                n_splits=self.config.model.cv_folds,
-                shuffle=True,
-                random_state=self.random_state,
-            )
-
-            cv_scores = []
-            for fold, (train_idx, val_idx) in enumerate(cv.split(X_train, y_train), 1):
-                X_fold_train = X_train[train_idx]
-                y_fold_train = y_train.iloc[train_idx]
-                X_fold_val = X_train[val_idx]
-                y_fold_val = y_train.iloc[val_idx]
+    def train(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        use_cv: bool = True,
+    ) -> tuple[Pipeline, dict[str, float]]:
+        """Train the model with optional cross-validation.
 
-                fold_model = self.build_model()
-                fold_model.fit(X_fold_train, y_fold_train)
+        Parameters
+        ----------
+        X : DataFrame
+            Feature matrix.
+        y : Series
+            Target vector.
+        use_cv : bool, default=True
+            Whether to use cross-validation. With ``config.model.cv_ensemble``
+            the fold models become the final model (a
+            :class:`~src.bankchurn.models.FoldEnsembleClassifier` averaging
+            their probabilities) and the full refit is skipped.
 
-                y_pred = fold_model.predict(X_fold_val)
-                fold_f1 = f1_score(y_fold_val, y_pred, average="weighted")
-                cv_scores.append(fold_f1)
+        Returns
+        -------
+        model : Pipeline
+            Fitted model.
+        metrics : dict
+            Training metrics.
+        """
+        X_train, X_test, y_train, y_test = self.split_and_preprocess(X, y)
 
-                logger.info(f"Fold {fold}/{self.config.model.cv_folds}: F1 = {fold_f1:.4f}")
+        cv_ensemble = self.config.model.cv_ensemble
+        if cv_ensemble and not use_cv:
+            logger.warning("cv_ensemble requires cross-validation; refitting a single model instead")
+            cv_ensemble = False
 
-            logger.info(f"CV Mean F1: {np.mean(cv_scores):.4f} (+/- {np.std(cv_scores):.4f})")
+        cv_metrics: dict[str, float] = {}
+        if use_cv:
+            cv_metrics = self.cross_validate(X_train, y_train, keep_models=cv_ensemble)
 
-        # Final training on full train set
-        assert self.model_ is not None
-        self.model_.fit(X_train, y_train)
+        if cv_ensemble:
+            # Bag the fold models instead of refitting on the full train set
+            self.model_ = FoldEnsembleClassifier(self.cv_models_).fit()
+        else:
+            # Final training on full train set
+            self.model_ = self.build_model()
+            self.model_.fit(X_train, y_train)
 
         # Evaluate
         y_train_pred = self.model_.predict(X_train)
@@ -346,6 +388,7 @@ class ChurnTrainer:
             "train_f1": self.train_score_,
             "test_f1": self.test_score_,
             "test_auc": test_auc,
+            **cv_metrics,
         }
 
         logger.info(f"Training complete - Train F1: {self.train_score_:.4f}, Test F1: {self.test_score_:.4f}")
@@ -358,6 +401,9 @@ class ChurnTrainer:
 
                 # Log metrics
                 mlflow.log_metrics(metrics)
+                for fold, result in enumerate(self.cv_results_, 1):
+                    mlflow.log_metric("cv_fold_f1", result["f1"], step=fold)
+                    mlflow.log_metric("cv_fold_fit_seconds", result["fit_seconds"], step=fold)
 
                 # Log model (optional, might be large)
                 # mlflow.sklearn.log_model(self.model_, "model")
@@ -365,6 +411,80 @@ class ChurnTrainer:
 
         return self.model_, metrics
 
+    def cross_validate(self, X: np.ndarray, y: pd.Series, keep_models: bool = False) -> dict[str, float]:
+        """Stratified K-fold cross-validation of :meth:`build_model`.
+
+        Folds are fitted in parallel on ``config.model.n_jobs`` joblib worker
+        processes. The preprocessed matrix is written once to a memory map
+        shared read-only by every worker instead of being pickled per fold,
+        and each fold forest is single threaded to avoid oversubscription.
+
+        Parameters
+        ----------
+        X : ndarray
+            Preprocessed training matrix.
+        y : Series
+            Training target.
+        keep_models : bool, default=False
+            Keep the fitted fold models in ``cv_models_``.
+
+        Returns
+        -------
+        metrics : dict
+            ``cv_f1_mean``, ``cv_f1_std``, ``cv_seconds`` (wall time) and the
+            out-of-fold ``oof_f1`` and ``oof_auc``. Per-fold scores and fit
+            times are stored in ``cv_results_``, the out-of-fold
+            probabilities in ``oof_proba_``.
+        """
+        cv = StratifiedKFold(
+            n_splits=self.config.model.cv_folds,
+            shuffle=True,
+            random_state=self.random_state,
+        )
+        y_values = np.asarray(y)
+        n_workers = min(effective_n_jobs(self.config.model.n_jobs), self.config.model.cv_folds)
+
+        def fold_model() -> Any:
+            model = self.build_model()
+            if n_workers > 1:
+                model.set_params(estimator__rf__n_jobs=1)
+            return model
+
+        splits = list(cv.split(X, y_values))
+        start = time.perf_counter()
+        results = Parallel(n_jobs=n_workers, max_nbytes=0, mmap_mode="r")(
+            delayed(_fit_fold)(fold_model(), X, y_values, train_idx, val_idx, keep_models)
+            for train_idx, val_idx in splits
+        )
+        wall_seconds = time.perf_counter() - start
+
+        self.cv_results_ = [{"f1": f1, "fit_seconds": seconds} for f1, seconds, _, _ in results]
+        self.cv_models_ = [model for _, _, _, model in results] if keep_models else []
+        for fold, (f1, seconds, _, _) in enumerate(results, 1):
+            logger.info(f"Fold {fold}/{self.config.model.cv_folds}: F1 = {f1:.4f} ({seconds:.2f}s)")
+
+        # Every training row is scored exactly once, by the fold that did not see it
+        classes = np.unique(y_values)
+        oof = np.empty((len(y_values), len(classes)))
+        for (_, val_idx), (_, _, proba, _) in zip(splits, results):
+            oof[val_idx] = proba
+        self.oof_proba_ = pd.Series(oof[:, -1], index=getattr(y, "index", None), name="oof_proba")
+        oof_f1 = float(f1_score(y_values, classes[np.argmax(oof, axis=1)], average="weighted"))
+        oof_auc = float(roc_auc_score(y_values, oof[:, -1])) if len(classes) == 2 else None
+
+        scores = [f1 for f1, _, _, _ in results]
+        logger.info(
+            f"CV Mean F1: {np.mean(scores):.4f} (+/- {np.std(scores):.4f}), OOF F1: {oof_f1:.4f}, "
+            f"{wall_seconds:.2f}s on {n_workers} worker(s)"
+        )
+        return {
+            "cv_f1_mean": float(np.mean(scores)),
+            "cv_f1_std": float(np.std(scores)),
+            "cv_seconds": wall_seconds,
+            "oof_f1": oof_f1,
+            "oof_auc": oof_auc,
+        }
+
     def save_model(self, model_path: str | Path, preprocessor_path: str | Path | None = None) -> None:
         """Save trained model and preprocessor to disk.
 
@@ -5,7 +5,13 @@ import sys
 from collections.abc import Generator
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pytest
+from sklearn.pipeline import Pipeline
+
+from src.bankchurn.config import BankChurnConfig, DataConfig, MLflowConfig, ModelConfig, RandomForestConfig
+from src.bankchurn.training import ChurnTrainer
 
 try:
     from common_utils.seed import set_seed
@@ -32,3 +38,70 @@ def deterministic_seed() -> Generator[None, None, None]:
     seed = int(os.getenv("TEST_SEED", os.getenv("SEED", "42")))
     set_seed(seed)
     yield
+
+
+NUMERIC_FEATURES = [
+    "CreditScore",
+    "Age",
+    "Tenure",
+    "Balance",
+    "NumOfProducts",
+    "HasCrCard",
+    "IsActiveMember",
+    "EstimatedSalary",
+]
+
+
+@pytest.fixture(scope="module")
+def churn_data(request: pytest.FixtureRequest) -> pd.DataFrame:
+    """Synthetic churn dataset, configured by the requesting test module.
+
+    Modules may set ``CHURN_SEED`` (default 0), ``CHURN_ROWS`` (default 400)
+    and ``CHURN_TARGET``: ``"age"`` (default) makes churn likelier with age,
+    so models have a signal to learn; ``"random"`` draws ~25% churners
+    independently of the features.
+    """
+    seed = getattr(request.module, "CHURN_SEED", 0)
+    n = getattr(request.module, "CHURN_ROWS", 400)
+    target = getattr(request.module, "CHURN_TARGET", "age")
+    rng = np.random.default_rng(seed)
+    age = rng.integers(18, 90, n)
+    data = pd.DataFrame(
+        {
+            "CreditScore": rng.integers(300, 850, n),
+            "Geography": rng.choice(["France", "Germany", "Spain"], n),
+            "Gender": rng.choice(["Male", "Female"], n),
+            "Age": age,
+            "Tenure": rng.integers(0, 11, n),
+            "Balance": rng.uniform(0, 250000, n),
+            "NumOfProducts": rng.integers(1, 5, n),
+            "HasCrCard": rng.integers(0, 2, n),
+            "IsActiveMember": rng.integers(0, 2, n),
+            "EstimatedSalary": rng.uniform(10000, 200000, n),
+        }
+    )
+    if target == "age":
+        data["Exited"] = (rng.uniform(size=n) < (age - 18) / 90).astype(int)
+    elif target == "random":
+        data["Exited"] = rng.choice([0, 1], n, p=[0.75, 0.25])
+    else:
+        raise ValueError(f"Unknown CHURN_TARGET: {target}")
+    return data
+
+
+@pytest.fixture(scope="module")
+def trained_pipeline(churn_data: pd.DataFrame):
+    """``(pipeline, X)``: the default ensemble (25-tree forest) trained on ``churn_data``."""
+    config = BankChurnConfig(
+        data=DataConfig(
+            target_column="Exited",
+            categorical_features=["Geography", "Gender"],
+            numerical_features=NUMERIC_FEATURES,
+        ),
+        model=ModelConfig(random_forest=RandomForestConfig(n_estimators=25, n_jobs=1)),
+        mlflow=MLflowConfig(enabled=False),
+    )
+    trainer = ChurnTrainer(config, random_state=42)
+    X, y = trainer.prepare_features(churn_data)
+    trainer.train(X, y, use_cv=False)
+    return Pipeline([("preprocessor", trainer.preprocessor_), ("classifier", trainer.model_)]), X
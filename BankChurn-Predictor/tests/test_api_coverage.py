@@ -1,10 +1,16 @@
 from unittest.mock import MagicMock, patch
 
-import pandas as pd
 import pytest
 from fastapi.testclient import TestClient
 
-from app.fastapi_app import app
+from app.fastapi_app import (
+    BatchPredictionResponse,
+    ColumnarBatchPredictionResponse,
+    app,
+    calculate_feature_contributions,
+)
+from src.bankchurn.compiled import CompilationError
+from src.bankchurn.postprocessing import postprocess
 
 client = TestClient(app)
 
@@ -12,6 +18,7 @@ client = TestClient(app)
 @pytest.fixture
 def mock_predictor():
     with patch("app.fastapi_app.predictor") as mock:
+        mock.explain.side_effect = CompilationError("mock model")
         yield mock
 
 
@@ -48,8 +55,7 @@ def test_health_degraded():
 
 def test_predict_endpoint(mock_predictor):
     # Setup mock
-    mock_df = pd.DataFrame({"prediction": [1], "probability": [0.8], "risk_level": ["HIGH"]})
-    mock_predictor.predict.return_value = mock_df
+    mock_predictor.predict.return_value = postprocess([0.8])
 
     payload = {
         "CreditScore": 600,
@@ -74,8 +80,7 @@ def test_predict_endpoint(mock_predictor):
 
 def test_predict_batch_endpoint(mock_predictor):
     # Setup mock
-    mock_df = pd.DataFrame({"prediction": [0, 1], "probability": [0.1, 0.9], "risk_level": ["LOW", "HIGH"]})
-    mock_predictor.predict.return_value = mock_df
+    mock_predictor.predict.return_value = postprocess([0.1, 0.9])
 
     customer = {
         "CreditScore": 600,
@@ -115,3 +120,55 @@ def test_predict_model_not_loaded():
         }
         response = client.post("/predict", json=customer)
         assert response.status_code == 503
+
+
+def test_predict_batch_columnar_matches_rows(mock_predictor):
+    mock_predictor.predict.return_value = postprocess([0.1, 0.9, 0.5])
+    base = {
+        "CreditScore": 600,
+        "Gender": "Female",
+        "Tenure": 2,
+        "Balance": 0.0,
+        "HasCrCard": 1,
+        "EstimatedSalary": 30000.0,
+    }
+    customers = [
+        {**base, "Geography": "Germany", "Age": 55, "NumOfProducts": 1, "IsActiveMember": 0},
+        {**base, "Geography": "Spain", "Age": 25, "NumOfProducts": 2, "IsActiveMember": 1},
+        {**base, "Geography": "France", "Age": 40, "NumOfProducts": 3, "IsActiveMember": 1},
+    ]
+
+    # Both requests must report the same second
+    with patch("app.fastapi_app.time.strftime", return_value="2025-01-01T00:00:00Z"):
+        body = client.post("/predict_batch", json={"customers": customers}).json()
+        columnar = client.post("/predict_batch?format=columnar", json={"customers": customers}).json()
+
+    # Both shapes match the schemas documented in OpenAPI
+    BatchPredictionResponse(**body)
+    ColumnarBatchPredictionResponse(**columnar)
+    rows = body["predictions"]
+    assert columnar["total_customers"] == 3
+    assert columnar["risk_level"] == ["LOW", "HIGH", "MEDIUM"]
+    for i, (row, customer) in enumerate(zip(rows, customers)):
+        assert row["risk_level"] == columnar["risk_level"][i]
+        assert row["confidence"] == pytest.approx(columnar["confidence"][i])
+        assert row["prediction_timestamp"] == columnar["prediction_timestamp"]
+        assert row["feature_contributions"] == calculate_feature_contributions(customer)
+        assert {k: v[i] for k, v in columnar["feature_contributions"].items()} == row["feature_contributions"]
+
+
+def test_predict_batch_rejects_unknown_format(mock_predictor):
+    customer = {
+        "CreditScore": 600,
+        "Geography": "Spain",
+        "Gender": "Female",
+        "Age": 30,
+        "Tenure": 2,
+        "Balance": 0.0,
+        "NumOfProducts": 1,
+        "HasCrCard": 1,
+        "IsActiveMember": 0,
+        "EstimatedSalary": 30000.0,
+    }
+    response = client.post("/predict_batch?format=xml", json={"customers": [customer]})
+    assert response.status_code == 422
@@ -0,0 +1,71 @@
+"""Tests for memory-mapped artifact loading and startup warm-up."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import joblib
+import numpy as np
+import pytest
+from common_utils.artifacts import ArtifactSettings, load_artifact, memory_usage
+from fastapi.testclient import TestClient
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from app import fastapi_app
+
+
+@pytest.fixture
+def fitted_pipeline():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 4))
+    return make_pipeline(StandardScaler(), LogisticRegression()).fit(X, X[:, 0] > 0), X
+
+
+def test_artifact_settings_from_env():
+    env = {"SVC_MODEL_MMAP": "true", "SVC_PRELOAD_MODEL": "1"}
+    with patch.dict(os.environ, env):
+        settings = ArtifactSettings.from_env("SVC_")
+    assert settings.mmap and settings.preload and settings.mmap_mode == "r"
+    assert ArtifactSettings().mmap_mode is None
+
+
+def test_load_artifact_memory_maps_arrays(tmp_path, fitted_pipeline):
+    model, X = fitted_pipeline
+    path = tmp_path / "model.joblib"
+    joblib.dump(model, path)
+
+    mapped = load_artifact(path, mmap_mode="r")
+
+    assert isinstance(mapped[-1].coef_, np.memmap)
+    assert not mapped[-1].coef_.flags.writeable
+    np.testing.assert_allclose(mapped.predict_proba(X), model.predict_proba(X))
+
+
+def test_load_artifact_falls_back_for_compressed_files(tmp_path, fitted_pipeline, recwarn):
+    model, X = fitted_pipeline
+    path = tmp_path / "model.joblib"
+    joblib.dump(model, path, compress=3)
+
+    loaded = load_artifact(path, mmap_mode="r")
+
+    assert not isinstance(loaded[-1].coef_, np.memmap)
+    np.testing.assert_allclose(loaded.predict_proba(X), model.predict_proba(X))
+    assert not [w for w in recwarn if "mmap" in str(w.message)]
+
+
+@pytest.mark.skipif(not Path("/proc/self/smaps_rollup").exists(), reason="needs Linux smaps_rollup")
+def test_memory_usage_reports_rss_and_pss():
+    usage = memory_usage()
+    assert usage["rss"] > 0
+    assert usage["pss"] <= usage["rss"]
+    assert usage["shared"] + usage["private"] == pytest.approx(usage["rss"], rel=0.01)
+
+
+def test_startup_unloads_model_that_fails_warm_up():
+    with patch.object(fastapi_app, "load_model_logic"), patch.object(fastapi_app, "predictor", object()):
+        with TestClient(fastapi_app.app) as client:
+            health = client.get("/health").json()
+
+    assert health["model_loaded"] is False
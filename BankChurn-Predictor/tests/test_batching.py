@@ -0,0 +1,135 @@
+"""Tests for the /predict micro-batcher."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import fastapi_app
+from app.batching import MicroBatcher, QueueFullError
+from src.bankchurn.compiled import CompilationError
+from src.bankchurn.postprocessing import postprocess
+
+
+def test_concurrent_requests_are_coalesced():
+    calls = []
+
+    def batch_fn(items):
+        calls.append(list(items))
+        return [item * 2 for item in items]
+
+    async def scenario():
+        batcher = MicroBatcher(batch_fn, max_batch_size=64, max_wait_ms=50)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert results == [i * 2 for i in range(10)]
+    assert len(calls) == 1
+    assert calls[0] == list(range(10))
+
+
+def test_batches_respect_max_size():
+    sizes = []
+
+    def batch_fn(items):
+        sizes.append(len(items))
+        return items
+
+    async def scenario():
+        batcher = MicroBatcher(batch_fn, max_batch_size=4, max_wait_ms=20)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+        await batcher.stop()
+        return results
+
+    assert asyncio.run(scenario()) == list(range(10))
+    assert sizes == [4, 4, 2]
+
+
+def test_async_batch_fn_and_observer():
+    observed = []
+
+    async def batch_fn(items):
+        await asyncio.sleep(0)
+        return [-item for item in items]
+
+    async def scenario():
+        batcher = MicroBatcher(batch_fn, max_wait_ms=5, observer=lambda n, wait: observed.append(n))
+        results = await asyncio.gather(batcher.submit(1), batcher.submit(2))
+        await batcher.stop()
+        return results
+
+    assert asyncio.run(scenario()) == [-1, -2]
+    assert sum(observed) == 2
+
+
+def test_errors_propagate_to_every_request():
+    def batch_fn(items):
+        raise ValueError("model exploded")
+
+    async def scenario():
+        batcher = MicroBatcher(batch_fn, max_wait_ms=5)
+        results = await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_queue_full_is_rejected():
+    async def scenario():
+        release = asyncio.Event()
+
+        async def batch_fn(items):
+            await release.wait()
+            return items
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=1, max_wait_ms=0, max_queue_size=1)
+        first = asyncio.ensure_future(batcher.submit(1))
+        await asyncio.sleep(0.01)  # first item is now being scored
+        second = asyncio.ensure_future(batcher.submit(2))
+        await asyncio.sleep(0)
+        with pytest.raises(QueueFullError):
+            await batcher.submit(3)
+        release.set()
+        results = await asyncio.gather(first, second)
+        await batcher.stop()
+        return results
+
+    assert asyncio.run(scenario()) == [1, 2]
+
+
+def test_predict_endpoint_uses_batcher():
+    payload = {
+        "CreditScore": 600,
+        "Geography": "France",
+        "Gender": "Male",
+        "Age": 40,
+        "Tenure": 3,
+        "Balance": 60000.0,
+        "NumOfProducts": 2,
+        "HasCrCard": 1,
+        "IsActiveMember": 1,
+        "EstimatedSalary": 50000.0,
+    }
+
+    class StubPredictor:
+        def predict(self, records, as_arrays=False):
+            return postprocess([0.9] * len(records))
+
+        def explain(self, records):
+            raise CompilationError("stub model")
+
+    with patch.object(fastapi_app, "MICROBATCH_ENABLED", True), patch.object(fastapi_app, "load_model_logic"):
+        with patch.object(fastapi_app, "predictor", StubPredictor()):
+            with TestClient(fastapi_app.app) as client:
+                assert fastapi_app.batcher is not None
+                response = client.post("/predict", json=payload)
+
+    assert response.status_code == 200
+    assert response.json()["churn_probability"] == 0.9
+    assert fastapi_app.batcher is None
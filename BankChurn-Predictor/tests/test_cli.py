@@ -47,6 +47,10 @@ def mock_args():
     args.threshold = 0.5
     args.no_proba = False
     args.fairness_features = "Gender"
+    args.chunksize = None
+    args.prune_columns = False
+    args.id_columns = None
+    args.workers = 1
     return args
 
 
@@ -149,6 +153,7 @@ def test_train_command(mock_trainer_cls, mock_config_cls, mock_args, mock_data):
         mock_data["Exited"],
     )
     mock_trainer.train.return_value = (MagicMock(), {"f1": 0.8})
+    mock_trainer.cv_results_ = [{"f1": 0.8, "fit_seconds": 0.1}]
 
     # Run
     exit_code = train_command(mock_args)
@@ -198,3 +203,32 @@ def test_predict_command(mock_read_csv, mock_predictor_cls, mock_args, mock_data
     # Verify
     assert exit_code == 0
     mock_predictor.predict_batch.assert_called_once()
+
+
+@patch("src.bankchurn.cli.ChurnPredictor")
+def test_predict_command_chunked(mock_predictor_cls, mock_args):
+    mock_args.chunksize = 1000
+    mock_args.prune_columns = True
+    mock_args.id_columns = "CustomerId,Surname"
+    mock_predictor = mock_predictor_cls.from_files.return_value
+    mock_predictor.predict_batch_chunked.return_value = 100
+
+    exit_code = predict_command(mock_args)
+
+    assert exit_code == 0
+    mock_predictor.predict_batch.assert_not_called()
+    kwargs = mock_predictor.predict_batch_chunked.call_args.kwargs
+    assert kwargs["chunksize"] == 1000
+    assert kwargs["id_columns"] == ["CustomerId", "Surname"]
+
+
+@patch("src.bankchurn.cli.predict_csv_parallel")
+def test_predict_command_workers(mock_parallel, mock_args):
+    mock_args.workers = 4
+    mock_args.input = ["a.csv", "b.csv"]
+    mock_parallel.return_value = 10
+
+    assert predict_command(mock_args) == 0
+    kwargs = mock_parallel.call_args.kwargs
+    assert kwargs["workers"] == 4
+    assert kwargs["input_paths"] == ["a.csv", "b.csv"]
@@ -0,0 +1,99 @@
+"""Tests for the compiled NumPy inference path."""
+
+import numpy as np
+import pytest
+from sklearn.ensemble import GradientBoostingClassifier
+from sklearn.pipeline import Pipeline
+
+from src.bankchurn.compiled import CompilationError, CompiledChurnModel, compile_model
+from src.bankchurn.config import BankChurnConfig, DataConfig, MLflowConfig, ModelConfig, RandomForestConfig
+from src.bankchurn.prediction import ChurnPredictor
+from src.bankchurn.training import ChurnTrainer
+
+# Churn labels independent of the features (see conftest.churn_data)
+CHURN_TARGET = "random"
+
+
+def test_compiled_matches_sklearn_probabilities(trained_pipeline):
+    pipeline, X = trained_pipeline
+    compiled = CompiledChurnModel.from_pipeline(pipeline)
+
+    np.testing.assert_allclose(compiled.predict_proba(X), pipeline.predict_proba(X), rtol=0, atol=1e-9)
+    np.testing.assert_array_equal(compiled.predict(X), pipeline.predict(X))
+
+
+def test_compiled_fold_ensemble(churn_data):
+    config = BankChurnConfig(
+        data=DataConfig(target_column="Exited", categorical_features=["Geography", "Gender"]),
+        model=ModelConfig(cv_folds=3, cv_ensemble=True, random_forest=RandomForestConfig(n_estimators=10, n_jobs=1)),
+        mlflow=MLflowConfig(enabled=False),
+    )
+    trainer = ChurnTrainer(config, random_state=0)
+    X, y = trainer.prepare_features(churn_data)
+    trainer.train(X, y)
+    pipeline = Pipeline([("preprocessor", trainer.preprocessor_), ("classifier", trainer.model_)])
+
+    compiled = CompiledChurnModel.from_pipeline(pipeline)
+
+    assert len(compiled.members) == 6
+    np.testing.assert_allclose(compiled.predict_proba(X), pipeline.predict_proba(X), rtol=0, atol=1e-9)
+
+
+def test_compiled_handles_unknown_and_missing_values(trained_pipeline):
+    pipeline, X = trained_pipeline
+    X = X.head(30).copy()
+    X["Geography"] = X["Geography"].astype(object)
+    X.loc[X.index[:5], "Geography"] = "Italy"
+    X.loc[X.index[5:10], "Balance"] = np.nan
+    X.loc[X.index[10:15], "Geography"] = None
+
+    compiled = compile_model(pipeline, check_data=X)
+
+    np.testing.assert_allclose(compiled.predict_proba(X), pipeline.predict_proba(X), rtol=0, atol=1e-9)
+
+
+def test_compiled_accepts_records(trained_pipeline):
+    pipeline, X = trained_pipeline
+    compiled = CompiledChurnModel.from_pipeline(pipeline)
+    records = X.head(3).to_dict(orient="records")
+
+    np.testing.assert_allclose(compiled.predict_proba(records), pipeline.predict_proba(X.head(3)), atol=1e-9)
+
+
+def test_unsupported_estimator_raises(trained_pipeline):
+    pipeline, X = trained_pipeline
+    preprocessor = pipeline.named_steps["preprocessor"]
+    gbc = GradientBoostingClassifier(n_estimators=5).fit(preprocessor.transform(X), np.arange(len(X)) % 2)
+
+    with pytest.raises(CompilationError):
+        CompiledChurnModel.from_pipeline(Pipeline([("preprocessor", preprocessor), ("classifier", gbc)]))
+
+
+def test_predictor_compiled_mode(trained_pipeline):
+    pipeline, X = trained_pipeline
+    sklearn_predictor = ChurnPredictor(pipeline)
+    compiled_predictor = ChurnPredictor(pipeline, compiled=True)
+
+    assert sklearn_predictor.inference_mode == "sklearn"
+    assert compiled_predictor.inference_mode == "compiled"
+
+    expected = sklearn_predictor.predict(X)
+    result = compiled_predictor.predict(X.to_dict(orient="records"))
+
+    np.testing.assert_allclose(result["probability"], expected["probability"], atol=1e-9)
+    np.testing.assert_array_equal(result["prediction"], expected["prediction"])
+
+
+def test_predictor_falls_back_when_not_compilable():
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.preprocessing import StandardScaler
+
+    X = np.random.randn(50, 3)
+    y = np.arange(50) % 2
+    model = Pipeline([("scaler", StandardScaler()), ("clf", RandomForestClassifier(n_estimators=3))]).fit(X, y)
+
+    predictor = ChurnPredictor(model, compiled=True)
+
+    assert predictor.inference_mode == "sklearn"
+    with pytest.raises(CompilationError):
+        predictor.compile(strict=True)
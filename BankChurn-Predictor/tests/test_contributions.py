@@ -0,0 +1,113 @@
+"""Tests for exact feature contributions."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from scipy.special import expit
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from app import fastapi_app
+from src.bankchurn.contributions import FeatureContributions
+from src.bankchurn.prediction import ChurnPredictor
+
+NUMERIC = ["CreditScore", "Age", "Tenure", "Balance", "NumOfProducts", "HasCrCard", "IsActiveMember", "EstimatedSalary"]
+CHURN_SEED = 1
+
+
+def _numeric_pipeline(classifier, churn_data):
+    preprocessor = ColumnTransformer([("num", StandardScaler(), NUMERIC)])
+    return Pipeline([("preprocessor", preprocessor), ("classifier", classifier)]).fit(
+        churn_data[NUMERIC], churn_data["Exited"]
+    )
+
+
+def test_contributions_add_up_to_ensemble_probability(trained_pipeline):
+    pipeline, X = trained_pipeline
+    X = X.head(50).copy()
+    X["Geography"] = X["Geography"].astype(object)
+    X.loc[X.index[:5], "Geography"] = "Italy"
+    X.loc[X.index[5:10], "Balance"] = np.nan
+
+    result = FeatureContributions.from_pipeline(pipeline).explain(X)
+
+    assert result.feature_names == ("Geography", "Gender", *NUMERIC)
+    np.testing.assert_allclose(
+        result.base_value + result.values.sum(axis=1), pipeline.predict_proba(X)[:, 1], rtol=0, atol=1e-9
+    )
+
+
+def test_linear_contributions_follow_coefficients(churn_data):
+    pipeline = _numeric_pipeline(LogisticRegression(), churn_data)
+    X = churn_data[NUMERIC].head(20)
+    background = churn_data[NUMERIC].sample(100, random_state=0)
+
+    result = FeatureContributions.from_pipeline(pipeline, background=background).explain(X)
+
+    scaler, lr = pipeline.named_steps["preprocessor"], pipeline.named_steps["classifier"]
+    baseline = scaler.transform(background).mean(axis=0)
+    logit_terms = (scaler.transform(X) - baseline) * lr.coef_[0]
+    assert result.base_value == pytest.approx(expit(baseline @ lr.coef_[0] + lr.intercept_[0]))
+    # Each row rescales its log-odds terms by one factor onto the probability change
+    ratios = result.values / logit_terms
+    np.testing.assert_allclose(ratios, ratios[:, :1].repeat(len(NUMERIC), axis=1), rtol=1e-9)
+    np.testing.assert_allclose(result.base_value + result.values.sum(axis=1), pipeline.predict_proba(X)[:, 1])
+
+
+def test_forest_contributions_match_decision_paths(churn_data):
+    forest = RandomForestClassifier(n_estimators=5, max_depth=4, random_state=0)
+    pipeline = _numeric_pipeline(forest, churn_data)
+    X = churn_data[NUMERIC].head(10)
+    X_t = pipeline.named_steps["preprocessor"].transform(X).astype(np.float32)
+
+    expected = np.zeros((len(X), len(NUMERIC)))
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        positive = tree.value[:, 0, 1] / tree.value[:, 0, :].sum(axis=1)
+        for i, path in enumerate(estimator.decision_path(X_t).tolil().rows):
+            for parent, child in zip(path[:-1], path[1:]):
+                expected[i, tree.feature[parent]] += (positive[child] - positive[parent]) / len(forest.estimators_)
+
+    result = FeatureContributions.from_pipeline(pipeline).explain(X)
+
+    np.testing.assert_allclose(result.values, expected, atol=1e-12)
+
+
+def test_predict_returns_exact_contributions(trained_pipeline):
+    pipeline, X = trained_pipeline
+    customer = X.iloc[0].to_dict()
+    exact = ChurnPredictor(pipeline)
+    with patch.object(fastapi_app, "load_model_logic"), patch.object(fastapi_app, "predictor", exact):
+        with TestClient(fastapi_app.app) as client:
+            data = client.post("/predict", json=customer).json()
+            with patch.object(fastapi_app, "CONTRIBUTIONS_MODE", "heuristic"):
+                heuristic = client.post("/predict", json=customer).json()
+
+    assert set(data["feature_contributions"]) == set(X.columns)
+    assert exact.contributions_.base_value_ + sum(data["feature_contributions"].values()) == pytest.approx(
+        data["churn_probability"]
+    )
+    assert set(heuristic["feature_contributions"]) == set(fastapi_app.CONTRIBUTION_FEATURES)
+
+
+def test_score_batch_explains_with_the_model_that_scored(trained_pipeline):
+    pipeline, X = trained_pipeline
+    served, reloaded = ChurnPredictor(pipeline), ChurnPredictor(pipeline)
+    score = served.predict
+
+    def predict_then_reload(*args, **kwargs):
+        fastapi_app.predictor = reloaded  # a reload lands between scoring and explaining
+        return score(*args, **kwargs)
+
+    with patch.object(fastapi_app, "predictor", served), patch.object(served, "predict", predict_then_reload):
+        with patch.object(reloaded, "explain", side_effect=AssertionError("explained by the reloaded model")):
+            scores, contributions = fastapi_app.score_batch([X.iloc[0].to_dict()])
+
+    assert served.contributions_.base_value_ + sum(values[0] for values in contributions.values()) == pytest.approx(
+        scores.probability[0]
+    )
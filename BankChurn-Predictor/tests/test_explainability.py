@@ -6,15 +6,26 @@ Tests cover both SHAP-based explanations (when available) and fallback modes.
 
 from __future__ import annotations
 
+import pickle
+from unittest.mock import patch
+
+import joblib
 import numpy as np
 import pandas as pd
 import pytest
+from fastapi.testclient import TestClient
+from sklearn.compose import ColumnTransformer
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.linear_model import LogisticRegression
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from app import fastapi_app
+from src.bankchurn.cli import cli_main
+from src.bankchurn.explainability import SHAP_AVAILABLE, ModelExplainer, clear_explanation_cache
+from src.bankchurn.prediction import ChurnPredictor
 
-from src.bankchurn.explainability import SHAP_AVAILABLE, ModelExplainer
+needs_shap = pytest.mark.skipif(not SHAP_AVAILABLE, reason="SHAP not installed")
 
 
 @pytest.fixture
@@ -314,6 +325,171 @@ class TestEdgeCases:
         assert importance == {"no_importance_available": 1.0}
 
 
+@pytest.fixture
+def customer_pipeline(sample_data):
+    """RandomForest pipeline on numeric and one-hot encoded customer features."""
+    X, y = sample_data
+    X = X.assign(CreditScore=650, Gender="Female", Tenure=5, HasCrCard=1, EstimatedSalary=np.linspace(2e4, 2e5, len(X)))
+    preprocessor = ColumnTransformer(
+        [
+            ("cat", OneHotEncoder(handle_unknown="ignore"), ["Geography", "Gender"]),
+            ("num", StandardScaler(), [c for c in X.columns if c not in ("Geography", "Gender")]),
+        ]
+    )
+    classifier = RandomForestClassifier(n_estimators=10, max_depth=4, random_state=42)
+    return Pipeline([("preprocessor", preprocessor), ("classifier", classifier)]).fit(X, y), X
+
+
+@needs_shap
+class TestBatchExplanations:
+    """Tests for batched SHAP explanations and their cache."""
+
+    def test_tree_batch_adds_up_to_probability(self, pipeline_model):
+        pipeline, X = pipeline_model
+        explainer = ModelExplainer(pipeline, X)
+
+        result = explainer.explain_batch(X.head(20))
+
+        assert result["method"] == "tree"
+        assert result["explanation_type"] == "shap"
+        assert result["contributions"].shape == (20, X.shape[1])
+        np.testing.assert_allclose(
+            result["base_value"] + result["contributions"].sum(axis=1), result["probabilities"], atol=1e-9
+        )
+        np.testing.assert_array_equal(result["predictions"], pipeline.predict(X.head(20)))
+
+    def test_explain_prediction_matches_batch_row(self, pipeline_model):
+        pipeline, X = pipeline_model
+        explainer = ModelExplainer(pipeline, X)
+
+        single = explainer.explain_prediction(X.iloc[[3]])
+        batch = explainer.explain_batch(X.head(5))["contributions"].iloc[3]
+
+        assert single["feature_contributions"] == {k: round(v, 4) for k, v in batch.items()}
+
+    def test_importance_and_background_cached_per_model_key(self, pipeline_model):
+        pipeline, X = pipeline_model
+        clear_explanation_cache()
+        first = ModelExplainer(pipeline, X, model_key="model-a")
+        importance = first.get_feature_importance()
+
+        second = ModelExplainer(pipeline, X, model_key="model-a")
+        with patch.object(second.explainer, "shap_values") as shap_values:
+            assert second.get_feature_importance() == importance
+        shap_values.assert_not_called()
+        assert second._X_background_transformed is first._X_background_transformed
+
+    def test_workers_match_single_process(self, pipeline_model):
+        pipeline, X = pipeline_model
+        explainer = ModelExplainer(pipeline, X)
+
+        serial = explainer.explain_batch(X.head(30))
+        pooled = explainer.explain_batch(X.head(30), n_jobs=2)
+
+        pd.testing.assert_frame_equal(serial["contributions"], pooled["contributions"])
+
+    def test_pickle_rebuilds_explainer(self, pipeline_model):
+        pipeline, X = pipeline_model
+        explainer = ModelExplainer(pipeline, X)
+
+        restored = pickle.loads(pickle.dumps(explainer))
+
+        assert restored.explanation_method == "tree"
+        pd.testing.assert_frame_equal(
+            restored.explain_batch(X.head(5))["contributions"], explainer.explain_batch(X.head(5))["contributions"]
+        )
+
+    def test_kernel_batch_explains_raw_features(self, sample_data):
+        X, y = sample_data
+        X = X[["Age", "Balance", "NumOfProducts", "IsActiveMember"]]
+        pipeline = Pipeline([("preprocessor", StandardScaler()), ("classifier", LogisticRegression())]).fit(X, y)
+        explainer = ModelExplainer(pipeline, X, kernel_nsamples=50)
+
+        result = explainer.explain_batch(X.head(3))
+
+        assert result["method"] == "kernel"
+        assert list(result["contributions"].columns) == list(X.columns)
+        np.testing.assert_allclose(
+            result["base_value"] + result["contributions"].sum(axis=1), result["probabilities"], atol=1e-6
+        )
+
+    def test_batch_fallback_without_explainer(self, simple_model):
+        model, X = simple_model
+        explainer = ModelExplainer(model)
+
+        result = explainer.explain_batch(X.head(4))
+
+        assert result["explanation_type"] == "fallback"
+        assert result["method"] is None
+        assert len(result["contributions"]) == 4
+
+    def test_invalid_method(self, simple_model):
+        model, X = simple_model
+        with pytest.raises(ValueError, match="method"):
+            ModelExplainer(model, X, method="deep")
+
+    def test_explain_cli_writes_contributions(self, customer_pipeline, tmp_path):
+        pipeline, X = customer_pipeline
+        joblib.dump(pipeline, tmp_path / "model.pkl")
+        X.to_csv(tmp_path / "customers.csv", index=False)
+        output = tmp_path / "explanations.parquet"
+
+        exit_code = cli_main(
+            [
+                "explain",
+                "--model",
+                str(tmp_path / "model.pkl"),
+                "--input",
+                str(tmp_path / "customers.csv"),
+                "--output",
+                str(output),
+                "--rows",
+                "10",
+            ]
+        )
+
+        assert exit_code == 0
+        result = pd.read_parquet(output)
+        assert len(result) == 10
+        assert {"prediction", "probability", "base_value"} <= set(result.columns)
+        shap_columns = [c for c in result.columns if c.startswith("shap_")]
+        np.testing.assert_allclose(
+            result["base_value"] + result[shap_columns].sum(axis=1), result["probability"], atol=1e-9
+        )
+
+    def test_explain_batch_endpoint(self, customer_pipeline, tmp_path):
+        pipeline, X = customer_pipeline
+        background_path = str(tmp_path / "background.csv")
+        X.to_csv(background_path, index=False)
+        customers = X.head(3).to_dict(orient="records")
+        predictor = ChurnPredictor(pipeline)
+
+        with patch.object(fastapi_app, "load_model_logic"), patch.object(fastapi_app, "predictor", predictor):
+            with patch.object(fastapi_app, "model_explainer", None), patch.object(
+                fastapi_app, "model_checksum", "abc123"
+            ), patch.object(fastapi_app, "EXPLAIN_BACKGROUND_PATH", background_path), TestClient(
+                fastapi_app.app
+            ) as client:
+                response = client.post("/explain_batch", json={"customers": customers})
+                # Built for the served predictor under its checksum
+                assert fastapi_app.model_explainer[0] is predictor
+                assert fastapi_app.model_explainer[1].model_key == "abc123"
+                with patch.object(fastapi_app, "EXPLAIN_MAX_BATCH_SIZE", 2):
+                    oversized = client.post("/explain_batch", json={"customers": customers})
+                with patch.object(fastapi_app, "EXPLAIN_BACKGROUND_PATH", None):
+                    unconfigured = client.post("/explain_batch", json={"customers": customers})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["method"] == "tree"
+        assert data["total_customers"] == 3
+        for row, probability in zip(data["explanations"], pipeline.predict_proba(X.head(3))[:, 1]):
+            assert row["churn_probability"] == pytest.approx(probability)
+            assert data["base_value"] + sum(row["feature_contributions"].values()) == pytest.approx(probability)
+        assert oversized.status_code == 413
+        assert unconfigured.status_code == 503
+
+
 # Test SHAP availability flag
 def test_shap_availability_flag():
     """Test that SHAP_AVAILABLE is properly set."""
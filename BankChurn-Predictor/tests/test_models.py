@@ -9,8 +9,9 @@ import pandas as pd
 import pytest
 from sklearn.datasets import make_classification
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.exceptions import NotFittedError
 
-from src.bankchurn.models import ResampleClassifier
+from src.bankchurn.models import FoldEnsembleClassifier, ResampleClassifier
 
 
 @pytest.fixture
@@ -236,3 +237,28 @@ def test_resample_undersample_mock(mock_rus):
     clf.fit(X, y)
 
     mock_rus_inst.fit_resample.assert_called_once()
+
+
+def test_fold_ensemble_averages_member_probabilities(imbalanced_dataset):
+    """Fold ensemble probabilities are the mean of its prefit members."""
+    X, y = imbalanced_dataset
+    members = [RandomForestClassifier(n_estimators=5, random_state=seed).fit(X, y) for seed in range(3)]
+
+    ensemble = FoldEnsembleClassifier(members).fit()
+
+    expected = np.mean([member.predict_proba(X) for member in members], axis=0)
+    np.testing.assert_allclose(ensemble.predict_proba(X), expected)
+    np.testing.assert_array_equal(ensemble.predict(X), ensemble.classes_[np.argmax(expected, axis=1)])
+
+
+def test_fold_ensemble_rejects_invalid_members(imbalanced_dataset):
+    """Empty, unfitted or mismatched members are rejected."""
+    X, y = imbalanced_dataset
+    with pytest.raises(ValueError, match="at least one"):
+        FoldEnsembleClassifier([]).fit()
+    with pytest.raises(NotFittedError):
+        FoldEnsembleClassifier([RandomForestClassifier()]).fit()
+    fitted = RandomForestClassifier(n_estimators=2, random_state=0).fit(X, y)
+    relabeled = RandomForestClassifier(n_estimators=2, random_state=0).fit(X, y + 1)
+    with pytest.raises(ValueError, match="same classes"):
+        FoldEnsembleClassifier([fitted, relabeled]).fit()
@@ -0,0 +1,122 @@
+"""Tests for Optuna hyperparameter tuning."""
+
+from pathlib import Path
+
+import pytest
+
+from src.bankchurn.cli import cli_main
+from src.bankchurn.config import BankChurnConfig, SearchSpaceConfig
+
+optuna = pytest.importorskip("optuna")
+
+from src.bankchurn.optimization import HyperparameterTuner, apply_params, write_tuned_config  # noqa: E402
+
+CONFIG_PATH = Path(__file__).parent.parent / "configs" / "config.yaml"
+CHURN_SEED = 7
+CHURN_ROWS = 200
+
+PARAMS = {
+    "lr_C": 0.5,
+    "rf_n_estimators": 7,
+    "rf_max_depth": 3,
+    "rf_min_samples_split": 4,
+    "rf_min_samples_leaf": 2,
+    "ensemble_lr_weight": 0.25,
+}
+
+
+@pytest.fixture
+def config():
+    config = BankChurnConfig.from_yaml(CONFIG_PATH)
+    config.mlflow.enabled = False
+    config.model.cv_folds = 3
+    config.hyperparameter_optimization.search_space = SearchSpaceConfig(
+        rf_n_estimators=[5, 10], rf_max_depth=[2, 4], rf_min_samples_split=[2, 6], rf_min_samples_leaf=[1, 3]
+    )
+    return config
+
+
+def test_apply_params_updates_model_section(config):
+    tuned = apply_params(config, PARAMS)
+
+    assert tuned.model.logistic_regression.C == 0.5
+    assert tuned.model.random_forest.n_estimators == 7
+    assert tuned.model.random_forest.min_samples_leaf == 2
+    assert tuned.model.ensemble.weights == [0.25, 0.75]
+    # Untouched settings are kept
+    assert tuned.model.random_forest.class_weight == config.model.random_forest.class_weight
+    assert tuned.data == config.data
+
+
+def test_write_tuned_config_is_loadable(tmp_path):
+    output = write_tuned_config(CONFIG_PATH, PARAMS, tmp_path / "tuned.yaml", score=0.8)
+
+    tuned = BankChurnConfig.from_yaml(output)
+    original = BankChurnConfig.from_yaml(CONFIG_PATH)
+    assert tuned.model.random_forest.max_depth == 3
+    assert tuned.model.logistic_regression.solver == original.model.logistic_regression.solver
+    assert tuned.data == original.data
+
+
+def test_tune_reports_folds_and_respects_search_space(config, churn_data):
+    tuner = HyperparameterTuner(config, random_state=0)
+    X, y = churn_data.drop(columns="Exited"), churn_data["Exited"]
+
+    study = tuner.tune(X, y, n_trials=3, timeout=0)
+
+    assert len(study.trials) == 3
+    complete = [t for t in study.trials if t.state == optuna.trial.TrialState.COMPLETE]
+    assert all(len(t.intermediate_values) == config.model.cv_folds for t in complete)
+    best = tuner.best_config()
+    assert 5 <= best.model.random_forest.n_estimators <= 10
+    assert 2 <= best.model.random_forest.max_depth <= 4
+    assert best.mlflow == config.mlflow
+
+
+def test_tune_resumes_stored_study(config, churn_data, tmp_path):
+    storage = f"sqlite:///{tmp_path / 'optuna.db'}"
+    X, y = churn_data.drop(columns="Exited"), churn_data["Exited"]
+
+    HyperparameterTuner(config, random_state=0).tune(X, y, n_trials=2, storage=storage, study_name="resume")
+    study = HyperparameterTuner(config, random_state=0).tune(X, y, n_trials=2, storage=storage, study_name="resume")
+
+    assert len(study.trials) == 4
+
+
+def test_parallel_trials_need_storage(config, churn_data):
+    with pytest.raises(ValueError, match="storage"):
+        HyperparameterTuner(config).tune(churn_data.drop(columns="Exited"), churn_data["Exited"], n_jobs=2)
+
+
+def test_tune_command_writes_config_for_train(config, churn_data, tmp_path):
+    config_path = tmp_path / "config.yaml"
+    write_tuned_config(CONFIG_PATH, PARAMS, config_path)
+    churn_data.to_csv(tmp_path / "churn.csv", index=False)
+    output = tmp_path / "tuned.yaml"
+
+    exit_code = cli_main(
+        [
+            "--seed",
+            "0",
+            "tune",
+            "--config",
+            str(config_path),
+            "--input",
+            str(tmp_path / "churn.csv"),
+            "--output",
+            str(output),
+            "--n-trials",
+            "4",
+            "--workers",
+            "2",
+            "--storage",
+            f"sqlite:///{tmp_path / 'optuna.db'}",
+        ]
+    )
+
+    assert exit_code == 0
+    study = optuna.load_study(study_name="bankchurn", storage=f"sqlite:///{tmp_path / 'optuna.db'}")
+    assert len(study.trials) == 4
+    tuned = BankChurnConfig.from_yaml(output)
+    assert tuned.model.logistic_regression.C == pytest.approx(study.best_params["lr_C"])
+    assert tuned.model.random_forest.n_estimators == study.best_params["rf_n_estimators"]
@@ -0,0 +1,98 @@
+"""Tests for multi-process batch scoring."""
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from common_utils.tabular_io import TableWriter, read_table
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.bankchurn import parallel
+from src.bankchurn.parallel import csv_byte_ranges, predict_csv_parallel, row_group_ranges
+from src.bankchurn.prediction import ChurnPredictor
+
+
+@pytest.fixture
+def model_and_data(tmp_path):
+    rng = np.random.default_rng(1)
+    features = pd.DataFrame(rng.normal(size=(503, 3)), columns=["a", "b", "c"])
+    model = Pipeline(
+        [("scaler", StandardScaler()), ("clf", RandomForestClassifier(n_estimators=5, n_jobs=-1, random_state=0))]
+    )
+    model.fit(features, rng.integers(0, 2, len(features)))
+    model_path = tmp_path / "model.pkl"
+    joblib.dump(model, model_path)
+
+    data = features.assign(CustomerId=np.arange(len(features)))
+    input_path = tmp_path / "input.csv"
+    data.to_csv(input_path, index=False)
+    return model_path, input_path, data
+
+
+def test_byte_ranges_cover_every_row_once(model_and_data):
+    _, input_path, data = model_and_data
+    header, ranges = csv_byte_ranges(input_path, 7)
+
+    raw = input_path.read_bytes()
+    assert header == raw[: len(header)]
+    assert ranges[0][0] == len(header) and ranges[-1][1] == len(raw)
+    assert all(prev[1] == nxt[0] for prev, nxt in zip(ranges, ranges[1:]))
+    assert all(raw[start - 1 : start] == b"\n" for start, _ in ranges)
+    assert sum(raw[start:end].count(b"\n") for start, end in ranges) == len(data)
+
+
+def test_parallel_output_matches_single_process(model_and_data, tmp_path):
+    model_path, input_path, _ = model_and_data
+    expected = ChurnPredictor.from_files(model_path).predict_batch(input_path, tmp_path / "single.csv")
+
+    n_rows = predict_csv_parallel(model_path, input_path, tmp_path / "parallel.csv", workers=3, chunksize=50)
+
+    assert n_rows == len(expected)
+    result = pd.read_csv(tmp_path / "parallel.csv")
+    pd.testing.assert_frame_equal(result, pd.read_csv(tmp_path / "single.csv"))
+    assert not list(tmp_path.glob(".parallel.csv.*"))  # part files cleaned up
+
+
+def test_parallel_multiple_files_keep_order(model_and_data, tmp_path):
+    model_path, input_path, data = model_and_data
+    first, second = tmp_path / "first.csv", tmp_path / "second.csv"
+    data.iloc[:200].to_csv(first, index=False)
+    data.iloc[200:].to_csv(second, index=False)
+
+    n_rows = predict_csv_parallel(
+        model_path,
+        [first, second],
+        tmp_path / "merged.csv",
+        workers=2,
+        prune_columns=True,
+        id_columns=["CustomerId"],
+    )
+
+    result = pd.read_csv(tmp_path / "merged.csv")
+    assert n_rows == len(data)
+    assert result["CustomerId"].tolist() == data["CustomerId"].tolist()
+    assert list(result.columns[:4]) == ["CustomerId", "a", "b", "c"]
+
+
+def test_parallel_parquet_shards_by_row_group(model_and_data, tmp_path):
+    model_path, _, data = model_and_data
+    input_path = tmp_path / "input.parquet"
+    with TableWriter(input_path) as writer:
+        for start in range(0, len(data), 100):
+            writer.write(data.iloc[start : start + 100])
+    expected = ChurnPredictor.from_files(model_path).predict_batch(input_path, tmp_path / "single.parquet")
+
+    assert row_group_ranges(6, 4) == [(0, 1), (1, 3), (3, 4), (4, 6)]
+    n_rows = predict_csv_parallel(model_path, input_path, tmp_path / "parallel.parquet", workers=4, chunksize=64)
+
+    assert n_rows == len(data)
+    pd.testing.assert_frame_equal(read_table(tmp_path / "parallel.parquet"), expected, check_categorical=False)
+
+
+def test_score_shard_requires_initialised_worker(model_and_data, tmp_path):
+    _, input_path, _ = model_and_data
+
+    with pytest.raises(RuntimeError, match="not initialised"):
+        parallel._score_shard(parallel._Shard(str(input_path)), str(tmp_path / "part.csv"), 100, True, 0.5, False, None)
@@ -4,10 +4,12 @@ import joblib
 import numpy as np
 import pandas as pd
 import pytest
+from common_utils.tabular_io import read_table, write_table
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 
+from src.bankchurn.postprocessing import ChurnScores, determine_risk_level, postprocess
 from src.bankchurn.prediction import ChurnPredictor
 
 
@@ -114,6 +116,46 @@ def test_predict_with_threshold(trained_model, fitted_preprocessor, prediction_d
     assert len(result) == len(prediction_data)
 
 
+def test_postprocess_risk_boundaries():
+    """Risk levels are left-closed at 0.3 and 0.7, and 0 is LOW."""
+    probabilities = [0.0, 0.29, 0.3, 0.69, 0.7, 1.0]
+
+    scores = postprocess(probabilities)
+
+    assert scores.risk_level.tolist() == ["LOW", "LOW", "MEDIUM", "MEDIUM", "HIGH", "HIGH"]
+    assert scores.risk_level.tolist() == [determine_risk_level(p) for p in probabilities]
+    assert scores.prediction.tolist() == [0, 0, 0, 1, 1, 1]
+    assert scores.confidence == pytest.approx([1.0, 0.42, 0.4, 0.38, 0.4, 1.0])
+    assert scores.risk_distribution() == {"LOW": 2, "MEDIUM": 2, "HIGH": 2}
+
+
+def test_predict_as_arrays_matches_dataframe(trained_model, fitted_preprocessor, prediction_data):
+    """as_arrays returns the same values as the DataFrame output."""
+    predictor = ChurnPredictor(trained_model, fitted_preprocessor)
+
+    frame = predictor.predict(prediction_data, threshold=0.4)
+    scores = predictor.predict(prediction_data, threshold=0.4, as_arrays=True)
+
+    assert isinstance(scores, ChurnScores)
+    assert list(frame.columns) == ["prediction", "probability", "risk_level", "confidence"]
+    np.testing.assert_array_equal(frame["prediction"], scores.prediction)
+    np.testing.assert_allclose(frame["probability"], scores.probability)
+    np.testing.assert_array_equal(frame["risk_level"].astype(str), scores.risk_level)
+    np.testing.assert_allclose(frame["confidence"], scores.confidence)
+
+
+def test_predict_as_arrays_requires_binary_model(fitted_preprocessor, prediction_data):
+    """as_arrays is rejected for multi-class models."""
+    np.random.seed(42)
+    model = RandomForestClassifier(n_estimators=5, random_state=42).fit(
+        np.random.randn(60, 5), np.random.choice([0, 1, 2], 60)
+    )
+    predictor = ChurnPredictor(model, fitted_preprocessor)
+
+    with pytest.raises(ValueError, match="binary"):
+        predictor.predict(prediction_data, as_arrays=True)
+
+
 def test_predict_batch_size(trained_model, fitted_preprocessor):
     """Test predictions on different batch sizes."""
     predictor = ChurnPredictor(trained_model, fitted_preprocessor)
@@ -127,3 +169,59 @@ def test_predict_batch_size(trained_model, fitted_preprocessor):
     data_multi = pd.DataFrame(np.random.randn(100, 5), columns=[f"f{i}" for i in range(5)])
     result_multi = predictor.predict(data_multi)
     assert len(result_multi) == 100
+
+
+@pytest.fixture
+def frame_model_and_csv(tmp_path):
+    """Pipeline fitted on a DataFrame plus a CSV with extra columns."""
+    rng = np.random.default_rng(0)
+    features = pd.DataFrame(rng.normal(size=(250, 3)), columns=["a", "b", "c"])
+    model = Pipeline([("scaler", StandardScaler()), ("clf", RandomForestClassifier(n_estimators=5, random_state=0))])
+    model.fit(features, rng.integers(0, 2, 250))
+
+    data = features.assign(CustomerId=np.arange(250), Notes="x" * 20)
+    path = tmp_path / "input.csv"
+    data.to_csv(path, index=False)
+    return model, path
+
+
+def test_predict_batch_chunked_matches_in_memory(frame_model_and_csv, tmp_path):
+    model, input_path = frame_model_and_csv
+    predictor = ChurnPredictor(model)
+
+    expected = predictor.predict_batch(input_path, tmp_path / "full.csv")
+    n_rows = predictor.predict_batch_chunked(input_path, tmp_path / "chunked.csv", chunksize=64)
+
+    assert n_rows == 250
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "chunked.csv"), pd.read_csv(tmp_path / "full.csv"))
+    assert len(expected) == 250
+
+
+def test_predict_batch_chunked_prunes_columns(frame_model_and_csv, tmp_path):
+    model, input_path = frame_model_and_csv
+    predictor = ChurnPredictor(model)
+
+    assert predictor.required_features == ["a", "b", "c"]
+    predictor.predict_batch_chunked(
+        input_path, tmp_path / "pruned.csv", chunksize=100, prune_columns=True, id_columns=["CustomerId"]
+    )
+
+    result = pd.read_csv(tmp_path / "pruned.csv")
+    assert list(result.columns[:4]) == ["CustomerId", "a", "b", "c"]
+    assert "Notes" not in result.columns
+    assert result["CustomerId"].tolist() == list(range(250))
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".feather"])
+def test_columnar_formats_match_csv(frame_model_and_csv, tmp_path, suffix):
+    model, csv_path = frame_model_and_csv
+    predictor = ChurnPredictor(model)
+    expected = predictor.predict_batch(csv_path, tmp_path / "expected.csv")
+
+    columnar_path = tmp_path / f"input{suffix}"
+    write_table(read_table(csv_path), columnar_path)
+    predictor.predict_batch(columnar_path, tmp_path / f"full{suffix}")
+    predictor.predict_batch_chunked(columnar_path, tmp_path / f"chunked{suffix}", chunksize=64)
+
+    for name in (f"full{suffix}", f"chunked{suffix}"):
+        pd.testing.assert_frame_equal(read_table(tmp_path / name), expected, check_dtype=False, check_categorical=False)
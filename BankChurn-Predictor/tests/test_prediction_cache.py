@@ -0,0 +1,180 @@
+"""Tests for the prediction result cache and its /predict wiring."""
+
+import os
+import sqlite3
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from common_utils.cache import ENTRY_OVERHEAD, CacheSettings, PredictionCache, canonical_key
+from fastapi.testclient import TestClient
+
+from app import fastapi_app
+from src.bankchurn.compiled import CompilationError
+from src.bankchurn.postprocessing import postprocess
+
+CUSTOMER = fastapi_app.WARMUP_RECORDS[0]
+
+
+class CountingPredictor:
+    """Stub model whose churn probability is Age / 100, counting scored rows."""
+
+    inference_mode = "stub"
+
+    def __init__(self):
+        self.rows_scored = 0
+
+    def predict(self, records, as_arrays=False):
+        frame = pd.DataFrame(records)
+        self.rows_scored += len(frame)
+        return postprocess(frame["Age"].to_numpy(dtype=float) / 100)
+
+    def explain(self, records):
+        raise CompilationError("stub model")
+
+
+def test_canonical_key_ignores_order_and_number_types():
+    key = canonical_key({"Age": 40, "Geography": "France", "HasCrCard": True}, "model-a")
+
+    assert key == canonical_key({"HasCrCard": 1, "Geography": "France", "Age": np.float64(40.0)}, "model-a")
+    assert key != canonical_key({"Age": 41, "Geography": "France", "HasCrCard": True}, "model-a")
+    assert key != canonical_key({"Age": 40, "Geography": "France", "HasCrCard": True}, "model-b")
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_cache_evicts_least_recently_used_within_byte_budget(tmp_path, shared):
+    events = []
+    entry_size = len(canonical_key({}, "")) + 100 + ENTRY_OVERHEAD
+    cache = PredictionCache(
+        max_bytes=3 * entry_size + 50,
+        ttl_seconds=0,
+        path=tmp_path / "cache.sqlite" if shared else None,
+        observer=events.append,
+    )
+    keys = [canonical_key({"i": i}, "m") for i in range(4)]
+    for key in keys[:3]:
+        cache.put(key, "x" * 98)  # encodes to 100 bytes of JSON
+
+    assert cache.get(keys[0]) is not None  # keys[1] is now least recently used
+    cache.put(keys[3], "x" * 98)
+
+    assert cache.get(keys[1]) is None
+    assert all(cache.get(key) is not None for key in (keys[0], keys[2], keys[3]))
+    assert len(cache) == 3 and cache.bytes_used <= 3 * entry_size + 50
+    assert events.count("eviction") == 1
+    cache.close()
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_batched_lookup_and_fill(tmp_path, shared):
+    events = []
+    cache = PredictionCache(path=tmp_path / "cache.sqlite" if shared else None, observer=events.append)
+    score = (0.4, 0, "LOW", 0.5, {"Age": 0.1})
+
+    cache.put_many([("a", score), ("b", (0.9, 1, "HIGH", 0.5, {}))])
+
+    assert cache.get_many(["b", "missing", "a"]) == [(0.9, 1, "HIGH", 0.5, {}), None, score]
+    assert events == ["hit", "miss", "hit"]
+    cache.close()
+
+
+def test_shared_store_holds_json_not_pickles(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = PredictionCache(path=path)
+    cache.put("k", (0.25, 0))
+    with pytest.raises(TypeError):
+        cache.put("j", object())
+
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT value FROM entries").fetchall() == [(b"[0.25,0]",)]
+    cache.close()
+
+
+def test_cache_entries_expire_after_ttl():
+    events = []
+    cache = PredictionCache(ttl_seconds=10, observer=events.append)
+    with patch("common_utils.cache.time.time", return_value=1000.0):
+        cache.put("k", (0.4, 0))
+        assert cache.get("k") == (0.4, 0)
+    with patch("common_utils.cache.time.time", return_value=1011.0):
+        assert cache.get("k") is None
+
+    assert events == ["hit", "expired"]
+    assert len(cache) == 0
+
+
+def test_shared_store_is_visible_to_other_processes(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    writer, reader = PredictionCache(path=path), PredictionCache(path=path)
+
+    writer.put("k", (0.25, 0))
+
+    assert reader.get("k") == (0.25, 0)
+    reader.clear()
+    assert writer.get("k") is None
+
+
+def test_locked_shared_store_is_a_miss_without_blocking(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = PredictionCache(path=path)
+    cache.put("k", (0.25, 0))
+    other_worker = sqlite3.connect(path, isolation_level=None)
+    other_worker.execute("BEGIN IMMEDIATE")
+
+    start = time.perf_counter()
+    assert cache.get("k") is None
+    cache.put("j", (0.5, 1))
+    assert time.perf_counter() - start < 1.0
+
+    other_worker.execute("ROLLBACK")
+    other_worker.close()
+    assert cache.get("k") == (0.25, 0)
+    assert cache.get("j") is None
+    cache.close()
+
+
+def test_cache_settings_from_env():
+    env = {
+        "SVC_PREDICTION_CACHE": "1",
+        "SVC_PREDICTION_CACHE_MAX_BYTES": "1024",
+        "SVC_PREDICTION_CACHE_TTL_SECONDS": "0",
+        "SVC_PREDICTION_CACHE_PATH": "/dev/shm/svc.sqlite",
+    }
+    with patch.dict(os.environ, env):
+        settings = CacheSettings.from_env("SVC_")
+    assert settings == CacheSettings(enabled=True, max_bytes=1024, ttl_seconds=0.0, path="/dev/shm/svc.sqlite")
+
+
+@pytest.fixture
+def cached_client():
+    stub = CountingPredictor()
+    with patch.object(fastapi_app, "load_model_logic"), patch.object(fastapi_app, "predictor", stub), patch.object(
+        fastapi_app, "model_checksum", "checksum-1"
+    ), patch.object(fastapi_app, "CACHE_SETTINGS", CacheSettings(enabled=True)):
+        with TestClient(fastapi_app.app) as client:
+            stub.rows_scored = 0  # ignore the startup warm-up
+            yield client, stub
+
+
+def test_repeated_predict_is_served_from_cache(cached_client):
+    client, stub = cached_client
+
+    first = client.post("/predict", json=CUSTOMER).json()
+    second = client.post("/predict", json={**CUSTOMER, "Balance": int(CUSTOMER["Balance"])}).json()
+    client.post("/predict", json={**CUSTOMER, "Age": 70})
+
+    assert stub.rows_scored == 2
+    assert first["churn_probability"] == second["churn_probability"] == pytest.approx(0.40)
+    assert 'bankchurn_prediction_cache_events_total{event="hit"}' in client.get("/metrics").text
+
+
+def test_new_model_checksum_bypasses_cached_results(cached_client):
+    client, stub = cached_client
+    client.post("/predict", json=CUSTOMER)
+
+    with patch.object(fastapi_app, "model_checksum", "checksum-2"):
+        client.post("/predict", json=CUSTOMER)
+
+    assert stub.rows_scored == 2
@@ -0,0 +1,115 @@
+"""Tests for hot model reload."""
+
+import asyncio
+import os
+from unittest.mock import patch
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from app import fastapi_app
+from app.reloading import ModelFileWatcher
+
+NUMERIC = ["CreditScore", "Age", "Tenure", "Balance", "NumOfProducts", "HasCrCard", "IsActiveMember", "EstimatedSalary"]
+
+
+def _fit_pipeline(seed: int) -> Pipeline:
+    rng = np.random.default_rng(seed)
+    n = 200
+    X = pd.DataFrame(
+        {
+            "CreditScore": rng.integers(300, 851, n),
+            "Geography": rng.choice(["France", "Spain", "Germany"], n),
+            "Gender": rng.choice(["Male", "Female"], n),
+            "Age": rng.integers(18, 90, n),
+            "Tenure": rng.integers(0, 11, n),
+            "Balance": rng.uniform(0, 2e5, n),
+            "NumOfProducts": rng.integers(1, 5, n),
+            "HasCrCard": rng.integers(0, 2, n),
+            "IsActiveMember": rng.integers(0, 2, n),
+            "EstimatedSalary": rng.uniform(1e4, 2e5, n),
+        }
+    )
+    preprocessor = ColumnTransformer(
+        [("num", StandardScaler(), NUMERIC), ("cat", OneHotEncoder(), ["Geography", "Gender"])]
+    )
+    model = Pipeline([("preprocessor", preprocessor), ("classifier", LogisticRegression())])
+    return model.fit(X, rng.integers(0, 2, n))
+
+
+@pytest.fixture
+def model_files(tmp_path):
+    model_path = tmp_path / "best_model.pkl"
+    joblib.dump(_fit_pipeline(0), model_path)
+    with patch.object(fastapi_app, "MODEL_PATH", model_path), patch.object(
+        fastapi_app, "PREPROCESSOR_PATH", tmp_path / "preprocessor.pkl"
+    ), patch.object(fastapi_app, "METADATA_PATH", tmp_path / "metadata.json"):
+        yield model_path
+
+
+def test_watcher_waits_for_file_to_settle(tmp_path):
+    path = tmp_path / "model.pkl"
+    path.write_bytes(b"v1")
+    reloads = []
+
+    async def reload():
+        reloads.append(path.read_bytes())
+
+    async def scenario():
+        watcher = ModelFileWatcher(path, reload, interval_seconds=1)
+        assert not await watcher.poll()  # unchanged
+        path.write_bytes(b"v2-partial")
+        assert not await watcher.poll()  # changed: wait one more interval
+        path.write_bytes(b"v2-complete")
+        os.utime(path, ns=(1, 1))
+        assert not await watcher.poll()  # still changing
+        assert await watcher.poll()  # settled
+        assert not await watcher.poll()
+
+    asyncio.run(scenario())
+    assert reloads == [b"v2-complete"]
+
+
+def test_admin_reload_swaps_model(model_files):
+    with TestClient(fastapi_app.app) as client:
+        original, original_checksum = fastapi_app.predictor, fastapi_app.model_checksum
+        assert original is not None
+
+        assert client.post("/admin/reload").json()["status"] == "unchanged"
+        assert fastapi_app.predictor is original
+
+        joblib.dump(_fit_pipeline(1), model_files)
+        result = client.post("/admin/reload").json()
+
+        assert result["status"] == "reloaded"
+        assert result["previous_checksum"] == original_checksum
+        assert result["checksum"] == fastapi_app.model_checksum != original_checksum
+        assert fastapi_app.predictor is not original
+        assert client.post("/predict", json=fastapi_app.WARMUP_RECORDS[0]).status_code == 200
+        assert f'checksum="{result["checksum"][:12]}"' in client.get("/metrics").text
+
+
+def test_failed_reload_keeps_previous_model(model_files):
+    with TestClient(fastapi_app.app) as client:
+        original = fastapi_app.predictor
+        model_files.write_bytes(b"not a pickle")
+
+        response = client.post("/admin/reload")
+
+        assert response.status_code == 500
+        assert fastapi_app.predictor is original
+        assert client.post("/predict", json=fastapi_app.WARMUP_RECORDS[0]).status_code == 200
+
+
+def test_admin_reload_requires_token_when_configured(model_files):
+    with patch.object(fastapi_app, "ADMIN_TOKEN", "s3cret"), TestClient(fastapi_app.app) as client:
+        assert client.post("/admin/reload").status_code == 403
+        response = client.post("/admin/reload?force=true", headers={"X-Admin-Token": "s3cret"})
+        assert response.json()["status"] == "reloaded"
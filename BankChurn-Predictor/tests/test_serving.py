@@ -0,0 +1,157 @@
+"""Tests for the shared bounded inference executor and its API wiring."""
+
+import asyncio
+import math
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from common_utils.serving import (
+    ExecutorSaturatedError,
+    ExecutorSettings,
+    InferenceExecutor,
+    InferenceMetrics,
+    run_inference,
+)
+from fastapi.testclient import TestClient
+
+from app import fastapi_app
+
+PAYLOAD = {
+    "CreditScore": 600,
+    "Geography": "France",
+    "Gender": "Male",
+    "Age": 40,
+    "Tenure": 3,
+    "Balance": 60000.0,
+    "NumOfProducts": 2,
+    "HasCrCard": 1,
+    "IsActiveMember": 1,
+    "EstimatedSalary": 50000.0,
+}
+
+
+def test_run_off_loop_and_observe_timings():
+    observed = []
+    loop_threads = []
+
+    def work(x):
+        time.sleep(0.02)
+        return threading.get_ident(), x * 2
+
+    async def scenario():
+        loop_threads.append(threading.get_ident())
+        executor = InferenceExecutor(max_workers=1, max_queue=4, observer=lambda w, c: observed.append((w, c)))
+        results = await asyncio.gather(executor.run(work, 1), executor.run(work, 2))
+        executor.shutdown()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert [r[1] for r in results] == [2, 4]
+    assert all(thread != loop_threads[0] for thread, _ in results)
+    assert len(observed) == 2
+    assert all(compute >= 0.015 for _, compute in observed)
+    # With one worker, the second call waits for the first
+    assert max(wait for wait, _ in observed) >= 0.015
+
+
+def test_saturated_executor_rejects():
+    release = threading.Event()
+
+    async def scenario():
+        executor = InferenceExecutor(max_workers=1, max_queue=1)
+        first = asyncio.ensure_future(executor.run(release.wait))
+        second = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.01)
+        assert executor.pending == 2
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run(release.wait)
+        release.set()
+        await asyncio.gather(first, second)
+        assert executor.pending == 0
+        executor.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_call_holds_slot_until_work_finishes():
+    release = threading.Event()
+
+    async def scenario():
+        executor = InferenceExecutor(max_workers=1, max_queue=0)
+        call = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.01)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+        # The worker thread is still blocked, so the slot stays taken
+        assert executor.pending == 1
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run(release.wait)
+        release.set()
+        for _ in range(100):
+            if executor.pending == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert executor.pending == 0
+        assert await executor.run(abs, -3) == 3
+        executor.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_process_executor():
+    async def scenario():
+        executor = InferenceExecutor(max_workers=1, kind="process")
+        result = await executor.run(math.sqrt, 16.0)
+        executor.shutdown()
+        return result
+
+    assert asyncio.run(scenario()) == 4.0
+
+
+def test_settings_from_env(monkeypatch):
+    monkeypatch.setenv("BANKCHURN_INFERENCE_WORKERS", "3")
+    monkeypatch.setenv("BANKCHURN_INFERENCE_EXECUTOR", "Process")
+
+    settings = ExecutorSettings.from_env("BANKCHURN_")
+
+    assert (settings.max_workers, settings.max_queue, settings.kind) == (3, 32, "process")
+    with pytest.raises(ValueError):
+        InferenceExecutor(kind="gpu")
+
+
+def test_metrics_and_run_inference():
+    from prometheus_client import REGISTRY
+
+    metrics = InferenceMetrics("test_serving")
+    executor = InferenceExecutor.from_settings(ExecutorSettings(max_workers=1), metrics=metrics)
+
+    assert asyncio.run(run_inference(executor, abs, -2)) == 2
+    executor.shutdown()
+    # Without an executor (lifespan not started) calls still run off the loop
+    assert asyncio.run(run_inference(None, abs, -3)) == 3
+
+    assert REGISTRY.get_sample_value("test_serving_inference_compute_seconds_count") == 1.0
+    assert REGISTRY.get_sample_value("test_serving_inference_pending") == 0.0
+
+
+def test_predict_returns_429_when_executor_saturated():
+    class SaturatedExecutor:
+        kind, max_workers, max_queue, pending = "thread", 1, 0, 0
+
+        async def run(self, fn, *args):
+            raise ExecutorSaturatedError("full")
+
+        def shutdown(self, wait=True):
+            pass
+
+    with patch.object(fastapi_app, "load_model_logic"), patch.object(fastapi_app, "predictor", object()):
+        with patch.object(fastapi_app, "create_executor", SaturatedExecutor), patch.object(fastapi_app, "warm_up"):
+            with TestClient(fastapi_app.app) as client:
+                response = client.post("/predict", json=PAYLOAD)
+
+    assert response.status_code == 429
+    assert fastapi_app.executor is None
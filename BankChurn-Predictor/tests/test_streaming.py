@@ -0,0 +1,147 @@
+"""Tests for the /predict_stream bulk scoring endpoint."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from fastapi.testclient import TestClient
+
+from app import fastapi_app
+from app.streaming import BodyReader, validate_chunk
+from src.bankchurn.compiled import CompilationError
+from src.bankchurn.postprocessing import postprocess
+
+CUSTOMER = {
+    "CreditScore": 600,
+    "Geography": "France",
+    "Gender": "Male",
+    "Age": 40,
+    "Tenure": 3,
+    "Balance": 60000.0,
+    "NumOfProducts": 2,
+    "HasCrCard": 1,
+    "IsActiveMember": 1,
+    "EstimatedSalary": 50000.0,
+}
+
+
+class AgePredictor:
+    """Deterministic stand-in: probability = Age / 100."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def predict(self, X, as_arrays=False):
+        X = pd.DataFrame(X)
+        self.batch_sizes.append(len(X))
+        return postprocess(X["Age"].to_numpy(dtype=float) / 100)
+
+    def explain(self, X):
+        raise CompilationError("stub model")
+
+
+@pytest.fixture
+def stream_client():
+    stub = AgePredictor()
+    with patch.object(fastapi_app, "load_model_logic"), patch.object(fastapi_app, "predictor", stub):
+        with TestClient(fastapi_app.app) as client:
+            stub.batch_sizes.clear()  # drop the startup warm-up batch
+            yield client, stub
+
+
+def test_validate_chunk_matches_customer_rules():
+    frame = pd.DataFrame(
+        [
+            CUSTOMER,
+            {**CUSTOMER, "Age": 17},
+            {**CUSTOMER, "Geography": "Italy"},
+            {**CUSTOMER, "Tenure": 2.5},
+            {**CUSTOMER, "Balance": None},
+        ]
+    )
+
+    features, errors = validate_chunk(frame, fastapi_app.CUSTOMER_RULES)
+
+    assert errors[0] is None
+    assert errors[1].startswith("Age")
+    assert errors[2].startswith("Geography")
+    assert errors[3].startswith("Tenure")
+    assert errors[4].startswith("Balance")
+    assert features["Age"].dtype.kind == "i"
+    for row, error in zip(frame.to_dict(orient="records"), errors):
+        try:
+            fastapi_app.CustomerData(**row)
+            pydantic_valid = True
+        except ValueError:
+            pydantic_valid = False
+        assert pydantic_valid == (error is None)
+
+
+def test_body_reader_spills_to_disk_in_order():
+    reader = BodyReader(max_memory_chunks=2)
+    chunks = [bytes([i]) * 1000 for i in range(10)]
+    for chunk in chunks:
+        reader.feed(chunk)
+    reader.feed(None)
+
+    assert reader.spooled_bytes == 8000
+    assert io.BufferedReader(reader).read() == b"".join(chunks)
+    assert reader.spooled_bytes == 0
+    reader.close()
+
+
+def test_ndjson_stream_is_scored_in_chunks(stream_client):
+    client, stub = stream_client
+    rows = [{**CUSTOMER, "Age": 20 + i, "CustomerId": 1000 + i} for i in range(7)]
+    rows[3] = {**rows[3], "Gender": "Other"}
+    body = "\n".join(json.dumps(r) for r in rows) + "\nnot json\n"
+
+    response = client.post(
+        "/predict_stream?chunk_size=3",
+        content=body.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["row"] for r in results] == list(range(8))
+    assert results[0]["CustomerId"] == 1000
+    assert results[0]["churn_probability"] == pytest.approx(0.20)
+    assert results[0]["risk_level"] == "LOW"
+    assert results[0]["error"] is None
+    assert results[3]["churn_probability"] is None
+    assert results[3]["error"].startswith("Gender")
+    assert results[7]["error"] == "invalid JSON object"
+    # Invalid rows are never sent to the model; every batch is at most one chunk
+    assert sum(stub.batch_sizes) == 6
+    assert max(stub.batch_sizes) <= 3
+
+
+def test_arrow_stream_round_trip(stream_client):
+    client, _ = stream_client
+    table = pa.Table.from_pandas(pd.DataFrame([{**CUSTOMER, "Age": 20 + i} for i in range(10)]))
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=4):
+            writer.write_batch(batch)
+
+    response = client.post(
+        "/predict_stream?chunk_size=3",
+        content=sink.getvalue(),
+        headers={"Content-Type": "application/vnd.apache.arrow.stream"},
+    )
+
+    assert response.status_code == 200
+    result = pa.ipc.open_stream(response.content).read_pandas()
+    assert result["row"].tolist() == list(range(10))
+    assert result["churn_probability"].tolist() == pytest.approx([(20 + i) / 100 for i in range(10)])
+    assert result["error"].isna().all()
+
+
+def test_stream_rejects_unsupported_content_type(stream_client):
+    client, _ = stream_client
+    response = client.post("/predict_stream", content=b"{}", headers={"Content-Type": "text/csv"})
+    assert response.status_code == 415
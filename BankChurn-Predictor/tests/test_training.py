@@ -1,12 +1,14 @@
 """Tests for ChurnTrainer."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 import pytest
 
 from src.bankchurn.config import BankChurnConfig
+from src.bankchurn.models import FoldEnsembleClassifier
 from src.bankchurn.training import ChurnTrainer
 
 
@@ -222,6 +224,24 @@ def test_trainer_load_and_prepare(config, full_sample_data, tmp_path):
     assert "Exited" not in X.columns
 
 
+def test_load_data_reuses_feature_cache(config, full_sample_data, tmp_path, monkeypatch):
+    """With BANKCHURN_FEATURE_CACHE=1 an unchanged CSV is parsed once."""
+    monkeypatch.setenv("BANKCHURN_FEATURE_CACHE", "1")
+    monkeypatch.setenv("BANKCHURN_FEATURE_CACHE_DIR", str(tmp_path / "feature_cache"))
+    data_path = tmp_path / "train.csv"
+    full_sample_data.to_csv(data_path, index=False)
+    trainer = ChurnTrainer(config, random_state=42)
+
+    first = trainer.load_data(data_path)
+    with patch("pandas.read_csv", side_effect=AssertionError("CSV parsed on a cache hit")):
+        cached = trainer.load_data(data_path)
+    pd.testing.assert_frame_equal(cached, first)
+
+    # A modified file is parsed again
+    full_sample_data.head(50).to_csv(data_path, index=False)
+    assert len(trainer.load_data(data_path)) == 50
+
+
 def test_trainer_build_pipeline(config, full_sample_data):
     """Test building complete preprocessing and model pipeline."""
     trainer = ChurnTrainer(config, random_state=42)
@@ -270,6 +290,48 @@ def test_trainer_with_different_random_states(config, full_sample_data):
     assert len(pred1) == len(pred2)
 
 
+def test_parallel_cross_validation_matches_serial(config, full_sample_data):
+    """Folds fitted on worker processes score exactly like the serial loop."""
+    config.mlflow.enabled = False
+    config.model.random_forest.n_estimators = 10
+    X, y = ChurnTrainer(config).prepare_features(full_sample_data)
+
+    results = {}
+    for n_jobs in (1, 2):
+        config.model.n_jobs = n_jobs
+        trainer = ChurnTrainer(config, random_state=42)
+        _, metrics = trainer.train(X, y, use_cv=True)
+        results[n_jobs] = (metrics, trainer.cv_results_)
+
+    (serial_metrics, serial_folds), (parallel_metrics, parallel_folds) = results[1], results[2]
+    assert len(parallel_folds) == config.model.cv_folds
+    assert [fold["f1"] for fold in parallel_folds] == [fold["f1"] for fold in serial_folds]
+    assert all(fold["fit_seconds"] > 0 for fold in parallel_folds)
+    assert parallel_metrics["cv_f1_mean"] == serial_metrics["cv_f1_mean"]
+    assert parallel_metrics["cv_seconds"] > 0
+
+
+def test_cv_ensemble_reuses_fold_models(config, full_sample_data):
+    """cv_ensemble serves the fold models and exposes out-of-fold probabilities."""
+    config.mlflow.enabled = False
+    config.model.random_forest.n_estimators = 10
+    config.model.cv_ensemble = True
+    trainer = ChurnTrainer(config, random_state=42)
+    X, y = trainer.prepare_features(full_sample_data)
+
+    with patch.object(ChurnTrainer, "build_model", wraps=trainer.build_model) as build_model:
+        model, metrics = trainer.train(X, y, use_cv=True)
+
+    # One model per fold and no extra refit
+    assert build_model.call_count == config.model.cv_folds
+    assert isinstance(model, FoldEnsembleClassifier)
+    assert model.estimators_ == trainer.cv_models_
+    assert len(trainer.oof_proba_) == len(y) - round(len(y) * config.model.test_size)
+    assert trainer.oof_proba_.index.isin(y.index).all()
+    assert trainer.oof_proba_.between(0, 1).all()
+    assert {"oof_f1", "oof_auc", "test_f1"} <= set(metrics)
+
+
 def test_trainer_handles_missing_columns(config, tmp_path):
     """Test trainer validation for missing required columns."""
     # Create data without target column
@@ -3,6 +3,10 @@ CarVision Market Intelligence API
 
 Features:
 - Vehicle price prediction using RandomForest model
+- Batch pricing of up to ``MAX_BATCH_SIZE`` listings per request (``/predict_batch``)
+- Inference on a bounded worker pool so scoring never blocks the event loop
+- Memory-mapped model loading and optional preload for copy-on-write sharing across workers
+- Synthetic warm-up prediction before the service reports ready
 - Prometheus-compatible metrics endpoint
 - Health checks for Kubernetes readiness/liveness
 """
@@ -11,19 +15,28 @@ from __future__ import annotations
 
 import json
 import os
+import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-import joblib
 import pandas as pd
+from common_utils.artifacts import ArtifactSettings, freeze_for_fork, load_artifact
+from common_utils.serving import (
+    ExecutorSaturatedError,
+    ExecutorSettings,
+    InferenceExecutor,
+    InferenceMetrics,
+    run_inference,
+)
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import RedirectResponse, Response
-from pydantic import BaseModel
+from pydantic import BaseModel, validator
 
 # Prometheus metrics (optional dependency)
+INFERENCE_METRICS: Optional[InferenceMetrics] = None
 try:
-    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
 
     PROMETHEUS_AVAILABLE = True
     REQUEST_COUNT = Counter(
@@ -37,25 +50,64 @@ try:
         ["endpoint"],
         buckets=[0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
     )
+    INFERENCE_METRICS = InferenceMetrics("carvision")
+    MODEL_LOAD_SECONDS = Gauge(
+        "carvision_model_load_seconds",
+        "Time the last model load spent in each phase",
+        ["phase"],
+    )
 except ImportError:
     PROMETHEUS_AVAILABLE = False
 
+# The pickled pipeline needs src.carvision (FeatureEngineer) importable anyway
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.carvision.prediction import align_features, feature_fill_values  # noqa: E402
+
 app = FastAPI(title="CarVision Inference API", version="1.0.0")
 start_time = time.time()
 
 MODEL_PATH = os.getenv("MODEL_PATH", "artifacts/model.joblib")
 ARTIFACTS_DIR = Path(os.getenv("ARTIFACTS_DIR", "artifacts"))
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "10000"))
+
+# Bounded inference executor (INFERENCE_WORKERS / INFERENCE_MAX_QUEUE / INFERENCE_EXECUTOR)
+EXECUTOR_SETTINGS = ExecutorSettings.from_env()
+executor: Optional[InferenceExecutor] = None
+
+# Model loading (MODEL_MMAP / PRELOAD_MODEL)
+ARTIFACT_SETTINGS = ArtifactSettings.from_env()
+
+# Synthetic vehicle scored before the service reports ready
+WARMUP_VEHICLE: Dict[str, Any] = {
+    "model_year": 2015,
+    "model": "ford f-150",
+    "condition": "good",
+    "cylinders": 6.0,
+    "fuel": "gas",
+    "odometer": 90000.0,
+    "transmission": "automatic",
+    "drive": "4wd",
+    "type": "truck",
+    "paint_color": "white",
+}
 
 
 class ModelWrapper:
     def __init__(self):
         self.model = None
         self.feature_columns = None
+        self.fill_values: Optional[Dict[str, Any]] = None
 
     def load(self):
         if not Path(MODEL_PATH).exists():
             return  # Handle gracefully or fail
-        self.model = joblib.load(MODEL_PATH)
+        start = time.perf_counter()
+        self.model = load_artifact(MODEL_PATH, mmap_mode=ARTIFACT_SETTINGS.mmap_mode)
+        if PROMETHEUS_AVAILABLE:
+            MODEL_LOAD_SECONDS.labels(phase="load").set(time.perf_counter() - start)
         feat_path = ARTIFACTS_DIR / "feature_columns.json"
         if feat_path.exists():
             self.feature_columns = json.loads(feat_path.read_text())
@@ -66,27 +118,65 @@ class ModelWrapper:
                 self.feature_columns = list(pre.transformers_[0][2]) + list(pre.transformers_[1][2])
             except Exception:
                 pass
+        # Column template: missing features get the pipeline's imputed value
+        if self.feature_columns:
+            self.fill_values = feature_fill_values(self.model, self.feature_columns)
 
-    def predict(self, data: Dict[str, Any]) -> float:
+    def predict_many(self, records: List[Dict[str, Any]]) -> List[float]:
+        """Score a list of vehicles with one aligned DataFrame and one model call."""
         if not self.model:
             raise HTTPException(status_code=503, detail="Model not loaded")
 
-        df = pd.DataFrame([data])
+        df = pd.DataFrame.from_records(records)
 
         # Feature engineering is handled by the model pipeline.
-
-        # Align columns
         if self.feature_columns:
-            for col in self.feature_columns:
-                if col not in df.columns:
-                    df[col] = 0  # Neutral value for missing numeric/encoded
-            df = df[self.feature_columns]
+            df = align_features(df, self.feature_columns, self.fill_values)
+
+        return self.model.predict(df).tolist()
 
-        return float(self.model.predict(df)[0])
+    def predict(self, data: Dict[str, Any]) -> float:
+        return self.predict_many([data])[0]
+
+    def warm_up(self) -> bool:
+        """Score ``WARMUP_VEHICLE`` once; unloads the model if that fails."""
+        if not self.model:
+            return False
+        start = time.perf_counter()
+        try:
+            self.predict(WARMUP_VEHICLE)
+        except Exception as e:
+            print(f"ERROR: Model warm-up failed, serving without a model: {e}")
+            self.model = None
+            return False
+        if PROMETHEUS_AVAILABLE:
+            MODEL_LOAD_SECONDS.labels(phase="warmup").set(time.perf_counter() - start)
+        return True
 
 
 wrapper = ModelWrapper()
 
+# Load in the importing process so workers forked by ``gunicorn --preload``
+# share the model copy-on-write instead of each unpickling its own copy.
+if ARTIFACT_SETTINGS.preload:
+    wrapper.load()
+    if wrapper.warm_up():
+        freeze_for_fork()
+
+
+def _load_worker_model() -> None:
+    wrapper.load()
+
+
+def predict_one(data: Dict[str, Any]) -> float:
+    """Predict with the module-level wrapper (picklable entry point for process workers)."""
+    return wrapper.predict(data)
+
+
+def predict_many(records: List[Dict[str, Any]]) -> List[float]:
+    """Batch counterpart of :func:`predict_one`."""
+    return wrapper.predict_many(records)
+
 
 class VehicleFeatures(BaseModel):
     model_year: int
@@ -101,9 +191,38 @@ class VehicleFeatures(BaseModel):
     paint_color: Optional[str] = "white"
 
 
+class BatchVehicleFeatures(BaseModel):
+    vehicles: List[VehicleFeatures]
+
+    @validator("vehicles")
+    def validate_batch_size(cls, v):
+        if len(v) > MAX_BATCH_SIZE:
+            raise ValueError(f"Max {MAX_BATCH_SIZE} vehicles per batch")
+        if len(v) == 0:
+            raise ValueError("Must include at least one vehicle")
+        return v
+
+
 @app.on_event("startup")
 def load_model():
-    wrapper.load()
+    global executor
+    # Load the model (unless preloaded at import) and warm it up before serving
+    if not wrapper.model:
+        wrapper.load()
+    wrapper.warm_up()
+    executor = InferenceExecutor.from_settings(
+        EXECUTOR_SETTINGS,
+        metrics=INFERENCE_METRICS,
+        initializer=_load_worker_model if EXECUTOR_SETTINGS.kind == "process" else None,
+    )
+
+
+@app.on_event("shutdown")
+def shutdown_executor():
+    global executor
+    if executor is not None:
+        executor.shutdown(wait=False)
+        executor = None
 
 
 @app.get("/", include_in_schema=False)
@@ -131,7 +250,7 @@ async def metrics():
 async def predict(features: VehicleFeatures):
     pred_start = time.time()
     try:
-        pred = wrapper.predict(features.dict())
+        pred = await run_inference(executor, predict_one, features.dict())
         latency = time.time() - pred_start
 
         if PROMETHEUS_AVAILABLE:
@@ -139,7 +258,36 @@ async def predict(features: VehicleFeatures):
             REQUEST_LATENCY.labels(endpoint="/predict").observe(latency)
 
         return {"prediction": pred}
+    except ExecutorSaturatedError as e:
+        if PROMETHEUS_AVAILABLE:
+            REQUEST_COUNT.labels(method="POST", endpoint="/predict", status="429").inc()
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         if PROMETHEUS_AVAILABLE:
             REQUEST_COUNT.labels(method="POST", endpoint="/predict", status="500").inc()
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/predict_batch")
+async def predict_batch(batch: BatchVehicleFeatures):
+    """Price a batch of listings with a single model call."""
+    pred_start = time.time()
+    try:
+        preds = await run_inference(executor, predict_many, [v.dict() for v in batch.vehicles])
+        latency = time.time() - pred_start
+
+        if PROMETHEUS_AVAILABLE:
+            REQUEST_COUNT.labels(method="POST", endpoint="/predict_batch", status="200").inc()
+            REQUEST_LATENCY.labels(endpoint="/predict_batch").observe(latency)
+
+        return {"predictions": preds, "count": len(preds), "processing_time_seconds": latency}
+    except ExecutorSaturatedError as e:
+        if PROMETHEUS_AVAILABLE:
+            REQUEST_COUNT.labels(method="POST", endpoint="/predict_batch", status="429").inc()
+        raise HTTPException(status_code=429, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        if PROMETHEUS_AVAILABLE:
+            REQUEST_COUNT.labels(method="POST", endpoint="/predict_batch", status="500").inc()
+        raise HTTPException(status_code=500, detail=str(e))
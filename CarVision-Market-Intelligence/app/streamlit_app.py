@@ -38,7 +38,7 @@ if str(ROOT_DIR) not in sys.path:
 try:
     from src.carvision.analysis import MarketAnalyzer
     from src.carvision.data import clean_data, load_data
-    from src.carvision.features import FeatureEngineer
+    from src.carvision.features import FeatureEngineer, extract_brand
     from src.carvision.visualization import VisualizationEngine
 except ImportError as e:
     st.error(f"Error importando módulos: {e}")
@@ -170,7 +170,7 @@ def get_pre_cols(m) -> Tuple[List, List, List]:
 def prep_input(data: Dict, feat: List, num: List) -> pd.DataFrame:
     df = pd.DataFrame([data])
     if "model" in df.columns and "brand" not in df.columns:
-        df["brand"] = df["model"].astype(str).str.split().str[0]
+        df["brand"] = extract_brand(df["model"])
     for c in feat:
         if c not in df.columns:
             df[c] = 0 if c in num else "unknown"
@@ -315,7 +315,8 @@ if selected_tab == "📊 Overview":
     with col3:
         st.subheader("🏆 Top Manufacturers")
         if "brand" in df_f.columns:
-            tb = df_f["brand"].value_counts().head(10)
+            tb = df_f["brand"].value_counts()
+            tb = tb[tb > 0].head(10)
             fig3 = px.bar(
                 x=tb.values,
                 y=tb.index,
@@ -7,6 +7,9 @@ Uso:
     python main.py --mode dashboard --port 8501
     python main.py --mode report --output reports/market_analysis.html
     python main.py --mode export --format excel --output market_data.xlsx
+    python main.py --mode predict --input_json payload.json
+    python main.py --mode predict --input vehicles.parquet --output predictions.parquet
+    python main.py --mode tune --config configs/config.yaml
 
 Autor: Daniel Duque
 Versión: 1.0.0
@@ -29,9 +32,10 @@ from src.carvision.analysis import MarketAnalyzer
 from src.carvision.data import clean_data, load_data
 from src.carvision.evaluation import evaluate_model
 from src.carvision.features import FeatureEngineer
-from src.carvision.prediction import predict_price
+from src.carvision.prediction import predict_batch, predict_price, predict_prices
 from src.carvision.reporting import ReportGenerator
 from src.carvision.training import train_model
+from src.carvision.tuning import tune_model
 
 try:
     from common_utils.seed import set_seed
@@ -73,6 +77,7 @@ def main():
             "report",
             "export",
             "train",
+            "tune",
             "eval",
             "predict",
         ],
@@ -119,7 +124,14 @@ def main():
         "--input_json",
         type=str,
         default=None,
-        help="Ruta a JSON con payload para modo predict",
+        help="Ruta a JSON con payload (o lista de payloads) para modo predict",
+    )
+
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=None,
+        help="Filas por lote en predict por archivo (CSV/Parquet/Feather); sin valor carga todo el archivo",
     )
 
     parser.add_argument(
@@ -212,6 +224,16 @@ def main():
             logger.info(f"Modelo guardado en: {result['model_path']}")
             print(json.dumps(result["val_metrics"], indent=2))
 
+        elif args.mode == "tune":
+            logger.info("=== MODO TUNE ===")
+            cfg = load_config(args.config)
+            cfg["seed"] = int(seed_used)
+            # Los parámetros ganadores se escriben en --output si es un YAML; si no, junto a --config
+            # como <nombre>.tuned.yaml. --config nunca se sobrescribe (safe_dump borraría sus comentarios)
+            output_config = args.output if Path(args.output).suffix in (".yaml", ".yml") else None
+            result = tune_model(cfg, args.config, output_config)
+            print(json.dumps({k: result[k] for k in ("best_params", "val_metrics", "cost")}, indent=2))
+
         elif args.mode == "eval":
             logger.info("=== MODO EVAL ===")
             cfg = load_config(args.config)
@@ -221,15 +243,25 @@ def main():
 
         elif args.mode == "predict":
             logger.info("=== MODO PREDICT ===")
-            if not args.input_json or not Path(args.input_json).exists():
-                raise FileNotFoundError("Debe especificar --input_json con ruta válida")
-
             cfg = load_config(args.config)
             cfg["seed"] = int(seed_used)
-            payload = json.loads(Path(args.input_json).read_text())
 
-            result = predict_price(payload, cfg)
-            print(json.dumps(result, indent=2))
+            if args.input_json:
+                if not Path(args.input_json).exists():
+                    raise FileNotFoundError("Debe especificar --input_json con ruta válida")
+                payload = json.loads(Path(args.input_json).read_text())
+
+                # Una lista de vehículos se predice con una sola llamada al modelo
+                if isinstance(payload, list):
+                    result = predict_prices(payload, cfg)
+                else:
+                    result = predict_price(payload, cfg)
+                print(json.dumps(result, indent=2))
+            else:
+                # Predicción por lotes: formato de entrada/salida según la extensión
+                output_file = args.output if Path(args.output).suffix else f"{args.output}.csv"
+                n_rows = predict_batch(args.input, output_file, cfg, batch_size=args.batch_size)
+                logger.info(f"Predicciones por lote: {n_rows} filas -> {output_file}")
 
     except Exception as e:
         logger.error(f"Error en ejecución: {e}")
@@ -8,6 +8,7 @@ from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
+from common_utils.feature_cache import read_csv
 from scipy.stats import ks_2samp
 
 try:  # optional
@@ -83,8 +84,8 @@ def main() -> None:
     parser.add_argument("--evidently_html", default="artifacts/evidently_drift_report.html")
     args = parser.parse_args()
 
-    ref_df = pd.read_csv(args.ref)
-    cur_df = pd.read_csv(args.cur)
+    ref_df = read_csv(args.ref)
+    cur_df = read_csv(args.cur)
 
     res = calc_drift(ref_df, cur_df, args.features)
     html_path = maybe_generate_evidently(ref_df, cur_df, Path(args.evidently_html))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark de throughput de la API: listings/seg en ``/predict`` y ``/predict_batch``.
+
+Para cada tamaño de lote (1 a 10k por defecto) mide:
+
+- ``predict_loop``: una llamada a ``/predict`` por vehículo (cliente HTTP en proceso)
+- ``predict_batch``: una llamada a ``/predict_batch`` con todo el lote
+- ``align_loop`` / ``align_reindex``: solo la alineación de columnas, con el bucle
+  anterior (una columna faltante por vez) frente a ``align_features`` (un ``reindex``)
+
+Necesita un modelo entrenado (``python main.py --mode train``).
+
+Uso:
+    python scripts/benchmark_batch_predict.py --model artifacts/model.joblib --sizes 1 10 100 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+
+def _vehicles(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = np.random.default_rng(seed)
+    models = ["ford f-150", "chevrolet silverado", "toyota camry", "honda civic", "ram 1500", "jeep wrangler"]
+    return [
+        {
+            "model_year": int(rng.integers(1995, 2020)),
+            "model": str(rng.choice(models)),
+            "condition": str(rng.choice(["excellent", "good", "fair"])),
+            "cylinders": float(rng.choice([4, 6, 8])),
+            "fuel": str(rng.choice(["gas", "diesel"])),
+            "odometer": float(rng.integers(0, 250000)),
+            "transmission": "automatic",
+            "type": str(rng.choice(["sedan", "SUV", "truck"])),
+        }
+        for _ in range(n)
+    ]
+
+
+def _align_loop(records: List[Dict[str, Any]], feature_columns: List[str]) -> pd.DataFrame:
+    # Alineación anterior de ModelWrapper.predict (fila a fila en la API)
+    df = pd.DataFrame(records)
+    for col in feature_columns:
+        if col not in df.columns:
+            df[col] = 0
+    return df[feature_columns]
+
+
+def _rate(fn: Callable[[], Any], n_items: int, min_seconds: float) -> float:
+    runs, start = 0, time.perf_counter()
+    while True:
+        fn()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return runs * n_items / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="artifacts/model.joblib")
+    parser.add_argument("--artifacts", default="artifacts", help="Directorio con feature_columns.json")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000, 10000])
+    parser.add_argument("--min-seconds", type=float, default=1.0, help="Tiempo mínimo de medición por caso")
+    args = parser.parse_args()
+
+    if not Path(args.model).exists():
+        sys.exit(f"Modelo no encontrado: {args.model} (ejecuta primero python main.py --mode train)")
+    os.environ.update(MODEL_PATH=args.model, ARTIFACTS_DIR=args.artifacts, INFERENCE_WORKERS="1")
+    os.environ.setdefault("MAX_BATCH_SIZE", str(max(args.sizes)))
+
+    from fastapi.testclient import TestClient
+
+    from app.fastapi_app import app, wrapper
+    from src.carvision.prediction import align_features
+
+    print(f"{'size':>7}{'predict_loop':>15}{'predict_batch':>15}{'align_loop':>13}{'align_reindex':>15}   (listings/s)")
+    with TestClient(app) as client:
+        for size in args.sizes:
+            records = _vehicles(size)
+            loop_records = records[: min(size, 200)]
+            loop = _rate(
+                lambda: [client.post("/predict", json=r) for r in loop_records], len(loop_records), args.min_seconds
+            )
+            batch = _rate(lambda: client.post("/predict_batch", json={"vehicles": records}), size, args.min_seconds)
+            align_old = _rate(lambda: _align_loop(records, wrapper.feature_columns), size, args.min_seconds)
+            align_new = _rate(
+                lambda: align_features(pd.DataFrame(records), wrapper.feature_columns, wrapper.fill_values),
+                size,
+                args.min_seconds,
+            )
+            print(f"{size:>7}{loop:>15,.0f}{batch:>15,.0f}{align_old:>13,.0f}{align_new:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark del bootstrap de evaluación: bucle por remuestra frente al motor vectorizado.
+
+El bucle de referencia (``bootstrap_loop``, el cálculo previo) solo calcula delta-RMSE; el motor de
+``common_utils.bootstrap`` calcula RMSE, MAE, MAPE y R² de modelo y baseline en
+bloques de remuestras, opcionalmente en varios procesos (``--n-jobs``).
+
+Uso:
+    python scripts/benchmark_bootstrap.py --rows 10000 --resamples 200 10000 --n-jobs 1 -1
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from src.carvision.evaluation import _run_bootstrap, rmse  # noqa: E402
+
+
+def bootstrap_loop(y_true, y_model, y_base, n_resamples: int, random_state: int) -> float:
+    """Delta-RMSE medio con una remuestra por iteración (implementación de referencia)."""
+    rng = np.random.default_rng(random_state)
+    n_samples = len(y_true)
+    deltas = []
+    for _ in range(n_resamples):
+        idx = rng.choice(n_samples, size=n_samples, replace=True)
+        deltas.append(rmse(y_true[idx], y_model[idx]) - rmse(y_true[idx], y_base[idx]))
+    return float(np.mean(deltas))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000, help="Filas del conjunto de test")
+    parser.add_argument("--resamples", type=int, nargs="+", default=[200, 10_000])
+    parser.add_argument("--n-jobs", type=int, nargs="+", default=[1, -1])
+    parser.add_argument("--method", default="multinomial", choices=["multinomial", "poisson"])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    y = rng.uniform(1000, 60000, args.rows)
+    y_model = y + rng.normal(0, 4000, args.rows)
+    y_base = np.full(args.rows, np.median(y))
+
+    print(f"{'resamples':>10}  {'variant':<38}{'seconds':>10}{'delta RMSE':>12}")
+    for n_resamples in args.resamples:
+        start = time.perf_counter()
+        loop = bootstrap_loop(y, y_model, y_base, n_resamples, 42)
+        seconds = time.perf_counter() - start
+        print(f"{n_resamples:>10}  {'bucle (solo delta-RMSE)':<38}{seconds:>10.2f}{loop:>12.1f}")
+        for n_jobs in args.n_jobs:
+            start = time.perf_counter()
+            result = _run_bootstrap(y, y_model, y_base, n_resamples, 42, method=args.method, n_jobs=n_jobs)
+            seconds = time.perf_counter() - start
+            label = f"vectorizado, n_jobs={n_jobs} (4 métricas)"
+            print(f"{n_resamples:>10}  {label:<38}{seconds:>10.2f}{result['delta_rmse_mean']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark de FeatureEngineer.transform y MarketAnalyzer.analyze_market_by_brand.
+
+Compara la implementación anterior (copia profunda del DataFrame y ``brand`` con
+``astype(str).str.split()`` fila a fila) con la actual (copia superficial y
+``extract_brand`` sobre los modelos únicos) en un DataFrame de vehículos replicado
+hasta ``--rows`` filas, con ``model`` como texto y como categoría (``load_data``).
+Verifica además que ambas producen los mismos valores.
+
+Uso:
+    python scripts/benchmark_features.py --rows 5000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from scripts.benchmark_load_data import synthetic_vehicles  # noqa: E402
+from src.carvision.analysis import MarketAnalyzer  # noqa: E402
+from src.carvision.features import FeatureEngineer  # noqa: E402
+
+
+def _previous_transform(X: pd.DataFrame, year: int) -> pd.DataFrame:
+    X = X.copy()
+    X["vehicle_age"] = year - X["model_year"]
+    X["brand"] = X["model"].astype(str).str.split().str[0]
+    X["price_per_mile"] = X["price"] / (X["odometer"] + 1)
+    X["price_category"] = pd.cut(
+        X["price"],
+        bins=[0, 10000, 25000, 50000, float("inf")],
+        labels=["Budget", "Mid-Range", "Premium", "Luxury"],
+    )
+    return X
+
+
+def _previous_brand_analysis(df: pd.DataFrame) -> pd.Series:
+    brand = df["model"].str.split().str[0]
+    df.assign(brand=brand).groupby("brand")["price"].agg(["mean", "median", "count"])
+    return brand.value_counts().head(10)
+
+
+def _measure(fn: Callable[[], Any]) -> Tuple[Any, float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    args = parser.parse_args()
+
+    base = synthetic_vehicles()
+    reps = -(-args.rows // len(base))
+    df = pd.concat([base] * reps, ignore_index=True).head(args.rows)
+    df["model"] = df["model"].astype(object)
+    fe = FeatureEngineer(current_year=2024)
+
+    print(f"{'case':<34}{'seconds':>10}{'peak MB':>10}")
+    for label in ("model texto", "model categoría"):
+        if label == "model categoría":
+            df["model"] = df["model"].astype("category")
+        old, old_s, old_mb = _measure(lambda: _previous_transform(df, 2024))
+        new, new_s, new_mb = _measure(lambda: fe.transform(df))
+        np.testing.assert_array_equal(new["brand"].astype(object).to_numpy(), old["brand"].astype(object).to_numpy())
+        pd.testing.assert_frame_equal(new.drop(columns="brand"), old.drop(columns="brand"))
+        print(f"{'transform anterior, ' + label:<34}{old_s:>10.2f}{old_mb:>10.0f}")
+        print(f"{'transform actual, ' + label:<34}{new_s:>10.2f}{new_mb:>10.0f}")
+        del old, new
+
+        old_vol, old_s, _ = _measure(lambda: _previous_brand_analysis(df))
+        new_vol, new_s, _ = _measure(lambda: MarketAnalyzer(df.copy(deep=False)).analyze_market_by_brand())
+        assert new_vol["volume"] == old_vol.to_dict()
+        print(f"{'marcas anterior, ' + label:<34}{old_s:>10.2f}{'':>10}")
+        print(f"{'marcas actual, ' + label:<34}{new_s:>10.2f}{'':>10}")
+
+
+if __name__ == "__main__":
+    main()
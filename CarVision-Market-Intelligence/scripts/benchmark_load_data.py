@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark de carga del dataset de vehículos: tiempo, pico de memoria y tamaño del DataFrame.
+
+Replica ``vehicles_us.csv`` hasta ``--rows`` filas (5M por defecto) y compara:
+
+- ``read_csv``: ``pd.read_csv`` sin esquema (texto como object/str, numéricos en 64 bits)
+- ``load_data``: esquema categórico + downcast numérico
+- ``load_data_chunked``: igual, leyendo en bloques de ``--chunksize`` filas
+- ``load_data_projected``: igual, leyendo solo las columnas de ``--columns``
+
+Cada variante corre en un proceso nuevo para medir su pico de RSS de forma aislada.
+Sin el CSV real (DVC) se genera una muestra sintética con el mismo esquema.
+
+Uso:
+    python scripts/benchmark_load_data.py --data data/raw/vehicles_us.csv --rows 5000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing as mp
+import resource
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from src.carvision.data import load_data  # noqa: E402
+
+DEFAULT_COLUMNS = ["price", "model_year", "model", "condition", "odometer", "fuel", "type"]
+
+
+def synthetic_vehicles(n_rows: int = 51525, seed: int = 0) -> pd.DataFrame:
+    """Muestra con el esquema de vehicles_us.csv (13 columnas, con nulos)."""
+    rng = np.random.default_rng(seed)
+    brands = ["ford", "chevrolet", "toyota", "honda", "ram", "jeep", "nissan", "gmc", "subaru", "bmw"]
+    models = [f"{b} model-{i}" for b in brands for i in range(10)]
+
+    def with_nans(values: np.ndarray, rate: float) -> np.ndarray:
+        values = values.astype(float)
+        values[rng.random(len(values)) < rate] = np.nan
+        return values
+
+    return pd.DataFrame(
+        {
+            "price": rng.integers(1, 100000, n_rows),
+            "model_year": with_nans(rng.integers(1960, 2020, n_rows), 0.07),
+            "model": rng.choice(models, n_rows),
+            "condition": rng.choice(["excellent", "good", "like new", "fair", "new", "salvage"], n_rows),
+            "cylinders": with_nans(rng.choice([4, 6, 8, 10], n_rows), 0.1),
+            "fuel": rng.choice(["gas", "diesel", "hybrid", "electric", "other"], n_rows),
+            "odometer": with_nans(rng.integers(0, 300000, n_rows), 0.15),
+            "transmission": rng.choice(["automatic", "manual", "other"], n_rows),
+            "type": rng.choice(["SUV", "truck", "sedan", "pickup", "coupe", "wagon", "van"], n_rows),
+            "paint_color": rng.choice(["white", "black", "silver", "grey", "blue", "red", None], n_rows),
+            "is_4wd": with_nans(np.ones(n_rows), 0.5),
+            "date_posted": pd.Timestamp("2018-05-01") + pd.to_timedelta(rng.integers(0, 365, n_rows), unit="D"),
+            "days_listed": rng.integers(0, 270, n_rows),
+        }
+    )
+
+
+def replicate(source: Optional[Path], output: Path, n_rows: int) -> Path:
+    """Escribe ``output`` repitiendo las filas de ``source`` hasta ``n_rows``."""
+    base = pd.read_csv(source) if source is not None and source.exists() else synthetic_vehicles()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with open(output, "w") as f:
+        while written < n_rows:
+            block = base.head(n_rows - written)
+            block.to_csv(f, index=False, header=written == 0)
+            written += len(block)
+    return output
+
+
+def _run(variant: str, path: str, chunksize: int, columns: List[str], queue: Any) -> None:
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if variant == "read_csv":
+        df = pd.read_csv(path)
+    elif variant == "load_data":
+        df = load_data(path)
+    elif variant == "load_data_chunked":
+        df = load_data(path, chunksize=chunksize)
+    else:
+        df = load_data(path, columns=columns)
+    seconds = time.perf_counter() - start
+    queue.put(
+        {
+            "variant": variant,
+            "seconds": round(seconds, 2),
+            "peak_rss_mb": round((resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline) / 1024, 1),
+            "frame_mb": round(df.memory_usage(deep=True).sum() / 2**20, 1),
+            "rows": len(df),
+            "columns": df.shape[1],
+        }
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data", default="data/raw/vehicles_us.csv", help="CSV de origen a replicar")
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--output", default="artifacts/benchmark/vehicles_replicated.csv")
+    parser.add_argument("--chunksize", type=int, default=500_000)
+    parser.add_argument("--columns", nargs="+", default=DEFAULT_COLUMNS)
+    parser.add_argument("--json", default=None, help="Guardar resultados en este JSON")
+    args = parser.parse_args()
+
+    path = Path(args.output)
+    if not path.exists():
+        replicate(Path(args.data), path, args.rows)
+    print(f"{path}: {path.stat().st_size / 2**20:.0f} MB")
+
+    ctx = mp.get_context("spawn")
+    results: List[Dict[str, Any]] = []
+    for variant in ("read_csv", "load_data", "load_data_chunked", "load_data_projected"):
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_run, args=(variant, str(path), args.chunksize, args.columns, queue))
+        proc.start()
+        results.append(queue.get())
+        proc.join()
+
+    print(f"{'variant':<22}{'rows':>10}{'cols':>6}{'seconds':>10}{'peak RSS MB':>13}{'frame MB':>10}")
+    for r in results:
+        print(
+            f"{r['variant']:<22}{r['rows']:>10}{r['columns']:>6}{r['seconds']:>10.2f}"
+            f"{r['peak_rss_mb']:>13.1f}{r['frame_mb']:>10.1f}"
+        )
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark del análisis de errores por segmento del backtest temporal.
+
+Compara el método anterior (``model.predict`` de nuevo para cada grupo de
+``condition``, ``type`` y ``model_year``) con ``segment_errors``, que agrega los
+errores de una única predicción (incluye además los pares de columnas). El
+tiempo de la predicción única sobre la ventana se reporta por separado.
+
+Entrena un pipeline pequeño (FeatureEngineer + preprocesador + RandomForest)
+sobre la muestra sintética de ``benchmark_load_data.py``.
+
+Uso:
+    python scripts/benchmark_segments.py --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.pipeline import Pipeline
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from scripts.benchmark_load_data import synthetic_vehicles  # noqa: E402
+from src.carvision.data import build_preprocessor  # noqa: E402
+from src.carvision.evaluation import DEFAULT_SEGMENTS, rmse, segment_errors  # noqa: E402
+from src.carvision.features import FeatureEngineer  # noqa: E402
+
+NUMERIC = ["model_year", "odometer", "cylinders", "vehicle_age"]
+CATEGORICAL = ["condition", "fuel", "transmission", "type", "brand"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Filas de la ventana de backtest")
+    parser.add_argument("--n-estimators", type=int, default=20)
+    args = parser.parse_args()
+
+    base = synthetic_vehicles()
+    model = Pipeline(
+        [
+            ("features", FeatureEngineer(current_year=2024)),
+            ("pre", build_preprocessor(NUMERIC, CATEGORICAL)),
+            ("model", RandomForestRegressor(n_estimators=args.n_estimators, max_depth=10, n_jobs=1, random_state=0)),
+        ]
+    )
+    model.fit(base.drop(columns="price"), base["price"])
+
+    window = pd.concat([base] * -(-args.rows // len(base)), ignore_index=True).head(args.rows)
+    X, y = window.drop(columns="price"), window["price"]
+
+    start = time.perf_counter()
+    y_pred = model.predict(X)
+    predict_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    old_rows = []
+    for col in DEFAULT_SEGMENTS:
+        for val, group in window.groupby(col, observed=True):
+            if len(group) >= 30:
+                old_rows.append((col, str(val), rmse(group["price"], model.predict(group.drop(columns="price")))))
+    old_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = segment_errors(window, y, y_pred, DEFAULT_SEGMENTS)
+    new_s = time.perf_counter() - start
+
+    singles = new.set_index(["segment_col", "segment_val"])["rmse"]
+    np.testing.assert_allclose([singles[(c, v)] for c, v, _ in old_rows], [r for _, _, r in old_rows], rtol=1e-9)
+
+    print(f"ventana: {args.rows} filas; predicción única: {predict_s:.2f}s")
+    print(f"anterior (predict por grupo, {len(old_rows)} segmentos): {old_s:.2f}s")
+    print(f"segment_errors ({len(new)} segmentos con pares): {new_s:.3f}s ({old_s / new_s:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,8 @@ from typing import Any, Dict, List
 import numpy as np
 import pandas as pd
 
+from src.carvision.features import extract_brand
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,14 +63,15 @@ class MarketAnalyzer:
 
         # Ensure brand column exists
         if "brand" not in self.df.columns:
-            self.df["brand"] = self.df["model"].str.split().str[0]
+            self.df["brand"] = extract_brand(self.df["model"])
 
-        # Top marcas por volumen
-        brand_volume = self.df["brand"].value_counts().head(10)
+        # Top marcas por volumen (sin categorías vacías, p. ej. tras filtrar)
+        brand_volume = self.df["brand"].value_counts()
+        brand_volume = brand_volume[brand_volume > 0].head(10)
 
         # Precio promedio por marca
         if "price" in self.df.columns:
-            brand_price = self.df.groupby("brand")["price"].agg(["mean", "median", "count"]).round(0)
+            brand_price = self.df.groupby("brand", observed=True)["price"].agg(["mean", "median", "count"]).round(0)
             brand_price = brand_price[brand_price["count"] >= 100].sort_values("mean", ascending=False)
             pricing_dict = brand_price.to_dict()
         else:
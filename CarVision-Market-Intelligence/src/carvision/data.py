@@ -7,27 +7,115 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
+from common_utils.feature_cache import FeatureCache, source_version
+from pandas.api.types import union_categoricals
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import OneHotEncoder, StandardScaler
 
+from src.carvision.features import FeatureEngineer
 
-def load_data(csv_path: str) -> pd.DataFrame:
+# Text columns of the vehicles dataset read as categoricals: each distinct value
+# is stored once and rows hold small integer codes
+CATEGORICAL_COLUMNS = [
+    "model",
+    "condition",
+    "fuel",
+    "transmission",
+    "type",
+    "paint_color",
+    "drive",
+    "size",
+    "date_posted",
+]
+
+
+def optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast numeric columns in place: floats to float32, integers to the smallest integer type.
+
+    Args:
+        df: DataFrame to shrink.
+    Returns:
+        The same DataFrame.
+    """
+    for col in df.select_dtypes(include=["float"]).columns:
+        df[col] = df[col].astype(np.float32)
+    for col in df.select_dtypes(include=["integer"]).columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+def _concat_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate chunks, merging the categories of categorical columns instead of falling back to object."""
+    if not chunks:
+        return pd.DataFrame()
+    columns = {}
+    for col in chunks[0].columns:
+        parts = [chunk[col] for chunk in chunks]
+        if isinstance(parts[0].dtype, pd.CategoricalDtype):
+            columns[col] = pd.Categorical(union_categoricals(parts, ignore_order=True))
+        else:
+            columns[col] = pd.concat(parts, ignore_index=True)
+    return optimize_dtypes(pd.DataFrame(columns))
+
+
+def load_data(
+    csv_path: str,
+    columns: Optional[Sequence[str]] = None,
+    chunksize: Optional[int] = None,
+    optimize: bool = True,
+) -> pd.DataFrame:
     """Load dataset from CSV path.
 
+    By default text columns in :data:`CATEGORICAL_COLUMNS` are parsed as
+    categoricals and numeric columns are downcast (see :func:`optimize_dtypes`),
+    which cuts the memory of the vehicles dataset several times over.
+
     Args:
         csv_path: Path to CSV file.
+        columns: Only parse these columns (default: all).
+        chunksize: Parse this many rows at a time, bounding the parser's
+            working memory on large files (default: whole file at once).
+        optimize: Apply the categorical/downcast schema; False returns the
+            plain ``pd.read_csv`` dtypes.
     Returns:
         pandas DataFrame
     """
-    df = pd.read_csv(csv_path)
-    return df
+    kwargs: Dict[str, Any] = {"usecols": list(columns) if columns is not None else None}
+    if optimize:
+        kwargs["dtype"] = {col: "category" for col in CATEGORICAL_COLUMNS}
+    if chunksize:
+        with pd.read_csv(csv_path, chunksize=chunksize, **kwargs) as reader:
+            chunks = [optimize_dtypes(chunk) if optimize else chunk for chunk in reader]
+        return _concat_chunks(chunks) if optimize else pd.concat(chunks, ignore_index=True)
+    df = pd.read_csv(csv_path, **kwargs)
+    return optimize_dtypes(df) if optimize else df
+
+
+def cached(
+    compute: Callable[[], Dict[str, Any]],
+    data_paths: Sequence[str | Path],
+    config: Dict[str, Any],
+    code: Sequence[Any],
+) -> Dict[str, Any]:
+    """Run ``compute`` through the feature cache when ``FEATURE_CACHE`` is enabled.
+
+    Args:
+        compute: Builds the entry (name -> DataFrame, Series, ndarray or JSON value).
+        data_paths: Raw files the entry is derived from.
+        config: Settings the entry depends on.
+        code: Modules or functions whose source is part of the key.
+    """
+    cache = FeatureCache.from_env()
+    if not cache.enabled:
+        return compute()
+    return cache.get_or_compute(compute, data_paths, config, source_version(*code))
 
 
 def clean_data(df: pd.DataFrame, filters: Optional[Dict[str, float]] = None) -> pd.DataFrame:
@@ -202,3 +290,110 @@ def save_split_indices(indices: Dict[str, List[int]], path: str) -> None:
 def load_split_indices(path: str) -> Dict[str, List[int]]:
     with open(path, "r") as f:
         return json.load(f)
+
+
+def prepare_training_data(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Load, clean and split the data and build the (unfitted) feature steps.
+
+    With ``FEATURE_CACHE=1`` the cleaned data, inferred columns and split
+    indices are reused while the raw file, the preprocessing/split settings and
+    this code are unchanged (see :func:`cached`).
+
+    Returns a dict with the cleaned ``data``, the ``features`` and ``pre``
+    pipeline steps, the inferred ``num_cols``/``cat_cols``, the ``split`` tuple
+    from :func:`split_data` and the ``split_indices``.
+    """
+    tr = cfg["training"]
+    prep = cfg["preprocessing"]
+    dataset_year = cfg.get("dataset_year", 2024)
+    fe = FeatureEngineer(current_year=dataset_year)
+
+    def compute() -> Dict[str, Any]:
+        # Load & clean data
+        df = clean_data(load_data(cfg["paths"]["data_path"]), filters=prep.get("filters"))
+
+        # Feature engineering for inferring types (since FeatureEngineer is part of pipeline,
+        # we need to know what features WILL be produced if we want to be strict, but
+        # infer_feature_types usually runs on raw dataframe.
+        # However, FeatureEngineer produces 'vehicle_age' etc.
+        # So we should probably run FeatureEngineer on the df temporarily to infer types
+        # OR we assume FeatureEngineer is part of the pipeline and we infer on raw data + added cols?
+        #
+        # The previous code ran clean_data which ADDED columns. Now clean_data does NOT add columns.
+        # So infer_feature_types will miss 'vehicle_age', 'brand', 'price_per_mile'.
+        # We must manually add these or run a temporary transform.
+
+        # Let's create the engineer and transform df temporarily for type inference and splitting.
+        # Wait, if we transform for splitting, we should pass transformed data to the pipeline?
+        # NO, the pipeline expects raw data.
+
+        # BUT, if we split on raw data, we are fine.
+        # The issue is infer_feature_types needs to know about 'vehicle_age' etc if they are to be used.
+        # And build_preprocessor needs to know about them.
+
+        # If we put FeatureEngineer in the pipeline, the pipeline input is raw data.
+        # The FeatureEngineer output is data with new columns.
+        # The ColumnTransformer (pre) comes AFTER FeatureEngineer.
+        # So ColumnTransformer MUST be configured with the columns that exist AFTER FeatureEngineer.
+
+        # So we MUST run FeatureEngineer once to get the column names/types.
+
+        df_transformed = fe.transform(df)
+
+        # Infer features on transformed data
+        num_cols, cat_cols = infer_feature_types(
+            df_transformed,
+            target=tr["target"],
+            numeric_features=prep.get("numeric_features"),
+            categorical_features=prep.get("categorical_features"),
+            drop_columns=prep.get("drop_columns"),
+        )
+
+        # Split on RAW data (or transformed? Pipeline expects raw usually).
+        # If we want the pipeline to be end-to-end callable with raw data, we should split on RAW data.
+        # But then we need to be careful that 'pre' (ColumnTransformer) is applied to output of 'features'.
+
+        *_, split_indices = split_data(
+            df,  # Split raw df
+            target=tr["target"],
+            test_size=tr["test_size"],
+            val_size=tr["val_size"],
+            seed=cfg.get("seed", 42),
+            shuffle=tr["shuffle"],
+        )
+        return {"data": df, "num_cols": num_cols, "cat_cols": cat_cols, "split_indices": split_indices}
+
+    key_config = {
+        "preprocessing": prep,
+        "split": {k: tr[k] for k in ("target", "test_size", "val_size", "shuffle")},
+        "seed": cfg.get("seed", 42),
+        "dataset_year": dataset_year,
+    }
+    prepared = cached(
+        compute, [cfg["paths"]["data_path"]], key_config, [clean_data, FeatureEngineer, prepare_training_data]
+    )
+    df, split_indices = prepared["data"], prepared["split_indices"]
+    num_cols, cat_cols = prepared["num_cols"], prepared["cat_cols"]
+    X, y = df.drop(columns=[tr["target"]]), df[tr["target"]]
+    parts = ("train", "val", "test")
+    split = tuple(X.loc[split_indices[p]] for p in parts) + tuple(y.loc[split_indices[p]] for p in parts)
+
+    # Preprocessor (configured with inferred columns from transformed data)
+    pre = build_preprocessor(
+        num_cols,
+        cat_cols,
+        numeric_imputer=prep.get("numeric_imputer", "median"),
+        categorical_imputer=prep.get("categorical_imputer", "most_frequent"),
+        scale_numeric=prep.get("scale_numeric", True),
+        handle_unknown=prep.get("handle_unknown_category", "ignore"),
+    )
+
+    return {
+        "features": fe,
+        "pre": pre,
+        "num_cols": num_cols,
+        "cat_cols": cat_cols,
+        "data": df,
+        "split": split,
+        "split_indices": split_indices,
+    }
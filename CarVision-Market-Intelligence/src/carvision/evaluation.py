@@ -4,17 +4,22 @@ Model evaluation utilities.
 
 from __future__ import annotations
 
+import itertools
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 
 import joblib
 import numpy as np
 import pandas as pd
+from common_utils.bootstrap import bootstrap_metrics, summarize_bootstrap
 from sklearn.dummy import DummyRegressor
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 
-from src.carvision.data import clean_data, infer_feature_types, load_data, split_data
+from src.carvision.data import infer_feature_types, prepare_training_data
+
+# Segment columns of the temporal backtest error analysis (evaluation.temporal.segments)
+DEFAULT_SEGMENTS = ["condition", "type", "model_year"]
 
 
 def rmse(y_true, y_pred) -> float:
@@ -35,8 +40,10 @@ def evaluate_model(cfg: Dict[str, Any]) -> Dict[str, Any]:
     prep = cfg["preprocessing"]
     seed = cfg.get("seed", 42)
 
-    # Load and clean
-    df = clean_data(load_data(paths["data_path"]), filters=prep.get("filters"))
+    # Load, clean and split (shared with training, through the feature cache)
+    data = prepare_training_data(cfg)
+    df = data["data"]
+    X_train, X_val, X_test, y_train, y_val, y_test = data["split"]
 
     # Infer features to ensure consistent splitting/types
     num_cols, cat_cols = infer_feature_types(
@@ -48,16 +55,6 @@ def evaluate_model(cfg: Dict[str, Any]) -> Dict[str, Any]:
     )
     feature_cols = num_cols + cat_cols
 
-    # Split
-    X_train, X_val, X_test, y_train, y_val, y_test, _ = split_data(
-        df,
-        target=tr["target"],
-        test_size=tr["test_size"],
-        val_size=tr["val_size"],
-        seed=seed,
-        shuffle=tr["shuffle"],
-    )
-
     # Load model
     model = joblib.load(paths["model_path"])
     y_pred = model.predict(X_test)
@@ -97,18 +94,24 @@ def evaluate_model(cfg: Dict[str, Any]) -> Dict[str, Any]:
             yb,
             n_resamples=int(boot_cfg.get("n_resamples", 200)),
             random_state=int(boot_cfg.get("random_state", seed)),
+            method=boot_cfg.get("method", "multinomial"),
+            n_jobs=boot_cfg.get("n_jobs", 1),
         )
 
     # Temporal (Backtesting)
     temporal_results = None
+    temporal_cfg = cfg.get("evaluation", {}).get("temporal", {})
     if "model_year" in df.columns:
         temporal_results = _run_temporal_backtest(
             df,
             model,
             tr["target"],
             feature_cols,
-            test_size=cfg.get("evaluation", {}).get("temporal", {}).get("test_size", 0.2),
+            test_size=temporal_cfg.get("test_size", 0.2),
             artifacts_dir=artifacts_dir,
+            segments=temporal_cfg.get("segments", DEFAULT_SEGMENTS),
+            pairwise=temporal_cfg.get("pairwise_segments", True),
+            min_count=int(temporal_cfg.get("min_segment_size", 30)),
         )
 
     # Save results
@@ -131,34 +134,148 @@ def evaluate_model(cfg: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _run_bootstrap(y_true, y_model, y_base, n_resamples: int, random_state: int) -> Dict[str, Any]:
-    rng = np.random.default_rng(random_state)
-    y_true = np.array(y_true)
-    y_model = np.array(y_model)
-    y_base = np.array(y_base)
-
-    deltas = []
-    n_samples = len(y_true)
+def _run_bootstrap(
+    y_true,
+    y_model,
+    y_base,
+    n_resamples: int,
+    random_state: int,
+    method: str = "multinomial",
+    n_jobs: Optional[int] = 1,
+) -> Dict[str, Any]:
+    """Bootstrap CIs of RMSE, MAE, MAPE and R² for model and baseline, and their paired deltas.
+
+    Uses the vectorized engine in ``common_utils.bootstrap`` (resamples in
+    chunks, optionally in ``n_jobs`` processes). The top-level ``delta_rmse_*``
+    and ``p_value_two_sided`` keys compare model RMSE against the baseline.
+    """
+    samples = bootstrap_metrics(
+        y_true,
+        {"model": y_model, "baseline": y_base},
+        metrics=("rmse", "mae", "mape", "r2"),
+        n_resamples=n_resamples,
+        random_state=random_state,
+        method=method,
+        n_jobs=n_jobs,
+    )
+    summary = summarize_bootstrap(samples, reference="baseline")
+    delta_rmse = summary["deltas"]["model"]["rmse"]
 
-    for _ in range(n_resamples):
-        idx = rng.choice(n_samples, size=n_samples, replace=True)
-        # Calculate metric (RMSE)
-        rmse_m = rmse(y_true[idx], y_model[idx])
-        rmse_b = rmse(y_true[idx], y_base[idx])
-        deltas.append(rmse_m - rmse_b)
+    return {
+        "delta_rmse_mean": delta_rmse["mean"],
+        "delta_rmse_ci95": delta_rmse["ci"],
+        "p_value_two_sided": delta_rmse["p_value_two_sided"],
+        "n_resamples": n_resamples,
+        "method": method,
+        "metrics": summary["metrics"],
+        "deltas": summary["deltas"]["model"],
+    }
 
-    deltas_arr = np.array(deltas)
-    ci_low, ci_high = np.percentile(deltas_arr, [2.5, 97.5])
 
-    # P-value: 2 * min(prop > 0, prop < 0)
-    # H0: delta = 0.
-    p_val = 2 * min(np.mean(deltas_arr > 0), np.mean(deltas_arr < 0))
+def segment_errors(
+    segments: pd.DataFrame,
+    y_true,
+    y_pred,
+    columns: Sequence[str],
+    pairwise: bool = True,
+    min_count: int = 30,
+) -> pd.DataFrame:
+    """Error metrics per segment, aggregated from one prediction vector.
+
+    Each segment column is factorized once; per-row errors are then summed
+    per segment with ``np.bincount`` over the codes, for each column and,
+    with ``pairwise``, each pair of columns (combined codes, renumbered to
+    the observed combinations when the cross product has more slots than
+    there are rows, so memory stays bounded by the data). The model is
+    never re-run on subsets. Rows with a missing segment value are left out
+    of that segment, as with ``groupby``.
+
+    Args:
+        segments: Frame holding the segment columns, aligned with ``y_true``.
+        y_true: True target values.
+        y_pred: Predictions for the same rows.
+        columns: Segment columns; those missing from ``segments`` are skipped.
+        pairwise: Also report every pair of columns (e.g. condition x type).
+        min_count: Skip segments with fewer rows.
+
+    Returns:
+        One row per segment, sorted by value within each segment column:
+        ``segment_col`` and ``segment_val`` (``|``-joined for pairs), ``n``,
+        ``rmse``, ``mae``, ``mape`` and ``bias`` (mean of prediction minus truth).
+    """
+    columns = [c for c in columns if c in segments.columns]
+    y_true = np.asarray(y_true, dtype=float)
+    err = np.asarray(y_pred, dtype=float) - y_true
+    # Same MAPE definition as mape(): 1e-8 avoids division by zero
+    stats = {"se": err**2, "ae": np.abs(err), "ape": np.abs(err / (y_true + 1e-8)), "err": err}
+
+    factorized = {}
+    for col in columns:
+        codes, uniques = pd.factorize(segments[col], sort=True)
+        factorized[col] = (codes, np.asarray(uniques.astype(str)))
+
+    groupings = [[c] for c in columns]
+    if pairwise:
+        groupings += [list(pair) for pair in itertools.combinations(columns, 2)]
+
+    frames = []
+    for cols in groupings:
+        codes = np.zeros(len(y_true), dtype=np.int64)
+        valid = np.ones(len(y_true), dtype=bool)
+        n_groups = 1
+        for col in cols:
+            col_codes, uniques = factorized[col]
+            codes = codes * len(uniques) + col_codes
+            valid &= col_codes >= 0
+            n_groups *= len(uniques)
+        codes = codes[valid]
+
+        # The cross product of high-cardinality columns can dwarf the data:
+        # renumber the combinations actually present so the bincounts below
+        # never allocate more slots than there are rows
+        observed = None
+        if n_groups > len(codes):
+            observed, codes = np.unique(codes, return_inverse=True)
+            n_groups = len(observed)
+
+        n = np.bincount(codes, minlength=n_groups)
+        keep = np.flatnonzero(n >= max(min_count, 1))
+        if not keep.size:
+            continue
+        sums = {
+            name: np.bincount(codes, weights=values[valid], minlength=n_groups)[keep] for name, values in stats.items()
+        }
+        n = n[keep]
+        if observed is not None:
+            keep = observed[keep]
+
+        # Decode combined codes back to one label per column
+        labels = []
+        for col in reversed(cols):
+            uniques = factorized[col][1]
+            labels.append(uniques[keep % len(uniques)])
+            keep = keep // len(uniques)
+        values = labels[-1]
+        for label in reversed(labels[:-1]):
+            values = np.char.add(np.char.add(values, "|"), label)
+
+        frames.append(
+            pd.DataFrame(
+                {
+                    "segment_col": "|".join(cols),
+                    "segment_val": values,
+                    "n": n,
+                    "rmse": np.sqrt(sums["se"] / n),
+                    "mae": sums["ae"] / n,
+                    "mape": sums["ape"] / n * 100,
+                    "bias": sums["err"] / n,
+                }
+            )
+        )
 
-    return {
-        "delta_rmse_mean": float(deltas_arr.mean()),
-        "delta_rmse_ci95": [float(ci_low), float(ci_high)],
-        "p_value_two_sided": float(p_val),
-    }
+    if not frames:
+        return pd.DataFrame(columns=["segment_col", "segment_val", "n", "rmse", "mae", "mape", "bias"])
+    return pd.concat(frames, ignore_index=True)
 
 
 def _run_temporal_backtest(
@@ -168,6 +285,9 @@ def _run_temporal_backtest(
     feature_cols: List[str],
     test_size: float,
     artifacts_dir: Path,
+    segments: Sequence[str] = DEFAULT_SEGMENTS,
+    pairwise: bool = True,
+    min_count: int = 30,
 ) -> Dict[str, Any]:
     df_sorted = df.sort_values("model_year")
     n_test = max(1, int(len(df_sorted) * test_size))
@@ -190,26 +310,9 @@ def _run_temporal_backtest(
         "n_samples": len(df_temp),
     }
 
-    # Segment analysis
-    rows = []
-    for col in ["condition", "type", "model_year"]:
-        if col not in df_temp:
-            continue
-        for val, group in df_temp.groupby(col):
-            if len(group) < 30:
-                continue
-
-            y_g_pred = model.predict(group[feature_cols])
-            rows.append(
-                {
-                    "segment_col": col,
-                    "segment_val": str(val),
-                    "n": len(group),
-                    "rmse": rmse(group[target], y_g_pred),
-                }
-            )
-
-    if rows:
-        pd.DataFrame(rows).to_csv(artifacts_dir / "error_by_segment.csv", index=False)
+    # Segment analysis from the same predictions
+    by_segment = segment_errors(df_temp, y_temp, y_pred, segments, pairwise=pairwise, min_count=min_count)
+    if len(by_segment):
+        by_segment.to_parquet(artifacts_dir / "error_by_segment.parquet", index=False)
 
     return metrics
@@ -2,10 +2,32 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 
 
+def extract_brand(model: pd.Series) -> pd.Series:
+    """Brand (first word of ``model``) as a categorical Series aligned with ``model``.
+
+    Same values as ``model.astype(str).str.split().str[0]``, but the string
+    work runs once per distinct model instead of once per row: ``model`` is
+    factorized, brands are derived from the unique values and mapped back
+    through the codes.
+    """
+    codes, uniques = pd.factorize(model)
+    if (codes == -1).any():
+        # Missing models take an extra slot so they go through the same split
+        uniques = uniques.append(pd.Index([np.nan]))
+    unique_brands = pd.Series(uniques).astype(str).str.split().str[0]
+    brand_codes, brands = pd.factorize(unique_brands, sort=True)
+    return pd.Series(
+        pd.Categorical.from_codes(brand_codes[codes], categories=brands),
+        index=model.index,
+        name="brand",
+    )
+
+
 class FeatureEngineer(BaseEstimator, TransformerMixin):
     """
     Centralized feature engineering to ensure consistency across
@@ -19,7 +41,8 @@ class FeatureEngineer(BaseEstimator, TransformerMixin):
         return self
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
-        X = X.copy()
+        # Shallow copy: derived columns are added without duplicating the input ones
+        X = X.copy(deep=False)
 
         # Use configured year or current year
         year = self.current_year or pd.Timestamp.now().year
@@ -28,7 +51,7 @@ class FeatureEngineer(BaseEstimator, TransformerMixin):
             X["vehicle_age"] = year - X["model_year"]
 
         if "model" in X.columns:
-            X["brand"] = X["model"].astype(str).str.split().str[0]
+            X["brand"] = extract_brand(X["model"])
 
         # Derived features for analysis/training only (requires target/extra cols)
         # Note: Inference usually doesn't have 'price' or 'odometer' might be user input
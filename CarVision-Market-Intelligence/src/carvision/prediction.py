@@ -1,53 +1,221 @@
 """
 Prediction logic.
+
+Loaded models are kept in a process-wide registry keyed by the model path.
+Each entry records the ``(mtime_ns, size)`` of the model file and of
+``feature_columns.json``; a changed file is reloaded on the next call, so
+repeated predictions pay for deserialization once per artifact version. At
+most ``MODEL_CACHE_SIZE`` models stay resident (least recently used are
+dropped first) and :func:`invalidate_model_cache` forces a reload.
 """
 
 from __future__ import annotations
 
 import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import joblib
 import numpy as np
 import pandas as pd
+from common_utils.tabular_io import TableWriter, iter_batches, read_columns, read_table
 
+logger = logging.getLogger(__name__)
 
-def predict_price(payload: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, float]:
-    """Predict car price from payload."""
-    paths = config["paths"]
+# Maximum number of models kept loaded by the registry
+MODEL_CACHE_SIZE = int(os.getenv("MODEL_CACHE_SIZE", "2"))
+
+Signature = Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]
+
+
+@dataclass
+class LoadedModel:
+    """A deserialized model with its feature template."""
+
+    model: Any
+    feature_columns: List[str]
+    fill_values: Dict[str, Any]
+    signature: Signature
+
+
+_registry: "OrderedDict[str, LoadedModel]" = OrderedDict()
+_registry_lock = threading.Lock()
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
-    # Load model
-    model = joblib.load(paths["model_path"])
+
+def _load(model_path: Path, feat_path: Path, signature: Signature) -> LoadedModel:
+    model = joblib.load(model_path)
 
     # Load feature columns
-    feat_path = Path(paths["artifacts_dir"]) / "feature_columns.json"
     if feat_path.exists():
-        feature_columns = json.loads(Path(feat_path).read_text())
+        feature_columns = json.loads(feat_path.read_text())
     else:
         # fallback
         pre = model.named_steps["pre"]
         feature_columns = list(pre.transformers_[0][2]) + list(pre.transformers_[1][2])
+    logger.info(f"Modelo cargado desde {model_path}")
+    return LoadedModel(model, feature_columns, feature_fill_values(model, feature_columns), signature)
+
+
+def get_model(config: Dict[str, Any]) -> LoadedModel:
+    """Registry entry for ``paths.model_path``, loading it if missing or changed on disk."""
+    paths = config["paths"]
+    model_path = Path(paths["model_path"]).resolve()
+    feat_path = Path(paths["artifacts_dir"]) / "feature_columns.json"
+    signature = (_file_signature(model_path), _file_signature(feat_path))
+    if signature[0] is None:
+        raise FileNotFoundError(f"Modelo no encontrado: {model_path}")
+
+    key = str(model_path)
+    with _registry_lock:
+        entry = _registry.get(key)
+        if entry is not None and entry.signature == signature:
+            _registry.move_to_end(key)
+            return entry
+
+    # Load outside the lock so other models stay available meanwhile
+    entry = _load(model_path, feat_path, signature)
+    with _registry_lock:
+        _registry[key] = entry
+        _registry.move_to_end(key)
+        while len(_registry) > max(MODEL_CACHE_SIZE, 1):
+            evicted, _ = _registry.popitem(last=False)
+            logger.info(f"Modelo {evicted} descargado del registro")
+    return entry
+
+
+def invalidate_model_cache(model_path: Union[str, Path, None] = None) -> None:
+    """Drop one model (by path) or, without arguments, every model from the registry."""
+    with _registry_lock:
+        if model_path is None:
+            _registry.clear()
+        else:
+            _registry.pop(str(Path(model_path).resolve()), None)
+
+
+def _load_model_and_features(config: Dict[str, Any]) -> Tuple[Any, List[str]]:
+    entry = get_model(config)
+    return entry.model, entry.feature_columns
+
+
+def feature_fill_values(model: Any, feature_columns: Sequence[str]) -> Dict[str, Any]:
+    """Fill value for each feature column, used when an input lacks it.
+
+    Columns handled by a fitted ``SimpleImputer`` in the ``pre`` step get its
+    statistic (median / most frequent), so a missing value scores exactly as
+    the pipeline would impute it. Any other column is filled with NaN.
+
+    Args:
+        model: Fitted pipeline.
+        feature_columns: Columns the pipeline expects.
+
+    Returns:
+        Mapping of column name to fill value, in ``feature_columns`` order.
+    """
+    fill_values: Dict[str, Any] = dict.fromkeys(feature_columns, np.nan)
+    pre = getattr(model, "named_steps", {}).get("pre")
+    for _, transformer, columns in getattr(pre, "transformers_", []):
+        imputer = getattr(transformer, "named_steps", {}).get("imputer")
+        statistics = getattr(imputer, "statistics_", None)
+        if statistics is None:
+            continue
+        fill_values.update((col, value) for col, value in zip(columns, statistics) if col in fill_values)
+    return fill_values
+
+
+def align_features(
+    df: pd.DataFrame, feature_columns: Sequence[str], fill_values: Optional[Dict[str, Any]] = None
+) -> pd.DataFrame:
+    """Select ``feature_columns`` in order with a single ``reindex``.
+
+    Missing columns and missing values are filled from ``fill_values`` (see
+    :func:`feature_fill_values`); without it they are left as NaN.
+    """
+    aligned = df.reindex(columns=feature_columns)
+    return aligned if fill_values is None else aligned.fillna(fill_values)
+
+
+def _align_columns(df: pd.DataFrame, feature_columns: List[str]) -> pd.DataFrame:
+    return align_features(df, feature_columns)
+
+
+def predict_price(payload: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, float]:
+    """Predict car price from payload."""
+    return predict_prices([payload], config)[0]
+
+
+def predict_prices(payloads: Sequence[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict[str, float]]:
+    """Predict car prices for several payloads with a single model call.
+
+    Args:
+        payloads: Vehicle records (raw columns, as for :func:`predict_price`).
+        config: Project configuration (model and artifact paths).
+
+    Returns:
+        One ``{"prediction": price}`` per payload, in input order.
+    """
+    entry = get_model(config)
+
+    # Feature engineering is handled by the pipeline (FeatureEngineer step); columns
+    # the payloads lack, derived ones included, get the template's fill values.
+    df_in = align_features(pd.DataFrame.from_records(payloads), entry.feature_columns, entry.fill_values)
+
+    return [{"prediction": float(pred)} for pred in entry.model.predict(df_in)]
+
+
+def predict_batch(
+    input_path: str | Path,
+    output_path: str | Path,
+    config: Dict[str, Any],
+    batch_size: Optional[int] = None,
+    id_columns: Optional[Sequence[str]] = None,
+) -> int:
+    """Predict prices for every row of a CSV, Parquet or Feather file.
 
-    df_in = pd.DataFrame([payload])
+    Input and output formats are chosen from the file extensions. The output
+    holds the input columns plus ``predicted_price``.
 
-    # Feature engineering is now handled by the pipeline (FeatureEngineer step)
-    # We just ensure raw columns are present if possible, or let alignment handle it.
+    Args:
+        input_path: Input file path.
+        output_path: Output file path.
+        config: Project configuration (model and artifact paths).
+        batch_size: Score in chunks of this many rows (Parquet row groups are
+            streamed) instead of loading the whole file.
+        id_columns: If given, decode only these columns plus the model's
+            feature columns instead of every column in the input.
 
-    # Align columns
-    # Note: feature_columns contains the columns expected by the Preprocessor (step 2).
-    # Since the pipeline starts with FeatureEngineer (step 1), we should ideally
-    # ensure RAW columns are present.
-    # However, the current logic aligns to 'feature_columns' which includes derived features.
-    # We fill them with NaN, and FeatureEngineer will populate them correctly
-    # (assuming raw columns like 'model_year' and 'model' are in feature_columns or payload).
+    Returns:
+        Number of rows scored.
+    """
+    model, feature_columns = _load_model_and_features(config)
 
-    for col in feature_columns:
-        if col not in df_in.columns:
-            df_in[col] = np.nan
+    columns = None
+    if id_columns is not None:
+        available = set(read_columns(input_path))
+        columns = list(id_columns) + [c for c in feature_columns if c in available and c not in id_columns]
 
-    df_in = df_in[feature_columns]
+    def score(chunk: pd.DataFrame) -> pd.DataFrame:
+        return chunk.assign(predicted_price=model.predict(_align_columns(chunk, feature_columns)))
 
-    pred = model.predict(df_in)
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    with TableWriter(output_path) as writer:
+        if batch_size is None:
+            writer.write(score(read_table(input_path, columns=columns)))
+        else:
+            for chunk in iter_batches(input_path, batch_size, columns=columns):
+                writer.write(score(chunk))
 
-    return {"prediction": float(pred[0])}
+    logger.info(f"Predicciones para {writer.rows_written} vehículos guardadas en {output_path}")
+    return writer.rows_written
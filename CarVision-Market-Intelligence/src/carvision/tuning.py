@@ -0,0 +1,285 @@
+"""
+Successive-halving search for the RandomForestRegressor.
+
+Candidates are sampled from ``tuning.param_space`` and scored by RMSE on the
+validation split of :func:`split_data`. Every round keeps the best
+``1 / eta`` of the candidates and grows the survivors on ``eta`` times more
+training rows and trees:
+
+- Forests are grown with ``warm_start``: a survivor keeps its trees and only
+  fits the new ones, on a larger (nested) sample of the training split.
+- The feature steps are fitted once on the training split and every
+  candidate trains on the same preprocessed matrix.
+- Candidates of a round are fitted in parallel worker processes.
+
+The cost of every round (tree-rows fitted and seconds) is reported next to
+its best RMSE, relative to fitting every candidate with the full budget.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import yaml
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.metrics import mean_absolute_error, r2_score
+from sklearn.model_selection import ParameterSampler
+from sklearn.pipeline import Pipeline
+
+from src.carvision.data import cached, clean_data, prepare_training_data
+from src.carvision.evaluation import mape, rmse
+from src.carvision.features import FeatureEngineer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TUNING: Dict[str, Any] = {
+    "n_candidates": 27,
+    "eta": 3,
+    "min_rows": 500,
+    "min_estimators": 25,
+    "max_estimators": 300,
+    "n_jobs": -1,
+    "param_space": {
+        "max_depth": [8, 12, 16, 20, None],
+        "min_samples_leaf": [1, 2, 4, 8],
+        "max_features": [1.0, 0.5, "sqrt"],
+    },
+}
+
+
+def halving_schedule(
+    n_candidates: int, n_rows: int, eta: int, min_rows: int, min_estimators: int, max_estimators: int
+) -> List[Dict[str, int]]:
+    """Candidates, training rows and trees per round.
+
+    Each round keeps ``1 / eta`` of the candidates. The last round trains on
+    all ``n_rows``, each earlier one on ``eta`` times fewer (at least
+    ``min_rows``). Trees grow geometrically from ``min_estimators`` to
+    ``max_estimators`` so that survivors add trees in every round.
+    """
+    if eta < 2:
+        raise ValueError(f"eta debe ser >= 2, recibido {eta}")
+    n_rounds = 1
+    while eta ** (n_rounds - 1) < n_candidates:
+        n_rounds += 1
+    schedule = []
+    for rnd in range(n_rounds):
+        growth = rnd / (n_rounds - 1) if n_rounds > 1 else 1.0
+        schedule.append(
+            {
+                "candidates": max(1, math.ceil(n_candidates / eta**rnd)),
+                "rows": min(n_rows, max(min_rows, int(n_rows / eta ** (n_rounds - 1 - rnd)))),
+                "n_estimators": int(round(min_estimators * (max_estimators / min_estimators) ** growth)),
+            }
+        )
+    return schedule
+
+
+def _grow(
+    model: RandomForestRegressor,
+    n_estimators: int,
+    X: np.ndarray,
+    y: np.ndarray,
+    X_val: np.ndarray,
+    y_val: np.ndarray,
+) -> Tuple[RandomForestRegressor, float]:
+    """Add trees up to ``n_estimators`` (warm start) and score on the validation split."""
+    model.set_params(n_estimators=n_estimators)
+    model.fit(X, y)
+    return model, rmse(y_val, model.predict(X_val))
+
+
+def _feature_matrices(cfg: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """Preprocessed training (shuffled) and validation matrices, through the feature cache."""
+    seed = cfg["seed"]
+
+    def compute() -> Dict[str, np.ndarray]:
+        data = prepare_training_data(cfg)
+        X_train, X_val, _, y_train, y_val, _ = data["split"]
+        feature_steps = Pipeline(steps=[("features", data["features"]), ("pre", data["pre"])])
+        # Shuffled once so that every round trains on a superset of the previous rows
+        order = np.random.default_rng(seed).permutation(len(X_train))
+        return {
+            "X": np.asarray(feature_steps.fit_transform(X_train.iloc[order]), dtype=float),
+            "y": np.asarray(y_train, dtype=float)[order],
+            "X_val": np.asarray(feature_steps.transform(X_val), dtype=float),
+            "y_val": np.asarray(y_val, dtype=float),
+        }
+
+    tr = cfg["training"]
+    key_config = {
+        "matrices": "tuning",
+        "preprocessing": cfg["preprocessing"],
+        "split": {k: tr[k] for k in ("target", "test_size", "val_size", "shuffle")},
+        "seed": seed,
+        "dataset_year": cfg.get("dataset_year", 2024),
+    }
+    return cached(
+        compute,
+        [cfg["paths"]["data_path"]],
+        key_config,
+        [clean_data, FeatureEngineer, prepare_training_data, _feature_matrices],
+    )
+
+
+def successive_halving(cfg: Dict[str, Any], n_jobs: Optional[int] = None) -> Dict[str, Any]:
+    """Run the successive-halving search.
+
+    Args:
+        cfg: Project configuration. The search settings are read from the
+            ``tuning`` section (defaults in :data:`DEFAULT_TUNING`) and the
+            fixed forest parameters from ``training.random_forest_params``.
+        n_jobs: Parallel candidate fits (overrides ``tuning.n_jobs``; -1 for all cores).
+
+    Returns:
+        Report dict with the ``best_params`` to write into
+        ``training.random_forest_params``, the winner's ``val_metrics``,
+        one entry per round in ``rounds`` and the overall ``cost``.
+    """
+    tuning = {**DEFAULT_TUNING, **(cfg.get("tuning") or {})}
+    seed = cfg["seed"]
+    n_workers = effective_n_jobs(tuning["n_jobs"] if n_jobs is None else n_jobs)
+
+    matrices = _feature_matrices(cfg)
+    X, y, X_val, y_val = (matrices[k] for k in ("X", "y", "X_val", "y_val"))
+
+    base_params = {k: v for k, v in cfg["training"].get("random_forest_params", {}).items() if k != "n_estimators"}
+    base_params.setdefault("random_state", seed)
+    if n_workers > 1:
+        base_params["n_jobs"] = 1
+
+    candidates = [
+        dict(params)
+        for params in ParameterSampler(tuning["param_space"], n_iter=tuning["n_candidates"], random_state=seed)
+    ]
+    models = [RandomForestRegressor(**{**base_params, **params, "warm_start": True}) for params in candidates]
+    schedule = halving_schedule(
+        len(candidates),
+        len(X),
+        tuning["eta"],
+        tuning["min_rows"],
+        tuning["min_estimators"],
+        tuning["max_estimators"],
+    )
+
+    alive = list(range(len(candidates)))
+    trees = [0] * len(candidates)
+    rounds: List[Dict[str, Any]] = []
+    tree_rows = 0
+    start = time.perf_counter()
+    with Parallel(n_jobs=n_workers) as parallel:
+        for rnd, step in enumerate(schedule):
+            alive = alive[: step["candidates"]]
+            rows = step["rows"]
+            round_start = time.perf_counter()
+            results = parallel(
+                delayed(_grow)(models[i], step["n_estimators"], X[:rows], y[:rows], X_val, y_val) for i in alive
+            )
+            scores = {}
+            for i, (model, score) in zip(alive, results):
+                models[i], scores[i] = model, score
+                tree_rows += (step["n_estimators"] - trees[i]) * rows
+                trees[i] = step["n_estimators"]
+            alive.sort(key=scores.__getitem__)
+            rounds.append(
+                {
+                    "round": rnd,
+                    "candidates": len(results),
+                    "rows": rows,
+                    "n_estimators": step["n_estimators"],
+                    "best_rmse": scores[alive[0]],
+                    "median_rmse": float(np.median(list(scores.values()))),
+                    "seconds": time.perf_counter() - round_start,
+                    "cumulative_seconds": time.perf_counter() - start,
+                    "cumulative_tree_rows": tree_rows,
+                }
+            )
+            logger.info(
+                "Ronda %d: %d candidatos, %d filas, %d árboles, mejor RMSE %.2f (%.1fs)",
+                rnd,
+                len(results),
+                rows,
+                step["n_estimators"],
+                scores[alive[0]],
+                rounds[-1]["seconds"],
+            )
+
+    winner = alive[0]
+    best_params = {**candidates[winner], "n_estimators": trees[winner]}
+    yv = models[winner].predict(X_val)
+    val_metrics = {
+        "rmse": rmse(y_val, yv),
+        "mae": float(mean_absolute_error(y_val, yv)),
+        "mape": mape(y_val, yv),
+        "r2": float(r2_score(y_val, yv)),
+    }
+    # Cost of fitting every candidate with the full budget, the plain random search
+    full_budget = len(candidates) * tuning["max_estimators"] * len(X)
+    cost = {
+        "seconds": time.perf_counter() - start,
+        "tree_rows": tree_rows,
+        "full_budget_tree_rows": full_budget,
+        "fraction_of_full_budget": tree_rows / full_budget,
+        "n_jobs": n_workers,
+    }
+    logger.info(
+        "Mejor candidato %s: RMSE %.2f con %.1f%% del coste de entrenar todos los candidatos completos",
+        best_params,
+        val_metrics["rmse"],
+        100 * cost["fraction_of_full_budget"],
+    )
+    return {"best_params": best_params, "val_metrics": val_metrics, "rounds": rounds, "cost": cost}
+
+
+def tuned_config_path(config_path: str | Path) -> Path:
+    """Default output of :func:`tune_model`: ``configs/config.yaml`` -> ``configs/config.tuned.yaml``."""
+    config_path = Path(config_path)
+    return config_path.with_name(f"{config_path.stem}.tuned{config_path.suffix or '.yaml'}")
+
+
+def write_best_params(config_path: str | Path, best_params: Dict[str, Any], output_path: str | Path) -> Path:
+    """Write ``config_path`` with ``best_params`` merged into ``training.random_forest_params``.
+
+    The result is re-serialized with ``yaml.safe_dump``, which drops comments,
+    so ``output_path`` should not be a hand-maintained config.
+    """
+    cfg = yaml.safe_load(Path(config_path).read_text())
+    training = cfg.setdefault("training", {})
+    training["random_forest_params"] = {**(training.get("random_forest_params") or {}), **best_params}
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(yaml.safe_dump(cfg, sort_keys=False, allow_unicode=True))
+    return output_path
+
+
+def tune_model(
+    cfg: Dict[str, Any], config_path: str | Path, output_path: Optional[str | Path] = None
+) -> Dict[str, Any]:
+    """Run the search, save the report and write the winner into a tuned copy of the config.
+
+    Args:
+        cfg: Loaded project configuration.
+        config_path: YAML the configuration was loaded from; never modified
+            unless passed again as ``output_path``.
+        output_path: YAML to write the tuned configuration to (default:
+            :func:`tuned_config_path`, e.g. ``configs/config.tuned.yaml``).
+
+    Returns:
+        The :func:`successive_halving` report plus ``config_path`` (written
+        config) and ``report_path``.
+    """
+    report = successive_halving(cfg)
+    output_path = write_best_params(config_path, report["best_params"], output_path or tuned_config_path(config_path))
+
+    report_path = Path(cfg["paths"]["artifacts_dir"]) / "tuning_report.json"
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, indent=2))
+    logger.info(f"Parámetros ganadores guardados en {output_path}; informe en {report_path}")
+    return {**report, "config_path": str(output_path), "report_path": str(report_path)}
@@ -9,6 +9,7 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 from src.carvision.analysis import MarketAnalyzer
+from src.carvision.features import extract_brand
 
 
 class VisualizationEngine:
@@ -72,8 +73,9 @@ class VisualizationEngine:
         if "model" in self.df.columns:
             # Top marcas
             if "brand" not in self.df.columns:
-                self.df["brand"] = self.df["model"].str.split().str[0]
-            top_brands = self.df["brand"].value_counts().head(10)
+                self.df["brand"] = extract_brand(self.df["model"])
+            top_brands = self.df["brand"].value_counts()
+            top_brands = top_brands[top_brands > 0].head(10)
             fig.add_trace(
                 go.Bar(
                     x=top_brands.values,
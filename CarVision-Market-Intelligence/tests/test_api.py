@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.fastapi_app as api
+import main as carvision_module
+from tests.utils_carvision import build_test_config
+
+VEHICLE = {"model_year": 2016, "model": "ford focus", "odometer": 60000, "fuel": "gas", "type": "sedan"}
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    cfg, _ = build_test_config(tmp_path)
+    carvision_module.train_model(cfg)
+    monkeypatch.setattr(api, "MODEL_PATH", cfg["paths"]["model_path"])
+    monkeypatch.setattr(api, "ARTIFACTS_DIR", Path(cfg["paths"]["artifacts_dir"]))
+    monkeypatch.setattr(api, "wrapper", api.ModelWrapper())
+    with TestClient(api.app) as test_client:
+        yield test_client
+
+
+def test_predict_batch_matches_single_predictions(client: TestClient) -> None:
+    vehicles = [VEHICLE, {**VEHICLE, "model": "audi a4", "model_year": 2014}, {**VEHICLE, "drive": "4wd"}]
+
+    response = client.post("/predict_batch", json={"vehicles": vehicles})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 3
+    singles = [client.post("/predict", json=v).json()["prediction"] for v in vehicles]
+    assert body["predictions"] == pytest.approx(singles)
+
+
+def test_missing_features_use_imputed_values(client: TestClient) -> None:
+    wrapper = api.wrapper
+    # 'size' no está en el esquema de la API: se rellena con el valor imputado del pipeline
+    assert "size" in wrapper.feature_columns
+    assert wrapper.fill_values["size"] in {"compact", "full-size"}
+
+    explicit = wrapper.predict({**VEHICLE, "size": wrapper.fill_values["size"]})
+    assert wrapper.predict(VEHICLE) == pytest.approx(explicit)
+
+
+def test_predict_batch_rejects_empty_and_oversized(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert client.post("/predict_batch", json={"vehicles": []}).status_code == 422
+
+    monkeypatch.setattr(api, "MAX_BATCH_SIZE", 2)
+    assert client.post("/predict_batch", json={"vehicles": [VEHICLE] * 3}).status_code == 422
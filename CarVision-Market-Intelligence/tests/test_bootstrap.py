@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from common_utils.bootstrap import (
+    CLASSIFICATION_METRICS,
+    REGRESSION_METRICS,
+    bootstrap_metrics,
+    resample_weights,
+    summarize_bootstrap,
+)
+from sklearn.metrics import (
+    accuracy_score,
+    f1_score,
+    mean_absolute_error,
+    mean_squared_error,
+    precision_score,
+    r2_score,
+    recall_score,
+    roc_auc_score,
+)
+
+from src.carvision.evaluation import _run_bootstrap, mape
+
+
+def _rows(weights: np.ndarray, b: int) -> np.ndarray:
+    return np.repeat(np.arange(weights.shape[1]), weights[b].astype(int))
+
+
+def test_weighted_regression_metrics_match_resampled_rows() -> None:
+    rng = np.random.default_rng(0)
+    y = rng.uniform(1000, 40000, 300)
+    y_pred = y + rng.normal(0, 3000, 300)
+    weights = resample_weights(np.random.default_rng(1), 5, 300)
+    assert (weights.sum(axis=1) == 300).all()
+
+    reference = {
+        "rmse": lambda t, p: np.sqrt(mean_squared_error(t, p)),
+        "mae": mean_absolute_error,
+        "mape": mape,
+        "r2": r2_score,
+    }
+    for name, fn in REGRESSION_METRICS.items():
+        values = fn(weights, y, y_pred)
+        expected = [reference[name](y[_rows(weights, b)], y_pred[_rows(weights, b)]) for b in range(5)]
+        np.testing.assert_allclose(values, expected, rtol=1e-9, err_msg=name)
+
+
+def test_weighted_classification_metrics_match_resampled_rows() -> None:
+    rng = np.random.default_rng(0)
+    y = rng.integers(0, 2, 200)
+    # Puntuaciones redondeadas para incluir empates en ROC AUC
+    scores = np.round(np.clip(0.35 * y + rng.uniform(0, 0.65, 200), 0, 1), 1)
+    weights = resample_weights(np.random.default_rng(2), 4, 200, method="poisson")
+
+    reference = {
+        "accuracy": accuracy_score,
+        "precision": lambda t, p: precision_score(t, p, zero_division=0),
+        "recall": lambda t, p: recall_score(t, p, zero_division=0),
+        "f1": lambda t, p: f1_score(t, p, zero_division=0),
+    }
+    for b in range(4):
+        rows = _rows(weights, b)
+        for name, fn in reference.items():
+            expected = fn(y[rows], (scores[rows] > 0.5).astype(int))
+            assert CLASSIFICATION_METRICS[name](weights, y, scores)[b] == pytest.approx(expected), name
+        expected_auc = roc_auc_score(y[rows], scores[rows])
+        assert CLASSIFICATION_METRICS["roc_auc"](weights, y, scores)[b] == pytest.approx(expected_auc)
+
+
+def test_samples_do_not_depend_on_n_jobs() -> None:
+    rng = np.random.default_rng(3)
+    y = rng.uniform(0, 10, 500)
+    preds = {"model": y + rng.normal(0, 1, 500), "baseline": np.full(500, y.mean())}
+    # chunk_bytes pequeño: varios bloques de remuestras
+    kwargs = dict(n_resamples=64, random_state=7, chunk_bytes=32 * 500 * 10)
+
+    serial = bootstrap_metrics(y, preds, **kwargs)
+    parallel = bootstrap_metrics(y, preds, n_jobs=2, **kwargs)
+
+    for name in preds:
+        for metric in ("rmse", "mae", "mape", "r2"):
+            assert serial[name][metric].shape == (64,)
+            np.testing.assert_array_equal(serial[name][metric], parallel[name][metric])
+
+    summary = summarize_bootstrap(serial, reference="baseline")
+    delta = summary["deltas"]["model"]["rmse"]
+    assert delta["ci"][0] <= delta["mean"] <= delta["ci"][1] < 0
+    assert delta["p_value_two_sided"] == 0.0
+
+    with pytest.raises(ValueError):
+        bootstrap_metrics(y, preds, method="jackknife")
+    with pytest.raises(ValueError):
+        bootstrap_metrics(y, preds, metrics=("gini",))
+
+
+def test_run_bootstrap_reports_all_metrics() -> None:
+    rng = np.random.default_rng(4)
+    y = rng.uniform(5000, 40000, 120)
+    result = _run_bootstrap(y, y + rng.normal(0, 2000, 120), np.full(120, np.median(y)), 100, 42)
+
+    assert result["delta_rmse_mean"] == result["deltas"]["rmse"]["mean"]
+    assert result["delta_rmse_ci95"][0] <= result["delta_rmse_mean"] <= result["delta_rmse_ci95"][1]
+    assert set(result["metrics"]) == {"model", "baseline"}
+    assert set(result["metrics"]["model"]) == {"rmse", "mae", "mape", "r2"}
+    assert result["metrics"]["model"]["r2"]["mean"] > result["metrics"]["baseline"]["r2"]["mean"]
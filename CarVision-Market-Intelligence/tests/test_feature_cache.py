@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from common_utils.feature_cache import FeatureCache, read_csv
+
+import src.carvision.data as data_module
+from src.carvision.data import prepare_training_data
+from src.carvision.tuning import _feature_matrices
+from tests.utils_carvision import build_test_config
+
+
+@pytest.fixture
+def cache_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache_dir = tmp_path / "feature_cache"
+    monkeypatch.setenv("FEATURE_CACHE", "1")
+    monkeypatch.setenv("FEATURE_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+def test_feature_cache_round_trip(tmp_path: Path) -> None:
+    data_csv = tmp_path / "data.csv"
+    data_csv.write_text("a,b\n1,x\n2,y\n")
+    cache = FeatureCache(tmp_path / "cache")
+    frame = pd.DataFrame({"a": [1.5, 2.5], "b": ["x", "y"]}, index=[10, 20])
+    entry = {
+        "frame": frame,
+        "series": pd.Series([1, 2], index=[10, 20], name="price"),
+        "array": np.arange(6, dtype=float).reshape(2, 3),
+        "columns": ["a", "b"],
+    }
+    calls = []
+
+    def compute() -> dict:
+        calls.append(1)
+        return entry
+
+    cache.get_or_compute(compute, [data_csv], {"filters": {"min_price": 1000}}, "v1")
+    loaded = cache.get_or_compute(compute, [data_csv], {"filters": {"min_price": 1000}}, "v1")
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(loaded["frame"], frame)
+    pd.testing.assert_series_equal(loaded["series"], entry["series"])
+    np.testing.assert_array_equal(loaded["array"], entry["array"])
+    assert loaded["columns"] == ["a", "b"]
+
+    # Cambios en datos, configuración o código generan una clave nueva
+    cache.get_or_compute(compute, [data_csv], {"filters": {"min_price": 2000}}, "v1")
+    cache.get_or_compute(compute, [data_csv], {"filters": {"min_price": 1000}}, "v2")
+    data_csv.write_text("a,b\n1,x\n3,z\n")
+    cache.get_or_compute(compute, [data_csv], {"filters": {"min_price": 1000}}, "v1")
+    assert len(calls) == 4
+
+    cache.clear()
+    assert not (tmp_path / "cache").exists()
+
+
+def test_disabled_cache_always_computes(tmp_path: Path) -> None:
+    cache = FeatureCache(tmp_path / "cache", enabled=False)
+    calls = []
+    for _ in range(2):
+        cache.get_or_compute(lambda: calls.append(1) or {"x": 1}, [tmp_path / "missing.csv"])
+    assert len(calls) == 2
+    assert not (tmp_path / "cache").exists()
+
+
+def test_read_csv_uses_prefixed_settings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    data_csv = tmp_path / "data.csv"
+    data_csv.write_text("a,b\n1,x\n2,y\n")
+    monkeypatch.setenv("DRIFT_FEATURE_CACHE", "1")
+    monkeypatch.setenv("DRIFT_FEATURE_CACHE_DIR", str(tmp_path / "cache"))
+
+    first = read_csv(data_csv, prefix="DRIFT_")
+    # Segunda lectura: sale de la caché sin volver a parsear el CSV
+    monkeypatch.setattr(pd, "read_csv", lambda *a, **k: pytest.fail("CSV parseado con la caché activa"))
+    second = read_csv(data_csv, prefix="DRIFT_")
+
+    pd.testing.assert_frame_equal(first, second)
+    assert (tmp_path / "cache").is_dir()
+
+
+def test_prepare_training_data_reuses_cache(tmp_path: Path, cache_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cfg, _ = build_test_config(tmp_path)
+    first = prepare_training_data(cfg)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("raw data parsed on a cache hit")
+
+    monkeypatch.setattr(data_module, "load_data", fail)
+    second = prepare_training_data(cfg)
+
+    assert second["num_cols"] == first["num_cols"]
+    assert second["cat_cols"] == first["cat_cols"]
+    assert second["split_indices"] == first["split_indices"]
+    for a, b in zip(first["split"], second["split"]):
+        pd.testing.assert_index_equal(a.index, b.index)
+    pd.testing.assert_frame_equal(second["split"][0], first["split"][0])
+
+    # Sin caché (entorno y load_data restaurados) los splits son los mismos
+    monkeypatch.undo()
+    uncached = prepare_training_data(cfg)
+    assert uncached["split_indices"] == first["split_indices"]
+
+
+def test_tuning_matrices_are_cached(tmp_path: Path, cache_env: Path) -> None:
+    cfg, _ = build_test_config(tmp_path)
+
+    first = _feature_matrices(cfg)
+    entries = {p.name for p in cache_env.iterdir()}
+    second = _feature_matrices(cfg)
+
+    assert {p.name for p in cache_env.iterdir()} == entries
+    for name in ("X", "y", "X_val", "y_val"):
+        np.testing.assert_array_equal(first[name], second[name])
@@ -40,3 +40,18 @@ def test_feature_engineering_no_price():
     assert "brand" in res.columns
     # Derived analysis features shouldn't be created if missing cols
     assert "price_per_mile" not in res.columns
+
+
+def test_brand_matches_string_split_and_is_categorical():
+    models = pd.Series(["ford f-150", None, "  bmw x5", "ford focus", "", "honda civic"], index=[5, 3, 9, 1, 0, 2])
+    for model in (models, models.astype("category")):
+        df = pd.DataFrame({"model": model, "model_year": 2015})
+
+        res = FeatureEngineer(current_year=2024).transform(df)
+
+        expected = models.astype(str).str.split().str[0]
+        assert isinstance(res["brand"].dtype, pd.CategoricalDtype)
+        assert list(res["brand"].cat.categories) == ["bmw", "ford", "honda"]
+        pd.testing.assert_series_equal(res["brand"].astype(object), expected.astype(object), check_names=False)
+        # La entrada no se modifica
+        assert "brand" not in df.columns
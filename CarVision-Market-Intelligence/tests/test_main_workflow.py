@@ -69,6 +69,26 @@ def test_cli_train_eval_predict_modes(
     parsed = json.loads(predict_output)
     assert "prediction" in parsed
 
+    # Predicción por lotes desde Parquet, en lotes de 20 filas
+    batch_input = tmp_path / "batch.parquet"
+    pd.read_csv(data_csv).head(50).to_parquet(batch_input, index=False)
+    _run_cli(
+        monkeypatch,
+        "--mode",
+        "predict",
+        "--config",
+        config_path,
+        "--input",
+        batch_input,
+        "--output",
+        tmp_path / "preds.parquet",
+        "--batch_size",
+        20,
+    )
+    batch_preds = pd.read_parquet(tmp_path / "preds.parquet")
+    assert len(batch_preds) == 50
+    assert batch_preds["predicted_price"].iloc[0] == pytest.approx(parsed["prediction"])
+
 
 def test_cli_analysis_report_export_dashboard(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture[str]
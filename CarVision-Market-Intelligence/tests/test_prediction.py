@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import main as carvision_module
+import src.carvision.prediction as prediction
+from src.carvision.prediction import get_model, invalidate_model_cache, predict_price, predict_prices
+from tests.utils_carvision import build_test_config
+
+VEHICLE = {"model_year": 2016, "model": "ford focus", "odometer": 60000, "fuel": "gas", "type": "sedan"}
+
+
+@pytest.fixture
+def trained_cfg(tmp_path: Path) -> dict:
+    cfg, _ = build_test_config(tmp_path)
+    carvision_module.train_model(cfg)
+    invalidate_model_cache()
+    yield cfg
+    invalidate_model_cache()
+
+
+@pytest.fixture
+def load_calls(monkeypatch: pytest.MonkeyPatch) -> list:
+    calls: list = []
+    original = prediction.joblib.load
+
+    def counting_load(path, *args, **kwargs):
+        calls.append(str(path))
+        return original(path, *args, **kwargs)
+
+    monkeypatch.setattr(prediction.joblib, "load", counting_load)
+    return calls
+
+
+def test_model_is_loaded_once_until_file_changes(trained_cfg: dict, load_calls: list) -> None:
+    first = predict_price(VEHICLE, trained_cfg)
+    assert predict_price(VEHICLE, trained_cfg) == first
+    assert len(load_calls) == 1
+
+    # Un artefacto nuevo (mtime distinto) se recarga en la siguiente llamada
+    model_path = Path(trained_cfg["paths"]["model_path"])
+    stat = model_path.stat()
+    os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    predict_price(VEHICLE, trained_cfg)
+    assert len(load_calls) == 2
+
+    invalidate_model_cache(model_path)
+    predict_price(VEHICLE, trained_cfg)
+    assert len(load_calls) == 3
+
+
+def test_registry_keeps_at_most_cache_size_models(
+    trained_cfg: dict, tmp_path: Path, load_calls: list, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(prediction, "MODEL_CACHE_SIZE", 1)
+    other_cfg, _ = build_test_config(tmp_path / "other")
+    carvision_module.train_model(other_cfg)
+
+    get_model(trained_cfg)
+    get_model(other_cfg)
+    get_model(other_cfg)
+    assert len(load_calls) == 2
+    get_model(trained_cfg)
+    assert len(load_calls) == 3
+
+    with pytest.raises(FileNotFoundError):
+        get_model({"paths": {**trained_cfg["paths"], "model_path": str(tmp_path / "missing.joblib")}})
+
+
+def test_predict_prices_matches_single_predictions(trained_cfg: dict, load_calls: list) -> None:
+    payloads = [VEHICLE, {**VEHICLE, "model": "audi a4", "model_year": 2014}, {**VEHICLE, "fuel": None}]
+
+    batch = predict_prices(payloads, trained_cfg)
+
+    singles = [predict_price(p, trained_cfg)["prediction"] for p in payloads]
+    assert [r["prediction"] for r in batch] == pytest.approx(singles)
+    assert len(load_calls) == 1
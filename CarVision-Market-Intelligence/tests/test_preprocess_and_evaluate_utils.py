@@ -8,7 +8,7 @@ import pytest
 import yaml
 
 from src.carvision.data import build_preprocessor, clean_data, infer_feature_types, load_data, split_data
-from src.carvision.evaluation import evaluate_model, rmse
+from src.carvision.evaluation import evaluate_model, rmse, segment_errors
 from src.carvision.features import FeatureEngineer
 from src.carvision.training import train_model
 
@@ -19,7 +19,39 @@ def test_load_data_reads_csv(tmp_path: Path) -> None:
     sample.to_csv(csv_path, index=False)
 
     df = load_data(str(csv_path))
-    assert df.equals(sample)
+    pd.testing.assert_frame_equal(df, sample, check_dtype=False, check_categorical=False)
+    assert isinstance(df["model"].dtype, pd.CategoricalDtype)
+    assert df["price"].dtype == np.int16
+
+    assert load_data(str(csv_path), optimize=False).equals(sample)
+
+
+def test_load_data_chunks_and_projection_match_full_read(tmp_path: Path) -> None:
+    csv_path = tmp_path / "cars.csv"
+    rng = np.random.default_rng(0)
+    n = 1000
+    sample = pd.DataFrame(
+        {
+            "price": rng.integers(1000, 90000, n),
+            "odometer": np.where(rng.random(n) < 0.1, np.nan, rng.uniform(0, 3e5, n)),
+            "model": rng.choice(["ford f-150", "honda civic", "bmw x5"], n),
+            # Algunas categorías solo aparecen en el último bloque
+            "paint_color": ["white"] * 900 + ["purple"] * 100,
+            "days_listed": rng.integers(0, 200, n),
+        }
+    )
+    sample.to_csv(csv_path, index=False)
+
+    full = load_data(str(csv_path))
+    chunked = load_data(str(csv_path), chunksize=300)
+    pd.testing.assert_frame_equal(chunked, full, check_categorical=False)
+    assert isinstance(chunked["paint_color"].dtype, pd.CategoricalDtype)
+    assert set(chunked["paint_color"].cat.categories) == {"white", "purple"}
+    assert full["odometer"].dtype == np.float32
+
+    projected = load_data(str(csv_path), columns=["price", "model"])
+    assert list(projected.columns) == ["price", "model"]
+    assert full.memory_usage(deep=True).sum() < load_data(str(csv_path), optimize=False).memory_usage(deep=True).sum()
 
 
 def test_clean_data_filters_and_feature_engineering() -> None:
@@ -155,3 +187,64 @@ def test_rmse_matches_numpy() -> None:
     y_pred = np.array([1.0, 2.0, 4.0])
     expected = float(np.sqrt(np.mean((y_true - y_pred) ** 2)))
     assert rmse(y_true, y_pred) == pytest.approx(expected)
+
+
+def test_segment_errors_match_per_group_metrics() -> None:
+    rng = np.random.default_rng(0)
+    n = 400
+    df = pd.DataFrame(
+        {
+            "condition": pd.Categorical(rng.choice(["good", "excellent", "fair"], n)),
+            "type": rng.choice(["sedan", "SUV", "truck", None], n),
+            "model_year": rng.choice([2014, 2015, 2016], n),
+        }
+    )
+    y_true = rng.uniform(5000, 40000, n)
+    y_pred = y_true + rng.normal(0, 3000, n)
+
+    result = segment_errors(df, y_true, y_pred, ["condition", "type", "model_year", "missing"], min_count=20)
+
+    assert set(result["segment_col"]) == {
+        "condition",
+        "type",
+        "model_year",
+        "condition|type",
+        "condition|model_year",
+        "type|model_year",
+    }
+    assert (result["n"] >= 20).all()
+    # Cada segmento coincide con las métricas calculadas sobre sus filas
+    for row in result.sample(8, random_state=0).itertuples():
+        mask = np.ones(n, dtype=bool)
+        for col, val in zip(row.segment_col.split("|"), row.segment_val.split("|")):
+            mask &= df[col].astype(str).to_numpy() == val
+        assert row.n == mask.sum()
+        assert row.rmse == pytest.approx(rmse(y_true[mask], y_pred[mask]))
+        assert row.bias == pytest.approx(np.mean(y_pred[mask] - y_true[mask]))
+    # Filas sin valor de segmento (type nulo) no forman grupo
+    assert "None" not in set(result.loc[result["segment_col"] == "type", "segment_val"])
+
+    only_columns = segment_errors(df, y_true, y_pred, ["condition"], pairwise=False, min_count=n + 1)
+    assert only_columns.empty
+
+
+def test_segment_errors_high_cardinality_pairs_match_groupby() -> None:
+    rng = np.random.default_rng(1)
+    n = 500
+    # 400 x 450 combinaciones posibles, muchas más que filas: se agrupan solo las observadas
+    df = pd.DataFrame({"model": rng.integers(0, 400, n), "odometer": rng.integers(0, 450, n) * 1000})
+    df.loc[:20, "model"] = 7
+    df.loc[:20, "odometer"] = 3000
+    y_true = rng.uniform(5000, 40000, n)
+    y_pred = y_true + rng.normal(0, 3000, n)
+
+    result = segment_errors(df, y_true, y_pred, ["model", "odometer"], min_count=1)
+
+    pairs = result[result["segment_col"] == "model|odometer"]
+    expected = (
+        df.assign(se=(y_pred - y_true) ** 2).groupby(["model", "odometer"])["se"].agg(["size", "mean"]).reset_index()
+    )
+    assert pairs["segment_val"].tolist() == [f"{m}|{o}" for m, o in zip(expected["model"], expected["odometer"])]
+    np.testing.assert_array_equal(pairs["n"].to_numpy(), expected["size"].to_numpy())
+    np.testing.assert_allclose(pairs["rmse"].to_numpy(), np.sqrt(expected["mean"].to_numpy()))
+    assert pairs.loc[pairs["segment_val"] == "7|3000", "n"].item() == 21
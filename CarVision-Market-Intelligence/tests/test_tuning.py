@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+import main as carvision_module
+from src.carvision.tuning import halving_schedule, successive_halving, tune_model
+from tests.utils_carvision import build_test_config
+
+
+def _tuning_config(tmp_path: Path, n_jobs: int = 1) -> dict:
+    cfg, _ = build_test_config(tmp_path)
+    cfg["tuning"] = {
+        "n_candidates": 9,
+        "eta": 3,
+        "min_rows": 20,
+        "min_estimators": 4,
+        "max_estimators": 18,
+        "n_jobs": n_jobs,
+        "param_space": {"max_depth": [2, 4, 6], "min_samples_leaf": [1, 2, 4], "max_features": [1.0, 0.5]},
+    }
+    return cfg
+
+
+def test_halving_schedule_shrinks_candidates_and_grows_budget() -> None:
+    schedule = halving_schedule(27, 9000, eta=3, min_rows=500, min_estimators=25, max_estimators=300)
+
+    assert [s["candidates"] for s in schedule] == [27, 9, 3, 1]
+    assert [s["rows"] for s in schedule] == [500, 1000, 3000, 9000]
+    assert [s["n_estimators"] for s in schedule] == [25, 57, 131, 300]
+
+    with pytest.raises(ValueError):
+        halving_schedule(9, 100, eta=1, min_rows=10, min_estimators=5, max_estimators=10)
+
+
+def test_successive_halving_grows_survivors(tmp_path: Path) -> None:
+    report = successive_halving(_tuning_config(tmp_path))
+
+    rounds = report["rounds"]
+    assert [r["candidates"] for r in rounds] == [9, 3, 1]
+    assert rounds[-1]["n_estimators"] == 18
+    # Rondas crecientes en filas; el coste acumulado queda por debajo del presupuesto completo
+    assert rounds[0]["rows"] < rounds[-1]["rows"]
+    assert report["cost"]["tree_rows"] == rounds[-1]["cumulative_tree_rows"]
+    assert 0 < report["cost"]["fraction_of_full_budget"] < 1
+    assert report["best_params"]["n_estimators"] == 18
+    assert set(report["best_params"]) == {"n_estimators", "max_depth", "min_samples_leaf", "max_features"}
+    assert report["val_metrics"]["rmse"] == pytest.approx(rounds[-1]["best_rmse"])
+
+
+def test_parallel_search_matches_serial(tmp_path: Path) -> None:
+    serial = successive_halving(_tuning_config(tmp_path / "serial"))
+    parallel = successive_halving(_tuning_config(tmp_path / "parallel", n_jobs=2))
+
+    assert parallel["best_params"] == serial["best_params"]
+    assert parallel["val_metrics"]["rmse"] == pytest.approx(serial["val_metrics"]["rmse"])
+
+
+def test_tune_model_writes_winner_into_tuned_copy(tmp_path: Path) -> None:
+    cfg = _tuning_config(tmp_path)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("# comentario\n" + yaml.safe_dump(cfg))
+    original = config_path.read_text()
+
+    result = tune_model(cfg, config_path)
+
+    # La configuración original no se toca
+    assert config_path.read_text() == original
+    assert result["config_path"] == str(tmp_path / "config.tuned.yaml")
+    tuned = yaml.safe_load(Path(result["config_path"]).read_text())
+    rf_params = tuned["training"]["random_forest_params"]
+    assert {k: rf_params[k] for k in result["best_params"]} == result["best_params"]
+    assert rf_params["n_jobs"] == cfg["training"]["random_forest_params"]["n_jobs"]
+    assert json.loads(Path(result["report_path"]).read_text())["best_params"] == result["best_params"]
+
+
+def test_cli_tune_mode(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump(_tuning_config(tmp_path)))
+    output_path = tmp_path / "config.tuned.yaml"
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        sys, "argv", ["main.py", "--mode", "tune", "--config", str(config_path), "--output", str(output_path)]
+    )
+
+    carvision_module.main()
+
+    printed = json.loads(capsys.readouterr().out)
+    tuned = yaml.safe_load(output_path.read_text())
+    assert tuned["training"]["random_forest_params"]["max_depth"] == printed["best_params"]["max_depth"]
+    # La configuración original no se modifica cuando --output es un YAML
+    assert "max_features" not in yaml.safe_load(config_path.read_text())["training"]["random_forest_params"]
@@ -3,26 +3,41 @@ TelecomAI Customer Intelligence API
 
 Features:
 - Plan recommendation prediction (Standard vs Ultra)
+- Inference on a bounded worker pool so scoring never blocks the event loop
+- Memory-mapped model loading and optional preload for copy-on-write sharing across workers
+- Synthetic warm-up prediction before the service reports ready
+- Optional prediction cache for repeated inputs (PREDICTION_CACHE=1)
 - Prometheus-compatible metrics endpoint
 - Health checks for Kubernetes readiness/liveness
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
 import time
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 
-import joblib
 import pandas as pd
+from common_utils.artifacts import ArtifactSettings, file_checksum, freeze_for_fork, load_artifact
+from common_utils.cache import CacheSettings, PredictionCache, canonical_key
+from common_utils.serving import (
+    ExecutorSaturatedError,
+    ExecutorSettings,
+    InferenceExecutor,
+    InferenceMetrics,
+    run_inference,
+)
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import RedirectResponse, Response
 from pydantic import BaseModel, Field
 
 # Prometheus metrics (optional dependency)
+INFERENCE_METRICS: Optional[InferenceMetrics] = None
 try:
-    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
 
     PROMETHEUS_AVAILABLE = True
     REQUEST_COUNT = Counter(
@@ -36,6 +51,21 @@ try:
         ["endpoint"],
         buckets=[0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
     )
+    INFERENCE_METRICS = InferenceMetrics("telecom")
+    MODEL_LOAD_SECONDS = Gauge(
+        "telecom_model_load_seconds",
+        "Time the last model load spent in each phase",
+        ["phase"],
+    )
+    PREDICTION_CACHE_EVENTS = Counter(
+        "telecom_prediction_cache_events_total",
+        "Prediction cache lookups (hit, miss, expired) and evictions",
+        ["event"],
+    )
+    PREDICTION_CACHE_BYTES = Gauge(
+        "telecom_prediction_cache_bytes",
+        "Approximate size of the prediction cache",
+    )
 except ImportError:
     PROMETHEUS_AVAILABLE = False
 
@@ -43,21 +73,114 @@ APP_TITLE = "TelecomAI Inference API"
 MODEL_PATH = os.getenv("MODEL_PATH", "artifacts/model.joblib")
 start_time = time.time()
 
+# Bounded inference executor (INFERENCE_WORKERS / INFERENCE_MAX_QUEUE / INFERENCE_EXECUTOR)
+EXECUTOR_SETTINGS = ExecutorSettings.from_env()
+
+# Model loading (MODEL_MMAP / PRELOAD_MODEL)
+ARTIFACT_SETTINGS = ArtifactSettings.from_env()
+
+# Prediction cache (PREDICTION_CACHE / _MAX_BYTES / _TTL_SECONDS / _PATH)
+CACHE_SETTINGS = CacheSettings.from_env()
+
+# Synthetic customer scored before the service reports ready
+WARMUP_FEATURES: Dict[str, Any] = {"calls": 60.0, "minutes": 420.0, "messages": 35.0, "mb_used": 17000.0}
+
 ml_models = {}
+executor: Optional[InferenceExecutor] = None
+prediction_cache: Optional[PredictionCache] = None
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    # Load the ML model
+def load_pipeline() -> None:
+    """Load the model into ``ml_models`` (also used to initialise process workers)."""
     if not Path(MODEL_PATH).exists():
         # Warn but don't crash, might be a build phase
         print(f"WARNING: Model not found at {MODEL_PATH}")
     else:
-        ml_models["pipeline"] = joblib.load(MODEL_PATH)
+        start = time.perf_counter()
+        ml_models["pipeline"] = load_artifact(MODEL_PATH, mmap_mode=ARTIFACT_SETTINGS.mmap_mode)
+        ml_models["checksum"] = file_checksum(MODEL_PATH)
+        if PROMETHEUS_AVAILABLE:
+            MODEL_LOAD_SECONDS.labels(phase="load").set(time.perf_counter() - start)
+
+
+def score_features(data: Dict[str, Any]) -> Tuple[int, Optional[float]]:
+    """Return (prediction, probability_is_ultra) for one feature dict."""
+    pipeline = ml_models["pipeline"]
+    df = pd.DataFrame([data])
+    proba = None
+    if hasattr(pipeline, "predict_proba"):
+        proba = float(pipeline.predict_proba(df)[0, 1])
+    return int(pipeline.predict(df)[0]), proba
+
+
+def warm_up_pipeline() -> bool:
+    """Score ``WARMUP_FEATURES`` once; unloads the model if that fails."""
+    if "pipeline" not in ml_models:
+        return False
+    start = time.perf_counter()
+    try:
+        score_features(WARMUP_FEATURES)
+    except Exception as e:
+        print(f"ERROR: Model warm-up failed, serving without a model: {e}")
+        ml_models.pop("pipeline", None)
+        return False
+    if PROMETHEUS_AVAILABLE:
+        MODEL_LOAD_SECONDS.labels(phase="warmup").set(time.perf_counter() - start)
+    return True
+
+
+async def score_features_cached(data: Dict[str, Any]) -> Tuple[int, Optional[float]]:
+    """``score_features`` on the executor, answering repeated inputs from the prediction cache."""
+    cache, checksum = prediction_cache, ml_models.get("checksum")
+    if cache is None or checksum is None:
+        return await run_inference(executor, score_features, data)
+    # Store round trips run off the event loop (a SQLite store may wait on a lock)
+    key = canonical_key(data, checksum)
+    result = await asyncio.to_thread(cache.get, key)
+    if result is None:
+        result = await run_inference(executor, score_features, data)
+        await asyncio.to_thread(cache.put, key, result)
+    return result
+
+
+def _observe_cache(event: str) -> None:
+    if PROMETHEUS_AVAILABLE:
+        PREDICTION_CACHE_EVENTS.labels(event=event).inc()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global executor, prediction_cache
+    # Load the ML model (unless preloaded at import) and warm it up before serving
+    if "pipeline" not in ml_models:
+        load_pipeline()
+    warm_up_pipeline()
+    executor = InferenceExecutor.from_settings(
+        EXECUTOR_SETTINGS,
+        metrics=INFERENCE_METRICS,
+        initializer=load_pipeline if EXECUTOR_SETTINGS.kind == "process" else None,
+    )
+    if CACHE_SETTINGS.enabled:
+        prediction_cache = PredictionCache.from_settings(CACHE_SETTINGS, observer=_observe_cache)
+        if PROMETHEUS_AVAILABLE:
+            PREDICTION_CACHE_BYTES.set_function(lambda: prediction_cache.bytes_used if prediction_cache else 0)
     yield
+    if executor is not None:
+        executor.shutdown(wait=False)
+        executor = None
+    if prediction_cache is not None:
+        prediction_cache.close()
+        prediction_cache = None
     ml_models.clear()
 
 
+# Load in the importing process so workers forked by ``gunicorn --preload``
+# share the model copy-on-write instead of each unpickling its own copy.
+if ARTIFACT_SETTINGS.preload:
+    load_pipeline()
+    if warm_up_pipeline():
+        freeze_for_fork()
+
 app = FastAPI(title=APP_TITLE, lifespan=lifespan)
 
 
@@ -104,11 +227,7 @@ async def predict(features: TelecomFeatures) -> dict:
     try:
         # pydantic v2 compatibility
         data_dict = features.model_dump() if hasattr(features, "model_dump") else features.dict()
-        df = pd.DataFrame([data_dict])
-        proba = None
-        if hasattr(pipeline, "predict_proba"):
-            proba = float(pipeline.predict_proba(df)[0, 1])
-        pred = int(pipeline.predict(df)[0])
+        pred, proba = await score_features_cached(data_dict)
 
         latency = time.time() - pred_start
         if PROMETHEUS_AVAILABLE:
@@ -119,6 +238,10 @@ async def predict(features: TelecomFeatures) -> dict:
             "prediction": pred,
             "probability_is_ultra": proba,
         }
+    except ExecutorSaturatedError as e:
+        if PROMETHEUS_AVAILABLE:
+            REQUEST_COUNT.labels(method="POST", endpoint="/predict", status="429").inc()
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         if PROMETHEUS_AVAILABLE:
             REQUEST_COUNT.labels(method="POST", endpoint="/predict", status="500").inc()
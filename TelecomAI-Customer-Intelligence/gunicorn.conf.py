@@ -0,0 +1,16 @@
+"""Gunicorn settings for the FastAPI service (``gunicorn -c gunicorn.conf.py app.fastapi_app:app``).
+
+``preload_app`` imports the app once in the master process. With
+``PRELOAD_MODEL=1`` the model is loaded, warmed up and frozen there, so the
+forked uvicorn workers share its memory copy-on-write instead of each loading
+their own copy.
+"""
+
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = 30
@@ -34,6 +34,8 @@ def main() -> None:
     parser.add_argument("--config", type=str, default="configs/config.yaml")
     parser.add_argument("--input_csv", type=str)
     parser.add_argument("--output_path", type=str)
+    parser.add_argument("--batch_size", type=int, help="Score the input in chunks of this many rows")
+    parser.add_argument("--id_columns", nargs="*", help="Decode only the model features plus these columns")
     parser.add_argument("--seed", type=int, help="Random seed override")
 
     args = parser.parse_args()
@@ -50,7 +52,14 @@ def main() -> None:
     elif args.mode == "predict":
         if not args.input_csv or not args.output_path:
             raise ValueError("Predict mode requires --input_csv and --output_path")
-        predict_batch(args.input_csv, args.output_path, cfg.paths["model_path"], cfg.features)
+        predict_batch(
+            args.input_csv,
+            args.output_path,
+            cfg.paths["model_path"],
+            cfg.features,
+            batch_size=args.batch_size,
+            id_columns=args.id_columns,
+        )
 
 
 if __name__ == "__main__":
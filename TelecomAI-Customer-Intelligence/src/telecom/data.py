@@ -6,11 +6,13 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, List, Tuple
 
 import pandas as pd
+from common_utils.feature_cache import FeatureCache, source_version
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
+from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 
@@ -53,6 +55,41 @@ def get_features_target(df: pd.DataFrame, features: List[str], target: str) -> T
     return X, y
 
 
+def load_split(cfg: Any) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
+    """Load the dataset and split it into train and test sets.
+
+    Shared by training and evaluation. With ``FEATURE_CACHE=1`` the split is
+    read from the feature cache while the CSV, the features/target/split
+    settings and this module are unchanged.
+
+    Args:
+        cfg: Project configuration (``paths.data_csv``, ``features``, ``target``, ``split``, ``random_seed``).
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]: (X_train, X_test, y_train, y_test)
+    """
+
+    def compute() -> dict:
+        df = load_dataset(cfg.paths["data_csv"])
+        X, y = get_features_target(df, cfg.features, cfg.target)
+        X_train, X_test, y_train, y_test = train_test_split(
+            X,
+            y,
+            test_size=float(cfg.split.get("test_size", 0.2)),
+            stratify=y if cfg.split.get("stratify", True) else None,
+            random_state=int(cfg.random_seed),
+        )
+        return {"X_train": X_train, "X_test": X_test, "y_train": y_train, "y_test": y_test}
+
+    cache = FeatureCache.from_env()
+    if not cache.enabled:
+        split = compute()
+    else:
+        key_config = {"features": cfg.features, "target": cfg.target, "split": cfg.split, "seed": cfg.random_seed}
+        split = cache.get_or_compute(compute, [cfg.paths["data_csv"]], key_config, source_version(load_split))
+    return split["X_train"], split["X_test"], split["y_train"], split["y_test"]
+
+
 def build_preprocessor(numeric_features: List[str]) -> ColumnTransformer:
     """Create preprocessor for numeric features.
 
@@ -11,9 +11,8 @@ import joblib
 import numpy as np
 import yaml
 from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score, roc_auc_score
-from sklearn.model_selection import train_test_split
 
-from src.telecom.data import get_features_target, load_dataset
+from src.telecom.data import load_split
 
 logger = logging.getLogger(__name__)
 
@@ -38,16 +37,7 @@ def compute_classification_metrics(
 def evaluate_model(cfg: Any) -> Dict[str, float]:
     logger.info("Starting evaluation...")
 
-    df = load_dataset(cfg.paths["data_csv"])
-    X, y = get_features_target(df, cfg.features, cfg.target)
-
-    _, X_test, _, y_test = train_test_split(
-        X,
-        y,
-        test_size=float(cfg.split.get("test_size", 0.2)),
-        stratify=y if cfg.split.get("stratify", True) else None,
-        random_state=int(cfg.random_seed),
-    )
+    _, X_test, _, y_test = load_split(cfg)
 
     # Load pipeline
     pipeline = joblib.load(cfg.paths["model_path"])
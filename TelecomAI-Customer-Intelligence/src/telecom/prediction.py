@@ -4,27 +4,71 @@ Prediction logic.
 
 from __future__ import annotations
 
+import logging
+from typing import Optional, Sequence
+
 import joblib
 import pandas as pd
+from common_utils.tabular_io import TableWriter, iter_batches, read_columns, read_table
 
+logger = logging.getLogger(__name__)
 
-def predict_batch(input_csv: str, output_path: str, model_path: str, features: list) -> None:
-    """Run batch prediction from CSV."""
-    df = pd.read_csv(input_csv)
-
-    # Load pipeline
-    pipeline = joblib.load(model_path)
-
-    # Validate columns
-    missing = [c for c in features if c not in df.columns]
-    if missing:
-        raise ValueError(f"Missing columns: {missing}")
 
+def _score(pipeline, df: pd.DataFrame, features: list) -> pd.DataFrame:
     preds = pipeline.predict(df[features])
     probas = pipeline.predict_proba(df[features])[:, 1] if hasattr(pipeline, "predict_proba") else None
 
     df["pred_is_ultra"] = preds
     if probas is not None:
         df["proba_is_ultra"] = probas
+    return df
+
+
+def predict_batch(
+    input_csv: str,
+    output_path: str,
+    model_path: str,
+    features: list,
+    batch_size: Optional[int] = None,
+    id_columns: Optional[Sequence[str]] = None,
+) -> int:
+    """Run batch prediction from a CSV, Parquet or Feather file.
+
+    Input and output formats are chosen from the file extensions.
+
+    Args:
+        input_csv: Input file path.
+        output_path: Output file path.
+        model_path: Trained pipeline path.
+        features: Model input features.
+        batch_size: Score in chunks of this many rows (Parquet row groups are
+            streamed) instead of loading the whole file.
+        id_columns: If given, decode only these columns plus ``features``
+            instead of every column in the input.
+
+    Returns:
+        int: Number of rows scored.
+    """
+    # Validate columns from the header/schema before decoding any data
+    missing = [c for c in features if c not in read_columns(input_csv)]
+    if missing:
+        raise ValueError(f"Missing columns: {missing}")
+
+    columns = None
+    if id_columns is not None:
+        columns = [c for c in id_columns if c not in features] + list(features)
+
+    # Load pipeline
+    pipeline = joblib.load(model_path)
+
+    if batch_size is None:
+        df = _score(pipeline, read_table(input_csv, columns=columns), features)
+        with TableWriter(output_path) as writer:
+            writer.write(df)
+    else:
+        with TableWriter(output_path) as writer:
+            for chunk in iter_batches(input_csv, batch_size, columns=columns):
+                writer.write(_score(pipeline, chunk, features))
 
-    df.to_csv(output_path, index=False)
+    logger.info("Predictions for %d rows saved to %s", writer.rows_written, output_path)
+    return writer.rows_written
@@ -11,10 +11,9 @@ from typing import Any, Dict
 import joblib
 from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
 from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
 
-from src.telecom.data import build_preprocessor, get_features_target, load_dataset
+from src.telecom.data import build_preprocessor, load_split
 
 logger = logging.getLogger(__name__)
 
@@ -46,16 +45,7 @@ def train_model(cfg: Any) -> Dict[str, float]:
     logger.info("Starting training...")
     ensure_dirs(cfg.paths)
 
-    df = load_dataset(cfg.paths["data_csv"])
-    X, y = get_features_target(df, cfg.features, cfg.target)
-
-    X_train, X_test, y_train, y_test = train_test_split(
-        X,
-        y,
-        test_size=float(cfg.split.get("test_size", 0.2)),
-        stratify=y if cfg.split.get("stratify", True) else None,
-        random_state=int(cfg.random_seed),
-    )
+    X_train, X_test, y_train, y_test = load_split(cfg)
 
     preprocessor = build_preprocessor(cfg.features)
     clf = build_model(cfg.model, int(cfg.random_seed))
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
+from app import fastapi_app
 from app.fastapi_app import app
+from common_utils.cache import CacheSettings
 from fastapi.testclient import TestClient
 from src.telecom.config import Config
 from src.telecom.training import train_model
@@ -45,6 +48,23 @@ def test_predict_endpoint_smoke():
         assert data["prediction"] in [0, 1]
 
 
+@pytest.mark.slow
+def test_predict_repeated_payload_served_from_cache():
+    ensure_artifacts()
+    payload = {"calls": 80, "minutes": 500.0, "messages": 30, "mb_used": 20000.0}
+    with patch.object(fastapi_app, "CACHE_SETTINGS", CacheSettings(enabled=True)), TestClient(app) as client:
+        with patch.object(fastapi_app, "score_features", wraps=fastapi_app.score_features) as scorer:
+            first = client.post("/predict", json=payload)
+            # Same customer with integers and floats swapped
+            second = client.post("/predict", json={**payload, "calls": 80.0, "mb_used": 20000})
+        metrics = client.get("/metrics").text
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert scorer.call_count == 1
+    assert 'telecom_prediction_cache_events_total{event="hit"}' in metrics
+
+
 def test_predict_endpoint_invalid_payload_missing_field():
     """Falta una feature obligatoria → debe devolver 422 Unprocessable Entity."""
 
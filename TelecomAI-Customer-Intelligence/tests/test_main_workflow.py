@@ -4,6 +4,8 @@ from pathlib import Path
 
 import pandas as pd
 import pytest
+from common_utils.tabular_io import read_table, write_table
+
 from src.telecom.config import Config
 from src.telecom.evaluation import evaluate_model
 from src.telecom.prediction import predict_batch
@@ -85,3 +87,47 @@ def test_predict_raises_for_missing_columns(tmp_path: Path) -> None:
             cfg.paths["model_path"],
             cfg.features,
         )
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".feather"])
+def test_predict_columnar_formats_match_csv(tmp_path: Path, suffix: str) -> None:
+    cfg = make_isolated_config(tmp_path)
+    train_model(cfg)
+
+    project_root = Path(__file__).resolve().parents[1]
+    df = pd.read_csv(project_root / "data/raw/users_behavior.csv").head(250)
+    df.to_csv(tmp_path / "input.csv", index=False)
+    write_table(df, tmp_path / f"input{suffix}")
+
+    predict_batch(str(tmp_path / "input.csv"), str(tmp_path / "expected.csv"), cfg.paths["model_path"], cfg.features)
+    n_rows = predict_batch(
+        str(tmp_path / f"input{suffix}"),
+        str(tmp_path / f"preds{suffix}"),
+        cfg.paths["model_path"],
+        cfg.features,
+        batch_size=64,
+        id_columns=[],
+    )
+
+    assert n_rows == 250
+    out_df = read_table(tmp_path / f"preds{suffix}")
+    assert "is_ultra" not in out_df.columns  # projected away
+    expected = pd.read_csv(tmp_path / "expected.csv")[list(out_df.columns)]
+    pd.testing.assert_frame_equal(out_df, expected, check_dtype=False)
+
+
+def test_train_and_evaluate_reuse_cached_split(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import src.telecom.data as data_module
+
+    monkeypatch.setenv("FEATURE_CACHE", "1")
+    monkeypatch.setenv("FEATURE_CACHE_DIR", str(tmp_path / "feature_cache"))
+    cfg = make_isolated_config(tmp_path)
+    first = train_model(cfg)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("dataset parsed on a cache hit")
+
+    monkeypatch.setattr(data_module, "load_dataset", fail)
+    assert train_model(cfg)["accuracy"] == pytest.approx(first["accuracy"])
+    assert "accuracy" in evaluate_model(cfg)
+    assert len(list((tmp_path / "feature_cache").iterdir())) == 1
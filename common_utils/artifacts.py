@@ -0,0 +1,124 @@
+"""Model artifact loading and memory accounting for the FastAPI services.
+
+Uncompressed joblib files (the ``joblib.dump`` default used by every training
+pipeline here) store NumPy arrays as raw, aligned buffers, so they can be
+loaded with ``mmap_mode="r"``: the arrays become read-only views of the page
+cache and every worker process mapping the same file shares them instead of
+holding a private copy. This covers coefficients, scaler statistics and
+other plain arrays. scikit-learn tree estimators copy their node arrays into
+private buffers while unpickling, so forests and boosting models are only
+shared when the model is loaded once in a parent process before the workers
+fork (``preload`` below, served with ``gunicorn --preload``).
+
+Memory-mapped artifacts must be replaced by atomic rename (write a temp file,
+then ``mv``): overwriting the file in place changes the arrays under a
+running model and truncating it crashes the process with SIGBUS.
+
+Features:
+- :class:`ArtifactSettings` read from ``{prefix}MODEL_MMAP`` / ``{prefix}PRELOAD_MODEL``
+- :func:`load_artifact` with mmap support and load timing
+- :func:`file_checksum` to identify the loaded model (e.g. in cache keys)
+- :func:`freeze_for_fork` so the parent's objects stay shared copy-on-write
+- :func:`memory_usage` (RSS / PSS / shared / private) for startup benchmarks
+"""
+
+from __future__ import annotations
+
+import gc
+import hashlib
+import logging
+import os
+import time
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import joblib
+
+logger = logging.getLogger(__name__)
+
+_TRUE = ("1", "true", "yes")
+
+
+@dataclass
+class ArtifactSettings:
+    """Artifact loading configuration, usually read from environment variables."""
+
+    mmap: bool = False
+    preload: bool = False
+
+    @classmethod
+    def from_env(cls, prefix: str = "") -> "ArtifactSettings":
+        """Read ``{prefix}MODEL_MMAP`` and ``{prefix}PRELOAD_MODEL`` (``1``/``true``/``yes``)."""
+        return cls(
+            mmap=os.getenv(f"{prefix}MODEL_MMAP", "0").lower() in _TRUE,
+            preload=os.getenv(f"{prefix}PRELOAD_MODEL", "0").lower() in _TRUE,
+        )
+
+    @property
+    def mmap_mode(self) -> Optional[str]:
+        """``mmap_mode`` argument for :func:`joblib.load`."""
+        return "r" if self.mmap else None
+
+
+def load_artifact(path: Union[str, Path], mmap_mode: Optional[str] = None) -> Any:
+    """Load a joblib artifact, memory-mapping its arrays when possible.
+
+    Compressed artifacts cannot be mapped; they are loaded normally.
+
+    Args:
+        path: Artifact file.
+        mmap_mode: ``"r"`` to memory-map NumPy arrays, None for a plain load.
+
+    Returns:
+        The unpickled object.
+    """
+    start = time.perf_counter()
+    with warnings.catch_warnings():
+        # joblib warns (and falls back to a plain load) for compressed files
+        warnings.filterwarnings("ignore", message=".*mmap_mode.*compressed.*")
+        obj = joblib.load(path, mmap_mode=mmap_mode)
+    logger.info(f"Loaded {path} in {time.perf_counter() - start:.3f}s (mmap_mode={mmap_mode})")
+    return obj
+
+
+def file_checksum(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def freeze_for_fork() -> None:
+    """Move every tracked object to the permanent GC generation.
+
+    Call after loading the model in a parent process that will fork workers:
+    collections in the children then never write to the parent's objects, so
+    their pages stay shared copy-on-write.
+    """
+    gc.collect()
+    gc.freeze()
+
+
+def memory_usage(pid: Union[int, str] = "self") -> Dict[str, float]:
+    """Resident memory of a process in MB, from ``/proc/<pid>/smaps_rollup`` (Linux).
+
+    Returns:
+        ``rss``, ``pss`` (RSS with shared pages split between the processes
+        mapping them), ``shared`` and ``private``.
+    """
+    fields: Dict[str, int] = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": fields.get("Rss", 0) / 1024,
+        "pss": fields.get("Pss", 0) / 1024,
+        "shared": (fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0)) / 1024,
+        "private": (fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)) / 1024,
+    }
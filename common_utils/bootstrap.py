@@ -0,0 +1,276 @@
+"""Vectorized bootstrap confidence intervals for model metrics.
+
+Instead of looping over resamples in Python, each chunk of resamples is a
+2-D weight matrix ``W`` of shape ``(resamples, rows)``: ``W[b, i]`` is how
+many times row ``i`` appears in resample ``b``. The weights come either from
+index blocks drawn as one 2-D array (``method="multinomial"``, the classic
+bootstrap) or from Poisson(1) counts (``method="poisson"``). Every metric is
+then a few matrix-vector products over the whole chunk, for every
+prediction set (e.g. a model and its baseline) at once.
+
+Chunks are sized so their working arrays stay around ``chunk_bytes``, which
+bounds memory for any number of resamples. Each chunk draws from its own seed, spawned
+from ``random_state``, so chunks can run in worker processes
+(``n_jobs``) and the samples do not depend on ``n_jobs``.
+
+Regression metrics: ``rmse``, ``mae``, ``mape``, ``r2``. Binary
+classification metrics (positive class 1): ``accuracy``, ``precision``,
+``recall``, ``f1``, ``roc_auc``. Classification predictions are scores
+(probabilities, or 0/1 labels); label metrics use ``score > threshold``.
+Custom metrics are callables ``fn(weights, y_true, y_pred) -> (resamples,)``.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Union
+
+import numpy as np
+from joblib import Parallel, delayed
+
+# fn(weights (B, n), y_true (n,), y_pred (n,)) -> metric per resample (B,)
+WeightedMetric = Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+Samples = Dict[str, Dict[str, np.ndarray]]
+
+
+def _ratio(num: np.ndarray, den: np.ndarray, empty: float = 0.0) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(den > 0, num / np.where(den > 0, den, 1.0), empty)
+
+
+# --- Regression -------------------------------------------------------------
+
+
+def weighted_rmse(weights: np.ndarray, y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    return np.sqrt(_ratio(weights @ (y_pred - y_true) ** 2, weights.sum(axis=1), np.nan))
+
+
+def weighted_mae(weights: np.ndarray, y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    return _ratio(weights @ np.abs(y_pred - y_true), weights.sum(axis=1), np.nan)
+
+
+def weighted_mape(weights: np.ndarray, y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """MAPE in percent; ``1e-8`` is added to the denominator to avoid division by zero."""
+    ape = np.abs((y_true - y_pred) / (y_true + 1e-8))
+    return _ratio(weights @ ape, weights.sum(axis=1), np.nan) * 100
+
+
+def weighted_r2(weights: np.ndarray, y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """R²; a resample with constant ``y_true`` scores 1.0 if perfect and 0.0 otherwise (as scikit-learn)."""
+    total = weights.sum(axis=1)
+    ss_res = weights @ (y_pred - y_true) ** 2
+    ss_tot = weights @ y_true**2 - _ratio((weights @ y_true) ** 2, total)
+    # Guard against tiny negative values from cancellation
+    ss_tot = np.maximum(ss_tot, 0.0)
+    perfect = np.where(ss_res > 0, 0.0, 1.0)
+    return np.where(ss_tot > 0, 1 - _ratio(ss_res, ss_tot), perfect)
+
+
+# --- Binary classification --------------------------------------------------
+
+
+def _confusion(weights: np.ndarray, y_true: np.ndarray, y_score: np.ndarray, threshold: float):
+    positive = y_true == 1
+    predicted = y_score > threshold
+    tp = weights @ (predicted & positive).astype(float)
+    fp = weights @ (predicted & ~positive).astype(float)
+    fn = weights @ (~predicted & positive).astype(float)
+    return tp, fp, fn
+
+
+def weighted_accuracy(
+    weights: np.ndarray, y_true: np.ndarray, y_score: np.ndarray, threshold: float = 0.5
+) -> np.ndarray:
+    correct = ((y_score > threshold) == (y_true == 1)).astype(float)
+    return _ratio(weights @ correct, weights.sum(axis=1), np.nan)
+
+
+def weighted_precision(
+    weights: np.ndarray, y_true: np.ndarray, y_score: np.ndarray, threshold: float = 0.5
+) -> np.ndarray:
+    tp, fp, _ = _confusion(weights, y_true, y_score, threshold)
+    return _ratio(tp, tp + fp)
+
+
+def weighted_recall(weights: np.ndarray, y_true: np.ndarray, y_score: np.ndarray, threshold: float = 0.5) -> np.ndarray:
+    tp, _, fn = _confusion(weights, y_true, y_score, threshold)
+    return _ratio(tp, tp + fn)
+
+
+def weighted_f1(weights: np.ndarray, y_true: np.ndarray, y_score: np.ndarray, threshold: float = 0.5) -> np.ndarray:
+    tp, fp, fn = _confusion(weights, y_true, y_score, threshold)
+    return _ratio(2 * tp, 2 * tp + fp + fn)
+
+
+def weighted_roc_auc(weights: np.ndarray, y_true: np.ndarray, y_score: np.ndarray) -> np.ndarray:
+    """ROC AUC with tied scores counted as half; NaN for resamples with a single class."""
+    order = np.argsort(y_score, kind="mergesort")
+    scores = y_score[order]
+    positive = (y_true[order] == 1).astype(float)
+    w = weights[:, order]
+    # Sum the weights of each group of tied scores
+    starts = np.flatnonzero(np.r_[True, scores[1:] != scores[:-1]])
+    pos = np.add.reduceat(w * positive, starts, axis=1)
+    neg = np.add.reduceat(w * (1.0 - positive), starts, axis=1)
+    neg_below = np.cumsum(neg, axis=1) - neg
+    pairs = pos.sum(axis=1) * neg.sum(axis=1)
+    return _ratio((pos * (neg_below + 0.5 * neg)).sum(axis=1), pairs, np.nan)
+
+
+REGRESSION_METRICS: Dict[str, WeightedMetric] = {
+    "rmse": weighted_rmse,
+    "mae": weighted_mae,
+    "mape": weighted_mape,
+    "r2": weighted_r2,
+}
+
+CLASSIFICATION_METRICS: Dict[str, Callable[..., np.ndarray]] = {
+    "accuracy": weighted_accuracy,
+    "precision": weighted_precision,
+    "recall": weighted_recall,
+    "f1": weighted_f1,
+    "roc_auc": weighted_roc_auc,
+}
+
+_THRESHOLD_METRICS = ("accuracy", "precision", "recall", "f1")
+
+
+def _resolve_metrics(
+    metrics: Union[Sequence[str], Mapping[str, WeightedMetric]], threshold: float
+) -> Dict[str, WeightedMetric]:
+    if isinstance(metrics, Mapping):
+        return dict(metrics)
+    resolved: Dict[str, WeightedMetric] = {}
+    for name in metrics:
+        if name in REGRESSION_METRICS:
+            resolved[name] = REGRESSION_METRICS[name]
+        elif name in _THRESHOLD_METRICS:
+            resolved[name] = functools.partial(CLASSIFICATION_METRICS[name], threshold=threshold)
+        elif name in CLASSIFICATION_METRICS:
+            resolved[name] = CLASSIFICATION_METRICS[name]
+        else:
+            raise ValueError(f"Unknown metric {name!r}")
+    return resolved
+
+
+def resample_weights(
+    rng: np.random.Generator, n_resamples: int, n_rows: int, method: str = "multinomial"
+) -> np.ndarray:
+    """Weight matrix ``(n_resamples, n_rows)`` of bootstrap row counts."""
+    if method == "poisson":
+        return rng.poisson(1.0, size=(n_resamples, n_rows)).astype(float)
+    if method != "multinomial":
+        raise ValueError(f"Unknown bootstrap method {method!r} (use 'multinomial' or 'poisson')")
+    idx = rng.integers(0, n_rows, size=(n_resamples, n_rows))
+    # Count each row's draws per resample with one bincount over offset indices
+    idx += (np.arange(n_resamples) * n_rows)[:, None]
+    return np.bincount(idx.ravel(), minlength=n_resamples * n_rows).reshape(n_resamples, n_rows).astype(float)
+
+
+def _run_chunk(
+    seed: np.random.SeedSequence,
+    n_resamples: int,
+    y_true: np.ndarray,
+    predictions: Dict[str, np.ndarray],
+    metrics: Dict[str, WeightedMetric],
+    method: str,
+) -> Samples:
+    weights = resample_weights(np.random.default_rng(seed), n_resamples, len(y_true), method)
+    return {
+        name: {metric: np.asarray(fn(weights, y_true, y_pred), dtype=float) for metric, fn in metrics.items()}
+        for name, y_pred in predictions.items()
+    }
+
+
+def bootstrap_metrics(
+    y_true: Any,
+    predictions: Mapping[str, Any],
+    metrics: Union[Sequence[str], Mapping[str, WeightedMetric]] = ("rmse", "mae", "mape", "r2"),
+    n_resamples: int = 1000,
+    random_state: Optional[int] = None,
+    method: str = "multinomial",
+    threshold: float = 0.5,
+    chunk_bytes: int = 64 * 1024 * 1024,
+    n_jobs: Optional[int] = 1,
+) -> Samples:
+    """Bootstrap distribution of each metric for each prediction set.
+
+    Args:
+        y_true: Target values (binary 0/1 for classification metrics).
+        predictions: Name -> predictions (or scores) aligned with ``y_true``,
+            e.g. ``{"model": y_pred, "baseline": y_base}``. All sets are
+            scored on the same resamples, so their differences are paired.
+        metrics: Metric names from :data:`REGRESSION_METRICS` /
+            :data:`CLASSIFICATION_METRICS`, or a mapping of custom metrics.
+        n_resamples: Number of bootstrap resamples.
+        random_state: Seed; the same seed, data and ``chunk_bytes`` give the
+            same samples for any ``n_jobs``.
+        method: ``"multinomial"`` (resample rows with replacement) or
+            ``"poisson"`` (Poisson(1) row weights).
+        threshold: Score above which classification label metrics predict 1.
+        chunk_bytes: Approximate memory budget of one chunk.
+        n_jobs: Worker processes for the chunks (joblib; -1 for all cores).
+
+    Returns:
+        ``{prediction_name: {metric: array of shape (n_resamples,)}}``.
+    """
+    y = np.asarray(y_true, dtype=float)
+    preds = {name: np.asarray(p, dtype=float) for name, p in predictions.items()}
+    if any(p.shape != y.shape for p in preds.values()):
+        raise ValueError("Every prediction array must have the shape of y_true")
+    if n_resamples < 1 or len(y) == 0:
+        raise ValueError("n_resamples and the number of rows must be positive")
+    fns = _resolve_metrics(metrics, threshold)
+
+    # Index block, counts and float weights take 8 bytes per cell each, plus metric temporaries
+    chunk = int(max(1, min(n_resamples, chunk_bytes // (32 * len(y)))))
+    sizes = [min(chunk, n_resamples - start) for start in range(0, n_resamples, chunk)]
+    seeds = np.random.SeedSequence(random_state).spawn(len(sizes))
+
+    tasks = (delayed(_run_chunk)(seed, size, y, preds, fns, method) for seed, size in zip(seeds, sizes))
+    if n_jobs in (None, 1) or len(sizes) == 1:
+        parts = [fn(*args, **kwargs) for fn, args, kwargs in tasks]
+    else:
+        parts = Parallel(n_jobs=n_jobs)(tasks)
+
+    return {name: {metric: np.concatenate([p[name][metric] for p in parts]) for metric in fns} for name in preds}
+
+
+def summarize_bootstrap(samples: Samples, reference: Optional[str] = None, confidence: float = 0.95) -> Dict[str, Any]:
+    """Mean and percentile interval per metric, plus paired deltas against ``reference``.
+
+    Deltas are ``other - reference`` per resample; ``p_value_two_sided`` is
+    ``2 * min(P(delta > 0), P(delta < 0))``. Resamples where a metric is
+    undefined (NaN, e.g. ROC AUC on a single class) are ignored.
+    """
+    tail = (1 - confidence) / 2 * 100
+
+    def describe(values: np.ndarray) -> Dict[str, Any]:
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return {"mean": None, "ci": [None, None]}
+        low, high = np.percentile(values, [tail, 100 - tail])
+        return {"mean": float(values.mean()), "ci": [float(low), float(high)]}
+
+    summary: Dict[str, Any] = {
+        "confidence": confidence,
+        "metrics": {name: {m: describe(v) for m, v in by_metric.items()} for name, by_metric in samples.items()},
+    }
+    if reference is not None:
+        deltas: Dict[str, Any] = {}
+        for name, by_metric in samples.items():
+            if name == reference:
+                continue
+            deltas[name] = {}
+            for metric, values in by_metric.items():
+                delta = values - samples[reference][metric]
+                delta = delta[~np.isnan(delta)]
+                p_value = 2 * min(np.mean(delta > 0), np.mean(delta < 0)) if delta.size else None
+                deltas[name][metric] = {
+                    **describe(delta),
+                    "p_value_two_sided": None if p_value is None else float(p_value),
+                }
+        summary["reference"] = reference
+        summary["deltas"] = deltas
+    return summary
@@ -0,0 +1,401 @@
+"""Prediction result cache shared by the FastAPI services.
+
+Repeated requests (client retries, dashboards polling the same customers) are
+answered from a cache keyed on a canonical hash of the validated input plus a
+model key (the model checksum), so a reloaded model never serves results of
+the previous one. Entries expire after a TTL and the cache is bounded in
+bytes, evicting least recently used entries first.
+
+Two stores are available:
+- :class:`MemoryStore` (default): per process, no serialization round trip
+  beyond encoding the cached value.
+- :class:`SQLiteStore`: a SQLite file on local disk (e.g. under ``/dev/shm``)
+  shared by every worker process on the host.
+
+Values are stored as JSON, never pickled, so a process that can write the
+shared file cannot make the others run code when they read it back. Callers
+look up and fill a whole request with :meth:`PredictionCache.get_many` and
+:meth:`PredictionCache.put_many` (one SQLite transaction each) from a worker
+thread, keeping the event loop free. The SQLite store never waits for a lock
+held by another process for more than ``SQLITE_BUSY_TIMEOUT_MS``: a lookup
+that finds the file locked is a miss and a store is skipped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple, Union
+
+# Called with the event name: "hit", "miss", "expired" or "eviction"
+CacheObserver = Callable[[str], None]
+
+# Approximate per-entry bookkeeping (dict slot, tuple, bytes headers) added to
+# key and value sizes when enforcing ``max_bytes``
+ENTRY_OVERHEAD = 200
+
+# Longest a SQLiteStore get/put waits for another process's write lock
+SQLITE_BUSY_TIMEOUT_MS = 5
+
+# Keys per ``IN (...)`` lookup, below SQLite's default host parameter limit
+_SQLITE_MAX_PARAMS = 500
+
+_TRUE = ("1", "true", "yes")
+
+
+@dataclass
+class CacheSettings:
+    """Prediction cache configuration, usually read from environment variables."""
+
+    enabled: bool = False
+    max_bytes: int = 64 * 1024 * 1024
+    ttl_seconds: float = 300.0
+    path: Optional[str] = None
+
+    @classmethod
+    def from_env(cls, prefix: str = "") -> "CacheSettings":
+        """Read ``{prefix}PREDICTION_CACHE`` and its ``_MAX_BYTES``, ``_TTL_SECONDS`` and ``_PATH`` options."""
+        return cls(
+            enabled=os.getenv(f"{prefix}PREDICTION_CACHE", "0").lower() in _TRUE,
+            max_bytes=int(os.getenv(f"{prefix}PREDICTION_CACHE_MAX_BYTES", str(cls.max_bytes))),
+            ttl_seconds=float(os.getenv(f"{prefix}PREDICTION_CACHE_TTL_SECONDS", str(cls.ttl_seconds))),
+            path=os.getenv(f"{prefix}PREDICTION_CACHE_PATH") or None,
+        )
+
+
+def _canonical_value(value: Any) -> Any:
+    if isinstance(value, (bool, int, float)):
+        value = float(value)
+        return None if math.isnan(value) else value
+    if hasattr(value, "item"):  # NumPy scalars
+        return _canonical_value(value.item())
+    return value
+
+
+def canonical_key(record: Mapping[str, Any], model_key: str) -> str:
+    """Hash of a validated input record and the model that scores it.
+
+    Field order does not matter, and ``1``, ``1.0``, ``True`` and
+    ``numpy.int64(1)`` hash alike, so equivalent requests share an entry.
+    """
+    payload = json.dumps(
+        {name: _canonical_value(value) for name, value in record.items()},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.blake2b(f"{model_key}\0{payload}".encode(), digest_size=16).hexdigest()
+
+
+class MemoryStore:
+    """In-process LRU store bounded in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, now: float) -> Tuple[Optional[bytes], bool]:
+        """Return ``(value, expired)``; expired entries are dropped."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            expires_at, value = entry
+            if expires_at and expires_at <= now:
+                self._remove(key)
+                return None, True
+            self._entries.move_to_end(key)
+            return value, False
+
+    def get_many(self, keys: Sequence[str], now: float) -> List[Tuple[Optional[bytes], bool]]:
+        return [self.get(key, now) for key in keys]
+
+    def put(self, key: str, value: bytes, expires_at: float) -> int:
+        """Store ``value`` and return the number of entries evicted to fit it."""
+        size = len(key) + len(value) + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return 0
+        evicted = 0
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            while self.bytes_used + size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                evicted += 1
+            self._entries[key] = (expires_at, value)
+            self.bytes_used += size
+        return evicted
+
+    def put_many(self, items: Sequence[Tuple[str, bytes]], expires_at: float) -> int:
+        return sum(self.put(key, value, expires_at) for key, value in items)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes_used = 0
+
+    def _remove(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self.bytes_used -= len(key) + len(value) + ENTRY_OVERHEAD
+
+
+class SQLiteStore:
+    """LRU store in a local SQLite file, shared by the processes that open it.
+
+    Total size is tracked in the same transaction as every write, so the
+    byte bound holds across processes. Put the file on local storage (ideally
+    a tmpfs such as ``/dev/shm``), not on a network filesystem.
+
+    ``get_many`` and ``put_many`` handle a whole batch in one transaction.
+    Reads and writes wait at most ``busy_timeout_ms`` for another
+    process's write lock; after that a lookup is reported as a miss and a
+    store is skipped instead of blocking the caller.
+    """
+
+    def __init__(self, path: Union[str, Path], max_bytes: int, busy_timeout_ms: int = SQLITE_BUSY_TIMEOUT_MS):
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Creating the schema may wait for workers starting at the same time
+        self._conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        with self._transaction() as cur:
+            cur.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value BLOB, size INTEGER, expires_at REAL, accessed REAL)"
+            )
+            cur.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+            cur.execute("CREATE TABLE IF NOT EXISTS usage (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER)")
+            cur.execute("INSERT OR IGNORE INTO usage VALUES (0, 0)")
+        self._conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._conn, self._lock)
+
+    @property
+    def bytes_used(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT bytes FROM usage").fetchone()[0])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+    def get(self, key: str, now: float) -> Tuple[Optional[bytes], bool]:
+        return self.get_many([key], now)[0]
+
+    def get_many(self, keys: Sequence[str], now: float) -> List[Tuple[Optional[bytes], bool]]:
+        try:
+            return self._get_many(keys, now)
+        except sqlite3.OperationalError as exc:
+            if not _is_busy(exc):
+                raise
+            return [(None, False)] * len(keys)
+
+    def _get_many(self, keys: Sequence[str], now: float) -> List[Tuple[Optional[bytes], bool]]:
+        rows = {}
+        with self._transaction() as cur:
+            for start in range(0, len(keys), _SQLITE_MAX_PARAMS):
+                chunk = list(keys[start : start + _SQLITE_MAX_PARAMS])
+                placeholders = ",".join("?" * len(chunk))
+                query = f"SELECT key, value, expires_at, size FROM entries WHERE key IN ({placeholders})"
+                rows.update(
+                    (key, (value, expires_at, size)) for key, value, expires_at, size in cur.execute(query, chunk)
+                )
+            expired = {key for key, (_, expires_at, _) in rows.items() if expires_at and expires_at <= now}
+            if expired:
+                cur.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in expired])
+                cur.execute("UPDATE usage SET bytes = bytes - ?", (sum(rows[key][2] for key in expired),))
+            cur.executemany(
+                "UPDATE entries SET accessed = ? WHERE key = ?", [(now, key) for key in rows if key not in expired]
+            )
+        results: List[Tuple[Optional[bytes], bool]] = []
+        for key in keys:
+            if key in expired:
+                results.append((None, True))
+            elif key in rows:
+                results.append((bytes(rows[key][0]), False))
+            else:
+                results.append((None, False))
+        return results
+
+    def put(self, key: str, value: bytes, expires_at: float) -> int:
+        return self.put_many([(key, value)], expires_at)
+
+    def put_many(self, items: Sequence[Tuple[str, bytes]], expires_at: float) -> int:
+        try:
+            with self._transaction() as cur:
+                return sum(self._insert(cur, key, value, expires_at) for key, value in items)
+        except sqlite3.OperationalError as exc:
+            if not _is_busy(exc):
+                raise
+            return 0
+
+    def _insert(self, cur: sqlite3.Cursor, key: str, value: bytes, expires_at: float) -> int:
+        size = len(key) + len(value) + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return 0
+        evicted = 0
+        old = cur.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+        if old is not None:
+            cur.execute("DELETE FROM entries WHERE key = ?", (key,))
+            cur.execute("UPDATE usage SET bytes = bytes - ?", (old[0],))
+        used = cur.execute("SELECT bytes FROM usage").fetchone()[0]
+        while used + size > self.max_bytes:
+            victims = cur.execute("SELECT key, size FROM entries ORDER BY accessed LIMIT 32").fetchall()
+            if not victims:
+                break
+            for victim, victim_size in victims:
+                if used + size <= self.max_bytes:
+                    break
+                cur.execute("DELETE FROM entries WHERE key = ?", (victim,))
+                used -= victim_size
+                evicted += 1
+        cur.execute(
+            "INSERT INTO entries VALUES (?, ?, ?, ?, ?)",
+            (key, sqlite3.Binary(value), size, expires_at, time.time()),
+        )
+        cur.execute("UPDATE usage SET bytes = ?", (used + size,))
+        return evicted
+
+    def clear(self) -> None:
+        with self._transaction() as cur:
+            cur.execute("DELETE FROM entries")
+            cur.execute("UPDATE usage SET bytes = 0")
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _is_busy(exc: sqlite3.OperationalError) -> bool:
+    """Whether ``exc`` is SQLITE_BUSY / SQLITE_LOCKED ("database is locked")."""
+    return "locked" in str(exc) or "busy" in str(exc)
+
+
+class _Transaction:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT`` under the store's thread lock."""
+
+    def __init__(self, conn: sqlite3.Connection, lock: threading.Lock):
+        self._conn = conn
+        self._lock = lock
+
+    def __enter__(self) -> sqlite3.Cursor:
+        self._lock.acquire()
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            self._lock.release()
+            raise
+        return self._conn.cursor()
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        try:
+            self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self._lock.release()
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _decode(data: bytes) -> Any:
+    value = json.loads(data)
+    # Results are cached as tuples; JSON only knows arrays
+    return tuple(value) if isinstance(value, list) else value
+
+
+class PredictionCache:
+    """TTL + LRU cache of prediction results.
+
+    Values must be JSON serializable; a top-level list or tuple is returned
+    as a tuple.
+
+    Args:
+        max_bytes: Upper bound on cached keys and JSON-encoded values.
+        ttl_seconds: Entry lifetime; ``0`` keeps entries until evicted.
+        path: SQLite file shared between processes; None keeps the cache in
+            this process.
+        observer: Optional callback receiving ``"hit"``, ``"miss"``,
+            ``"expired"`` (a miss on a stale entry) and ``"eviction"`` events.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = CacheSettings.max_bytes,
+        ttl_seconds: float = CacheSettings.ttl_seconds,
+        path: Optional[Union[str, Path]] = None,
+        observer: Optional[CacheObserver] = None,
+    ):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        if ttl_seconds < 0:
+            raise ValueError("ttl_seconds must be >= 0")
+        self.ttl_seconds = ttl_seconds
+        self.observer = observer
+        self.store: Union[MemoryStore, SQLiteStore] = (
+            SQLiteStore(path, max_bytes) if path is not None else MemoryStore(max_bytes)
+        )
+
+    @classmethod
+    def from_settings(cls, settings: CacheSettings, **kwargs: Any) -> "PredictionCache":
+        return cls(max_bytes=settings.max_bytes, ttl_seconds=settings.ttl_seconds, path=settings.path, **kwargs)
+
+    @property
+    def bytes_used(self) -> int:
+        return self.store.bytes_used
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def _observe(self, event: str, count: int = 1) -> None:
+        if self.observer is not None:
+            for _ in range(count):
+                self.observer(event)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for ``key``, or None on a miss."""
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """Cached values for ``keys`` (None for each miss), read in one store transaction."""
+        values: List[Optional[Any]] = []
+        # Wall-clock time so expiry agrees across processes sharing a store
+        for value, expired in self.store.get_many(keys, time.time()):
+            if value is None:
+                self._observe("expired" if expired else "miss")
+                values.append(None)
+            else:
+                self._observe("hit")
+                values.append(_decode(value))
+        return values
+
+    def put(self, key: str, value: Any) -> None:
+        self.put_many([(key, value)])
+
+    def put_many(self, items: Sequence[Tuple[str, Any]]) -> None:
+        """Store ``(key, value)`` pairs in one store transaction."""
+        expires_at = time.time() + self.ttl_seconds if self.ttl_seconds else 0.0
+        evicted = self.store.put_many([(key, _encode(value)) for key, value in items], expires_at)
+        self._observe("eviction", evicted)
+
+    def clear(self) -> None:
+        self.store.clear()
+
+    def close(self) -> None:
+        if isinstance(self.store, SQLiteStore):
+            self.store.close()
@@ -0,0 +1,205 @@
+"""Content-addressed cache of prepared feature data for training jobs.
+
+Training, evaluation, tuning and drift jobs all start by parsing the raw CSV,
+cleaning it, engineering features and splitting it. With the cache enabled,
+the result of those steps is stored on disk under a key derived from:
+
+- the SHA-256 of every raw input file,
+- the configuration that drives the preparation (canonical JSON),
+- a code version, usually :func:`source_version` of the modules doing the work.
+
+Any change to the data, the relevant config or the code produces a new key,
+so stale entries are never read; they are only left behind (``clear()``
+removes them). Repeat runs on unchanged inputs load the stored result
+instead of recomputing it.
+
+Entries are directories with one file per item: DataFrames and Series as
+Parquet (index included), NumPy arrays as ``.npy`` and other JSON-serializable
+values inline in ``manifest.json``. Entries are written to a temporary
+directory and renamed into place, so concurrent jobs never read a partial
+entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .artifacts import file_checksum
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk entry layout changes
+FORMAT_VERSION = 1
+
+_TRUE = ("1", "true", "yes")
+
+PathLike = Union[str, Path]
+
+
+@dataclass
+class FeatureCacheSettings:
+    """Feature cache configuration, usually read from environment variables."""
+
+    enabled: bool = False
+    path: str = ".feature_cache"
+
+    @classmethod
+    def from_env(cls, prefix: str = "") -> "FeatureCacheSettings":
+        """Read ``{prefix}FEATURE_CACHE`` (``1``/``true``/``yes``) and ``{prefix}FEATURE_CACHE_DIR``."""
+        return cls(
+            enabled=os.getenv(f"{prefix}FEATURE_CACHE", "0").lower() in _TRUE,
+            path=os.getenv(f"{prefix}FEATURE_CACHE_DIR") or cls.path,
+        )
+
+
+def source_version(*sources: Union[ModuleType, Callable[..., Any], PathLike]) -> str:
+    """Hash of the source files of modules, classes or functions (or plain paths)."""
+    digest = hashlib.sha256()
+    for source in sources:
+        path = source if isinstance(source, (str, Path)) else inspect.getsourcefile(source)
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class FeatureCache:
+    """On-disk cache of prepared feature data, addressed by input content.
+
+    Args:
+        root: Directory holding the entries.
+        enabled: When False, :meth:`get_or_compute` always computes and
+            nothing is hashed, read or written.
+    """
+
+    def __init__(self, root: PathLike = ".feature_cache", enabled: bool = True):
+        self.root = Path(root)
+        self.enabled = enabled
+
+    @classmethod
+    def from_env(cls, prefix: str = "") -> "FeatureCache":
+        settings = FeatureCacheSettings.from_env(prefix)
+        return cls(settings.path, enabled=settings.enabled)
+
+    @staticmethod
+    def key(data_paths: Sequence[PathLike], config: Optional[Mapping[str, Any]] = None, code_version: str = "") -> str:
+        """Key for the given raw files, preparation config and code version."""
+        payload = json.dumps(
+            {
+                "format": FORMAT_VERSION,
+                "data": [file_checksum(path) for path in data_paths],
+                "config": config or {},
+                "code": code_version,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Stored entry for ``key``, or None if there is none."""
+        entry_dir = self.root / key
+        try:
+            manifest = json.loads((entry_dir / "manifest.json").read_text())
+        except FileNotFoundError:
+            return None
+
+        entry: Dict[str, Any] = {}
+        for name, item in manifest["items"].items():
+            kind = item["kind"]
+            if kind == "frame":
+                entry[name] = pd.read_parquet(entry_dir / item["file"])
+            elif kind == "series":
+                entry[name] = pd.read_parquet(entry_dir / item["file"])["values"].rename(item["name"])
+            elif kind == "array":
+                entry[name] = np.load(entry_dir / item["file"], allow_pickle=False)
+            else:
+                entry[name] = item["value"]
+        return entry
+
+    def save(self, key: str, entry: Mapping[str, Any]) -> Path:
+        """Store ``entry`` (name -> DataFrame, Series, ndarray or JSON value) under ``key``."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(prefix=f".{key}-", dir=self.root))
+        items: Dict[str, Dict[str, Any]] = {}
+        try:
+            for i, (name, value) in enumerate(entry.items()):
+                if isinstance(value, pd.DataFrame):
+                    value.to_parquet(tmp_dir / f"{i}.parquet")
+                    items[name] = {"kind": "frame", "file": f"{i}.parquet"}
+                elif isinstance(value, pd.Series):
+                    value.to_frame("values").to_parquet(tmp_dir / f"{i}.parquet")
+                    items[name] = {"kind": "series", "file": f"{i}.parquet", "name": value.name}
+                elif isinstance(value, np.ndarray):
+                    np.save(tmp_dir / f"{i}.npy", value, allow_pickle=False)
+                    items[name] = {"kind": "array", "file": f"{i}.npy"}
+                else:
+                    items[name] = {"kind": "json", "value": value}
+            (tmp_dir / "manifest.json").write_text(json.dumps({"key": key, "items": items}))
+            os.replace(tmp_dir, self.root / key)
+        except OSError:
+            # Another job stored the same key first; its entry is identical
+            if not (self.root / key / "manifest.json").exists():
+                raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return self.root / key
+
+    def get_or_compute(
+        self,
+        compute: Callable[[], Dict[str, Any]],
+        data_paths: Sequence[PathLike],
+        config: Optional[Mapping[str, Any]] = None,
+        code_version: str = "",
+    ) -> Dict[str, Any]:
+        """Load the entry for these inputs, or run ``compute`` and store its result."""
+        if not self.enabled:
+            return compute()
+
+        start = time.perf_counter()
+        key = self.key(data_paths, config, code_version)
+        entry = self.load(key)
+        if entry is not None:
+            logger.info("Feature cache hit %s (%.2fs)", key, time.perf_counter() - start)
+            return entry
+
+        entry = compute()
+        self.save(key, entry)
+        logger.info("Feature cache miss %s, stored (%.2fs)", key, time.perf_counter() - start)
+        return entry
+
+    def read_csv(self, path: PathLike, **kwargs: Any) -> pd.DataFrame:
+        """``pd.read_csv`` that reuses the parsed frame while the file is unchanged."""
+        return self.get_or_compute(
+            lambda: {"data": pd.read_csv(path, **kwargs)}, [path], {"read_csv": kwargs}, f"pandas-{pd.__version__}"
+        )["data"]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def read_csv(path: PathLike, prefix: str = "", **kwargs: Any) -> pd.DataFrame:
+    """``pd.read_csv`` through the feature cache configured by ``{prefix}FEATURE_CACHE``.
+
+    With the cache disabled (the default) this is :func:`pandas.read_csv`.
+
+    Args:
+        path: CSV file.
+        prefix: Environment variable prefix, e.g. ``"BANKCHURN_"``.
+        **kwargs: Passed to :func:`pandas.read_csv`.
+    """
+    return FeatureCache.from_env(prefix).read_csv(path, **kwargs)
@@ -0,0 +1,220 @@
+"""Bounded executor for running model inference off the asyncio event loop.
+
+Shared by the FastAPI services so that a slow ``predict``/``predict_proba``
+call never blocks ``/health`` or other requests on the same worker.
+
+Features:
+- Thread pool (default) or process pool for GIL-heavy models
+- Bounded concurrency with backpressure (:class:`ExecutorSaturatedError`)
+- Queue-wait and compute-time observation hook for metrics
+- Optional Prometheus metrics for the executor (:class:`InferenceMetrics`)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple
+
+# Called with (queue_wait_seconds, compute_seconds) after every task
+Observer = Callable[[float, float], None]
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when both the worker slots and the wait queue are full."""
+
+
+@dataclass
+class ExecutorSettings:
+    """Executor configuration, usually read from environment variables."""
+
+    max_workers: int = 1
+    max_queue: int = 32
+    kind: str = "thread"
+
+    @classmethod
+    def from_env(cls, prefix: str = "") -> "ExecutorSettings":
+        """Read ``{prefix}INFERENCE_WORKERS``, ``_MAX_QUEUE`` and ``_EXECUTOR``."""
+        return cls(
+            max_workers=int(os.getenv(f"{prefix}INFERENCE_WORKERS", str(cls.max_workers))),
+            max_queue=int(os.getenv(f"{prefix}INFERENCE_MAX_QUEUE", str(cls.max_queue))),
+            kind=os.getenv(f"{prefix}INFERENCE_EXECUTOR", cls.kind).lower(),
+        )
+
+
+def _timed_call(fn: Callable[..., Any], args: Tuple[Any, ...], kwargs: dict) -> Tuple[Any, float, float]:
+    # Module-level so it can be pickled for process pools. time.monotonic is
+    # system-wide on Linux, so start/end are comparable across processes.
+    started = time.monotonic()
+    result = fn(*args, **kwargs)
+    return result, started, time.monotonic()
+
+
+class InferenceExecutor:
+    """Run blocking inference callables on a bounded worker pool.
+
+    At most ``max_workers`` calls compute concurrently and at most
+    ``max_queue`` more may wait for a slot; further submissions fail fast
+    with :class:`ExecutorSaturatedError` so the API can answer 429.
+
+    Args:
+        max_workers: Concurrent inference calls.
+        max_queue: Calls allowed to wait for a free worker.
+        kind: ``"thread"`` or ``"process"``. Process pools require picklable,
+            module-level callables; use ``initializer`` to load the model
+            once in every worker process.
+        initializer: Optional per-worker initializer (process pools only).
+        initargs: Arguments for ``initializer``.
+        observer: Optional ``(queue_wait_seconds, compute_seconds)`` callback.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        max_queue: int = 32,
+        kind: str = "thread",
+        initializer: Optional[Callable[..., Any]] = None,
+        initargs: Tuple[Any, ...] = (),
+        observer: Optional[Observer] = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must be >= 0")
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.kind = kind
+        self.observer = observer
+        self._pending = 0
+        self._lock = threading.Lock()
+
+        self._pool: Executor
+        if kind == "process":
+            self._pool = ProcessPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs)
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="inference")
+
+    @classmethod
+    def from_settings(
+        cls, settings: ExecutorSettings, metrics: Optional["InferenceMetrics"] = None, **kwargs: Any
+    ) -> "InferenceExecutor":
+        """Build an executor from settings, reporting to ``metrics`` when given."""
+        if metrics is not None:
+            kwargs.setdefault("observer", metrics.observe)
+        executor = cls(
+            max_workers=settings.max_workers,
+            max_queue=settings.max_queue,
+            kind=settings.kind,
+            **kwargs,
+        )
+        if metrics is not None:
+            metrics.track(executor)
+        return executor
+
+    @property
+    def pending(self) -> int:
+        """Calls currently computing or waiting for a worker."""
+        return self._pending
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._pending >= self.capacity:
+                raise ExecutorSaturatedError(
+                    f"Inference queue full ({self.max_workers} running, {self.max_queue} waiting)"
+                )
+            self._pending += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``fn(*args, **kwargs)`` on the pool and await its result.
+
+        Raises:
+            ExecutorSaturatedError: If the executor is at capacity.
+        """
+        self._acquire()
+        submitted = time.monotonic()
+        try:
+            future = self._pool.submit(functools.partial(_timed_call, fn, args, kwargs))
+        except BaseException:
+            self._release()
+            raise
+        # Free the slot when the work finishes, not when the awaiting request
+        # goes away: a cancelled caller leaves the worker busy until then.
+        future.add_done_callback(lambda _: self._release())
+        result, started, finished = await asyncio.wrap_future(future)
+        if self.observer is not None:
+            self.observer(max(0.0, started - submitted), finished - started)
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+
+class InferenceMetrics:
+    """Prometheus metrics for an :class:`InferenceExecutor` (requires ``prometheus_client``).
+
+    Registers ``{namespace}_inference_queue_wait_seconds``,
+    ``{namespace}_inference_compute_seconds`` and ``{namespace}_inference_pending``
+    in the default registry, so create one instance per service.
+
+    Args:
+        namespace: Metric name prefix, e.g. ``"bankchurn"``.
+    """
+
+    def __init__(self, namespace: str):
+        from prometheus_client import Gauge, Histogram
+
+        self.queue_wait = Histogram(
+            f"{namespace}_inference_queue_wait_seconds",
+            "Time inference calls waited for a free executor worker",
+            buckets=LATENCY_BUCKETS,
+        )
+        self.compute = Histogram(
+            f"{namespace}_inference_compute_seconds",
+            "Time spent computing predictions on an executor worker",
+            buckets=LATENCY_BUCKETS,
+        )
+        self.pending = Gauge(
+            f"{namespace}_inference_pending",
+            "Inference calls running or waiting on the executor",
+        )
+
+    def observe(self, queue_wait: float, compute: float) -> None:
+        """Executor observer: record one call's queue wait and compute time."""
+        self.queue_wait.observe(queue_wait)
+        self.compute.observe(compute)
+
+    def track(self, executor: InferenceExecutor) -> None:
+        """Report ``executor.pending`` as the pending gauge (replaces a previous executor)."""
+        self.pending.set_function(lambda: executor.pending)
+
+
+async def run_inference(executor: Optional[InferenceExecutor], fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking inference call on ``executor``.
+
+    Services create their executor at startup; calls made before that (e.g. an
+    app driven without its lifespan) run on the default thread pool instead.
+
+    Raises:
+        ExecutorSaturatedError: If the executor is at capacity.
+    """
+    if executor is None:
+        return await asyncio.to_thread(fn, *args)
+    return await executor.run(fn, *args)
@@ -0,0 +1,217 @@
+"""Tabular file IO for batch scoring: CSV, Parquet and Arrow IPC (Feather v2).
+
+Shared by the batch prediction paths of every project. The format is selected
+from the file extension:
+
+- ``.parquet`` / ``.pq`` -> Parquet
+- ``.feather`` / ``.arrow`` / ``.ipc`` -> Arrow IPC file (Feather v2)
+- anything else (``.csv``, ``.csv.gz``, ...) -> CSV
+
+Readers support column projection, so only the requested columns are decoded,
+and chunked iteration. For Parquet, chunks are produced from row groups with
+:meth:`pyarrow.parquet.ParquetFile.iter_batches`; Arrow IPC files are read
+record batch by record batch. Chunked reads use plain buffered file IO, with
+no memory map and no Parquet pre-buffering, because both grow RSS with file
+size. Whole-file reads use memory maps.
+
+Parquet and Arrow support requires ``pyarrow``; CSV only needs pandas.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+import pandas as pd
+
+CSV = "csv"
+PARQUET = "parquet"
+FEATHER = "feather"
+
+FORMAT_BY_SUFFIX = {
+    ".csv": CSV,
+    ".parquet": PARQUET,
+    ".pq": PARQUET,
+    ".feather": FEATHER,
+    ".arrow": FEATHER,
+    ".ipc": FEATHER,
+}
+
+
+def detect_format(path: str | Path) -> str:
+    """Return the file format for a path.
+
+    Compression suffixes are skipped (``data.csv.gz`` is CSV). Unknown
+    extensions are treated as CSV, matching the historical CSV-only behaviour.
+
+    Args:
+        path: File path.
+
+    Returns:
+        ``"csv"``, ``"parquet"`` or ``"feather"``.
+    """
+    for suffix in reversed(Path(path).suffixes):
+        fmt = FORMAT_BY_SUFFIX.get(suffix.lower())
+        if fmt is not None:
+            return fmt
+    return CSV
+
+
+def pyarrow_modules() -> tuple[Any, Any, Any]:
+    """Import ``(pyarrow, pyarrow.parquet, pyarrow.ipc)`` with a helpful error if missing."""
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover
+        raise ImportError("Parquet and Arrow IPC files require pyarrow (pip install pyarrow)") from exc
+    return pa, pq, ipc
+
+
+def open_ipc(path: str | Path, memory_map: bool = True) -> Any:
+    """Open an Arrow IPC file as a :class:`pyarrow.ipc.RecordBatchFileReader`."""
+    pa, _, ipc = pyarrow_modules()
+    return ipc.open_file(pa.memory_map(str(path), "r") if memory_map else pa.OSFile(str(path), "rb"))
+
+
+def read_columns(path: str | Path, fmt: str | None = None) -> list[str]:
+    """Column names of a file, read from its header or schema only."""
+    fmt = fmt or detect_format(path)
+    if fmt == PARQUET:
+        _, pq, _ = pyarrow_modules()
+        return list(pq.read_schema(path).names)
+    if fmt == FEATHER:
+        return list(open_ipc(path).schema.names)
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def read_table(path: str | Path, columns: Sequence[str] | None = None, fmt: str | None = None) -> pd.DataFrame:
+    """Read a whole file into a DataFrame.
+
+    Args:
+        path: Input file.
+        columns: Columns to decode, in output order (default: all columns).
+        fmt: Override the format detected from the extension.
+
+    Returns:
+        File contents, with columns ordered as ``columns`` when given.
+    """
+    fmt = fmt or detect_format(path)
+    columns = list(columns) if columns is not None else None
+    if fmt == PARQUET:
+        _, pq, _ = pyarrow_modules()
+        data = pq.read_table(path, columns=columns, memory_map=True).to_pandas()
+    elif fmt == FEATHER:
+        table = open_ipc(path).read_all()
+        data = (table.select(columns) if columns is not None else table).to_pandas()
+    else:
+        data = pd.read_csv(path, usecols=columns)
+    return data[columns] if columns is not None else data
+
+
+def iter_batches(
+    source: Any,
+    batch_size: int,
+    columns: Sequence[str] | None = None,
+    fmt: str | None = None,
+    row_groups: Sequence[int] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield a file as DataFrames of at most ``batch_size`` rows.
+
+    Args:
+        source: Input file path, or a file object (read as CSV unless ``fmt``
+            says otherwise).
+        batch_size: Maximum rows per yielded DataFrame.
+        columns: Columns to decode, in output order (default: all columns).
+        fmt: Override the format detected from the extension.
+        row_groups: Restrict reading to these Parquet row groups (or Arrow IPC
+            record batches). Ignored for CSV.
+
+    Yields:
+        Consecutive rows of the file.
+    """
+    if fmt is None:
+        fmt = detect_format(source) if isinstance(source, (str, Path)) else CSV
+    columns = list(columns) if columns is not None else None
+
+    if fmt == PARQUET:
+        _, pq, _ = pyarrow_modules()
+        with pq.ParquetFile(source, pre_buffer=False) as parquet_file:
+            for batch in parquet_file.iter_batches(batch_size=batch_size, row_groups=row_groups, columns=columns):
+                yield batch.to_pandas()
+    elif fmt == FEATHER:
+        reader = open_ipc(source, memory_map=False)
+        indices = row_groups if row_groups is not None else range(reader.num_record_batches)
+        for i in indices:
+            batch = reader.get_batch(i)
+            if columns is not None:
+                batch = batch.select(columns)
+            for start in range(0, batch.num_rows, batch_size):
+                yield batch.slice(start, batch_size).to_pandas()
+    else:
+        with pd.read_csv(source, usecols=columns, chunksize=batch_size) as reader:
+            for chunk in reader:
+                yield chunk[columns] if columns is not None else chunk
+
+
+class TableWriter:
+    """Write DataFrames to one CSV, Parquet or Arrow IPC file chunk by chunk.
+
+    Each :meth:`write` call appends one CSV block, one Parquet row group or
+    one Arrow record batch. The schema of the first chunk is kept for the
+    rest of the file, so later chunks are cast to it (e.g. an integer column
+    that had missing values in one CSV chunk). Nothing is created until the
+    first chunk is written.
+
+    Args:
+        path: Output file.
+        fmt: Override the format detected from the extension.
+    """
+
+    def __init__(self, path: str | Path, fmt: str | None = None) -> None:
+        self.path = Path(path)
+        self.fmt = fmt or detect_format(path)
+        self.rows_written = 0
+        self._writer: Any = None
+        self._schema: Any = None
+        self._started = False
+
+    def write(self, frame: pd.DataFrame) -> None:
+        """Append ``frame`` to the output file."""
+        if self.fmt == CSV:
+            frame.to_csv(self.path, index=False, mode="a" if self._started else "w", header=not self._started)
+        else:
+            pa, _, _ = pyarrow_modules()
+            self.write_arrow(pa.Table.from_pandas(frame, schema=self._schema, preserve_index=False))
+        self._started = True
+        self.rows_written += len(frame)
+
+    def write_arrow(self, table: Any) -> None:
+        """Append a :class:`pyarrow.Table` (Parquet and Arrow IPC outputs only)."""
+        _, pq, ipc = pyarrow_modules()
+        if self._writer is None:
+            self._schema = table.schema
+            if self.fmt == PARQUET:
+                self._writer = pq.ParquetWriter(self.path, self._schema)
+            else:
+                self._writer = ipc.new_file(str(self.path), self._schema)
+        elif table.schema != self._schema:
+            table = table.cast(self._schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "TableWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def write_table(frame: pd.DataFrame, path: str | Path, fmt: str | None = None) -> None:
+    """Write a whole DataFrame to ``path`` in the format given by its extension."""
+    with TableWriter(path, fmt=fmt) as writer:
+        writer.write(frame)
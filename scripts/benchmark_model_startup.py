@@ -0,0 +1,134 @@
+"""Model startup benchmark: load time and per-worker memory for N API workers.
+
+Forks ``--workers`` processes per strategy, lets each one load (or inherit)
+the model and run a warm-up prediction on ``--sample`` rows, then reads every
+worker's memory from ``/proc/<pid>/smaps_rollup`` while all of them are alive:
+
+- ``load``          every worker unpickles its own copy (uvicorn ``--workers N``)
+- ``mmap``          every worker loads with ``mmap_mode="r"`` (``MODEL_MMAP=1``)
+- ``preload+fork``  the parent loads once and forks (``PRELOAD_MODEL=1`` with
+                    ``gunicorn --preload``), sharing the model copy-on-write
+
+Libraries are imported before forking in every strategy, so differences come
+from the model alone. PSS splits shared pages between the processes mapping
+them; summed over the workers it is the real memory cost of the deployment.
+Linux only.
+
+Usage:
+    python scripts/benchmark_model_startup.py \\
+        --model BankChurn-Predictor/models/best_model.pkl \\
+        --sample BankChurn-Predictor/data/raw/Churn.csv \\
+        --project-dir BankChurn-Predictor --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import multiprocessing as mp
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import joblib
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from common_utils.artifacts import freeze_for_fork, load_artifact, memory_usage  # noqa: E402
+
+STRATEGIES = ("load", "mmap", "preload+fork")
+
+# Set in the parent before forking for the preload strategy
+_PRELOADED: Any = None
+
+
+def warm_up(model: Any, sample: pd.DataFrame) -> float:
+    start = time.perf_counter()
+    (model.predict_proba if hasattr(model, "predict_proba") else model.predict)(sample)
+    return time.perf_counter() - start
+
+
+def _worker(model_path: str, mmap_mode: Optional[str], sample: pd.DataFrame, results: Any, done: Any) -> None:
+    start = time.perf_counter()
+    model = _PRELOADED if _PRELOADED is not None else load_artifact(model_path, mmap_mode=mmap_mode)
+    load_seconds = time.perf_counter() - start
+    warmup_seconds = warm_up(model, sample)
+    results.put({"load_s": load_seconds, "warmup_s": warmup_seconds, **memory_usage()})
+    done.wait()  # stay alive until every worker has been measured
+
+
+def run_strategy(strategy: str, model_path: str, sample: pd.DataFrame, workers: int) -> Dict[str, Any]:
+    global _PRELOADED
+    ctx = mp.get_context("fork")
+    results, done = ctx.Queue(), ctx.Event()
+    parent_load = 0.0
+    if strategy == "preload+fork":
+        start = time.perf_counter()
+        _PRELOADED = load_artifact(model_path)
+        warm_up(_PRELOADED, sample)
+        freeze_for_fork()
+        parent_load = time.perf_counter() - start
+
+    mmap_mode = "r" if strategy == "mmap" else None
+    procs = [ctx.Process(target=_worker, args=(model_path, mmap_mode, sample, results, done)) for _ in range(workers)]
+    for proc in procs:
+        proc.start()
+    rows: List[Dict[str, float]] = [results.get(timeout=600) for _ in procs]
+    # Re-read once all workers are alive so PSS reflects the final sharing
+    for row, proc in zip(rows, procs):
+        row.update(memory_usage(proc.pid))
+    done.set()
+    for proc in procs:
+        proc.join()
+
+    if _PRELOADED is not None:
+        _PRELOADED = None
+        gc.unfreeze()
+        gc.collect()
+    frame = pd.DataFrame(rows)
+    return {
+        "strategy": strategy,
+        "parent_load_s": parent_load,
+        "worker_load_s": frame["load_s"].mean(),
+        "warmup_s": frame["warmup_s"].mean(),
+        "rss_mb": frame["rss"].mean(),
+        "pss_mb": frame["pss"].mean(),
+        "private_mb": frame["private"].mean(),
+        "total_pss_mb": frame["pss"].sum(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", required=True, help="Uncompressed joblib model artifact")
+    parser.add_argument("--sample", required=True, help="CSV with rows accepted by the model's predict")
+    parser.add_argument("--sample-rows", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--project-dir", help="Project whose modules the pickle references (e.g. src.bankchurn)")
+    parser.add_argument("--strategies", default=",".join(STRATEGIES), help="Comma-separated strategies to compare")
+    args = parser.parse_args()
+
+    if args.project_dir:
+        sys.path.insert(0, str(Path(args.project_dir).resolve()))
+    sample = pd.read_csv(args.sample, nrows=args.sample_rows)
+    joblib.load(args.model)  # import every module the pickle needs before forking
+    print(f"model: {args.model} ({Path(args.model).stat().st_size / 1e6:.1f} MB), workers: {args.workers}")
+    print(
+        f"{'strategy':<14}{'parent load s':>14}{'worker load s':>15}{'warm-up ms':>12}"
+        f"{'RSS MB':>9}{'PSS MB':>9}{'private MB':>12}{'total PSS MB':>14}"
+    )
+    for strategy in args.strategies.split(","):
+        r = run_strategy(strategy, args.model, sample, args.workers)
+        print(
+            f"{r['strategy']:<14}{r['parent_load_s']:>14.3f}{r['worker_load_s']:>15.3f}"
+            f"{r['warmup_s'] * 1000:>12.1f}{r['rss_mb']:>9.1f}{r['pss_mb']:>9.1f}"
+            f"{r['private_mb']:>12.1f}{r['total_pss_mb']:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()